@@ -1,6 +1,6 @@
 """Ortak pytest altyapısı.
 
-İki kural:
+Üç kural:
 
 1. **Testler varsayılan olarak ağa çıkmaz.** Anime siteleri kararsız; ağa bağlı
    test paketi kırmızıya boyanır ve güvenilirliğini yitirir. Gerçek ağ isteyen
@@ -8,10 +8,13 @@
    verildiğinde çalışır.
 2. **Qt testleri offscreen koşar.** `QT_QPA_PLATFORM=offscreen`, QApplication
    kurulmadan *önce* ayarlanmalı; bu yüzden import zamanında yapılıyor.
+3. **Kaynak önbellekleri kullanıcının evine yazılmaz.** Katalog/dizin kopyaları
+   her testte geçici dizine bağlanır (bkz. `_kaynak_onbellekleri`).
 """
 from __future__ import annotations
 
 import os
+import sys
 import threading
 from http.server import BaseHTTPRequestHandler, HTTPServer
 
@@ -96,6 +99,51 @@ def _ag_mandali(pytestconfig):
         socket.getaddrinfo = ozgun[2]
 
 
+# ── Kaynak önbellekleri ──────────────────────────────────────────────────────
+@pytest.fixture(autouse=True)
+def _kaynak_onbellekleri(tmp_path_factory, monkeypatch):
+    """Diskte kalıcı önbellekleri (katalog, dizin, arama, alias, kapak) testte izole et.
+
+    Yalıtılmazsa bir testin sahte dizini `~/.turkanime` altına yazılıyor ve
+    sonraki test (ya da kullanıcının gerçek uygulaması) onu gerçek arşiv
+    sanıp `If-None-Match` ile doğrulamaya çalışıyordu — sonuç test sırasına
+    bağlı hâle geliyordu.
+    """
+    kok = tmp_path_factory.mktemp("kaynak-onbellek")
+    monkeypatch.setattr("turkanime_api.sources.anizle.CACHE_DIR", kok / "anizle")
+    monkeypatch.setattr("turkanime_api.sources.animedepo.CACHE_DIR", kok / "animedepo")
+    # Arama sonucu önbelleği süreç genelinde; testler birbirinin sahte
+    # adapter sonuçlarını görmesin diye her teste boş, disksiz bir tane.
+    from turkanime_api.common.sonuc_onbellegi import SonucOnbellegi
+    monkeypatch.setattr("turkanime_api.common.adapters.ARAMA_ONBELLEK_DOSYASI",
+                        kok / "arama_onbellegi.json")
+    monkeypatch.setattr("turkanime_api.common.adapters._arama_onbellegi",
+                        SonucOnbellegi())
+    monkeypatch.setattr("turkanime_api.common.title_match._CACHE_DB",
+                        kok / "title_cache.sqlite3")
+    monkeypatch.setattr("turkanime_api.common.title_match._CACHE_DIR",
+                        kok / "title_cache")
+    monkeypatch.setattr("turkanime_api.common.title_match._depo", None)
+    # Oturum havuzu da süreç genelinde: sayaçlar ve açık bağlantılar testler
+    # arasında taşınmasın (bir sonraki test ilk isteğinde yenisini kurar).
+    monkeypatch.setattr("turkanime_api.common.oturum_havuzu._havuz", None)
+    # Cloudflare izinleri diskte kalıcı; testler kullanıcının gerçek iznini
+    # okumasın, sahte izinler de kullanıcıya sızmasın.
+    monkeypatch.setattr("turkanime_api.common.izin_deposu.IZIN_DOSYASI",
+                        kok / "cf_izinleri.json")
+    monkeypatch.setattr("turkanime_api.common.izin_deposu._depo", None)
+    monkeypatch.setattr("turkanime_api.common.yontem_gecmisi.GECMIS_DOSYASI",
+                        kok / "cf_yontemleri.json")
+    monkeypatch.setattr("turkanime_api.common.yontem_gecmisi._gecmis", None)
+    # Kapak servisi de süreç genelinde: her teste boş bellek, geçici disk.
+    # Qt'yi burada içe aktarmıyoruz; Qt testleri modülü toplama sırasında yükler.
+    gorseller = sys.modules.get("turkanime_api.gui.qt.images")
+    if gorseller is None:
+        return
+    monkeypatch.setattr(gorseller, "CACHE_DIR", kok / "gorsel_cache")
+    monkeypatch.setattr(gorseller, "_servis", None)
+
+
 # ── Qt ───────────────────────────────────────────────────────────────────────
 @pytest.fixture(scope="session", autouse=True)
 def _qt_env():
@@ -132,7 +180,7 @@ def _stub_discover_sources(request, monkeypatch):
 
 
 @pytest.fixture(scope="session", autouse=True)
-def _cevresel_taban(pytestconfig):
+def _cevresel_taban(pytestconfig, tmp_path_factory):
     """Ağ uçlarının OTURUM BOYU tabanını sahteye çek.
 
     Fonksiyon kapsamlı `monkeypatch` teardown'da *eski* değeri geri koyuyor;
@@ -145,10 +193,15 @@ def _cevresel_taban(pytestconfig):
         return
     from turkanime_api.common import requirements as req_mod
     from turkanime_api.common import updater as upd_mod
+    from turkanime_api.gui.qt import startup
 
     mp = pytest.MonkeyPatch()
     mp.setattr(upd_mod, "surum_bilgisi_getir", lambda *a, **k: {})
     mp.setattr(req_mod, "eksik_araclar", lambda *a, **k: [])
+    # Açılış raporu ilk çizimden sonra arka planda yazılıyor; oturum boyu
+    # geçici dizine, kullanıcının `~/.turkanime/acilis.log`'una değil.
+    mp.setattr(startup, "LOG_PATH",
+               tmp_path_factory.mktemp("acilis") / "acilis.log")
     try:
         yield
     finally:
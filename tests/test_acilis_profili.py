@@ -0,0 +1,151 @@
+"""Açılış: sayfalar ilk ziyarette kuruluyor, ağır modüller ilk kareden sonra.
+
+Eskiden `app.py` yedi menü sayfasını, detay/bölüm sayfalarını ve zincirleme
+yt-dlp/requests'i pencere görünmeden önce yüklüyordu. Ağa çıkılmaz.
+
+İçe aktarma ölçümü `pytest -s` ile görünür.
+"""
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from turkanime_api.gui.qt import startup  # noqa: E402
+from turkanime_api.gui.qt.startup import Timeline, warm_up  # noqa: E402
+
+AGIR_MODULLER = (
+    "yt_dlp",
+    "requests",
+    "turkanime_api.gui.qt.pages.detail",
+    "turkanime_api.gui.qt.pages.episodes",
+    "turkanime_api.gui.qt.pages.search",
+    "turkanime_api.gui.qt.pages.settings",
+    "turkanime_api.gui.qt.pages.watchlist",
+)
+
+
+class Saat:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+# ── Çizelge ─────────────────────────────────────────────────────────────────
+def test_cizelge_isaretleri_ardisik_olcuyor():
+    saat = Saat()
+    tl = Timeline(saat=saat)
+    saat.t = 0.010
+    assert tl.mark("a") == pytest.approx(10)
+    saat.t = 0.035
+    assert tl.mark("b") == pytest.approx(25)
+    assert [ad for ad, _ in tl.phases()] == ["a", "b"]
+    assert tl.elapsed() == pytest.approx(35)
+
+
+def test_olcum_isaret_akisini_kaydirmiyor():
+    saat = Saat()
+    tl = Timeline(saat=saat)
+    with tl.measure("sayfa: search"):
+        saat.t = 0.040
+    saat.t = 0.050
+    assert tl.phase("sayfa: search") == pytest.approx(40)
+    assert tl.mark("ilk çizim") == pytest.approx(50)
+
+
+def test_rapor_diske_atomik_yaziliyor(tmp_path):
+    tl = Timeline()
+    tl.record("qt ortamı", 12.5)
+    hedef = tmp_path / "alt" / "acilis.log"
+    assert tl.write(hedef)
+    metin = hedef.read_text(encoding="utf-8")
+    assert "12.5 ms  qt ortamı" in metin and "toplam" in metin
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_rapor_yazilamazsa_acilis_etkilenmiyor(tmp_path):
+    engel = tmp_path / "dosya"
+    engel.write_text("")
+    assert Timeline().write(engel / "acilis.log") is False
+
+
+def test_isinma_eksik_modulu_atlayip_olcuyor():
+    tl = Timeline()
+    eksik = warm_up(tl, modules=("json", "boyle_bir_modul_yok"))
+    assert eksik == ["boyle_bir_modul_yok"]
+    assert tl.phase("ısınma: json") is not None
+
+
+def test_isinma_kaynak_modullerini_yukluyor():
+    """`turkanime_api.sources` tembel paket; onu yüklemek hiçbir kaynağı ısıtmaz."""
+    kod = ("import sys; from turkanime_api.gui.qt import startup; "
+           "startup.warm_up(modules=tuple(m for m in startup.WARMUP_MODULES "
+           "if m.startswith('turkanime_api.sources'))); "
+           "print(sorted(m for m in sys.modules if m.startswith('turkanime_api.sources.')))")
+    cikti = subprocess.run([sys.executable, "-c", kod], capture_output=True,
+                           text=True, timeout=120, check=True).stdout
+    assert "turkanime_api.sources.animecix" in cikti
+    assert "turkanime_api.sources.anizle" in cikti
+
+
+def test_ortam_degiskeniyle_rapor_stderre(monkeypatch, capsys):
+    monkeypatch.setenv(startup.RAPOR_ORTAM_ANAHTARI, "1")
+    tl = Timeline()
+    tl.record("show", 3.0)
+    startup.finish(tl)
+    assert "show" in capsys.readouterr().err
+    assert "show" in startup.LOG_PATH.read_text(encoding="utf-8")
+
+
+# ── Ana pencere ─────────────────────────────────────────────────────────────
+def test_acilista_yalnizca_ana_sayfa_kuruluyor(main_window):
+    assert list(main_window.pages.built()) == ["home"]
+    assert main_window.pages.peek("search") is None
+
+
+def test_sayfa_ilk_ziyarette_kurulup_olculuyor(main_window):
+    main_window.show_page("settings")
+    sayfa = main_window.pages.peek("settings")
+    assert sayfa is not None and main_window.stack.currentWidget() is sayfa
+    assert startup.timeline().phase("sayfa: settings") is not None
+    # İkinci ziyaret aynı nesne; yeniden kurulmaz.
+    main_window.show_page("home")
+    main_window.show_page("settings")
+    assert main_window.pages["settings"] is sayfa
+
+
+def test_gecmis_tazeleme_bolum_sayfasini_kurmuyor(main_window):
+    main_window._refresh_episode_history()
+    assert main_window.pages.peek("episodes") is None
+
+
+def test_ilk_cizimden_sonra_rapor_yaziliyor(qtbot, main_window):
+    qtbot.waitUntil(lambda: main_window._first_paint, timeout=3000)
+    assert startup.timeline().phase("ilk çizim") is not None
+    # Aynı oturumdaki önceki test de bu yola yazmış olabilir: içeriği bekle.
+    qtbot.waitUntil(lambda: startup.LOG_PATH.exists() and "ilk çizim" in
+                    startup.LOG_PATH.read_text(encoding="utf-8"), timeout=20000)
+
+
+# ── Soğuk içe aktarma ───────────────────────────────────────────────────────
+def test_app_icin_agir_modul_yuklenmiyor():
+    kod = ("import sys, turkanime_api.gui.qt.app; "
+           f"print([m for m in {AGIR_MODULLER!r} if m in sys.modules])")
+    cikti = subprocess.run([sys.executable, "-c", kod], capture_output=True,
+                           text=True, timeout=120, check=True).stdout
+    assert cikti.strip() == "[]"
+
+
+def test_ice_aktarma_olcumu():
+    cikti = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import turkanime_api.gui.qt.app"],
+        capture_output=True, text=True, timeout=120, check=True).stderr
+    satir = [s for s in cikti.splitlines() if s.endswith("| turkanime_api.gui.qt.app")]
+    toplam_us = int(satir[-1].split("|")[1])
+    print(f"\nturkanime_api.gui.qt.app soğuk içe aktarma: {toplam_us / 1000:.0f} ms")
+    assert toplam_us > 0
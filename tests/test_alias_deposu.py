@@ -0,0 +1,167 @@
+"""Alias önbelleği tek SQLite dosyasında: TTL, sınır, LRU, sayaçlar, süreçler.
+
+Eskiden her sorgu `~/.turkanime/title_cache` altına ayrı bir JSON dosyası
+yazıyordu; hiçbiri silinmiyor, ASCII dışı bütün sorgular da aynı `q.json`'a
+düşüyordu. Ağa çıkılmaz; saat elle ilerletiliyor.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+import turkanime_api.common.title_match as tm
+from turkanime_api.common.alias_deposu import AliasDeposu, alias_anahtari
+
+
+class Saat:
+    def __init__(self):
+        self.t = 1_000_000.0
+
+    def __call__(self):
+        return self.t
+
+
+@pytest.fixture
+def saat():
+    return Saat()
+
+
+@pytest.fixture
+def depo(tmp_path, saat):
+    d = AliasDeposu(tmp_path / "alias.sqlite3", ttl=100, kapasite=3, simdi=saat)
+    yield d
+    d.kapat()
+
+
+def test_yaz_oku_ve_anahtar(depo):
+    depo.koy("One  Piece", {"aliases": ["One Piece", "ワンピース"]})
+    assert depo.al("one piece") == {"aliases": ["One Piece", "ワンピース"]}
+    # ASCII dışı sorgular artık birbirine karışmıyor.
+    depo.koy("進撃の巨人", {"aliases": ["進撃の巨人"]})
+    assert depo.al("ワンピース") is None
+    assert alias_anahtari("進撃の巨人") != alias_anahtari("ワンピース")
+
+
+def test_ttl_dolunca_okunmuyor_ve_siliniyor(depo, saat):
+    depo.koy("naruto", {"aliases": ["naruto"]})
+    saat.t += 99
+    assert depo.al("naruto") is not None
+    saat.t += 2
+    assert depo.al("naruto") is None
+    assert len(depo) == 0
+
+
+def test_sinir_asilinca_en_eski_erisilen_atiliyor(depo, saat):
+    for ad in ("a", "b", "c"):
+        saat.t += 1
+        depo.koy(ad, {"aliases": [ad]})
+    saat.t += 1
+    assert depo.al("a") is not None          # a artık en yeni erişilen
+    saat.t += 1
+    depo.koy("d", {"aliases": ["d"]})
+
+    assert len(depo) == 3
+    assert depo.al("b") is None
+    assert all(depo.al(ad) is not None for ad in ("a", "c", "d"))
+    assert depo.tahliye == 1
+
+
+def test_sayaclar(depo):
+    depo.al("yok")
+    depo.koy("var", {"aliases": ["var"]})
+    depo.al("var")
+    depo.al("var")
+    ist = depo.istatistik()
+    assert (ist["isabet"], ist["iskalama"], ist["kayit"]) == (2, 1, 1)
+    assert ist["isabet_orani"] == pytest.approx(2 / 3)
+
+
+def test_eski_json_klasoru_aktariliyor_ve_siliniyor(tmp_path, saat):
+    klasor = tmp_path / "title_cache"
+    klasor.mkdir()
+    (klasor / "one_piece.json").write_text(json.dumps(
+        {"ts": saat.t - 10, "aliases": ["One Piece", "ワンピース"]}), encoding="utf-8")
+    (klasor / "q.json").write_text(json.dumps(
+        {"ts": saat.t - 10_000, "aliases": ["進撃の巨人"]}), encoding="utf-8")
+    (klasor / "bozuk.json").write_text("{", encoding="utf-8")
+
+    with AliasDeposu(tmp_path / "alias.sqlite3", ttl=100, simdi=saat) as d:
+        assert d.eski_klasoru_aktar(klasor) == 1
+        assert d.al("one piece") == {"aliases": ["One Piece", "ワンピース"]}
+        assert d.al("進撃の巨人") is None, "süresi dolmuş kayıt aktarıldı"
+    assert not klasor.exists()
+
+
+def test_threadler_ayni_depoyu_paylasiyor(tmp_path):
+    d = AliasDeposu(tmp_path / "alias.sqlite3", kapasite=10_000)
+    hatalar = []
+
+    def yaz(n):
+        try:
+            for i in range(100):
+                d.koy(f"t{n}-{i}", {"aliases": [str(i)]})
+                assert d.al(f"t{n}-{i}") == {"aliases": [str(i)]}
+        except Exception as exc:       # pragma: no cover - yalnızca hata raporu
+            hatalar.append(exc)
+
+    isler = [threading.Thread(target=yaz, args=(n,)) for n in range(8)]
+    for t in isler:
+        t.start()
+    for t in isler:
+        t.join(30)
+    assert hatalar == []
+    assert len(d) == 800
+    d.kapat()
+
+
+def test_surecler_ayni_dosyayi_paylasiyor(tmp_path):
+    yol = tmp_path / "alias.sqlite3"
+    betik = (
+        "import sys\n"
+        "from turkanime_api.common.alias_deposu import AliasDeposu\n"
+        "d = AliasDeposu(sys.argv[1], kapasite=10000)\n"
+        "for i in range(50):\n"
+        "    d.koy(f'p{sys.argv[2]}-{i}', {'aliases': [str(i)]})\n"
+        "d.kapat()\n"
+    )
+    kok = Path(__file__).resolve().parent.parent
+    surecler = [subprocess.Popen([sys.executable, "-c", betik, str(yol), str(n)],
+                                 cwd=kok, stderr=subprocess.PIPE)
+                for n in range(4)]
+    for s in surecler:
+        _, hata = s.communicate(timeout=60)
+        assert s.returncode == 0, hata.decode(errors="replace")
+
+    with AliasDeposu(yol, kapasite=10_000) as d:
+        assert len(d) == 200
+        assert d.al("p3-49") == {"aliases": ["49"]}
+
+
+# ── title_match ile ─────────────────────────────────────────────────────────
+def test_get_title_aliases_depoyu_kullaniyor(monkeypatch):
+    cagri = []
+    monkeypatch.setattr(tm, "_fetch_anilist_titles",
+                        lambda q: cagri.append(q) or ["Shingeki no Kyojin"])
+    monkeypatch.setattr(tm, "_fetch_jikan_titles", lambda q: [])
+
+    ilk = tm.get_title_aliases("AoT")
+    assert tm.get_title_aliases(" aot ") == ilk
+    assert cagri == ["AoT"]
+    assert tm._CACHE_DB.exists() and not tm._CACHE_DIR.exists()
+    assert tm._alias_deposu().istatistik()["isabet"] == 1
+
+
+def test_depo_acilamazsa_onbelleksiz_calisiyor(monkeypatch, tmp_path):
+    engel = tmp_path / "dosya"
+    engel.write_text("x")
+    monkeypatch.setattr(tm, "_CACHE_DB", engel / "alt" / "alias.sqlite3")
+    monkeypatch.setattr(tm, "_fetch_anilist_titles", lambda q: ["Bleach"])
+    monkeypatch.setattr(tm, "_fetch_jikan_titles", lambda q: [])
+
+    assert tm.get_title_aliases("bleach tv") == ["bleach tv", "Bleach"]
+    assert tm._alias_deposu() is None
@@ -0,0 +1,143 @@
+"""Alias aramaları paralel, tam eşleşmede erken bitiyor, bütçeyle sınırlı.
+
+`multilang_search` bir kaynak için en fazla `max_aliases` alias'ı SIRAYLA
+arıyordu; sunucunun `/search`'ü bunu her kaynak için tekrarlayınca tek sorgu
+6 × 7 ardışık ağ araması demekti. `get_title_aliases` da AniList ile Jikan'ı
+sırayla bekliyordu.
+
+Ağa çıkılmaz: arama fonksiyonları sahte, gecikmeler kapı/uyku ile.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+import turkanime_api.common.title_match as tm
+
+ALIASLAR = ["one piece", "wan pisu", "ワンピース", "op"]
+
+
+class SahteKaynak:
+    """Alias başına sonuç tablosu; eşzamanlı çağrı sayısını ölçer."""
+
+    def __init__(self, tablo, gecikme=0.0, kapi=None):
+        self.tablo, self.gecikme, self.kapi = tablo, gecikme, kapi
+        self.cagrilan: list = []
+        self._kilit = threading.Lock()
+        self._suren = 0
+        self.en_cok = 0
+
+    def __call__(self, alias):
+        with self._kilit:
+            self.cagrilan.append(alias)
+            self._suren += 1
+            self.en_cok = max(self.en_cok, self._suren)
+        try:
+            if self.kapi is not None and alias in self.kapi:
+                self.kapi[alias].wait(5)
+            time.sleep(self.gecikme)
+            return self.tablo.get(alias, [])
+        finally:
+            with self._kilit:
+                self._suren -= 1
+
+
+def test_aliaslar_ayni_anda_araniyor_ve_sira_korunuyor():
+    kaynak = SahteKaynak({a: [(f"s{i}", f"Baska {i}")] for i, a in enumerate(ALIASLAR)},
+                         gecikme=0.3)
+    basla = time.monotonic()
+    yanit = tm.multilang_search(kaynak, "one piece", aliases=ALIASLAR,
+                                paralel=4, possible_floor=0.0)
+    assert time.monotonic() - basla < 0.9, "alias aramaları sırayla yürüdü"
+    assert sorted(r.slug for r in yanit.possible) == ["s0", "s1", "s2", "s3"]
+    assert kaynak.en_cok == 4
+
+
+def test_paralellik_sinirli():
+    kaynak = SahteKaynak({}, gecikme=0.05)
+    tm.multilang_search(kaynak, "x", aliases=ALIASLAR * 2, max_aliases=8, paralel=2)
+    assert kaynak.en_cok <= 2
+    assert len(kaynak.cagrilan) == 8
+
+
+def test_tam_eslesmede_kalan_aliaslar_beklenmiyor():
+    kapilar = {a: threading.Event() for a in ALIASLAR[1:]}
+    kaynak = SahteKaynak({"one piece": [("op", "One Piece")]}, kapi=kapilar)
+    try:
+        basla = time.monotonic()
+        yanit = tm.multilang_search(kaynak, "one piece", aliases=ALIASLAR, paralel=2)
+        assert time.monotonic() - basla < 1.0, "tam eşleşmeden sonra beklendi"
+    finally:
+        for k in kapilar.values():
+            k.set()
+    assert [r.slug for r in yanit.exact] == ["op"]
+    # paralel=2: boşalan işçi en fazla üçüncüyü kapabilir, sonuncusu iptal.
+    assert "op" not in kaynak.cagrilan
+
+
+def test_erken_cikis_kapatilinca_tum_aliaslar_deneniyor():
+    kaynak = SahteKaynak({"one piece": [("op", "One Piece")],
+                          "op": [("film", "One Piece Film")]})
+    yanit = tm.multilang_search(kaynak, "one piece", aliases=ALIASLAR,
+                                paralel=1, erken_cik=False)
+    assert kaynak.cagrilan == ALIASLAR
+    assert {r.slug for r in yanit.exact + yanit.possible} == {"op", "film"}
+
+
+def test_butce_dolunca_eldekiyle_donuluyor():
+    kapilar = {"wan pisu": threading.Event()}
+    kaynak = SahteKaynak({"one piece": [("x", "Bambaska")],
+                          "wan pisu": [("y", "One Piece")]}, kapi=kapilar)
+    try:
+        basla = time.monotonic()
+        yanit = tm.multilang_search(kaynak, "one piece", aliases=ALIASLAR[:2],
+                                    butce=0.3, possible_floor=0.0)
+        assert time.monotonic() - basla < 1.5
+    finally:
+        kapilar["wan pisu"].set()
+    assert [r.slug for r in yanit.exact + yanit.possible] == ["x"]
+
+
+def test_patlayan_alias_digerlerini_dusurmuyor():
+    def kaynak(alias):
+        if alias == "wan pisu":
+            raise RuntimeError("kaynak kapalı")
+        return [("op", "One Piece")] if alias == "op" else []
+
+    yanit = tm.multilang_search(kaynak, "one piece", aliases=ALIASLAR)
+    assert [r.slug for r in yanit.exact] == ["op"]
+
+
+# ── get_title_aliases ───────────────────────────────────────────────────────
+@pytest.fixture
+def alias_servisleri(monkeypatch):
+    def _kur(anilist, jikan, gecikme=(0.3, 0.3)):
+        def ani(q):
+            time.sleep(gecikme[0])
+            return anilist
+
+        def jik(q):
+            time.sleep(gecikme[1])
+            return jikan
+
+        monkeypatch.setattr(tm, "_fetch_anilist_titles", ani)
+        monkeypatch.setattr(tm, "_fetch_jikan_titles", jik)
+
+    return _kur
+
+
+def test_anilist_ve_jikan_ayni_anda_sorgulaniyor(alias_servisleri):
+    alias_servisleri(["Shingeki no Kyojin"], ["Attack on Titan"])
+    basla = time.monotonic()
+    sonuc = tm.get_title_aliases("aot", use_cache=False)
+    assert time.monotonic() - basla < 0.55, "servisler sırayla beklendi"
+    assert sonuc == ["aot", "Shingeki no Kyojin", "Attack on Titan"]
+
+
+def test_birlestirme_sirasi_donus_sirasina_bagli_degil(alias_servisleri):
+    alias_servisleri(["Shingeki no Kyojin", "Attack on Titan"],
+                     ["attack on titan", "AoT Final"], gecikme=(0.2, 0.0))
+    assert tm.get_title_aliases("aot", use_cache=False) == [
+        "aot", "Shingeki no Kyojin", "Attack on Titan", "AoT Final"]
@@ -0,0 +1,198 @@
+"""AnimeDepo dizini diskte kalıcı, arama indeksi dizin sürümü başına bir kez.
+
+İki eski maliyet:
+
+1. `dizin()` dizini yalnızca bellekte tutuyordu; her süreç açılışı megabaytlık
+   `dizin.json`'ı koşulsuz indiriyordu. ETag de bellekte olduğu için
+   `_kosullu_getir` yeniden başlatmadan sonra hiçbir işe yaramıyordu.
+2. `search_animedepo` her sorguda `get_anime_listesi()`'ni baştan kurup tüm
+   arşivi SequenceMatcher ile puanlıyordu.
+
+Ağa çıkılmıyor: `_session` sahteleniyor, `CACHE_DIR` conftest'te geçici dizin.
+"""
+import random
+from difflib import SequenceMatcher
+
+import pytest
+
+from turkanime_api.sources import animedepo as depo
+
+
+def _eski_arama(liste, query, limit=20):
+    """İndeksten önceki `search_animedepo` gövdesi (referans)."""
+    q = query.strip().lower()
+    scored = []
+    for slug, title in liste:
+        hay = (title or "").lower()
+        ratio = SequenceMatcher(None, q, hay).ratio()
+        if hay == q or slug.lower() == q:
+            score = 3.0 + ratio
+        elif hay.startswith(q) or slug.lower().startswith(q):
+            score = 2.0 + ratio
+        elif q in hay or q in slug.lower():
+            score = 1.0 + ratio
+        elif ratio >= 0.55:
+            score = ratio
+        else:
+            continue
+        scored.append((score, (slug, title)))
+    scored.sort(key=lambda x: -x[0])
+    return [item for _, item in scored[:limit]]
+
+
+KELIMELER = ["one", "piece", "naruto", "shippuuden", "bleach", "kimetsu", "no",
+             "yaiba", "shingeki", "kyojin", "frieren", "spy", "family", "hero",
+             "academia", "film", "season", "2nd", "the", "final", "koisuru"]
+
+
+def _dizin(adet=600, tohum=3):
+    rnd = random.Random(tohum)
+    index = {}
+    for i in range(adet):
+        ad = " ".join(rnd.choice(KELIMELER) for _ in range(rnd.randint(1, 4))).title()
+        slug = ad.lower().replace(" ", "-") + f"-{i}"
+        # Başlığı olmayan kayıt slug'dan türetilir; indeks de aynısını yapmalı.
+        kayit = {"title": ad} if rnd.random() > 0.05 else {}
+        index.setdefault(ad[0], {})[slug] = kayit
+    index.setdefault("O", {})["one-piece"] = {"title": "One Piece"}
+    return {"index": index}
+
+
+DIZIN = _dizin()
+
+
+@pytest.mark.parametrize("sorgu", [
+    "One Piece", "one-piece", "naruto", "narto", "o", "on", "spy famly",
+    "kimetsu no yaiba", "film", "zzz", "the final season", "shippuden",
+])
+def test_indeks_eski_arama_ile_ayni(sorgu):
+    indeks = depo.DizinIndeksi(DIZIN)
+    liste = depo._anime_listesi(DIZIN)
+    for limit in (1, 5, 20):
+        assert indeks.ara(sorgu, limit) == _eski_arama(liste, sorgu, limit)
+
+
+def test_indeks_dizin_surumu_basina_bir_kez(monkeypatch):
+    monkeypatch.setattr(depo, "dizin", lambda tazele=False: DIZIN)
+    monkeypatch.setattr(depo, "_arama_indeksi", None)
+    depo.search_animedepo("naruto")
+    ilk = depo._arama_indeksi
+    depo.search_animedepo("bleach")
+    assert depo._arama_indeksi is ilk
+
+    yeni = _dizin(adet=10, tohum=9)
+    monkeypatch.setattr(depo, "dizin", lambda tazele=False: yeni)
+    depo.search_animedepo("naruto")
+    assert depo._arama_indeksi is not ilk and depo._arama_indeksi.kaynak is yeni
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Disk kopyası
+# ─────────────────────────────────────────────────────────────────────────────
+class _Yanit:
+    def __init__(self, durum, etag, veri):
+        self.status_code, self._veri = durum, veri
+        self.headers = {"ETag": etag}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+    def json(self):
+        return self._veri
+
+
+@pytest.fixture
+def arsiv(monkeypatch):
+    """ETag'i doğru uygulayan sahte arşiv; istekleri kaydeder."""
+    monkeypatch.delenv(depo.ORTAM_ANAHTARI, raising=False)
+    depo.taban_url_sifirla()
+    durum = {"etag": 'W/"v1"', "veri": {"index": {"N": {"naruto": {"title": "Naruto"}}}},
+             "istekler": [], "ag_yok": False}
+
+    class Oturum:
+        def get(self, url, timeout=None, headers=None):
+            if durum["ag_yok"]:
+                raise OSError("ağ yok")
+            baslik = dict(headers or {})
+            durum["istekler"].append(baslik)
+            if baslik.get("If-None-Match") == durum["etag"]:
+                return _Yanit(304, durum["etag"], None)
+            return _Yanit(200, durum["etag"], durum["veri"])
+
+    monkeypatch.setattr(depo, "_session", Oturum)
+
+    def yeniden_baslat():
+        # Süreç yeniden başlamış gibi: bellek gider, disk kalır.
+        depo.taban_url_sifirla()
+
+    durum["yeniden_baslat"] = yeniden_baslat
+    yield durum
+    depo.taban_url_sifirla()
+
+
+def test_yeniden_baslatmada_dizin_kosullu_dogrulaniyor(arsiv):
+    assert depo.dizin()["index"]
+    assert arsiv["istekler"] == [{}]
+
+    arsiv["yeniden_baslat"]()
+    veri = depo.dizin()
+    assert veri["index"]["N"]["naruto"]["title"] == "Naruto"
+    assert arsiv["istekler"][-1] == {"If-None-Match": 'W/"v1"'}, \
+        "diskteki ETag yeniden başlatmadan sonra da kullanılmalı"
+
+
+def test_arsiv_degistiyse_yeni_dizin_diske_yaziliyor(arsiv):
+    depo.dizin()
+    arsiv["etag"] = 'W/"v2"'
+    arsiv["veri"] = {"index": {"B": {"bleach": {"title": "Bleach"}}}}
+
+    arsiv["yeniden_baslat"]()
+    assert "B" in depo.dizin()["index"]
+
+    arsiv["yeniden_baslat"]()
+    depo.dizin()
+    assert arsiv["istekler"][-1] == {"If-None-Match": 'W/"v2"'}
+
+
+def test_ag_yokken_disk_kopyasi_kullaniliyor(arsiv):
+    depo.dizin()
+    arsiv["yeniden_baslat"]()
+    arsiv["ag_yok"] = True
+    assert depo.search_animedepo("naruto") == [("naruto", "Naruto")]
+
+
+def test_ag_yokken_kopya_bellekte_tutulup_yeniden_deneme_seyreltiliyor(arsiv, monkeypatch):
+    depo.dizin()
+    arsiv["yeniden_baslat"]()
+    arsiv["ag_yok"] = True
+    okuma: list = []
+    asil_oku = depo._dizin_kopyasi_oku
+    monkeypatch.setattr(depo, "_dizin_kopyasi_oku",
+                        lambda: okuma.append(1) or asil_oku())
+    deneme: list = []
+    asil_getir = depo._kosullu_getir
+    monkeypatch.setattr(depo, "_kosullu_getir",
+                        lambda yol: deneme.append(yol) or asil_getir(yol))
+
+    for _ in range(3):
+        assert depo.search_animedepo("naruto") == [("naruto", "Naruto")]
+    assert okuma == [1] and deneme == ["dizin.json"]
+    indeks = depo._arama_indeksi
+    assert depo._dizin_cache is None          # başarısızlık taze sayılmadı
+
+    # Süre dolunca arşive yeniden soruluyor; ağ geldiyse kopya tazeleniyor.
+    monkeypatch.setattr(depo, "_yeniden_deneme", 0.0)
+    arsiv["ag_yok"] = False
+    depo.search_animedepo("naruto")
+    assert len(deneme) == 2 and okuma == [1]
+    assert depo._dizin_cache is not None and depo._dizin_yedegi is None
+    assert depo._arama_indeksi is indeks      # 304: aynı dizin, aynı indeks
+
+
+def test_baska_arsivin_kopyasi_kullanilmiyor(arsiv, monkeypatch):
+    depo.dizin()
+    monkeypatch.setenv(depo.ORTAM_ANAHTARI, "https://baska.test/raw")
+    arsiv["yeniden_baslat"]()
+    depo.dizin()
+    assert arsiv["istekler"][-1] == {}, "farklı arşiv adresinde koşullu istek atılmamalı"
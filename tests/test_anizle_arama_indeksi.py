@@ -0,0 +1,113 @@
+"""Anizle arama indeksi, eski doğrusal taramayla BİREBİR aynı sonucu veriyor mu?
+
+`search_anizle` eskiden her sorguda katalogdaki her kaydın beş alanını
+`_similarity_score` (küçük harf + SequenceMatcher) ile puanlıyordu. İndeks
+aday üretimini trigramlara, elemeyi rapidfuzz üst sınırına devrediyor; ama
+kullanıcının gördüğü sıra değişmemeli. Referans olarak eski tarama
+`_dogrusal_ara` adıyla modülde duruyor ve buradaki testler iki yolu
+karşılaştırıyor.
+
+Ağa çıkılmıyor: katalog sentetik.
+"""
+import random
+
+import pytest
+
+import turkanime_api.sources.anizle as az
+
+KELIMELER = [
+    "one", "piece", "naruto", "shippuuden", "bleach", "kimetsu", "no", "yaiba",
+    "shingeki", "kyojin", "attack", "on", "titan", "sousou", "frieren", "spy",
+    "family", "jujutsu", "kaisen", "boku", "hero", "academia", "ao", "ashi",
+    "film", "movie", "season", "2nd", "the", "final", "koisuru", "noroi",
+    "gintama", "haikyuu", "kaguya", "sama", "dr", "stone", "mob", "psycho",
+]
+
+
+def _sentetik_katalog(adet=800, tohum=7):
+    rnd = random.Random(tohum)
+
+    def ad():
+        return " ".join(rnd.choice(KELIMELER) for _ in range(rnd.randint(1, 5))).title()
+
+    katalog = []
+    for i in range(adet):
+        kayit = {"info_slug": f"anime-{i}", "info_title": ad()}
+        if rnd.random() < 0.6:
+            kayit["info_titleoriginal"] = ad()
+        if rnd.random() < 0.4:
+            kayit["info_titleenglish"] = ad()
+        if rnd.random() < 0.3:
+            kayit["info_othernames"] = ", ".join(ad() for _ in range(2))
+        if rnd.random() < 0.1:
+            kayit["info_othernames"] = None
+        katalog.append(kayit)
+    # Doğrusal taramanın atladığı eksik kayıtlar da katalogda bulunur.
+    katalog.append({"info_slug": "", "info_title": "One Piece"})
+    katalog.append({"info_slug": "baslıksız", "info_title": ""})
+    katalog.append({"info_slug": "one-piece", "info_title": "One Piece"})
+    return katalog
+
+
+KATALOG = _sentetik_katalog()
+SORGULAR = [
+    "one piece", "One Piece", "naruto", "narto", "shingeki no kyojin",
+    "frieren", "sousou no frieren", "spy famly", "ao", "x", "bleach film",
+    "kimetsu no yaiba", "atack on titan", "hero", "zzzz", "the final season",
+    "koisuru one piece", "gintama", "dr. stone", "mob stonekcisuu", "",
+]
+
+
+@pytest.fixture(scope="module")
+def indeks():
+    return az.KatalogIndeksi(KATALOG)
+
+
+@pytest.mark.parametrize("sorgu", SORGULAR)
+@pytest.mark.parametrize("limit", [1, 5, 20])
+def test_indeks_dogrusal_tarama_ile_ayni(indeks, sorgu, limit):
+    assert indeks.ara(sorgu, limit) == az._dogrusal_ara(KATALOG, sorgu, limit)
+
+
+def test_rapidfuzz_olmadan_da_ayni(monkeypatch, indeks):
+    """rapidfuzz yoksa eleme atlanır, sonuç değişmez."""
+    monkeypatch.setattr(az, "_HAS_RF", False)
+    for sorgu in ("one piece", "narto", "ao"):
+        assert indeks.ara(sorgu, 20) == az._dogrusal_ara(KATALOG, sorgu, 20)
+
+
+def test_trigram_paylasmayan_bulanik_eslesme_kacmiyor():
+    """Trigram ortak değil ama SequenceMatcher eşiği geçiyor."""
+    katalog = [{"info_slug": "a", "info_title": "ab ab"}]
+    assert az._dogrusal_ara(katalog, "abab", 5) == [("a", "ab ab")]
+    assert az.KatalogIndeksi(katalog).ara("abab", 5) == [("a", "ab ab")]
+
+
+def test_search_anizle_indeksi_kullaniyor(monkeypatch):
+    monkeypatch.setattr(az, "USE_REMOTE_SERVER", False)
+    monkeypatch.setattr(az, "_anime_database", KATALOG)
+    monkeypatch.setattr(az, "_database_loaded", True)
+    monkeypatch.setattr(az, "_katalog_indeksi", None)
+
+    assert az.search_anizle("one piece", limit=5) == \
+        az._dogrusal_ara(KATALOG, "one piece", 5)
+    kurulan = az._katalog_indeksi
+    assert kurulan is not None and kurulan.kaynak is KATALOG
+    az.search_anizle("naruto")
+    assert az._katalog_indeksi is kurulan       # sorgu başına yeniden kurulmuyor
+
+
+def test_katalog_yuklenince_indeks_kurulur(monkeypatch):
+    monkeypatch.setattr(az, "_katalog_indeksi", None)
+    monkeypatch.setattr(az, "_anime_database", [])
+    monkeypatch.setattr(az, "_database_loaded", False)
+    az._katalogu_kur(KATALOG)
+    assert az._katalog_indeksi is not None
+    assert az._katalog_indeksi.kaynak is KATALOG
+
+
+def test_kiyasla_iki_yolu_olcer():
+    olcum = az.kiyasla(["one piece", "narto"], tekrar=1, database=KATALOG)
+    assert olcum["ayni"] is True
+    assert olcum["kayit"] == len(KATALOG)
+    assert olcum["dogrusal_ms"] > 0 and olcum["indeks_ms"] > 0
@@ -0,0 +1,156 @@
+"""Anizle katalogu diskte saklanıyor ve koşullu istekle tazeleniyor mu?
+
+`load_anime_database` eskiden `getAnimeListForSearch` listesinin tamamını her
+süreç açılışında 120 sn zaman aşımıyla indiriyor ve yalnızca bellekte
+tutuyordu: oturumun ilk araması megabaytlık indirmeyi bekliyordu. Artık
+anlık görüntü `CACHE_DIR`'e ETag/Last-Modified ve çekilme zamanıyla yazılıyor,
+açılışta diskten anında yükleniyor ve tazeliği arka planda doğrulanıyor.
+
+Ağa çıkılmıyor: `_http_get` sahteleniyor, `CACHE_DIR` geçici dizine bağlanıyor.
+"""
+import json
+import time
+
+import pytest
+
+import turkanime_api.sources.anizle as az
+
+KATALOG = [
+    {"info_slug": "naruto", "info_title": "Naruto"},
+    {"info_slug": "one-piece", "info_title": "One Piece"},
+]
+
+
+class SahteYanit:
+    def __init__(self, status_code=200, veri=None, headers=None):
+        self.status_code = status_code
+        self._veri = veri
+        self.headers = headers or {}
+
+    def json(self):
+        return self._veri
+
+
+@pytest.fixture
+def katalog(tmp_path, monkeypatch):
+    """Temiz modül durumu + sayılan sahte `_http_get`."""
+    monkeypatch.setattr(az, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(az, "KATALOG_AZAMI_YAS", None)
+    monkeypatch.delenv(az.AZAMI_YAS_ANAHTARI, raising=False)
+    for ad, deger in (("_anime_database", []), ("_database_loaded", False),
+                      ("_katalog_etag", None), ("_katalog_last_modified", None),
+                      ("_katalog_ts", 0.0), ("_tazeleme_thread", None)):
+        monkeypatch.setattr(az, ad, deger)
+
+    istekler = []
+    yanitlar = []
+
+    def sahte_get(url, timeout=60, headers=None):
+        istekler.append(dict(headers or {}))
+        return yanitlar.pop(0) if yanitlar else None
+
+    monkeypatch.setattr(az, "_http_get", sahte_get)
+
+    def sifirla_bellek():
+        az._anime_database, az._database_loaded = [], False
+
+    return {"istekler": istekler, "yanitlar": yanitlar, "yol": tmp_path / az.KATALOG_DOSYASI,
+            "sifirla": sifirla_bellek}
+
+
+def _bekle_tazeleme():
+    thread = az._tazeleme_thread
+    if thread is not None:
+        thread.join(timeout=5)
+
+
+def test_ilk_yukleme_diske_yazar(katalog):
+    katalog["yanitlar"].append(SahteYanit(200, KATALOG, {"ETag": '"v1"',
+                                                         "Last-Modified": "Mon"}))
+    assert az.load_anime_database() == KATALOG
+
+    kayit = json.loads(katalog["yol"].read_text(encoding="utf-8"))
+    assert kayit["data"] == KATALOG
+    assert kayit["etag"] == '"v1"' and kayit["last_modified"] == "Mon"
+    assert kayit["ts"] > 0
+    # İlk indirme koşulsuz: elde doğrulanacak bir kopya yok.
+    assert katalog["istekler"] == [{}]
+
+
+def test_acilis_diskten_aninda_yukler_ve_arkada_dogrular(katalog):
+    katalog["yanitlar"].append(SahteYanit(200, KATALOG, {"ETag": '"v1"'}))
+    az.load_anime_database()
+    katalog["sifirla"]()                 # yeni süreç gibi
+
+    katalog["yanitlar"].append(SahteYanit(304))
+    assert az.load_anime_database() == KATALOG
+    _bekle_tazeleme()
+
+    assert katalog["istekler"][-1] == {"If-None-Match": '"v1"'}
+    assert az._anime_database == KATALOG
+
+
+def test_arka_plan_yeni_katalogu_devreye_alir(katalog):
+    katalog["yanitlar"].append(SahteYanit(200, KATALOG, {"ETag": '"v1"'}))
+    az.load_anime_database()
+    katalog["sifirla"]()
+
+    yeni = KATALOG + [{"info_slug": "bleach", "info_title": "Bleach"}]
+    katalog["yanitlar"].append(SahteYanit(200, yeni, {"ETag": '"v2"'}))
+    az.load_anime_database()
+    _bekle_tazeleme()
+
+    assert az._anime_database == yeni
+    kayit = json.loads(katalog["yol"].read_text(encoding="utf-8"))
+    assert kayit["etag"] == '"v2"' and kayit["data"] == yeni
+
+
+def test_azami_yas_icindeyse_aga_cikilmaz(katalog, monkeypatch):
+    katalog["yanitlar"].append(SahteYanit(200, KATALOG))
+    az.load_anime_database()
+    katalog["sifirla"]()
+    onceki = len(katalog["istekler"])
+
+    monkeypatch.setattr(az, "KATALOG_AZAMI_YAS", 3600)
+    assert az.load_anime_database() == KATALOG
+    _bekle_tazeleme()
+    assert len(katalog["istekler"]) == onceki
+
+
+def test_eski_anlik_goruntu_azami_yasa_ragmen_dogrulanir(katalog):
+    katalog["yol"].write_text(json.dumps({
+        "ts": time.time() - 7200, "etag": '"v1"', "data": KATALOG}), encoding="utf-8")
+    katalog["yanitlar"].append(SahteYanit(304))
+
+    assert az.load_anime_database(azami_yas=3600) == KATALOG
+    _bekle_tazeleme()
+    assert katalog["istekler"] == [{"If-None-Match": '"v1"'}]
+    # 304 çekilme zamanını yeniler: bir sonraki açılış ağa çıkmaz.
+    assert json.loads(katalog["yol"].read_text(encoding="utf-8"))["ts"] > time.time() - 60
+
+
+def test_ortam_degiskeni_azami_yasi_ezer(katalog, monkeypatch):
+    katalog["yol"].write_text(json.dumps({"ts": time.time() - 7200, "data": KATALOG}),
+                              encoding="utf-8")
+    monkeypatch.setenv(az.AZAMI_YAS_ANAHTARI, "86400")
+
+    assert az.load_anime_database(azami_yas=60) == KATALOG
+    _bekle_tazeleme()
+    assert katalog["istekler"] == []
+
+
+def test_bozuk_anlik_goruntu_indirmeye_duser(katalog):
+    katalog["yol"].write_text("{yarım", encoding="utf-8")
+    katalog["yanitlar"].append(SahteYanit(200, KATALOG))
+
+    assert az.load_anime_database() == KATALOG
+    assert json.loads(katalog["yol"].read_text(encoding="utf-8"))["data"] == KATALOG
+
+
+def test_basarisiz_tazeleme_eldeki_kopyayi_korur(katalog):
+    katalog["yanitlar"].append(SahteYanit(200, KATALOG))
+    az.load_anime_database()
+
+    katalog["yanitlar"].append(None)          # ağ hatası
+    assert az.load_anime_database(force_reload=True) == KATALOG
+    assert json.loads(katalog["yol"].read_text(encoding="utf-8"))["data"] == KATALOG
@@ -0,0 +1,100 @@
+"""Arama sonuçları kaynak bittikçe akıyor mu?
+
+`search_all_sources_rich` eskiden yalnızca tüm kaynaklar bitince (ya da süre
+dolunca) dönüyordu; hızlı kaynağın sonucu en yavaş kaynağı bekliyordu. Akış
+hâli (`search_all_sources_rich_iter`) ve geri çağrı (`on_result`) sonucu
+geldiği anda verir; ilk ve son sonucun süresi `son_olcum`'da ayrı ölçülür.
+
+Ağa çıkılmaz: adapterler sahte, yavaş kaynak bir kapıda bekliyor.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from turkanime_api.common import adapters as adapters_mod
+from turkanime_api.common.adapters import SearchEngine
+
+
+class HizliAdapter:
+    def search_anime(self, query, limit=10):
+        return [("cb", "Cowboy Bebop")]
+
+
+class YavasAdapter:
+    """Kapı açılana dek dönmeyen kaynak."""
+
+    def __init__(self, kapi: threading.Event):
+        self.kapi = kapi
+
+    def search_rich(self, query, limit=10):
+        self.kapi.wait(5)
+        return [{"slug": "gec", "title": "Geç Kalan", "image": None}]
+
+
+@pytest.fixture
+def motor(monkeypatch):
+    monkeypatch.setattr(adapters_mod, "OVERALL_SEARCH_TIMEOUT", 3.0)
+    kapi = threading.Event()
+    motor = SearchEngine()
+    motor.adapters = {"Hizli": HizliAdapter(), "Yavas": YavasAdapter(kapi)}
+    try:
+        yield motor, kapi
+    finally:
+        kapi.set()
+
+
+def test_hizli_kaynak_yavasi_beklemeden_geliyor(motor):
+    engine, kapi = motor
+    akis = engine.search_all_sources_rich_iter("cowboy")
+
+    basla = time.monotonic()
+    kaynak, kayitlar = next(akis)
+    assert time.monotonic() - basla < 1.0, "ilk sonuç yavaş kaynağı bekledi"
+    assert kaynak == "Hizli"
+    assert kayitlar == [{"slug": "cb", "title": "Cowboy Bebop", "image": None}]
+
+    kapi.set()
+    assert [k for k, _ in akis] == ["Yavas"]
+    olcum = engine.son_olcum
+    assert olcum.ilk_sonuc is not None and olcum.ilk_sonuc <= olcum.son_sonuc
+    assert set(olcum.kaynaklar) == {"Hizli", "Yavas"}
+    assert olcum.yetismeyen == []
+
+
+def test_erken_cikis_yavas_kaynagi_beklemiyor(motor):
+    engine, _kapi = motor
+    basla = time.monotonic()
+    for kaynak, _ in engine.search_all_sources_rich_iter("cowboy"):
+        if kaynak == "Hizli":
+            break
+    assert time.monotonic() - basla < 1.0, "erken çıkış süren işi bekledi"
+
+
+def test_geri_cagri_sozlukle_ayni_sirayla_cagriliyor(motor):
+    engine, kapi = motor
+    gelenler = []
+
+    def geldi(kaynak, kayitlar):
+        gelenler.append((kaynak, time.monotonic()))
+        if kaynak == "Hizli":
+            kapi.set()          # yavaş kaynak ancak hızlı geldikten sonra biter
+
+    sonuc = engine.search_all_sources_rich("cowboy", on_result=geldi)
+
+    assert [k for k, _ in gelenler] == ["Hizli", "Yavas"]
+    assert set(sonuc) == {"Hizli", "Yavas"}
+    assert sonuc["Yavas"][0]["slug"] == "gec"
+
+
+def test_zaman_asiminda_yetismeyen_kaydediliyor(motor, monkeypatch):
+    engine, _kapi = motor
+    monkeypatch.setattr(adapters_mod, "OVERALL_SEARCH_TIMEOUT", 0.3)
+    sonuc = engine.search_all_sources_rich("cowboy")
+
+    assert sonuc["Yavas"] == []
+    olcum = engine.son_olcum
+    assert olcum.yetismeyen == ["Yavas"]
+    assert olcum.ilk_sonuc < olcum.son_sonuc
@@ -0,0 +1,223 @@
+"""Arama sonucu önbelleği: TTL, LRU, disk ve eşzamanlı çağrı birleştirme.
+
+Eskiden `DetailPage._do_resolve` ve `AnimeMatchDialog._do_search` her seferinde
+yeni bir `SearchEngine()` kurup sekiz kaynağı baştan arıyordu; kullanıcının
+saniyeler önce aradığı başlık için bile. Önbellek artık süreç genelinde ve
+`SearchEngine._zengin_gorev` içinden kullanılıyor.
+
+Ağa çıkılmaz: adapterler sahte, saat elle ilerletiliyor.
+"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from turkanime_api.common import adapters as adapters_mod
+from turkanime_api.common.adapters import SearchEngine, arama_onbellegi
+from turkanime_api.common.sonuc_onbellegi import SonucOnbellegi, sorgu_anahtari
+
+
+class Saat:
+    def __init__(self):
+        self.t = 1000.0
+
+    def __call__(self):
+        return self.t
+
+
+@pytest.fixture
+def saat():
+    return Saat()
+
+
+# ── Önbelleğin kendisi ──────────────────────────────────────────────────────
+def test_ttl_dolunca_yeniden_hesaplaniyor(saat):
+    ob = SonucOnbellegi(ttl=60, saat=saat)
+    cagri = []
+    hesapla = lambda: cagri.append(1) or ["a"]
+
+    assert ob.getir("k", hesapla) == ["a"]
+    saat.t += 59
+    assert ob.getir("k", hesapla) == ["a"]
+    assert len(cagri) == 1
+    saat.t += 2
+    ob.getir("k", hesapla)
+    assert len(cagri) == 2
+    assert ob.istatistik()["isabet"] == 1 and ob.istatistik()["iskalama"] == 2
+
+
+def test_lru_en_eski_dokunulani_atiyor(saat):
+    ob = SonucOnbellegi(kapasite=2, saat=saat)
+    ob.koy("a", 1)
+    ob.koy("b", 2)
+    assert ob.al("a") == 1          # a artık en yeni
+    ob.koy("c", 3)
+    assert ob.al("b") is None
+    assert ob.al("a") == 1 and ob.al("c") == 3
+    assert len(ob) == 2
+
+
+def test_saklanmayan_sonuc_onbellege_girmiyor(saat):
+    ob = SonucOnbellegi(saat=saat)
+    assert ob.getir("k", lambda: [], sakla=bool) == []
+    assert ob.al("k") is None
+
+
+def test_istisna_saklanmiyor_ve_sonraki_cagri_yeniden_deniyor(saat):
+    ob = SonucOnbellegi(saat=saat)
+    with pytest.raises(RuntimeError):
+        ob.getir("k", lambda: (_ for _ in ()).throw(RuntimeError("kapalı")))
+    assert ob.getir("k", lambda: ["tamam"]) == ["tamam"]
+
+
+def test_ayni_anahtar_icin_tek_cagri_yapiliyor():
+    ob = SonucOnbellegi()
+    kapi, basladi = threading.Event(), threading.Event()
+    cagri = []
+
+    def yavas():
+        cagri.append(1)
+        basladi.set()
+        kapi.wait(5)
+        return ["sonuc"]
+
+    sonuclar = []
+    ilk = threading.Thread(target=lambda: sonuclar.append(ob.getir("k", yavas)))
+    ilk.start()
+    assert basladi.wait(5)
+    digerleri = [threading.Thread(target=lambda: sonuclar.append(ob.getir("k", yavas)))
+                 for _ in range(4)]
+    for t in digerleri:
+        t.start()
+    # Bekleyenler birleştirildi olarak sayılınca kapıyı aç.
+    for _ in range(500):
+        if ob.istatistik()["birlesen"] == 4:
+            break
+        threading.Event().wait(0.01)
+    kapi.set()
+    for t in [ilk, *digerleri]:
+        t.join(5)
+
+    assert cagri == [1], "eşzamanlı aynı sorgu kaynağa birden çok kez gitti"
+    assert sonuclar == [["sonuc"]] * 5
+    assert ob.istatistik()["birlesen"] == 4
+
+
+def test_bekleyenler_istisnayi_da_goruyor():
+    ob = SonucOnbellegi()
+    kapi, basladi = threading.Event(), threading.Event()
+
+    def patlayan():
+        basladi.set()
+        kapi.wait(5)
+        raise RuntimeError("kaynak kapalı")
+
+    hatalar = []
+
+    def cagir():
+        try:
+            ob.getir("k", patlayan)
+        except RuntimeError as exc:
+            hatalar.append(str(exc))
+
+    ilk = threading.Thread(target=cagir)
+    ilk.start()
+    assert basladi.wait(5)
+    ikinci = threading.Thread(target=cagir)
+    ikinci.start()
+    for _ in range(500):
+        if ob.istatistik()["birlesen"] == 1:
+            break
+        threading.Event().wait(0.01)
+    kapi.set()
+    ilk.join(5)
+    ikinci.join(5)
+    assert hatalar == ["kaynak kapalı"] * 2
+
+
+def test_disk_kopyasi_yeniden_acilista_yukleniyor(tmp_path, saat):
+    dosya = tmp_path / "onbellek.json"
+    ob = SonucOnbellegi(ttl=60, dosya=dosya, saat=saat)
+    ob.getir(sorgu_anahtari("Naruto", "TurkAnime", 10),
+             lambda: [{"slug": "naruto", "title": "Naruto"}])
+    assert dosya.exists()
+
+    yeni = SonucOnbellegi(ttl=60, dosya=dosya, saat=saat)
+    assert yeni.al(sorgu_anahtari("naruto", "TurkAnime", 10)) == [
+        {"slug": "naruto", "title": "Naruto"}]
+
+    saat.t += 61
+    eskimis = SonucOnbellegi(ttl=60, dosya=dosya, saat=saat)
+    assert len(eskimis) == 0 and eskimis.al(("naruto", "TurkAnime", 10)) is None
+
+
+def test_bozuk_disk_kopyasi_yok_sayiliyor(tmp_path):
+    dosya = tmp_path / "onbellek.json"
+    dosya.write_text("{bozuk", encoding="utf-8")
+    ob = SonucOnbellegi(dosya=dosya)
+    assert ob.getir("k", lambda: [1]) == [1]
+
+
+def test_anahtar_buyuk_kucuk_harf_ve_bosluk_duyarsiz():
+    assert sorgu_anahtari("  One   Piece ", "A", 10) == sorgu_anahtari("one piece", "A", 10)
+    assert sorgu_anahtari("Re:Zero", "A", 10) != sorgu_anahtari("Re Zero", "A", 10)
+    assert sorgu_anahtari("x", "A", 10) != sorgu_anahtari("x", "A", 8)
+    assert sorgu_anahtari("x", "A", 10) != sorgu_anahtari("x", "B", 10)
+
+
+# ── SearchEngine ile ────────────────────────────────────────────────────────
+class SayanAdapter:
+    def __init__(self, sonuc):
+        self.sonuc = sonuc
+        self.cagri = 0
+
+    def search_anime(self, query, limit=10):
+        self.cagri += 1
+        return list(self.sonuc)
+
+
+@pytest.fixture
+def motor_kur():
+    def _kur(**adapterler):
+        motor = SearchEngine()
+        motor.adapters = adapterler
+        return motor
+    return _kur
+
+
+def test_ikinci_motor_kaynaga_gitmiyor(motor_kur):
+    dolu = SayanAdapter([("cb", "Cowboy Bebop")])
+    bos = SayanAdapter([])
+
+    ilk = motor_kur(Dolu=dolu, Bos=bos).search_all_sources_rich("Cowboy Bebop")
+    ikinci = motor_kur(Dolu=dolu, Bos=bos).search_all_sources_rich("cowboy  bebop")
+
+    assert ilk == ikinci
+    assert dolu.cagri == 1
+    assert bos.cagri == 2, "boş sonuç (yutulmuş ağ hatası olabilir) saklanmamalı"
+
+
+def test_farkli_limit_ayri_anahtar(motor_kur):
+    dolu = SayanAdapter([("cb", "Cowboy Bebop")])
+    motor_kur(Dolu=dolu).search_all_sources_rich("bebop", limit_per_source=1)
+    motor_kur(Dolu=dolu).search_all_sources_rich("bebop", limit_per_source=8)
+    assert dolu.cagri == 2
+
+
+def test_donen_kayitlar_onbellegi_bozamiyor(motor_kur):
+    dolu = SayanAdapter([("cb", "Cowboy Bebop")])
+    ilk = motor_kur(Dolu=dolu).search_all_sources_rich("bebop")
+    ilk["Dolu"][0]["title"] = "değişti"
+    ilk["Dolu"].clear()
+
+    ikinci = motor_kur(Dolu=dolu).search_all_sources_rich("bebop")
+    assert ikinci["Dolu"] == [{"slug": "cb", "title": "Cowboy Bebop", "image": None}]
+
+
+def test_surec_geneli_tek_onbellek(monkeypatch, tmp_path):
+    monkeypatch.setattr(adapters_mod, "_arama_onbellegi", None)
+    monkeypatch.setattr(adapters_mod, "ARAMA_ONBELLEK_DOSYASI", tmp_path / "a.json")
+    ob = arama_onbellegi()
+    assert arama_onbellegi() is ob
+    assert ob.dosya == tmp_path / "a.json"
@@ -0,0 +1,335 @@
+"""Asenkron taşıma: tek olay döngüsü, kaynak süreleri, eşzamanlı cephe.
+
+Eskiden `SearchEngine` her sorguda kaynak başına bir thread açıyor, sunucunun
+`/search`'ü kaynakları sırayla arıyordu. Sahte adapterler ve yerel bir HTTP
+sunucusu kullanılır; ağa çıkılmaz. `pytest -s` ile süreler görünür.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import pytest
+
+from turkanime_api.common import adapters as adapters_mod
+from turkanime_api.common import asenkron, iptal
+from turkanime_api.common import title_match as tm
+from turkanime_api.common.adapters import AsyncSearchEngine
+from turkanime_api.common.iptal import IptalEdildi
+
+pytest.importorskip("curl_cffi")
+
+
+class YerelSunucu:
+    """Yolu JSON'a eşleyen HTTP/1.1 sunucusu; eşzamanlı isteği sayar."""
+
+    def __init__(self, yanitlar, gecikme: float = 0.0):
+        sunucu = self
+        self.eszamanli = self.en_cok_eszamanli = self.istek = 0
+        self._kilit = threading.Lock()
+
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                with sunucu._kilit:
+                    sunucu.istek += 1
+                    sunucu.eszamanli += 1
+                    sunucu.en_cok_eszamanli = max(sunucu.en_cok_eszamanli,
+                                                  sunucu.eszamanli)
+                try:
+                    time.sleep(gecikme)
+                    yol = urlparse(self.path)
+                    veri = yanitlar.get(yol.path + ("?" + yol.query if yol.query else ""),
+                                        yanitlar.get(yol.path))
+                    govde = json.dumps(veri).encode()
+                    self.send_response(200 if veri is not None else 404)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(govde)))
+                    self.end_headers()
+                    self.wfile.write(govde)
+                finally:
+                    with sunucu._kilit:
+                        sunucu.eszamanli -= 1
+
+            def log_message(self, *_a):
+                pass
+
+        self._srv = GenisKuyrukluSunucu(("127.0.0.1", 0), Isleyici)
+        self._srv.daemon_threads = True
+        threading.Thread(target=self._srv.serve_forever, daemon=True).start()
+        self.url = f"http://localhost:{self._srv.server_address[1]}/"
+
+    def kapat(self):
+        self._srv.shutdown()
+        self._srv.server_close()
+
+
+class GenisKuyrukluSunucu(ThreadingHTTPServer):
+    # Varsayılan dinleme kuyruğu 5: aynı anda gelen 8 bağlantının fazlası
+    # SYN tekrarına (~1 sn) kalıyor ve süre ölçümü rastgele bozuluyordu.
+    request_queue_size = 64
+
+
+class HizliAsenkron:
+    """Yerel asenkron yolu olan adapter; hangi thread'de koştuğunu kaydeder."""
+
+    def __init__(self, sonuc, gecikme=0.2):
+        self.sonuc, self.gecikme, self.threadler = sonuc, gecikme, []
+
+    def search_anime(self, query, limit=10):       # pragma: no cover - kullanılmamalı
+        raise AssertionError("asenkron motor eşzamanlı yola düşmemeli")
+
+    async def search_anime_async(self, query, limit=10):
+        self.threadler.append(threading.current_thread().name)
+        await asyncio.sleep(self.gecikme)
+        return list(self.sonuc)
+
+
+class YavasEszamanli:
+    """Yalnızca eşzamanlı adapter: iptal edilene ya da süre dolana kadar bekler."""
+
+    def __init__(self, sure=5.0):
+        self.sure = sure
+        self.iptal_goruldu = threading.Event()
+
+    def search_anime(self, query, limit=10):
+        if iptal.gecerli().bekle(self.sure):
+            self.iptal_goruldu.set()
+            return []
+        return [("gec", "Geç Gelen")]
+
+
+# ── asenkron ───────────────────────────────────────────────────────────────
+def test_getir_istekleri_tek_threadde_es_zamanli_yapiyor():
+    sunucu = YerelSunucu({"/yavas": {"tamam": True}}, gecikme=0.2)
+
+    async def _hepsi():
+        try:
+            t0 = time.perf_counter()
+            yanitlar = await asyncio.gather(
+                *(asenkron.getir_json(sunucu.url + "yavas", timeout=5) for _ in range(8)))
+            return yanitlar, time.perf_counter() - t0
+        finally:
+            await asenkron.oturumlari_kapat()
+
+    try:
+        yanitlar, sure = asenkron.calistir(_hepsi())
+    finally:
+        sunucu.kapat()
+    print(f"\n8 × 0.2 sn istek: {sure:.2f} sn")
+    assert yanitlar == [{"tamam": True}] * 8
+    assert sunucu.en_cok_eszamanli > 1
+    assert sure < 0.2 * 8 / 2
+
+
+def test_calistir_cagiranin_iptalini_goreve_tasiyor():
+    baglam = iptal.IptalBaglami()
+    goruldu = threading.Event()
+
+    async def _uzun():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            goruldu.set()
+            raise
+
+    threading.Timer(0.1, baglam.iptal).start()
+    t0 = time.perf_counter()
+    with iptal.etkin(baglam), pytest.raises(IptalEdildi):
+        asenkron.calistir(_uzun())
+    assert time.perf_counter() - t0 < 2
+    assert goruldu.wait(2)
+
+
+def test_thread_ile_gorev_iptalinde_thread_baglamini_iptal_ediyor():
+    adapter = YavasEszamanli(sure=5)
+
+    async def _kes():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(asenkron.thread_ile(adapter.search_anime, "x"), 0.1)
+
+    asenkron.calistir(_kes())
+    assert adapter.iptal_goruldu.wait(2)
+
+
+def test_calistir_dongunun_icinden_reddediliyor():
+    async def _ic():
+        coro = asyncio.sleep(0)
+        try:
+            asenkron.calistir(coro)
+        finally:
+            coro.close()
+
+    with pytest.raises(RuntimeError):
+        asenkron.calistir(_ic())
+
+
+# ── AsyncSearchEngine ──────────────────────────────────────────────────────
+def motor(**adapters):
+    return AsyncSearchEngine(adapters)
+
+
+def test_kaynaklar_tek_dongude_ve_es_zamanli_kosuyor():
+    hizlilar = {f"K{i}": HizliAsenkron([(f"s{i}", f"Bebop {i}")]) for i in range(8)}
+    m = motor(**hizlilar)
+    t0 = time.perf_counter()
+    sonuc = m.search_all_sources_rich("bebop")
+    sure = time.perf_counter() - t0
+
+    print(f"\n8 kaynak × 0.2 sn: {sure:.2f} sn")
+    assert sure < 0.2 * 8 / 2
+    assert {ad: [k["slug"] for k in v] for ad, v in sonuc.items()} == {
+        f"K{i}": [f"s{i}"] for i in range(8)}
+    kosulan = {t for a in hizlilar.values() for t in a.threadler}
+    assert kosulan == {"asenkron-dongu"}
+
+
+def test_kaynak_suresi_dolan_kaynak_iptal_edilip_birakiliyor(monkeypatch):
+    monkeypatch.setattr(adapters_mod, "KAYNAK_SURELERI", {"Yavas": 0.3})
+    yavas = YavasEszamanli(sure=5)
+    m = motor(Hizli=HizliAsenkron([("h", "Hızlı")], gecikme=0), Yavas=yavas)
+
+    t0 = time.perf_counter()
+    sonuc = m.search_all_sources_rich("bebop")
+    sure = time.perf_counter() - t0
+
+    assert sure < 1.5
+    assert [k["slug"] for k in sonuc["Hizli"]] == ["h"] and sonuc["Yavas"] == []
+    assert m.son_olcum.yetismeyen == ["Yavas"]
+    assert set(m.son_olcum.kaynaklar) == {"Hizli"}
+    assert yavas.iptal_goruldu.wait(2), "süresi dolan kaynağın isteği kesilmeli"
+
+
+def test_geri_cagri_aramayi_baslatan_threadde():
+    m = motor(A=HizliAsenkron([("a", "A")], gecikme=0),
+              B=HizliAsenkron([("b", "B")], gecikme=0.05))
+    threadler = []
+    m.search_all_sources_rich("x", on_result=lambda ad, _k: threadler.append(
+        (ad, threading.current_thread() is threading.main_thread())))
+    assert threadler == [("A", True), ("B", True)]
+
+
+def test_akistan_erken_cikis_kalanlari_iptal_ediyor():
+    yavas = YavasEszamanli(sure=5)
+    m = motor(Hizli=HizliAsenkron([("h", "H")], gecikme=0), Yavas=yavas)
+    akis = m.search_all_sources_rich_iter("x")
+    assert next(akis)[0] == "Hizli"
+    akis.close()
+    assert yavas.iptal_goruldu.wait(2)
+
+
+def test_cagiran_iptal_edilince_akis_sessizce_bitiyor():
+    yavas = YavasEszamanli(sure=5)
+    baglam = iptal.IptalBaglami()
+    threading.Timer(0.1, baglam.iptal).start()
+    with iptal.etkin(baglam):
+        sonuc = motor(Yavas=yavas).search_all_sources_rich("x")
+    assert sonuc == {"Yavas": []}
+    assert yavas.iptal_goruldu.wait(2)
+
+
+def test_sonuclar_ortak_onbellege_yaziliyor():
+    a = HizliAsenkron([("a", "Bebop")], gecikme=0)
+    motor(A=a).search_all_sources_rich("Bebop")
+    motor(A=a).search_all_sources_rich("bebop")
+    assert len(a.threadler) == 1
+
+
+def test_cok_dilli_arama_esz_yolla_ayni_sonucu_veriyor():
+    veri = {"one piece": [("op", "One Piece")],
+            "wan pisu": [("op", "One Piece"), ("op2", "One Piece Film")],
+            "ワンピース": [("x", "Baska")]}
+    aliaslar = list(veri)
+
+    class Alias:
+        async def search_anime_async(self, query, limit=10):
+            await asyncio.sleep(0.05)
+            return veri.get(query, [])
+
+    esz = tm.multilang_search(lambda a: veri.get(a, []), "one piece",
+                              aliases=aliaslar, erken_cik=False)
+    asenk = motor(A=Alias(), B=Alias()).multilang_search_all(
+        "one piece", aliases=aliaslar, erken_cik=False)
+    assert set(asenk) == {"A", "B"}
+    for yanit in asenk.values():
+        assert yanit.exact == esz.exact and yanit.possible == esz.possible
+        assert yanit.aliases == aliaslar
+
+
+# ── AnimeciX asenkron yolu ─────────────────────────────────────────────────
+@pytest.fixture
+def cix_sunucusu(monkeypatch):
+    from turkanime_api.sources import animecix
+
+    yanitlar = {
+        "/secure/search/cowboy-bebop": {"results": [
+            {"id": 1, "name": "Cowboy Bebop"}, {"id": None, "name": "bozuk"}]},
+        "/secure/titles/1": {"title": {"videos": [{"id": 77}],
+                                       "seasons": [{}, {}, {}]}},
+    }
+    for s in range(1, 4):
+        yanitlar[f"/secure/related-videos?episode=1&season={s}&titleId=1&videoId=77"] = {
+            "videos": [{"name": f"{s}. Sezon {b}. Bölüm", "url": f"izle/{s}/{b}",
+                        "season_num": s} for b in (1, 2)]}
+    sunucu = YerelSunucu(yanitlar, gecikme=0.15)
+    monkeypatch.setattr(animecix, "BASE_URL", sunucu.url)
+    monkeypatch.setattr(animecix, "ALT_URL", sunucu.url)
+    monkeypatch.setattr(animecix, "HAS_CF_BYPASS", False)
+    monkeypatch.setattr(animecix, "_cf_session", None)
+    yield animecix, sunucu
+    sunucu.kapat()
+
+
+def test_animecix_asenkron_arama_ve_bolumler(cix_sunucusu):
+    animecix, sunucu = cix_sunucusu
+    assert asenkron.calistir(animecix.search_animecix_async("cowboy bebop")) == [
+        ("1", "Cowboy Bebop")]
+
+    t0 = time.perf_counter()
+    asenk = asenkron.calistir(animecix.get_episodes_async(1))
+    asenk_sure = time.perf_counter() - t0
+    sunucu.en_cok_eszamanli = 0
+    t0 = time.perf_counter()
+    esz = animecix.CixAnime("1", "Cowboy Bebop").episodes
+    esz_sure = time.perf_counter() - t0
+
+    print(f"\nAnimeciX bölümleri: eşzamanlı {esz_sure:.2f} sn, asenkron {asenk_sure:.2f} sn")
+    assert asenk == esz and len(asenk) == 6
+    assert asenk_sure < esz_sure
+
+
+def test_animecix_adapteri_asenkron_yolu_kullaniyor(cix_sunucusu):
+    sonuc = motor(AnimeciX=adapters_mod.AnimeciXAdapter()).search_all_sources_rich(
+        "cowboy bebop")
+    assert [k["slug"] for k in sonuc["AnimeciX"]] == ["1"]
+
+
+# ── Sunucu ─────────────────────────────────────────────────────────────────
+def test_sunucu_aramasi_kaynaklari_es_zamanli_yapiyor(monkeypatch):
+    pytest.importorskip("flask")
+    sunucu_app = pytest.importorskip("turkanime_server.app")
+
+    def _yavas(sonuc):
+        def _ara(q):
+            time.sleep(0.3)
+            return sonuc
+        return _ara
+
+    monkeypatch.setattr(sunucu_app, "SOURCES", {
+        f"k{i}": {"search": _yavas([(f"s{i}", "Cowboy Bebop")])} for i in range(4)})
+    monkeypatch.setattr(sunucu_app, "get_title_aliases", lambda q: [q])
+    t0 = time.perf_counter()
+    yanit = sunucu_app.app.test_client().get("/search?q=Cowboy Bebop")
+    sure = time.perf_counter() - t0
+
+    print(f"\n/search 4 kaynak × 0.3 sn: {sure:.2f} sn")
+    assert yanit.status_code == 200
+    sonuclar = yanit.get_json()["results"]
+    assert {k: [r["id"] for r in v["exact"]] for k, v in sonuclar.items()} == {
+        f"k{i}": [f"s{i}"] for i in range(4)}
+    assert sure < 0.3 * 4 / 2
@@ -0,0 +1,60 @@
+"""Tablo tabanlı `_normalize`, eski NFKD + regex hattıyla BİREBİR aynı mı?
+
+`_normalize` her çağrıda NFKD ayrıştırması, karakter karakter birleşik iz
+filtresi ve bir regex çalıştırıyordu; `fuzzy_score`, `siralama_skoru` ve
+tarayıcının kümelemesi aynı başlıkları defalarca normalize ediyor. Artık
+sonuç sınırlı LRU'da tutuluyor ve ıskalamada tek `str.translate` geçişi
+yapılıyor. Referans hat `_normalize_nfkd` adıyla modülde duruyor.
+"""
+import random
+
+import pytest
+
+import turkanime_api.common.title_match as tm
+
+tablo = tm._normalize.__wrapped__
+
+
+@pytest.mark.parametrize("blok", range(0, 0x30000, 0x1000))
+def test_her_karakter_ayni(blok):
+    for kod in range(blok, blok + 0x1000):
+        if 0xD800 <= kod < 0xE000:
+            continue
+        c = chr(kod)
+        for s in (c, f"a{c}b", c + c, f"{c} {c}"):
+            assert tablo(s) == tm._normalize_nfkd(s), hex(kod)
+
+
+def test_rastgele_dizgiler_ayni():
+    rnd = random.Random(3)
+    havuz = list("aAzZ09 -:;!?~") + list("İıŞşĞğÜüÖöÇçéèêÉ́̇ﬁ½ΣσςẞßⅫ①") + \
+        [chr(rnd.randrange(0x80, 0x3000)) for _ in range(300)]
+    for _ in range(20000):
+        s = "".join(rnd.choice(havuz) for _ in range(rnd.randint(0, 16)))
+        assert tablo(s) == tm._normalize_nfkd(s), repr(s)
+
+
+@pytest.mark.parametrize("baslik,beklenen", [
+    ("Şeytan Öldüren: Kimetsu no Yaiba", "seytan olduren kimetsu no yaiba"),
+    ("Steins;Gate", "steins gate"),
+    ("  Pokémon  (2019) ", "pokemon 2019"),
+    ("", ""),
+    ("!!!", ""),
+])
+def test_bilinen_ciktilar(baslik, beklenen):
+    assert tm._normalize(baslik) == beklenen
+
+
+def test_lru_sinirli_ve_isabet_sayiyor():
+    tm._normalize.cache_clear()
+    tm._normalize("One Piece")
+    tm._normalize("One Piece")
+    bilgi = tm._normalize.cache_info()
+    assert bilgi.hits == 1 and bilgi.misses == 1
+    assert bilgi.maxsize == tm._NORMALIZE_ONBELLEK
+
+
+def test_kiyasla_uc_yolu_olcer():
+    olcum = tm.normalize_kiyasla(tekrar=200)
+    assert olcum["ayni"] is True
+    assert min(olcum["referans_us"], olcum["tablo_us"], olcum["onbellek_us"]) > 0
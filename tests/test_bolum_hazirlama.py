@@ -0,0 +1,183 @@
+"""Bölüm listesi arka planda hazırlanıyor; sonuç modele tek seferde yerleşiyor.
+
+`EpisodePage` çok kaynaklı listede `merge_episodes`'i (her başlık için regex)
+ve geçmiş/ayar dosyası okumasını GUI thread'inde yapıyordu; büyük listelerde
+pencere donuyordu. Artık hazırlık havuzda, sayfa o sırada iskelet çiziyor ve
+aynı animenin tekrar açılışında birleştirme planı önbellekten geliyor.
+
+Ölçüm `pytest -s` ile görünür.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from turkanime_api.common.episode_parser import merge_episodes  # noqa: E402
+from turkanime_api.gui.qt import prefs  # noqa: E402
+from turkanime_api.gui.qt.pages import episodes as episodes_mod  # noqa: E402
+from turkanime_api.gui.qt.pages.episodes import (  # noqa: E402
+    EpisodePage, clear_merge_cache, merge_cached,
+)
+
+ADET = 1500
+
+
+def kaynaklar(adet=ADET):
+    return {
+        "TürkAnime": [{"title": f"One Piece {i}. Bölüm", "obj": object()}
+                      for i in range(1, adet + 1)],
+        "AnimeciX": [{"title": f"{i}. Bölüm", "obj": object()}
+                     for i in range(1, adet + 1)],
+        "Anizle": [{"title": f"Bölüm {i}", "obj": object()}
+                   for i in range(1, adet + 1, 2)],
+    }
+
+
+@pytest.fixture(autouse=True)
+def temiz_onbellek():
+    clear_merge_cache()
+    yield
+    clear_merge_cache()
+
+
+@pytest.fixture
+def page(qtbot):
+    widget = EpisodePage()
+    qtbot.addWidget(widget)
+    return widget
+
+
+@pytest.fixture
+def birlestirme(monkeypatch):
+    """`merge_episodes` çağrılarını (ve thread'ini) kaydet; istenirse beklet."""
+    kayit = {"threadler": [], "kapi": None}
+
+    def sarmal(sources, title=""):
+        kayit["threadler"].append(threading.current_thread())
+        if kayit["kapi"] is not None:
+            kayit["kapi"].wait(5)
+        return merge_episodes(sources, title)
+
+    monkeypatch.setattr(episodes_mod, "merge_episodes", sarmal)
+    return kayit
+
+
+def test_birlestirme_ve_gecmis_gui_threadinde_degil(qtbot, page, birlestirme,
+                                                    monkeypatch):
+    okuyan: list = []
+    asil_oku, asil_yukle = prefs.oku, prefs.Gecmis.yukle
+    monkeypatch.setattr(prefs, "oku", lambda: okuyan.append(
+        threading.current_thread()) or asil_oku())
+    monkeypatch.setattr(prefs.Gecmis, "yukle", classmethod(
+        lambda cls: okuyan.append(threading.current_thread()) or asil_yukle()))
+
+    with qtbot.waitSignal(page.list_ready, timeout=5000):
+        page.load("TürkAnime", "op", "One Piece", episodes=kaynaklar(20))
+
+    ana = threading.main_thread()
+    assert birlestirme["threadler"] and ana not in birlestirme["threadler"]
+    assert okuyan and ana not in okuyan
+    assert page.model.rowCount() == 20
+
+
+def test_hazirlanirken_iskelet_sonra_tek_sifirlama(qtbot, page, birlestirme):
+    kapi = birlestirme["kapi"] = threading.Event()
+    olaylar: list = []
+    page.model.modelReset.connect(lambda: olaylar.append("reset"))
+    page.model.rowsInserted.connect(lambda *a: olaylar.append("insert"))
+
+    page.load("TürkAnime", "op", "One Piece", episodes=kaynaklar(50))
+    assert page.view.is_skeleton()
+    assert page.model.rowCount() == 0
+    assert "hazırlanıyor" in page.lblStatus.text()
+    olaylar.clear()
+
+    with qtbot.waitSignal(page.list_ready, timeout=5000):
+        kapi.set()
+    assert not page.view.is_skeleton()
+    assert olaylar == ["reset"], "liste parça parça yerleşti"
+    assert page.model.rowCount() == 50
+    assert page.lblTitle.text() == "One Piece — 3 kaynak"
+
+
+def test_eski_hazirlik_yeni_listeyi_ezmiyor(qtbot, page, birlestirme):
+    kapi = birlestirme["kapi"] = threading.Event()
+    page.load("TürkAnime", "op", "One Piece", episodes=kaynaklar(30))
+    qtbot.waitUntil(lambda: bool(birlestirme["threadler"]), timeout=5000)
+    birlestirme["kapi"] = None
+    with qtbot.waitSignal(page.list_ready, timeout=5000):
+        page.load("TürkAnime", "tr", "Trigun", episodes=kaynaklar(3))
+
+    kapi.set()
+    qtbot.wait(100)
+    assert page.model.rowCount() == 3
+    assert page.lblTitle.text() == "Trigun — 3 kaynak"
+
+
+# ── Önbellek ────────────────────────────────────────────────────────────────
+def test_onbellekten_gelen_liste_birlestirmeyle_ayni():
+    yuk = kaynaklar(40)
+    ilk = merge_cached(yuk, "One Piece")
+    ikinci = merge_cached(yuk, "One Piece")
+    assert ikinci == ilk == merge_episodes(yuk, "One Piece")
+
+
+def test_ayni_anime_tekrar_acilinca_birlestirilmiyor(qtbot, page, birlestirme):
+    for _ in range(2):
+        # Her açılış yeni bir çekim: aynı içerik, yeni `Bolum` nesneleri.
+        yuk = kaynaklar(40)
+        with qtbot.waitSignal(page.list_ready, timeout=5000):
+            page.load("TürkAnime", "op", "One Piece", episodes=yuk)
+    assert len(birlestirme["threadler"]) == 1
+
+    # Satırlar son yükün kayıtlarını taşıyor, önbellekteki eskileri değil.
+    ilk = page.model.episode(0)["sources"]
+    assert ilk["TürkAnime"] is yuk["TürkAnime"][0]
+    assert ilk["AnimeciX"] is yuk["AnimeciX"][0]
+
+
+def test_yeni_bolum_gelince_yeniden_birlestiriliyor(birlestirme):
+    yuk = kaynaklar(10)
+    merge_cached(yuk, "One Piece")
+    yuk["AnimeciX"].append({"title": "11. Bölüm", "obj": object()})
+    satirlar = merge_cached(yuk, "One Piece")
+    assert len(birlestirme["threadler"]) == 2
+    assert len(satirlar) == 11
+
+    merge_cached(yuk, "Başka Anime")
+    assert len(birlestirme["threadler"]) == 3
+
+
+def test_onbellek_sinirli(monkeypatch):
+    monkeypatch.setattr(episodes_mod, "MERGE_CACHE_SIZE", 2)
+    for ad in "abc":
+        merge_cached(kaynaklar(2), ad)
+    assert len(episodes_mod._merge_cache) == 2
+
+
+# ── Ölçüm ───────────────────────────────────────────────────────────────────
+def test_gui_thread_durmasi_olcumu(qtbot, page):
+    yuk = kaynaklar()
+    t0 = time.perf_counter()
+    merge_episodes(yuk, "One Piece")
+    eski = time.perf_counter() - t0
+
+    with qtbot.waitSignal(page.list_ready, timeout=10000):
+        t0 = time.perf_counter()
+        page.load("TürkAnime", "op", "One Piece", episodes=yuk)
+        yeni = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with qtbot.waitSignal(page.list_ready, timeout=10000):
+        page.load("TürkAnime", "op", "One Piece", episodes=kaynaklar())
+    tekrar = time.perf_counter() - t0
+
+    print(f"\n{ADET} bölüm x 3 kaynak: eski GUI duraklaması (yalnız birleştirme) "
+          f"{eski * 1000:.0f} ms, yeni load() {yeni * 1000:.1f} ms, "
+          f"tekrar açılış (önbellek) {tekrar * 1000:.0f} ms")
+    assert yeni < eski
+    assert page.model.rowCount() == ADET
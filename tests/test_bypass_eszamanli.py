@@ -0,0 +1,191 @@
+"""`bypass.fetch` eşzamanlı çağrılar altında: ortak çerez, tek kurulum, tek çözüm.
+
+Eskiden tüm thread'ler tek bir curl_cffi oturumunu paylaşıyor, her 403'te
+yeni bir `CFSession` kurup challenge'ı baştan çözüyordu. Sunucu yerel; CF
+yedeği sahte (gerçek çözücüye ve ağa çıkılmaz).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("curl_cffi")
+
+from turkanime_api import bypass  # noqa: E402
+from turkanime_api.common import oturum_havuzu  # noqa: E402
+
+CAGIRAN = 32
+
+
+class SiteSunucusu:
+    """Ana sayfada çerez veren, `/engel` için `cf_clearance` isteyen sunucu."""
+
+    def __init__(self, gecikme: float = 0.05):
+        sunucu = self
+        self.ana_sayfa = 0
+        self.eszamanli = self.en_cok_eszamanli = 0
+        self._kilit = threading.Lock()
+
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                with sunucu._kilit:
+                    sunucu.eszamanli += 1
+                    sunucu.en_cok_eszamanli = max(sunucu.en_cok_eszamanli,
+                                                  sunucu.eszamanli)
+                try:
+                    self._cevapla()
+                finally:
+                    with sunucu._kilit:
+                        sunucu.eszamanli -= 1
+
+            def _cevapla(self):
+                cerez = self.headers.get("Cookie") or ""
+                durum, ek = 200, {}
+                if self.path == "/":
+                    with sunucu._kilit:
+                        sunucu.ana_sayfa += 1
+                    ek["Set-Cookie"] = "PHPSESSID=abc; Path=/"
+                    govde = b"ana sayfa"
+                else:
+                    time.sleep(gecikme)
+                    if self.path.startswith("/engel") and "cf_clearance" not in cerez:
+                        durum = 403
+                    oturum = "PHPSESSID=abc" in cerez
+                    govde = f"{self.path} {oturum}".encode()
+                self.send_response(durum)
+                for ad, deger in ek.items():
+                    self.send_header(ad, deger)
+                self.send_header("Content-Length", str(len(govde)))
+                self.end_headers()
+                self.wfile.write(govde)
+
+            def log_message(self, *_a):
+                pass
+
+        self._srv = ThreadingHTTPServer(("127.0.0.1", 0), Isleyici)
+        self._srv.daemon_threads = True
+        threading.Thread(target=self._srv.serve_forever, daemon=True).start()
+        # `localhost`: http.cookiejar IP adresine çerez yazmıyor.
+        self.url = f"http://localhost:{self._srv.server_address[1]}"
+
+    def kapat(self):
+        self._srv.shutdown()
+        self._srv.server_close()
+
+
+class SahteCF:
+    """Challenge'ı "çözen" yedek: yavaş, `cf_clearance` çerezi bırakır."""
+
+    kurulan: list = []
+
+    def __init__(self):
+        self.cozum = 0
+        self.eszamanli = self.en_cok_eszamanli = 0
+        self._kilit = threading.Lock()
+        self.last_method = "sahte"
+        self.cookies = {}
+        SahteCF.kurulan.append(self)
+
+    def get(self, url, headers=None, **_kw):
+        with self._kilit:
+            self.eszamanli += 1
+            self.en_cok_eszamanli = max(self.en_cok_eszamanli, self.eszamanli)
+            self.cozum += 1
+        time.sleep(0.2)
+        self.cookies = {"cf_clearance": "tamam"}
+        with self._kilit:
+            self.eszamanli -= 1
+        return SimpleNamespace(status_code=200, text=f"{url} cozuldu", url=url)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def site(monkeypatch):
+    s = SiteSunucusu()
+    SahteCF.kurulan = []
+    bypass.reset_session()
+    monkeypatch.setattr(bypass, "BASE_URL", s.url)
+    monkeypatch.setattr(bypass, "_get_cf_session", SahteCF)
+    yield s
+    bypass.reset_session()
+    s.kapat()
+
+
+def ayni_anda(fn, n=CAGIRAN):
+    """``fn(i)``'yi ``n`` thread'de aynı anda başlat; sonuçlar ve hatalar."""
+    engel = threading.Barrier(n)
+    sonuc: dict = {}
+    hatalar: list = []
+
+    def _is(i):
+        engel.wait()
+        try:
+            sonuc[i] = fn(i)
+        except Exception as exc:           # pragma: no cover - teşhis için
+            hatalar.append(exc)
+
+    isciler = [threading.Thread(target=_is, args=(i,)) for i in range(n)]
+    for t in isciler:
+        t.start()
+    for t in isciler:
+        t.join(60)
+    return sonuc, hatalar
+
+
+def test_eszamanli_cagrilar_dogru_cevabi_aliyor(site):
+    sonuc, hatalar = ayni_anda(lambda i: bypass.fetch(f"/bolum/{i}"))
+
+    assert hatalar == []
+    assert sonuc == {i: f"/bolum/{i} True" for i in range(CAGIRAN)}
+    assert site.ana_sayfa == 1                      # kurulum bir kez
+    assert site.en_cok_eszamanli <= oturum_havuzu.HOST_BASINA_AZAMI
+    sayac = oturum_havuzu.istatistikler()["localhost"]
+    print(f"\n{CAGIRAN} eşzamanlı fetch: {sayac}")
+    assert sayac["istek"] == CAGIRAN + 1
+    assert sayac["el_sikisma"] <= oturum_havuzu.HOST_BASINA_AZAMI
+    assert SahteCF.kurulan == []                    # yedeğe hiç düşülmedi
+
+
+def test_engel_firtinasinda_challenge_bir_kez_cozuluyor(site):
+    sonuc, hatalar = ayni_anda(lambda i: bypass.fetch(f"/engel/{i}"))
+
+    assert hatalar == []
+    assert len(sonuc) == CAGIRAN
+    for i, metin in sonuc.items():
+        # Ya çözümü yapan thread'in cevabı ya da ortak çerezle geçen istek.
+        assert metin in (f"{site.url}/engel/{i} cozuldu", f"/engel/{i} True")
+    assert len(SahteCF.kurulan) == 1                # domain başına tek yedek
+    cf = SahteCF.kurulan[0]
+    assert cf.cozum == 1 and cf.en_cok_eszamanli == 1
+    assert bypass.session.cookies.get("cf_clearance") == "tamam"
+
+    # Çözüm ortak kavanozda: sonraki istekler yedeğe uğramadan geçiyor.
+    assert bypass.fetch("/engel/son") == "/engel/son True"
+    assert cf.cozum == 1
+
+
+def test_yedek_siniri_eszamanli_cozumu_kisiyor(site, monkeypatch):
+    monkeypatch.setattr(bypass, "YEDEK_HOST_BASINA", 2)
+
+    class Inatci(SahteCF):
+        # Çerez bırakmıyor: her bekleyen thread gerçekten çözüme gider.
+        def get(self, url, headers=None, **kw):
+            yanit = super().get(url, headers, **kw)
+            self.cookies = {}
+            return yanit
+
+    monkeypatch.setattr(bypass, "_get_cf_session", Inatci)
+    sonuc, hatalar = ayni_anda(lambda i: bypass.fetch(f"/engel/{i}"), n=8)
+
+    assert hatalar == [] and len(sonuc) == 8
+    cf = SahteCF.kurulan[0]
+    assert len(SahteCF.kurulan) == 1
+    assert cf.en_cok_eszamanli == 2
@@ -0,0 +1,277 @@
+"""Cloudflare izin deposu: çözülen challenge süreç yeniden başlayınca da geçerli.
+
+Eskiden her açılış `CFSession` zincirini baştan yürüyordu; QtWebEngine
+çözücüsünün çerezleri oturumla ölüyordu. Sunucu yerel ve `cf_clearance` +
+doğru UA görmedikçe challenge sayfası döndürüyor; çözücü sahte (alt süreç
+açılmaz, ağa çıkılmaz).
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from turkanime_api.common import cf_bypass, izin_deposu
+from turkanime_api.common.izin_deposu import AZAMI_OMUR, VARSAYILAN_OMUR, IzinDeposu
+
+pytest.importorskip("curl_cffi")
+
+UA = "Mozilla/5.0 (X11; Linux x86_64) IzinTesti/1.0"
+CHALLENGE = b"<html><title>Just a moment...</title></html>"
+
+
+class KorumaliSunucu:
+    """`cf_clearance=tamam` ve `UA` olmadan challenge (403) döndüren site."""
+
+    def __init__(self):
+        sunucu = self
+        self.istekler: list = []
+
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                cerez = self.headers.get("Cookie") or ""
+                izinli = ("cf_clearance=tamam" in cerez
+                          and self.headers.get("User-Agent") == UA)
+                sunucu.istekler.append((self.path, izinli))
+                govde = f"icerik {self.path}".encode() if izinli else CHALLENGE
+                self.send_response(200 if izinli else 403)
+                self.send_header("Content-Length", str(len(govde)))
+                self.end_headers()
+                self.wfile.write(govde)
+
+            def log_message(self, *_a):
+                pass
+
+        self._srv = ThreadingHTTPServer(("127.0.0.1", 0), Isleyici)
+        self._srv.daemon_threads = True
+        threading.Thread(target=self._srv.serve_forever, daemon=True).start()
+        # `localhost`: http.cookiejar IP adresine çerez yazmıyor.
+        self.url = f"http://localhost:{self._srv.server_address[1]}"
+
+    def kapat(self):
+        self._srv.shutdown()
+        self._srv.server_close()
+
+
+@pytest.fixture
+def site():
+    s = KorumaliSunucu()
+    yield s
+    s.kapat()
+
+
+class Saat:
+    def __init__(self):
+        self.simdi = 1_000_000.0
+
+    def __call__(self):
+        return self.simdi
+
+
+def yeniden_baslat():
+    """Süreç yeniden başlamış gibi: depo diskten yeniden okunur."""
+    izin_deposu._depo = None
+    return izin_deposu.depo()
+
+
+def zinciri_kapat(monkeypatch, cagrilar):
+    """Zincirin bütün basamaklarını çağrı kaydeden boş sahtelerle değiştir."""
+    for ad in ("_try_curl_cffi", "_try_cloudscraper", "_try_flaresolverr",
+               "_try_qtwebengine", "_try_requests_fallback"):
+        monkeypatch.setattr(cf_bypass.CFSession, ad,
+                            lambda self, *a, _ad=ad, **k: cagrilar.append(_ad))
+
+
+# ── Depo ────────────────────────────────────────────────────────────────────
+def test_izin_diske_yazilip_yeniden_okunuyor(tmp_path):
+    dosya = tmp_path / "izin.json"
+    saat = Saat()
+    IzinDeposu(dosya, saat=saat).koy("https://www.ornek.test/a", {"cf_clearance": "x"},
+                                     user_agent=UA, kaynak="qtwebengine")
+
+    izin = IzinDeposu(dosya, saat=saat).al("www.ornek.test")
+    assert izin.cerezler == {"cf_clearance": "x"} and izin.user_agent == UA
+    assert izin.kaynak == "qtwebengine"
+    assert izin.bitis == saat.simdi + VARSAYILAN_OMUR
+    if sys.platform != "win32":
+        assert oct(os.stat(dosya).st_mode & 0o777) == "0o600"
+
+
+def test_sure_dolunca_izin_okunmuyor():
+    saat = Saat()
+    depo = IzinDeposu(saat=saat)
+    depo.koy("ornek.test", {"cf_clearance": "x"}, bitis=saat.simdi + 60)
+    saat.simdi += 59
+    assert depo.al("ornek.test") is not None
+    saat.simdi += 2
+    assert depo.al("ornek.test") is None and len(depo) == 0
+
+
+def test_cerezin_uzun_omru_sinirlaniyor():
+    saat = Saat()
+    depo = IzinDeposu(saat=saat)
+    depo.koy("ornek.test", {"cf_clearance": "x"}, bitis=saat.simdi + 365 * 86400)
+    assert depo.al("ornek.test").bitis == saat.simdi + AZAMI_OMUR
+
+
+def test_alt_alan_ust_domainin_iznini_kullaniyor_ve_gecersiz_kiliyor():
+    depo = IzinDeposu()
+    depo.koy("ornek.test", {"cf_clearance": "x"})
+    assert depo.al("https://www.ornek.test/b").alan == "ornek.test"
+    assert depo.al("baska.test") is None
+    assert depo.gecersiz_kil("www.ornek.test") is True
+    assert depo.al("ornek.test") is None
+    assert depo.istatistik()["gecersiz"] == 1
+
+
+def test_bozuk_dosya_bos_sayiliyor(tmp_path):
+    dosya = tmp_path / "izin.json"
+    dosya.write_text("{bozuk", encoding="utf-8")
+    depo = IzinDeposu(dosya)
+    assert depo.al("ornek.test") is None
+    depo.koy("ornek.test", {"cf_clearance": "x"})
+    assert json.loads(dosya.read_text(encoding="utf-8"))["ornek.test"]["cerezler"]
+
+
+# ── CFSession ───────────────────────────────────────────────────────────────
+class SahteCozucu:
+    """`cf_qt_solver` alt sürecinin stdin/stdout'u; tek cevap verir."""
+
+    def __init__(self, cevap):
+        self._cevap = json.dumps(cevap) + "\n"
+        self.stdin = self
+        self.stdout = self
+        self.istekler: list = []
+
+    def write(self, satir):
+        self.istekler.append(json.loads(satir))
+
+    def flush(self):
+        pass
+
+    def readline(self):
+        return self._cevap
+
+
+def test_cozulen_challenge_yeni_surecte_zinciri_atliyor(site, monkeypatch):
+    bitis = int(izin_deposu.time.time()) + 3600
+    cozucu = SahteCozucu({
+        "ok": True, "status": 200, "html": "<html>icerik /</html>", "url": site.url + "/",
+        "cookies": {"cf_clearance": "tamam", "baska_site": "y"},
+        "cookie_domains": {"cf_clearance": "localhost", "baska_site": "baska.test"},
+        "cookie_expires": {"cf_clearance": bitis, "baska_site": 0},
+        "user_agent": UA,
+    })
+    monkeypatch.setattr(cf_bypass.CFSession, "_get_qt_solver", lambda self: cozucu)
+    ilk = cf_bypass.CFSession(flaresolverr_url="", max_retries=1)
+    yanit = ilk._try_qtwebengine(site.url + "/")
+    assert yanit.status_code == 200 and ilk.last_method == "qtwebengine"
+
+    izin = yeniden_baslat().al(site.url)
+    assert izin.cerezler == {"cf_clearance": "tamam"}      # yalnızca bu host
+    assert izin.user_agent == UA and izin.bitis == bitis
+
+    # Yeni süreç: zincirin hiçbir basamağına gidilmeden içerik geliyor.
+    cagrilar: list = []
+    zinciri_kapat(monkeypatch, cagrilar)
+    oturum = cf_bypass.CFSession(flaresolverr_url="", max_retries=1)
+    yanit = oturum.get(site.url + "/bolum")
+    assert yanit.text == "icerik /bolum"
+    assert oturum.last_method == "izin (qtwebengine)"
+    assert cagrilar == []
+    assert oturum.cookies["cf_clearance"] == "tamam"
+
+
+def test_challenge_yeniden_gorulunce_izin_siliniyor(site, monkeypatch):
+    izin_deposu.depo().koy(site.url, {"cf_clearance": "eskimis"}, user_agent=UA)
+    cagrilar: list = []
+    zinciri_kapat(monkeypatch, cagrilar)
+    oturum = cf_bypass.CFSession(flaresolverr_url="", max_retries=1)
+    with pytest.raises(cf_bypass.CFBypassError):
+        oturum.get(site.url + "/bolum")
+
+    assert site.istekler == [("/bolum", False)]
+    assert cagrilar[0] == "_try_curl_cffi"                 # zincir yürüdü
+    assert yeniden_baslat().al(site.url) is None
+
+
+def test_flaresolverr_cozumu_kaydediliyor(monkeypatch):
+    class Yanit:
+        def json(self):
+            return {"status": "ok", "solution": {
+                "status": 200, "url": "https://ornek.test/", "response": "<html>ok</html>",
+                "userAgent": UA,
+                "cookies": [{"name": "cf_clearance", "value": "fs", "expires": -1}]}}
+
+    monkeypatch.setattr(cf_bypass.requests, "post", lambda *a, **k: Yanit())
+    oturum = cf_bypass.CFSession(flaresolverr_url="http://fs.test:8191")
+    assert oturum._try_flaresolverr("https://ornek.test/").status_code == 200
+
+    izin = izin_deposu.depo().al("ornek.test")
+    assert izin.cerezler == {"cf_clearance": "fs"} and izin.kaynak == "flaresolverr"
+
+
+# ── bypass.fetch ────────────────────────────────────────────────────────────
+def test_bypass_fetch_kayitli_izinle_soguk_basliyor(site, monkeypatch):
+    from turkanime_api import bypass
+
+    bypass.reset_session()
+    monkeypatch.setattr(bypass, "BASE_URL", site.url)
+    yedek: list = []
+    monkeypatch.setattr(bypass, "_get_cf_session", lambda: yedek.append(1))
+    izin_deposu.depo().koy(site.url, {"cf_clearance": "tamam"}, user_agent=UA)
+    try:
+        assert bypass.fetch("/bolum") == "icerik /bolum"
+        assert yedek == []
+        assert site.istekler == [("/", True), ("/bolum", True)]
+    finally:
+        bypass.reset_session()
+
+
+def test_bypass_fetch_403te_izni_siliyor(site, monkeypatch):
+    from turkanime_api import bypass
+
+    bypass.reset_session()
+    monkeypatch.setattr(bypass, "BASE_URL", site.url)
+    monkeypatch.setattr(bypass, "_get_cf_session", lambda: None)
+    izin_deposu.depo().koy(site.url, {"cf_clearance": "tamam"}, user_agent=UA)
+    try:
+        bypass.fetch(None)                      # kurulum izinle geçti
+        izin_deposu.depo().koy(site.url, {"cf_clearance": "yeni"}, user_agent=UA)
+        bypass.session.cookies.set("cf_clearance", "eskimis", domain="localhost")
+        with pytest.raises(ConnectionError):
+            bypass.fetch("/bolum")
+        assert izin_deposu.depo().al(site.url) is None
+    finally:
+        bypass.reset_session()
+
+
+# ── Çerez tarayıcısı ────────────────────────────────────────────────────────
+def test_cerez_tarayicisi_yalnizca_cf_iznini_saklayip_geri_veriyor():
+    pytest.importorskip("PySide6")
+    from turkanime_api.gui.qt import cookie_browser as qtcb
+
+    bitis = int(izin_deposu.time.time()) + 1800
+    toplanan = [
+        {"domain": ".tranimeizle.io", "path": "/", "secure": True, "expiry": bitis,
+         "name": "cf_clearance", "value": "tarayici"},
+        {"domain": ".tranimeizle.io", "path": "/", "secure": True, "expiry": 0,
+         "name": ".AitrWeb.Session", "value": "oturum"},
+    ]
+    assert qtcb._izni_kaydet(toplanan, UA) is True
+
+    izin = yeniden_baslat().al("https://www.tranimeizle.io/anime/x")
+    assert izin.cerezler == {"cf_clearance": "tarayici"}
+    assert izin.bitis == bitis and izin.kaynak == "cookie_browser"
+
+    cookies, ua = qtcb._kayitli_izin()
+    assert ua == UA
+    assert [(c["name"], c["value"]) for c in cookies] == [("cf_clearance", "tarayici")]
+    # Oturum çerezi tohumlanmıyor: tarayıcı kendiliğinden "bitti" sanmasın.
+    assert not qtcb._has_required_cookies(cookies)
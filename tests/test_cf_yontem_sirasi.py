@@ -0,0 +1,179 @@
+"""CF zinciri domain başına öğrenilen sırayla: en iyi yöntemden başlanıyor.
+
+Eskiden yalnızca FlareSolverr ile açılan bir domain her istekte başarısız
+curl_cffi ve cloudscraper denemelerini ödüyordu. Yöntemler sahte; süreleri
+gerçek (kısa) beklemeler, saat ise yoklama aralıkları için sahte.
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from turkanime_api.common import cf_bypass, yontem_gecmisi
+from turkanime_api.common.yontem_gecmisi import YOKLAMA_ILK, YontemGecmisi
+
+VARSAYILAN = ["curl_cffi", "cloudscraper", "flaresolverr", "qtwebengine", "requests"]
+URL = "https://korumali.test/bolum"
+
+
+class Saat:
+    def __init__(self):
+        self.simdi = 1_000_000.0
+
+    def __call__(self):
+        return self.simdi
+
+
+class SahteYanit:
+    status_code = 200
+    text = "<html>icerik</html>"
+
+
+@pytest.fixture
+def saat(tmp_path, monkeypatch):
+    s = Saat()
+    monkeypatch.setattr(yontem_gecmisi, "_gecmis",
+                        YontemGecmisi(tmp_path / "gecmis.json", saat=s))
+    return s
+
+
+@pytest.fixture
+def zincir(monkeypatch):
+    """Sahte yöntemler: ``basarili`` kümesindekiler cevap verir, hepsi sürer."""
+    durum = {"cagrilar": [], "basarili": {"flaresolverr"},
+             "sure": {"curl_cffi": 0.06, "cloudscraper": 0.06, "flaresolverr": 0.01}}
+
+    def _sahte(ad):
+        def _yontem(self, *_a, **_k):
+            durum["cagrilar"].append(ad)
+            time.sleep(durum["sure"].get(ad, 0.0))
+            return SahteYanit() if ad in durum["basarili"] else None
+        return _yontem
+
+    for ad, metot in (("curl_cffi", "_try_curl_cffi"), ("cloudscraper", "_try_cloudscraper"),
+                      ("flaresolverr", "_try_flaresolverr"),
+                      ("qtwebengine", "_try_qtwebengine"),
+                      ("requests", "_try_requests_fallback")):
+        monkeypatch.setattr(cf_bypass.CFSession, metot, _sahte(ad))
+    monkeypatch.setattr(cf_bypass.CFSession, "_try_izin", lambda self, *a, **k: None)
+    return durum
+
+
+def oturum():
+    return cf_bypass.CFSession(flaresolverr_url="", max_retries=2, retry_delay=0.01)
+
+
+# ── Geçmiş ──────────────────────────────────────────────────────────────────
+def test_gecmis_yokken_varsayilan_sira():
+    assert YontemGecmisi().sira(URL, VARSAYILAN) == VARSAYILAN
+
+
+def test_en_iyiden_basliyor_ucuzlari_ussel_araliklarla_yokluyor():
+    saat = Saat()
+    gecmis = YontemGecmisi(saat=saat)
+    gecmis.kaydet(URL, "flaresolverr", True, 3.0, VARSAYILAN)
+    gecmis.kaydet(URL, "curl_cffi", False, 1.0, VARSAYILAN)
+    assert gecmis.sira(URL, VARSAYILAN) == [
+        "cloudscraper", "flaresolverr", "curl_cffi", "qtwebengine", "requests"]
+
+    gecmis.kaydet(URL, "cloudscraper", False, 1.0, VARSAYILAN)
+    assert gecmis.sira(URL, VARSAYILAN)[0] == "flaresolverr"
+
+    aralik = YOKLAMA_ILK
+    for _ in range(4):
+        saat.simdi += aralik
+        assert gecmis.sira(URL, VARSAYILAN)[0] == "curl_cffi"     # yoklama vakti
+        gecmis.kaydet(URL, "curl_cffi", False, 1.0, VARSAYILAN)
+        aralik *= 2
+        saat.simdi += aralik / 2
+        assert gecmis.sira(URL, VARSAYILAN)[0] != "curl_cffi"     # aralık ikiye katlandı
+        saat.simdi -= aralik / 2
+    assert gecmis.istatistikler()["korumali.test"]["curl_cffi"]["yoklama_araligi"] == aralik
+
+    # Site korumayı kaldırdı: ucuz yöntem başarınca en iyi o oluyor.
+    saat.simdi += aralik
+    gecmis.kaydet(URL, "curl_cffi", True, 0.2, VARSAYILAN)
+    assert gecmis.sira(URL, VARSAYILAN)[:2] == ["curl_cffi", "cloudscraper"]
+    assert gecmis.en_iyi(URL, VARSAYILAN) == "curl_cffi"
+
+
+def test_sik_hata_veren_en_iyi_yerini_kaybediyor():
+    gecmis = YontemGecmisi()
+    gecmis.kaydet(URL, "cloudscraper", True, 1.0, VARSAYILAN)
+    gecmis.kaydet(URL, "flaresolverr", True, 2.0, VARSAYILAN)
+    assert gecmis.en_iyi(URL, VARSAYILAN) == "cloudscraper"
+    for _ in range(6):
+        gecmis.kaydet(URL, "cloudscraper", False, 1.0, VARSAYILAN)
+    assert gecmis.en_iyi(URL, VARSAYILAN) == "flaresolverr"
+
+
+def test_gecmis_diske_yazilip_yeniden_okunuyor(tmp_path):
+    dosya = tmp_path / "gecmis.json"
+    gecmis = YontemGecmisi(dosya)
+    gecmis.kaydet(URL, "flaresolverr", True, 3.0, VARSAYILAN)
+    gecmis.kaydet(URL, "curl_cffi", False, 1.0, VARSAYILAN)
+    gecmis.diske_yaz()
+
+    yeni = YontemGecmisi(dosya)
+    assert yeni.en_iyi(URL, VARSAYILAN) == "flaresolverr"
+    assert yeni.sira(URL, VARSAYILAN)[0] == "cloudscraper"
+    dosya.write_text("{bozuk", encoding="utf-8")
+    assert YontemGecmisi(dosya).sira(URL, VARSAYILAN) == VARSAYILAN
+
+
+# ── CFSession ───────────────────────────────────────────────────────────────
+def test_ikinci_istek_dogrudan_basarili_yonteme_gidiyor(saat, zincir):
+    t0 = time.perf_counter()
+    assert oturum().get(URL).text == "<html>icerik</html>"
+    ilk = time.perf_counter() - t0
+    assert zincir["cagrilar"] == ["curl_cffi", "cloudscraper", "flaresolverr"]
+
+    zincir["cagrilar"].clear()
+    t0 = time.perf_counter()
+    yeni = oturum()                 # yeni oturum; geçmiş süreç geneli
+    assert yeni.get(URL).status_code == 200
+    ikinci = time.perf_counter() - t0
+    assert zincir["cagrilar"] == ["flaresolverr"]
+    print(f"\nilk istek {ilk * 1000:.0f} ms, ikinci {ikinci * 1000:.0f} ms")
+    assert ikinci < ilk
+
+    ozet = cf_bypass.yontem_istatistikleri()
+    assert ozet["flaresolverr"]["basari"] == 2 and ozet["flaresolverr"]["en_iyi_domain"] == 1
+    for ad in ("curl_cffi", "cloudscraper"):
+        assert ozet[ad]["atlanan"] == 1 and ozet[ad]["hata"] == 1
+        assert ozet[ad]["kazanilan_sure"] == pytest.approx(0.06, abs=0.04)
+
+
+def test_yoklama_vakti_gelince_ucuz_yontem_yeniden_deneniyor(saat, zincir):
+    oturum().get(URL)
+    zincir["cagrilar"].clear()
+    saat.simdi += YOKLAMA_ILK
+    zincir["basarili"].add("curl_cffi")          # site korumayı kaldırdı
+    oturum().get(URL)
+    assert zincir["cagrilar"] == ["curl_cffi"]
+
+    zincir["cagrilar"].clear()
+    oturum().get(URL)
+    assert zincir["cagrilar"] == ["curl_cffi"]   # artık en iyi curl_cffi
+
+
+def test_en_iyi_basarisiz_olursa_zincirin_geri_kalani_deneniyor(saat, zincir):
+    oturum().get(URL)
+    zincir["cagrilar"].clear()
+    zincir["basarili"] = {"requests"}
+    zincir["sure"] = {}
+    assert oturum().get(URL).status_code == 200
+    assert zincir["cagrilar"] == ["flaresolverr", "curl_cffi", "cloudscraper",
+                                  "qtwebengine", "requests"]
+
+
+def test_sira_sureclar_arasi_korunuyor(saat, zincir, monkeypatch, tmp_path):
+    oturum().get(URL)
+    yontem_gecmisi.gecmis().diske_yaz()
+    # Yeni süreç: geçmiş diskten okunuyor.
+    monkeypatch.setattr(yontem_gecmisi, "_gecmis",
+                        YontemGecmisi(tmp_path / "gecmis.json", saat=saat))
+    zincir["cagrilar"].clear()
+    oturum().get(URL)
+    assert zincir["cagrilar"] == ["flaresolverr"]
@@ -0,0 +1,176 @@
+"""Görev şeritleri: öncelikli kuyruk, işbirlikçi iptal, sayfa gizlenince iptal.
+
+Eskiden her arka plan işi havuza aynı öncelikle ve geri alınamaz biçimde
+gidiyordu; terk edilen sayfanın kapak indirmeleri, kullanıcının az önce
+istediği işin önünde bekliyordu. Ağa çıkılmaz.
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QWidget  # noqa: E402
+
+from turkanime_api.gui.qt import workers  # noqa: E402
+from turkanime_api.gui.qt.workers import (  # noqa: E402
+    LANE_BACKGROUND, LANE_INTERACTIVE, LANE_PREFETCH, CancelToken,
+    WorkerSignals, current_token, lane_metrics,
+    long_task_pool, reset_lane_metrics, run_bg, set_long_task_limit,
+)
+
+
+@pytest.fixture
+def tek_thread():
+    """Tek thread'li havuz: kuyruk sırası gözlenebilsin."""
+    set_long_task_limit(1)
+    long_task_pool().waitForDone(2000)
+    reset_lane_metrics()
+    yield
+    set_long_task_limit(workers.VARSAYILAN_UZUN_IS)
+
+
+def tikac():
+    """Havuzun tek thread'ini serbest bırakılana dek tutan iş."""
+    basladi, birak = threading.Event(), threading.Event()
+
+    def _is():
+        basladi.set()
+        birak.wait(5)
+
+    handle = run_bg(_is, long_running=True)
+    assert basladi.wait(5)
+    return handle, birak
+
+
+def test_etkilesimli_is_kuyrukta_one_geciyor(tek_thread):
+    sira: list = []
+    _, birak = tikac()
+    handles = [run_bg(sira.append, lane, long_running=True, lane=lane)
+               for lane in (LANE_BACKGROUND, LANE_PREFETCH, LANE_INTERACTIVE)]
+    birak.set()
+    assert all(h.wait(5) for h in handles)
+    assert sira == [LANE_INTERACTIVE, LANE_PREFETCH, LANE_BACKGROUND]
+
+
+def test_baslamadan_iptal_edilen_is_hic_kosmuyor(tek_thread):
+    kostu: list = []
+    _, birak = tikac()
+    handle = run_bg(kostu.append, 1, long_running=True, lane=LANE_PREFETCH)
+    assert handle.state == "queued"
+    assert handle.cancel() is True
+    assert handle.done() and handle.state == "cancelled"
+    birak.set()
+    assert long_task_pool().waitForDone(5000)
+    assert kostu == []
+    assert lane_metrics()[LANE_PREFETCH]["cancelled"] == 1
+
+
+def test_kapanista_atilan_isin_tutamaci_bitiyor(tek_thread):
+    kostu: list = []
+    _, birak = tikac()
+    handle = run_bg(kostu.append, 1, long_running=True, lane=LANE_PREFETCH)
+    threading.Timer(0.1, birak.set).start()
+    assert workers.shutdown_pools(5000) is True
+    assert handle.wait(1), "atılan iş 'queued' kaldı; wait() askıda kalırdı"
+    assert handle.state == "cancelled" and kostu == []
+    metrik = lane_metrics()[LANE_PREFETCH]
+    assert metrik["queued"] == 0 and metrik["cancelled"] == 1
+
+
+def test_kosan_is_belirteci_gorup_erken_cikiyor(qtbot, tek_thread):
+    basladi = threading.Event()
+    hatalar: list = []
+    sig = WorkerSignals()
+    sig.connect_error(hatalar.append)
+
+    def _is():
+        basladi.set()
+        while True:
+            current_token().raise_if_cancelled()
+            time.sleep(0.005)
+
+    with qtbot.waitSignal(sig.finished, timeout=5000):
+        handle = run_bg(_is, signals=sig, long_running=True, lane=LANE_BACKGROUND)
+        assert basladi.wait(5)
+        assert handle.cancel() is False        # zaten koşuyordu
+    assert handle.state == "cancelled"
+    assert hatalar == []
+    metrik = lane_metrics()[LANE_BACKGROUND]
+    assert metrik["cancelled"] == 1 and metrik["failed"] == 0
+
+
+def test_paylasilan_belirtec_birden_cok_isi_iptal_ediyor(tek_thread):
+    belirtec = CancelToken()
+    _, birak = tikac()
+    handles = [run_bg(lambda: None, long_running=True, cancel_token=belirtec)
+               for _ in range(3)]
+    belirtec.cancel()
+    birak.set()
+    assert all(h.wait(5) for h in handles)
+    assert {h.state for h in handles} == {"cancelled"}
+
+
+def test_is_disinda_belirtec_hic_iptal_edilmiyor():
+    assert current_token().cancelled is False
+    current_token().raise_if_cancelled()
+
+
+def test_sahip_gizlenince_onden_yukleme_iptal_ediliyor(qtbot, tek_thread):
+    sayfa = QWidget()
+    qtbot.addWidget(sayfa)
+    sayfa.show()
+    _, birak = tikac()
+    kapak = run_bg(lambda: None, long_running=True, lane=LANE_PREFETCH, owner=sayfa)
+    arka = run_bg(lambda: None, long_running=True, lane=LANE_BACKGROUND, owner=sayfa)
+    arama = run_bg(lambda: None, long_running=True, lane=LANE_INTERACTIVE, owner=sayfa)
+
+    sayfa.hide()
+    assert kapak.state == "cancelled" and arka.state == "cancelled"
+    assert arama.state == "queued"
+    birak.set()
+    assert arama.wait(5) and arama.state == "done"
+
+
+def test_metrikler_kuyruk_derinligi_ve_bekleme(tek_thread):
+    _, birak = tikac()
+    handles = [run_bg(lambda: None, long_running=True, lane=LANE_PREFETCH)
+               for _ in range(3)]
+    assert lane_metrics()[LANE_PREFETCH]["queued"] == 3
+    time.sleep(0.05)
+    birak.set()
+    assert all(h.wait(5) for h in handles)
+    metrik = lane_metrics()[LANE_PREFETCH]
+    assert metrik["queued"] == 0 and metrik["completed"] == 3
+    assert metrik["wait_ms_max"] >= 40
+
+
+def test_bilinmeyen_serit_reddediliyor():
+    with pytest.raises(ValueError):
+        run_bg(lambda: None, lane="acil")
+
+
+# ── Izgara ──────────────────────────────────────────────────────────────────
+def test_izgara_donuste_iptal_edilen_kapaklari_yeniden_istiyor(qtbot):
+    from turkanime_api.gui.qt.pages._grid import CardGrid
+    from turkanime_api.gui.qt.widgets import CardItem
+
+    grid = CardGrid()
+    qtbot.addWidget(grid)
+    grid.resize(600, 400)
+    istenen: list = []
+    grid.thumbnails_needed.connect(istenen.extend)
+    items = [CardItem(f"Anime {i}", "AniList", payload=i,
+                      image_url=f"https://cdn/{i}.jpg") for i in range(4)]
+    grid.set_items(items)
+    grid.show()
+    qtbot.waitUntil(lambda: len(istenen) == 4, timeout=2000)
+
+    # Sayfa terk edildi, indirmeler iptal oldu; kapaklar hiç gelmedi.
+    grid.hide()
+    istenen.clear()
+    grid.show()
+    qtbot.waitUntil(lambda: len(istenen) == 4, timeout=2000)
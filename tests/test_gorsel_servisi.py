@@ -0,0 +1,245 @@
+"""Ortak kapak servisi: disk önbelleği, koşullu doğrulama, LRU, birleştirme.
+
+Arama / keşif / izleme listesi / detay sayfaları ve AniList avatarı aynı
+posterleri her ziyarette çıplak `requests.get` ile yeniden indiriyordu. Artık
+hepsi `images.gorsel_servisi()` üzerinden geçiyor.
+
+Ağa çıkılmaz: oturum sahte, saat elle ilerletiliyor.
+"""
+from __future__ import annotations
+
+import inspect
+import threading
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QBuffer, QByteArray  # noqa: E402
+from PySide6.QtGui import QPixmap  # noqa: E402
+
+from turkanime_api.gui.qt import images  # noqa: E402
+from turkanime_api.gui.qt.images import GorselServisi, gorsel_servisi  # noqa: E402
+
+
+class Saat:
+    def __init__(self):
+        self.t = 1_000_000.0
+
+    def __call__(self):
+        return self.t
+
+
+class Yanit:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+
+class SahteOturum:
+    """URL → (gövde, ETag); `If-None-Match` eşleşirse 304 döner."""
+
+    def __init__(self, tablo, kapi=None):
+        self.tablo = tablo
+        self.kapi = kapi
+        self.istekler: list = []
+        self.hata = False
+
+    def get(self, url, headers=None, timeout=None):
+        self.istekler.append((url, dict(headers or {})))
+        if self.kapi is not None:
+            self.kapi.wait(5)
+        if self.hata:
+            raise ConnectionError("ağ yok")
+        govde, etag = self.tablo[url]
+        if headers and headers.get("If-None-Match") == etag:
+            return Yanit(304)
+        return Yanit(200, govde, {"ETag": etag})
+
+
+@pytest.fixture
+def saat():
+    return Saat()
+
+
+@pytest.fixture
+def kur(tmp_path, saat):
+    def _kur(tablo, **kw):
+        oturum = SahteOturum(tablo, kapi=kw.pop("kapi", None))
+        servis = GorselServisi(kw.pop("dizin", tmp_path / "gorsel"),
+                               oturum_fabrikasi=lambda: oturum, saat=saat, **kw)
+        return servis, oturum
+    return _kur
+
+
+def png_baytlari(boyut: int = 6) -> bytes:
+    pix = QPixmap(boyut, boyut)
+    pix.fill()
+    ba = QByteArray()
+    buf = QBuffer(ba)
+    buf.open(QBuffer.OpenModeFlag.WriteOnly)
+    assert pix.save(buf, "PNG")
+    return bytes(ba)
+
+
+# ── Disk ────────────────────────────────────────────────────────────────────
+def test_taze_disk_kopyasi_aga_cikmiyor(kur, tmp_path):
+    servis, oturum = kur({"u": (b"poster", "e1")})
+    assert servis.baytlar("u") == b"poster"
+
+    # Yeni süreç: bellek boş, disk dolu.
+    ikinci, oturum2 = kur({"u": (b"poster", "e1")})
+    assert ikinci.baytlar("u") == b"poster"
+    assert len(oturum.istekler) == 1 and oturum2.istekler == []
+    assert ikinci.istatistik()["disk"] == 1
+
+
+def test_bayat_kayit_etag_ile_dogrulaniyor(kur, saat):
+    servis, oturum = kur({"u": (b"poster", "e1")}, tazelik=60)
+    servis.baytlar("u")
+    saat.t += 61
+    assert servis.baytlar("u") == b"poster"
+    assert oturum.istekler[-1] == ("u", {"If-None-Match": "e1"})
+    assert servis.istatistik()["dogrulanan"] == 1
+
+    # 304 tazeliği yeniledi: hemen ardından ağa çıkılmıyor.
+    servis.baytlar("u")
+    assert len(oturum.istekler) == 2
+
+
+def test_degisen_gorsel_yeniden_indiriliyor(kur, saat):
+    servis, oturum = kur({"u": (b"eski", "e1")}, tazelik=60)
+    servis.baytlar("u")
+    oturum.tablo["u"] = (b"yeni", "e2")
+    saat.t += 61
+    assert servis.baytlar("u") == b"yeni"
+    assert servis.istatistik()["indirilen"] == 2
+
+
+def test_ag_yoksa_bayat_kopya_veriliyor(kur, saat):
+    servis, oturum = kur({"u": (b"poster", "e1")}, tazelik=60)
+    servis.baytlar("u")
+    saat.t += 61
+    oturum.hata = True
+    assert servis.baytlar("u") == b"poster"
+    assert servis.baytlar("yok") is None
+    assert servis.istatistik()["hata"] == 1
+
+
+def test_disk_siniri_en_eski_dokunulani_atiyor(kur, saat):
+    tablo = {k: (bytes(40), k) for k in "abcd"}
+    servis, oturum = kur(tablo, disk_siniri=100)
+    for k in "abc":
+        saat.t += 1
+        servis.baytlar(k)
+    # 120 > 100: a atıldı. b'ye dokun, d gelince c atılmalı.
+    servis.baytlar("b")
+    servis.baytlar("d")
+    assert servis.istatistik()["disk_bayt"] <= 100
+    istek_sayisi = len(oturum.istekler)
+    servis.baytlar("b")
+    servis.baytlar("d")
+    assert len(oturum.istekler) == istek_sayisi
+    servis.baytlar("c")
+    assert len(oturum.istekler) == istek_sayisi + 1
+    assert len(list(servis.dizin.glob("*.img"))) == 2
+
+
+def test_disk_yazilamazsa_onbelleksiz_calisiyor(kur, tmp_path):
+    engel = tmp_path / "dosya"
+    engel.write_text("x")
+    servis, oturum = kur({"u": (b"poster", "e1")}, dizin=engel / "alt")
+    assert servis.baytlar("u") == b"poster"
+    assert servis.baytlar("u") == b"poster"
+    assert len(oturum.istekler) == 2
+
+
+# ── Birleştirme ─────────────────────────────────────────────────────────────
+def test_ayni_url_icin_tek_istek(kur):
+    kapi = threading.Event()
+    servis, oturum = kur({"u": (b"poster", "e1")}, kapi=kapi)
+    sonuclar = []
+    isler = [threading.Thread(target=lambda: sonuclar.append(servis.baytlar("u")))
+             for _ in range(5)]
+    for t in isler:
+        t.start()
+    for _ in range(500):
+        if oturum.istekler:
+            break
+        threading.Event().wait(0.01)
+    threading.Event().wait(0.1)        # diğerleri süren indirmeye bağlansın
+    kapi.set()
+    for t in isler:
+        t.join(5)
+    assert sonuclar == [b"poster"] * 5
+    assert len(oturum.istekler) == 1, "aynı poster ağdan birden çok kez indirildi"
+    assert servis.istatistik()["birlesen"] == 4
+
+
+# ── Rapor ───────────────────────────────────────────────────────────────────
+def test_isabet_orani_ve_tasarruf(kur):
+    servis, _ = kur({"u": (b"x" * 10, "e1"), "v": (b"y" * 5, "e2")})
+    servis.baytlar("u")
+    servis.baytlar("v")
+    servis.baytlar("u")
+    servis.baytlar("u")
+    ist = servis.istatistik()
+    assert ist["isabet_orani"] == pytest.approx(2 / 4)
+    assert ist["tasarruf_bayt"] == 20
+    assert ist["indirilen_bayt"] == 15
+
+
+# ── Bellek (GUI thread'i) ───────────────────────────────────────────────────
+def test_pixmap_bellekte_tutuluyor_ve_lru(qapp, kur):
+    servis, _ = kur({}, bellek_kapasitesi=2)
+    png = png_baytlari()
+    assert servis.pixmap("a") is None
+    ilk = servis.pixmap("a", png)
+    assert ilk is not None and not ilk.isNull()
+    assert servis.pixmap("a") is ilk
+    servis.pixmap("b", png)
+    servis.pixmap("a")                     # a en yeni
+    servis.pixmap("c", png)
+    assert servis.pixmap("b") is None
+    assert servis.pixmap("a") is ilk
+    assert servis.pixmap("x", b"resim degil") is None
+    assert servis.istatistik()["bellek"] == 3
+
+
+def test_kart_bellekteki_kapagi_hemen_aliyor(qapp):
+    from turkanime_api.gui.qt.widgets import AnimeCard
+
+    kart = AnimeCard("A", "AniList", image_url="https://cdn/a.png")
+    bos = AnimeCard("B", "AniList", image_url="https://cdn/b.png")
+    gorsel_servisi().pixmap("https://cdn/a.png", png_baytlari(),
+                            kart.thumbnail_target())
+    try:
+        assert kart.load_cached_thumbnail()
+        assert kart._src_pixmap is not None
+        assert not bos.load_cached_thumbnail()
+    finally:
+        kart.deleteLater()
+        bos.deleteLater()
+
+
+def test_surec_geneli_tek_servis(tmp_path, monkeypatch):
+    monkeypatch.setattr(images, "_servis", None)
+    monkeypatch.setattr(images, "CACHE_DIR", tmp_path / "g")
+    s = gorsel_servisi()
+    assert gorsel_servisi() is s and s.dizin == tmp_path / "g"
+
+
+@pytest.mark.parametrize("modul", [
+    "turkanime_api.gui.qt.pages.search",
+    "turkanime_api.gui.qt.pages.discover",
+    "turkanime_api.gui.qt.pages.watchlist",
+    "turkanime_api.gui.qt.pages.detail",
+    "turkanime_api.gui.qt.anilist",
+])
+def test_sayfalar_gorseli_dogrudan_indirmiyor(modul):
+    import importlib
+
+    kaynak = inspect.getsource(importlib.import_module(modul))
+    assert "requests.get(" not in kaynak
+    assert "gorsel_servisi()" in kaynak
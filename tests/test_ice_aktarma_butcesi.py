@@ -0,0 +1,84 @@
+"""Soğuk import bütçesi: CLI, arama motoru ve kaynak paketi tembel kalmalı.
+
+Eskiden `turkanime` komutu menüyü göstermeden önce questionary, rich,
+easygui, yt-dlp, curl_cffi, cloudscraper ve altı kaynağın hepsini yüklüyordu
+(~0.7 sn). Ölçüm ayrı yorumlayıcıda `-X importtime` ile yapılır, ağa
+çıkılmaz; `pytest -s` ile profil görünür.
+"""
+from __future__ import annotations
+
+import sys
+
+import pytest
+
+from turkanime_api.common import ice_aktarma_profili as profil_mod
+from turkanime_api.common.ice_aktarma_profili import (
+    BUTCELER, butce, cozumle, olc, yasak_yuklenenler,
+)
+
+ORNEK = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      1500 |       2200 |     yt_dlp.utils
+import time:       300 |       2500 |   yt_dlp
+import time:        40 |       2540 | turkanime_api.cli.__main__
+"""
+
+
+def test_importtime_ciktisi_cozumleniyor():
+    maliyetler = cozumle(ORNEK)
+    assert [m.modul for m in maliyetler] == [
+        "_io", "yt_dlp.utils", "yt_dlp", "turkanime_api.cli.__main__"]
+    assert maliyetler[1].kendi_us == 1500 and maliyetler[1].toplam_us == 2200
+    assert [m.derinlik for m in maliyetler] == [1, 2, 1, 0]
+
+    profil = profil_mod.Profil("turkanime_api.cli.__main__", maliyetler, ["yt_dlp"])
+    assert profil.toplam_ms == pytest.approx(2.54)
+    assert profil.en_pahalilar(1)[0].modul == "turkanime_api.cli.__main__"
+    assert yasak_yuklenenler(profil) == ["yt_dlp"]
+
+
+def test_carpan_butceyi_olcekliyor(monkeypatch):
+    monkeypatch.setenv(profil_mod.CARPAN_ORTAM_ANAHTARI, "2")
+    assert butce("turkanime_api.cli.__main__") == 2 * BUTCELER["turkanime_api.cli.__main__"]
+    assert butce("boyle.bir.modul") is None
+
+
+@pytest.mark.parametrize("hedef", sorted(BUTCELER))
+def test_soguk_import_butcesi(hedef):
+    # Zamanlama gürültülü: en iyi üç ölçümden biri bütçeye sığmalı.
+    # Yasaklı modül listesi ise deterministik; ilk ölçümde bakılır.
+    ilk = olc(hedef)
+    assert yasak_yuklenenler(ilk) == [], f"{hedef} ağır bağımlılığı erken yüklüyor"
+    sure = ilk.toplam_ms
+    for _ in range(2):
+        if sure <= butce(hedef):
+            break
+        sure = min(sure, olc(hedef).toplam_ms)
+    print(f"\n{ilk.rapor(8)}")
+    assert sure <= butce(hedef), f"{hedef}: {sure:.0f} ms > bütçe {butce(hedef):.0f} ms"
+
+
+def test_profil_komutu_ozet_basiyor(capsys):
+    assert profil_mod.main(["--ilk", "3", "turkanime_api.sources"]) == 0
+    assert "turkanime_api.sources:" in capsys.readouterr().out
+
+
+# ── Tembel adlar hâlâ erişilebilir ──────────────────────────────────────────
+def test_kaynak_paketi_adlari_ilk_erisimde_yukleniyor():
+    import turkanime_api.sources as kaynaklar
+    from turkanime_api.sources import anizle, search_animecix
+
+    assert anizle.__name__ == "turkanime_api.sources.anizle"
+    assert search_animecix is sys.modules["turkanime_api.sources.animecix"].search_animecix
+    assert kaynaklar.PROVIDERS["openani"]["adapter"] is kaynaklar.OpenAniAdapter
+    with pytest.raises(AttributeError):
+        kaynaklar.boyle_bir_ad_yok  # noqa: B018
+
+
+def test_adapter_youtubedl_ilk_erisimde_yukleniyor():
+    from turkanime_api.sources import adapter
+
+    import yt_dlp
+    assert adapter.YoutubeDL is yt_dlp.YoutubeDL
+    assert adapter._youtube_dl() is yt_dlp.YoutubeDL
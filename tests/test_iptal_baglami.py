@@ -0,0 +1,427 @@
+"""İptal bağlamı: terk edilen iş süren ağ isteğini ve thread'i bırakıyor.
+
+Eskiden `_paralel_akis` süre sınırında havuzu `shutdown(wait=False)` ile
+bırakıyordu ama yetişemeyen kaynağın curl_cffi/requests çağrısı sunucunun
+cevabına ya da kendi 30–60 sn'lik süresine kadar thread'i ve soketi tutuyordu.
+
+Testler ağa çıkmaz: "yavaş sunucu" bağlantıyı kabul edip hiç cevap vermeyen
+yerel bir sokettir.
+"""
+from __future__ import annotations
+
+import socket
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from turkanime_api.common import adapters as adapters_mod
+from turkanime_api.common import cf_bypass, iptal
+from turkanime_api.common.adapters import SearchEngine
+from turkanime_api.common.iptal import IptalBaglami, IptalEdildi
+from turkanime_api.common.sonuc_onbellegi import SonucOnbellegi
+
+SUNUCU_GECIKMESI = 30     # sunucu bu süre boyunca cevap vermez
+SINIR = 3.0               # iptalden sonra thread'in dönmesi için üst sınır (sn)
+
+
+class YavasSunucu:
+    """Bağlantıyı kabul eden, isteği okuyan ama hiç cevap vermeyen sunucu."""
+
+    def __init__(self):
+        self._dinleyici = socket.socket()
+        self._dinleyici.bind(("127.0.0.1", 0))
+        self._dinleyici.listen(16)
+        self.url = f"http://127.0.0.1:{self._dinleyici.getsockname()[1]}"
+        self.baglanti = 0
+        self.kapanan = 0
+        self._kilit = threading.Lock()
+        self._dur = threading.Event()
+        threading.Thread(target=self._kabul, daemon=True).start()
+
+    def _kabul(self):
+        while not self._dur.is_set():
+            try:
+                conn, _ = self._dinleyici.accept()
+            except OSError:
+                return
+            with self._kilit:
+                self.baglanti += 1
+            threading.Thread(target=self._tut, args=(conn,), daemon=True).start()
+
+    def _tut(self, conn):
+        conn.settimeout(SUNUCU_GECIKMESI)
+        try:
+            while conn.recv(4096):       # istemci kapatınca b"" döner
+                pass
+        except OSError:
+            pass
+        finally:
+            conn.close()
+            with self._kilit:
+                self.kapanan += 1
+
+    def kapat(self):
+        self._dur.set()
+        self._dinleyici.close()
+
+
+@pytest.fixture
+def yavas_sunucu():
+    sunucu = YavasSunucu()
+    yield sunucu
+    sunucu.kapat()
+
+
+def arka_planda(fn):
+    """``fn``'i yeni bir bağlamla ayrı thread'de koştur: (bağlam, sonuç, thread)."""
+    baglam = IptalBaglami()
+    sonuc: dict = {}
+
+    def _kos():
+        t0 = time.monotonic()
+        try:
+            with iptal.etkin(baglam):
+                sonuc["deger"] = fn()
+        except BaseException as exc:       # noqa: BLE001 — test teşhisi
+            sonuc["hata"] = exc
+        sonuc["sure"] = time.monotonic() - t0
+
+    thread = threading.Thread(target=_kos, daemon=True)
+    thread.start()
+    return baglam, sonuc, thread
+
+
+def bekle_baglanti(sunucu, adet=1):
+    son = time.monotonic() + 5
+    while sunucu.baglanti < adet and time.monotonic() < son:
+        time.sleep(0.01)
+    assert sunucu.baglanti >= adet, "istek sunucuya hiç ulaşmadı"
+
+
+def iptal_et_ve_bekle(baglam, thread):
+    t0 = time.monotonic()
+    baglam.iptal()
+    thread.join(SINIR)
+    assert not thread.is_alive(), "iptalden sonra thread serbest kalmadı"
+    return time.monotonic() - t0
+
+
+# ── Bağlam ──────────────────────────────────────────────────────────────────
+def test_alt_baglam_ustle_birlikte_iptal_oluyor():
+    ust = IptalBaglami()
+    alt = ust.alt()
+    kapanan: list = []
+    alt.kapanis_ekle(lambda: kapanan.append("alt"))
+    ust.iptal()
+    assert alt.iptal_edildi and kapanan == ["alt"]
+    with pytest.raises(IptalEdildi):
+        alt.kontrol()
+
+
+def test_kapatilan_alt_baglam_ustten_ayriliyor():
+    ust = IptalBaglami()
+    alt = ust.alt()
+    alt.kapat()
+    ust.iptal()
+    assert not alt.iptal_edildi
+
+
+def test_baglam_disinda_kok_baglam_hic_iptal_edilmiyor():
+    assert not iptal.gecerli().iptal_edilebilir
+    iptal.kontrol()
+    with pytest.raises(RuntimeError):
+        iptal.gecerli().iptal()
+
+
+def test_bekleme_iptalde_hemen_uyaniyor():
+    baglam = IptalBaglami()
+    threading.Timer(0.05, baglam.iptal).start()
+    t0 = time.monotonic()
+    assert baglam.bekle(10) is True
+    assert time.monotonic() - t0 < 1
+
+
+# ── Süren istekler kesiliyor ────────────────────────────────────────────────
+def test_curl_istegi_iptalde_kesiliyor(yavas_sunucu):
+    from curl_cffi import requests as curl_requests
+
+    def _istek():
+        oturum = curl_requests.Session(impersonate="chrome110")
+        with iptal.izle(oturum):
+            return oturum.get(yavas_sunucu.url, timeout=SUNUCU_GECIKMESI)
+
+    baglam, sonuc, thread = arka_planda(_istek)
+    bekle_baglanti(yavas_sunucu)
+    sure = iptal_et_ve_bekle(baglam, thread)
+    assert isinstance(sonuc.get("hata"), IptalEdildi)
+    print(f"\ncurl_cffi iptal gecikmesi: {sure * 1000:.0f} ms")
+
+
+def test_requests_soketi_iptalde_kesiliyor(yavas_sunucu):
+    oturum = iptal.izlenen(requests.Session())
+    baglam, sonuc, thread = arka_planda(
+        lambda: oturum.get(yavas_sunucu.url, timeout=SUNUCU_GECIKMESI))
+    bekle_baglanti(yavas_sunucu)
+    sure = iptal_et_ve_bekle(baglam, thread)
+    assert isinstance(sonuc.get("hata"), IptalEdildi)
+    assert sure < 1
+
+
+def test_urllib_soketi_iptalde_kesiliyor(yavas_sunucu):
+    baglam, sonuc, thread = arka_planda(
+        lambda: urllib.request.urlopen(yavas_sunucu.url, timeout=SUNUCU_GECIKMESI))
+    bekle_baglanti(yavas_sunucu)
+    iptal_et_ve_bekle(baglam, thread)
+    assert "hata" in sonuc
+
+
+def test_iptal_edilmeyen_istek_etkilenmiyor(local_server):
+    url = local_server(b"merhaba")
+    baglam, sonuc, thread = arka_planda(
+        lambda: iptal.izlenen(requests.Session()).get(url, timeout=5).text)
+    thread.join(5)
+    assert sonuc.get("deger") == "merhaba"
+    assert not baglam.iptal_edildi
+
+
+class KeepAliveSunucu:
+    """HTTP/1.1 keep-alive sunucu; ``/yavas`` cevabı ``gecikme`` sn sonra gelir."""
+
+    def __init__(self, gecikme: float = 0.5):
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):  # noqa: N802
+                if self.path == "/yavas":
+                    time.sleep(gecikme)
+                govde = self.path.encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(govde)))
+                self.end_headers()
+                self.wfile.write(govde)
+
+            def log_message(self, *_a):
+                pass
+
+        self._srv = ThreadingHTTPServer(("127.0.0.1", 0), Isleyici)
+        self._srv.daemon_threads = True
+        threading.Thread(target=self._srv.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self._srv.server_address[1]}"
+
+    def kapat(self):
+        self._srv.shutdown()
+        self._srv.server_close()
+
+
+def test_havuza_donen_soket_ilk_baglamin_iptalinden_etkilenmiyor():
+    sunucu = KeepAliveSunucu()
+    try:
+        ortak = iptal.izlenen(requests.Session())
+        a = IptalBaglami()
+        with iptal.etkin(a):
+            assert ortak.get(sunucu.url + "/hizli", timeout=5).text == "/hizli"
+
+        # B, A'nın açıp havuza bıraktığı bağlantıyı kullanıyor.
+        b, sonuc, thread = arka_planda(
+            lambda: ortak.get(sunucu.url + "/yavas", timeout=5).text)
+        time.sleep(0.2)
+        a.iptal()
+        thread.join(5)
+        assert sonuc.get("hata") is None and sonuc.get("deger") == "/yavas"
+        assert not b.iptal_edildi
+    finally:
+        sunucu.kapat()
+
+
+# ── CFSession ve bypass.fetch ───────────────────────────────────────────────
+def test_cfsession_iptalde_sonraki_yonteme_gecmiyor(yavas_sunucu, monkeypatch):
+    denenen: list = []
+    monkeypatch.setattr(cf_bypass.CFSession, "_try_cloudscraper",
+                        lambda self, *a, **k: denenen.append("cloudscraper"))
+    monkeypatch.setattr(cf_bypass.CFSession, "_try_requests_fallback",
+                        lambda self, *a, **k: denenen.append("requests"))
+    oturum = cf_bypass.CFSession(timeout=SUNUCU_GECIKMESI, flaresolverr_url="",
+                                 max_retries=3, retry_delay=5)
+    baglam, sonuc, thread = arka_planda(lambda: oturum.get(yavas_sunucu.url))
+    bekle_baglanti(yavas_sunucu)
+    iptal_et_ve_bekle(baglam, thread)
+    assert isinstance(sonuc.get("hata"), IptalEdildi)
+    assert denenen == []
+    # Tek impersonation denendi; iptal sonraki parmak izine de geçirmedi.
+    assert yavas_sunucu.baglanti == 1
+
+
+def test_cfsession_yeniden_deneme_beklemesi_iptalde_bitiyor(monkeypatch):
+    for ad in ("_try_curl_cffi", "_try_cloudscraper", "_try_qtwebengine"):
+        monkeypatch.setattr(cf_bypass.CFSession, ad, lambda self, *a, **k: None)
+    monkeypatch.setattr(cf_bypass.CFSession, "_try_requests_fallback",
+                        lambda self, *a, **k: None)
+    oturum = cf_bypass.CFSession(flaresolverr_url="", max_retries=3, retry_delay=30)
+    baglam, sonuc, thread = arka_planda(lambda: oturum.get("http://127.0.0.1:9/"))
+    time.sleep(0.1)
+    iptal_et_ve_bekle(baglam, thread)
+    assert isinstance(sonuc.get("hata"), IptalEdildi)
+
+
+def test_flaresolverr_iptalde_devre_kesiciyi_acmiyor(yavas_sunucu):
+    oturum = cf_bypass.CFSession(flaresolverr_url=yavas_sunucu.url)
+    baglam, sonuc, thread = arka_planda(
+        lambda: oturum._try_flaresolverr("http://127.0.0.1:9/"))
+    bekle_baglanti(yavas_sunucu)
+    iptal_et_ve_bekle(baglam, thread)
+    assert sonuc.get("deger") is None
+    assert oturum._flaresolverr_down is False
+
+
+def test_bypass_fetch_iptalde_cf_yedegine_dusmuyor(yavas_sunucu, monkeypatch):
+    from turkanime_api import bypass
+
+    monkeypatch.setattr(bypass, "session", None)
+    monkeypatch.setattr(bypass, "BASE_URL", yavas_sunucu.url)
+    yedek: list = []
+    monkeypatch.setattr(bypass, "_get_cf_session", lambda: yedek.append(1))
+    baglam, sonuc, thread = arka_planda(lambda: bypass.fetch("/ara"))
+    bekle_baglanti(yavas_sunucu)
+    iptal_et_ve_bekle(baglam, thread)
+    assert isinstance(sonuc.get("hata"), IptalEdildi)
+    assert yedek == []
+    assert bypass.session is None          # sıradaki çağrı baştan kurar
+
+
+# ── Arama motoru ────────────────────────────────────────────────────────────
+class YavasAdapter:
+    def __init__(self, url, biten):
+        self.url, self.biten = url, biten
+
+    def search_anime(self, query, limit=10):
+        try:
+            iptal.izlenen(requests.Session()).get(self.url, timeout=SUNUCU_GECIKMESI)
+            return [("x", query)]
+        except Exception:
+            return []
+        finally:
+            self.biten.set()
+
+
+class HizliAdapter:
+    def search_anime(self, query, limit=10):
+        return [("naruto", "Naruto")]
+
+
+def test_sure_dolunca_yetismeyen_kaynagin_istegi_kesiliyor(yavas_sunucu, monkeypatch):
+    monkeypatch.setattr(adapters_mod, "OVERALL_SEARCH_TIMEOUT", 0.5)
+    biten = threading.Event()
+    motor = SearchEngine()
+    motor.adapters = {"Hızlı": HizliAdapter(), "Yavaş": YavasAdapter(yavas_sunucu.url, biten)}
+
+    t0 = time.monotonic()
+    sonuc = motor.search_all_sources("naruto")
+    assert sonuc["Hızlı"] == [("naruto", "Naruto")] and sonuc["Yavaş"] == []
+    assert biten.wait(SINIR), "yetişemeyen kaynağın thread'i serbest kalmadı"
+    assert time.monotonic() - t0 < 0.5 + SINIR
+    son = time.monotonic() + 2
+    while yavas_sunucu.kapanan < 1 and time.monotonic() < son:
+        time.sleep(0.01)
+    assert yavas_sunucu.kapanan == 1, "soket açık kaldı"
+
+
+def test_biten_kaynagin_baglami_iptal_edilmiyor(yavas_sunucu, monkeypatch):
+    monkeypatch.setattr(adapters_mod, "OVERALL_SEARCH_TIMEOUT", 0.5)
+    gorulen: dict = {}
+
+    class KayitliAdapter(HizliAdapter):
+        def search_anime(self, query, limit=10):
+            gorulen["baglam"] = iptal.gecerli()
+            return super().search_anime(query, limit)
+
+    biten = threading.Event()
+    motor = SearchEngine()
+    motor.adapters = {"Hızlı": KayitliAdapter(), "Yavaş": YavasAdapter(yavas_sunucu.url, biten)}
+    motor.search_all_sources("naruto")
+    assert biten.wait(SINIR)
+    assert not gorulen["baglam"].iptal_edildi      # yalnızca yetişemeyen kesildi
+
+    motor.adapters = {"Hızlı": KayitliAdapter()}
+    motor.search_all_sources("naruto")
+    assert not gorulen["baglam"].iptal_edildi
+
+
+def test_cagiranin_iptali_aramaya_yayiliyor(yavas_sunucu, monkeypatch):
+    monkeypatch.setattr(adapters_mod, "OVERALL_SEARCH_TIMEOUT", SUNUCU_GECIKMESI)
+    biten = threading.Event()
+    motor = SearchEngine()
+    motor.adapters = {"Yavaş": YavasAdapter(yavas_sunucu.url, biten)}
+    baglam, sonuc, thread = arka_planda(lambda: motor.search_all_sources_rich("naruto"))
+    bekle_baglanti(yavas_sunucu)
+    iptal_et_ve_bekle(baglam, thread)
+    assert biten.wait(SINIR)
+    assert sonuc["deger"]["Yavaş"] == []
+
+
+def test_erken_cikan_tuketici_kaynaklari_serbest_birakiyor(yavas_sunucu):
+    biten = threading.Event()
+    motor = SearchEngine()
+    motor.adapters = {"Hızlı": HizliAdapter(), "Yavaş": YavasAdapter(yavas_sunucu.url, biten)}
+    akis = motor.search_all_sources_rich_iter("naruto")
+    kaynak, _ = next(akis)
+    assert kaynak == "Hızlı"
+    bekle_baglanti(yavas_sunucu)
+    akis.close()
+    assert biten.wait(SINIR)
+
+
+# ── Önbellek birleştirmesi ──────────────────────────────────────────────────
+def test_iptal_edilen_hesaplamayi_bekleyen_kendisi_hesapliyor():
+    onbellek = SonucOnbellegi()
+    basladi, birak = threading.Event(), threading.Event()
+    sahip = IptalBaglami()
+
+    def _yavas():
+        basladi.set()
+        birak.wait(5)
+        iptal.kontrol()
+        return ["sahip"]
+
+    def _sahip():
+        with iptal.etkin(sahip):
+            try:
+                onbellek.getir("k", _yavas)
+            except IptalEdildi:
+                pass
+
+    t = threading.Thread(target=_sahip)
+    t.start()
+    assert basladi.wait(5)
+    bekleyen: dict = {}
+    t2 = threading.Thread(
+        target=lambda: bekleyen.setdefault("deger", onbellek.getir("k", lambda: ["bekleyen"])))
+    t2.start()
+    time.sleep(0.05)
+    sahip.iptal()
+    birak.set()
+    t.join(5)
+    t2.join(5)
+    assert bekleyen["deger"] == ["bekleyen"]
+
+
+# ── GUI görevleri ───────────────────────────────────────────────────────────
+def test_gui_gorev_belirteci_kaynaklara_ulasiyor(yavas_sunucu):
+    pytest.importorskip("PySide6")
+    from turkanime_api.gui.qt.workers import CancelToken, run_bg
+
+    goruldu: dict = {}
+
+    def _gorev():
+        goruldu["baglam"] = iptal.gecerli()
+        iptal.izlenen(requests.Session()).get(yavas_sunucu.url, timeout=SUNUCU_GECIKMESI)
+
+    handle = run_bg(_gorev)
+    bekle_baglanti(yavas_sunucu)
+    assert isinstance(goruldu["baglam"], CancelToken) and goruldu["baglam"] is handle.token
+    handle.cancel()
+    assert handle.wait(SINIR)
+    assert handle.state == "cancelled"
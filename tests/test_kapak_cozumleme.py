@@ -0,0 +1,205 @@
+"""Kart kapakları worker'da, kart boyutunda çözülüyor; GUI thread'i yalnız yerleştiriyor.
+
+`AnimeCard.set_thumbnail` tam boy baytları GUI thread'inde `QPixmap`'e
+çözüyor, `_src_pixmap`'i de tam çözünürlükte saklıyordu: 60 kartlık ızgarada
+kaydırma takılıyor, pixmap'ler yüzlerce MB tutuyordu. Artık worker
+`QImageReader.setScaledSize` ile poster kutusu boyutunda `QImage` üretiyor.
+
+Son test tam bir ızgarada GUI thread'i duraklamasını ve bellekte kalan pixmap
+boyutunu eski yolla karşılaştırıp yazdırır (`pytest -s` ile görünür).
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QBuffer, QByteArray, QSize  # noqa: E402
+from PySide6.QtGui import QColor, QImage, QPainter, QPixmap  # noqa: E402
+
+from turkanime_api.gui.qt import images  # noqa: E402
+from turkanime_api.gui.qt.images import GorselServisi, kucult  # noqa: E402
+from turkanime_api.gui.qt.widgets import AnimeCard  # noqa: E402
+
+IZGARA = 60
+
+
+def jpeg_baytlari(w: int = 1000, h: int = 1500) -> bytes:
+    """Sıkıştırılabilir ama düz olmayan (çözücü kısayol bulamasın) bir poster."""
+    img = QImage(w, h, QImage.Format.Format_RGB32)
+    img.fill(QColor("#203040"))
+    p = QPainter(img)
+    for i in range(0, w, 25):
+        p.fillRect(i, (i * 7) % h, 20, h // 3, QColor((i * 3) % 256, 90, 160))
+    p.end()
+    ba = QByteArray()
+    buf = QBuffer(ba)
+    buf.open(QBuffer.OpenModeFlag.WriteOnly)
+    assert img.save(buf, "JPEG", 85)
+    return bytes(ba)
+
+
+@pytest.fixture(scope="module")
+def poster():
+    return jpeg_baytlari()
+
+
+# ── kucult ──────────────────────────────────────────────────────────────────
+def test_hedef_kutuyu_dolduracak_boyutta_cozuyor(qapp, poster):
+    img = kucult(poster, QSize(256, 384))
+    assert img is not None
+    assert (img.width(), img.height()) == (256, 384)
+
+    genis = kucult(poster, QSize(300, 300))       # kutu kareyse yükseklik taşar
+    assert genis.width() == 300 and genis.height() >= 300
+
+
+def test_kucuk_kaynak_buyutulmuyor_ve_bozuk_veri_none(qapp):
+    kucuk = jpeg_baytlari(100, 150)
+    img = kucult(kucuk, QSize(256, 384))
+    assert (img.width(), img.height()) == (100, 150)
+    assert kucult(b"resim degil", QSize(10, 10)) is None
+    assert kucult(b"", QSize(10, 10)) is None
+
+
+def test_worker_threadinde_cozulebiliyor(qapp, poster):
+    with ThreadPoolExecutor(4) as havuz:
+        sonuclar = list(havuz.map(lambda _: kucult(poster, QSize(192, 288)), range(8)))
+    assert all(r is not None and r.width() == 192 for r in sonuclar)
+
+
+# ── Kart ────────────────────────────────────────────────────────────────────
+def test_kart_hedefi_poster_kutusunu_kapsiyor(qtbot):
+    kart = AnimeCard("A", "AniList", image_url="https://cdn/a.jpg")
+    qtbot.addWidget(kart)
+    kart.resize(300, 520)
+    hedef = kart.thumbnail_target()
+    pw = kart._poster_width()
+    assert hedef.width() >= pw and hedef.width() % 64 == 0
+    assert hedef.height() >= int(pw * 1.5)
+
+
+def test_kartta_tam_boy_pixmap_tutulmuyor(qtbot, poster):
+    kart = AnimeCard("A", "AniList", image_url="https://cdn/a.jpg")
+    qtbot.addWidget(kart)
+    hedef = kart.thumbnail_target()
+    kart.set_thumbnail(kucult(poster, hedef))
+    assert kart._src_pixmap.width() == hedef.width()
+    assert kart.lblThumb.pixmap() is not None and not kart.lblThumb.pixmap().isNull()
+
+    # Eski çağıranlar bayt verse de tam boy saklanmıyor.
+    ham = AnimeCard("B", "AniList")
+    qtbot.addWidget(ham)
+    ham.set_thumbnail(poster)
+    assert ham._src_pixmap.width() <= ham.thumbnail_target().width()
+
+
+# ── Sayfa ───────────────────────────────────────────────────────────────────
+class _Oturum:
+    def __init__(self, govde):
+        self.govde = govde
+
+    def get(self, url, headers=None, timeout=None):
+        class Y:
+            status_code = 200
+            content = self.govde
+            headers = {}
+        return Y()
+
+
+def test_sayfa_gui_threadine_kucuk_qimage_tasiyor(qtbot, monkeypatch, tmp_path, poster):
+    from turkanime_api.gui.qt.pages.search import SearchPage
+
+    monkeypatch.setattr(images, "_servis", GorselServisi(
+        tmp_path / "g", oturum_fabrikasi=lambda: _Oturum(poster)))
+    cozen = []
+    asil = images.kucult
+
+    def izle(data, hedef=None):
+        cozen.append(threading.current_thread() is threading.main_thread())
+        return asil(data, hedef)
+
+    monkeypatch.setattr(images, "kucult", izle)
+    page = SearchPage()
+    qtbot.addWidget(page)
+    kart = AnimeCard("A", "AniList", image_url="https://cdn/a.jpg")
+    qtbot.addWidget(kart)
+    gelen = []
+    page.thumb_ready.connect(lambda c, img: gelen.append(img))
+
+    hedef = kart.thumbnail_target()
+    threading.Thread(target=page._fetch_thumb, args=(kart, kart.image_url, hedef)).start()
+    qtbot.waitUntil(lambda: bool(gelen), timeout=5000)
+
+    assert cozen == [False], "çözme GUI thread'inde yapıldı"
+    assert isinstance(gelen[0], QImage) and gelen[0].width() == hedef.width()
+
+
+# ── Ölçüm ───────────────────────────────────────────────────────────────────
+def _rss() -> int:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return 0
+
+
+def _pixmap_bayti(kartlar) -> int:
+    return sum(k._src_pixmap.width() * k._src_pixmap.height() * 4 for k in kartlar)
+
+
+def _eski_yerlestir(kart: AnimeCard, data: bytes) -> None:
+    """Önceki `set_thumbnail`: GUI thread'inde tam boy çöz, tam boy sakla."""
+    pix = QPixmap()
+    pix.loadFromData(data)
+    kart._src_pixmap = pix
+    kart._poster_size = (0, 0)
+    kart._apply_geometry()
+
+
+def test_tam_izgara_olcumu(qtbot, poster):
+    def kartlar():
+        liste = [AnimeCard(f"A{i}", "AniList", image_url=f"https://cdn/{i}.jpg")
+                 for i in range(IZGARA)]
+        for k in liste:
+            qtbot.addWidget(k)
+            k.resize(222, 400)
+        return liste
+
+    # Eski yol: her kapak GUI thread'inde tam boy çözülüyor.
+    eski = kartlar()
+    rss0 = _rss()
+    t0 = time.perf_counter()
+    for k in eski:
+        _eski_yerlestir(k, poster)
+    eski_sure = time.perf_counter() - t0
+    eski_rss = _rss() - rss0
+    eski_bayt = _pixmap_bayti(eski)
+
+    # Yeni yol: çözme havuzda, GUI thread'i yalnızca pixmap'e çevirip yerleştiriyor.
+    yeni = kartlar()
+    hedefler = [k.thumbnail_target() for k in yeni]
+    with ThreadPoolExecutor(4) as havuz:
+        resimler = list(havuz.map(lambda h: kucult(poster, h), hedefler))
+    rss0 = _rss()
+    t0 = time.perf_counter()
+    for k, img in zip(yeni, resimler):
+        k.set_thumbnail(img)
+    yeni_sure = time.perf_counter() - t0
+    yeni_rss = _rss() - rss0
+    yeni_bayt = _pixmap_bayti(yeni)
+
+    print(f"\n{IZGARA} kart, 1000x1500 JPEG kapak:"
+          f"\n  GUI thread'i: eski {eski_sure * 1000:.1f} ms, yeni {yeni_sure * 1000:.1f} ms"
+          f"\n  kartlardaki pixmap: eski {eski_bayt / 2**20:.1f} MB,"
+          f" yeni {yeni_bayt / 2**20:.1f} MB"
+          f"\n  RSS artışı: eski {eski_rss / 2**20:.1f} MB, yeni {yeni_rss / 2**20:.1f} MB")
+
+    assert yeni_bayt * 8 < eski_bayt
+    assert yeni_sure < eski_sure / 2, "GUI thread'i hâlâ çözme kadar duruyor"
+    assert all(k.lblThumb.pixmap() is not None for k in yeni)
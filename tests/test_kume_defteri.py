@@ -0,0 +1,110 @@
+"""KumeDefteri bloklama indeksi, tam taramayla BİREBİR aynı kümeyi mi seçiyor?
+
+`kume_bul` eskiden her yeni başlığı her küme başlığına `fuzzy_score` ile
+skorluyordu; onbinlerce animelik bir taramada O(N²). İndeks yalnızca eşiği
+geçebilecek kümeleri aday yapıyor ama atamalar değişmemeli: referans olarak
+eski döngü burada `_tam_tarama` adıyla duruyor.
+
+Ağa çıkılmıyor: durum deposu bellek içi SQLite.
+"""
+import random
+
+import pytest
+
+from turkanime_api.common.title_match import fuzzy_score
+from turkanime_server.crawler.durum import DurumDeposu
+from turkanime_server.crawler.eslestirme import KumeDefteri, slugla
+
+KELIMELER = [
+    "one", "piece", "naruto", "shippuuden", "bleach", "kimetsu", "no", "yaiba",
+    "shingeki", "kyojin", "frieren", "spy", "x", "family", "boku", "hero",
+    "academia", "film", "season", "2nd", "the", "final", "k", "on", "re", "zero",
+    "kara", "hajimeru", "isekai", "seikatsu", "ii", "ao", "ashi",
+]
+
+
+def _tam_tarama(defter, baslik):
+    """İndeksten önceki `kume_bul` gövdesi (referans)."""
+    aday = slugla(baslik)
+    if aday in defter._basliklar:
+        return aday
+    en_iyi, en_iyi_skor = None, 0.0
+    for slug, mevcut in defter._basliklar.items():
+        skor = fuzzy_score(baslik, mevcut)
+        if skor > en_iyi_skor:
+            en_iyi_skor, en_iyi = skor, slug
+    return en_iyi if en_iyi_skor >= defter.esik else None
+
+
+def _baslik(rnd):
+    """Kelime sırası, yazım hatası ve noktalama oynamış rastgele başlık."""
+    s = " ".join(rnd.choice(KELIMELER) for _ in range(rnd.randint(1, 5)))
+    harfler = list(s)
+    for _ in range(rnd.randint(0, 3)):
+        i = rnd.randrange(len(harfler) + 1)
+        islem = rnd.random()
+        if islem < 0.3 and len(harfler) > 1:
+            del harfler[min(i, len(harfler) - 1)]
+        elif islem < 0.6:
+            harfler.insert(i, rnd.choice("aeiounrst :-"))
+        elif harfler:
+            harfler[min(i, len(harfler) - 1)] = rnd.choice("aeiou ")
+    s = "".join(harfler)
+    if rnd.random() < 0.3:
+        s = " ".join(reversed(s.split()))
+    return s.title() or "X"
+
+
+@pytest.fixture
+def depo():
+    d = DurumDeposu(":memory:")
+    yield d
+    d.kapat()
+
+
+# 0 ve 1.5: indeks kullanılamaz, doğrusal taramaya düşülür (kurulum da patlamaz).
+@pytest.mark.parametrize("esik", [0.90, 0.95, 0.80, 0.60, 1.0, 0.0, 1.5])
+def test_indeks_tam_tarama_ile_ayni(depo, esik):
+    rnd = random.Random(int(esik * 100))
+    for i in range(250):
+        depo.kume_yaz(f"k{i:03d}", _baslik(rnd))
+    defter = KumeDefteri(depo, esik=esik)
+    for _ in range(150):
+        baslik = _baslik(rnd)
+        assert defter.kume_bul(baslik) == _tam_tarama(defter, baslik), baslik
+
+
+def test_bagla_indeksi_guncelliyor_ve_yeniden_acilista_ayni_atama(depo):
+    rnd = random.Random(11)
+    defter = KumeDefteri(depo)
+    basliklar = [_baslik(rnd) for _ in range(300)]
+    ilk = [defter.bagla("a", str(i), b) for i, b in enumerate(basliklar)]
+    for b in basliklar:
+        assert defter.kume_bul(b) == _tam_tarama(defter, b)
+
+    # Süreç yeniden başladı: indeks `depo.kumeler()`den kuruluyor.
+    yeniden = KumeDefteri(depo)
+    sorgular = basliklar + [_baslik(rnd) for _ in range(100)]
+    for b in sorgular:
+        assert yeniden.kume_bul(b) == _tam_tarama(yeniden, b)
+    assert [yeniden.bagla("a", str(i), b) for i, b in enumerate(basliklar)] == ilk
+
+
+def test_adaylar_kumelerin_kucuk_bir_kismi(depo):
+    rnd = random.Random(5)
+    hece = "ka ki ku ke ko sa shi su se so ta chi te to na ni ne no ha hi ma mi mo ya yu ra ri ro".split()
+    for i in range(2000):
+        ad = " ".join("".join(rnd.choice(hece) for _ in range(rnd.randint(2, 4)))
+                      for _ in range(rnd.randint(2, 4)))
+        depo.kume_yaz(f"k{i:04d}", ad.title())
+    defter = KumeDefteri(depo)
+    boyut = sum(len(defter._adaylar(b)) for _, b in depo.kumeler()[:50]) / 50
+    assert boyut < 0.25 * len(defter._basliklar)
+
+
+def test_cok_kisa_baslik_her_zaman_aday(depo):
+    depo.kume_yaz("k", "K")
+    depo.kume_yaz("one-piece", "One Piece")
+    defter = KumeDefteri(depo)
+    assert "k" in defter._adaylar("Kimetsu no Yaiba")
+    assert defter.kume_bul("X") == _tam_tarama(defter, "X")
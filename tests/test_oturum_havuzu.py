@@ -0,0 +1,217 @@
+"""Oturum havuzu: bağlantı yeniden kullanımı, host sınırı, boşta tahliye.
+
+Eskiden kaynaklar istek başına yeni curl_cffi oturumu kuruyordu; her istek
+yeni bir TCP + TLS el sıkışmasıydı. Sunucu yerel ve keep-alive konuşuyor;
+kabul ettiği bağlantıları sayıyor. Ağa çıkılmaz.
+"""
+from __future__ import annotations
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from turkanime_api.common import iptal, oturum_havuzu
+from turkanime_api.common.iptal import IptalEdildi
+from turkanime_api.common.oturum_havuzu import HavuzOturumu, OturumHavuzu
+
+pytest.importorskip("curl_cffi")
+
+
+class KeepAliveSunucu:
+    """HTTP/1.1 sunucusu: kabul edilen bağlantıyı ve eşzamanlı isteği sayar."""
+
+    def __init__(self, gecikme: float = 0.0):
+        sunucu = self
+        self.baglanti = 0
+        self.eszamanli = self.en_cok_eszamanli = 0
+        self._kilit = threading.Lock()
+
+        class Isleyici(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                with sunucu._kilit:
+                    sunucu.baglanti += 1
+                super().setup()
+
+            def do_GET(self):  # noqa: N802
+                with sunucu._kilit:
+                    sunucu.eszamanli += 1
+                    sunucu.en_cok_eszamanli = max(sunucu.en_cok_eszamanli,
+                                                  sunucu.eszamanli)
+                try:
+                    if self.path.startswith("/yavas"):
+                        time.sleep(gecikme)
+                    govde = (self.headers.get("Cookie") or "-").encode()
+                    self.send_response(200)
+                    if self.path == "/cerez":
+                        self.send_header("Set-Cookie", "oturum=A; Path=/")
+                    self.send_header("Content-Length", str(len(govde)))
+                    self.end_headers()
+                    self.wfile.write(govde)
+                finally:
+                    with sunucu._kilit:
+                        sunucu.eszamanli -= 1
+
+            def log_message(self, *_a):
+                pass
+
+        self._srv = ThreadingHTTPServer(("127.0.0.1", 0), Isleyici)
+        self._srv.daemon_threads = True
+        threading.Thread(target=self._srv.serve_forever, daemon=True).start()
+        # `localhost`: http.cookiejar IP adresine çerez yazmıyor.
+        self.url = f"http://localhost:{self._srv.server_address[1]}"
+
+    def kapat(self):
+        self._srv.shutdown()
+        self._srv.server_close()
+
+
+@pytest.fixture
+def sunucu():
+    s = KeepAliveSunucu(gecikme=0.1)
+    yield s
+    s.kapat()
+
+
+class Saat:
+    def __init__(self):
+        self.simdi = 1000.0
+
+    def __call__(self):
+        return self.simdi
+
+
+def test_ardisik_istekler_tek_baglantiyi_kullaniyor(sunucu):
+    havuz = OturumHavuzu()
+    oturum = HavuzOturumu("chrome131", havuz=havuz)
+    for _ in range(20):
+        assert oturum.get(sunucu.url + "/", timeout=5).status_code == 200
+
+    sayac = havuz.istatistikler()["localhost"]
+    print(f"\n20 istek: {sayac}")
+    assert sunucu.baglanti == 1
+    assert sayac["istek"] == 20
+    assert sayac["el_sikisma"] == 1 and sayac["yeniden_kullanim"] == 19
+    assert sayac["olusturulan"] == 1 and sayac["acik"] == 1 and sayac["kirada"] == 0
+
+
+def test_ayri_cepheler_baglantiyi_paylasip_cerezi_paylasmiyor(sunucu):
+    havuz = OturumHavuzu()
+    a = HavuzOturumu(havuz=havuz)
+    b = HavuzOturumu(havuz=havuz)
+    a.get(sunucu.url + "/cerez", timeout=5)
+    assert a.get(sunucu.url + "/", timeout=5).text == "oturum=A"
+    assert b.get(sunucu.url + "/", timeout=5).text == "-"
+    assert dict(a.cookies) == {"oturum": "A"} and dict(b.cookies) == {}
+    assert sunucu.baglanti == 1
+
+
+def test_host_siniri_eszamanli_baglantiyi_kisiyor(sunucu):
+    havuz = OturumHavuzu(host_basina=2)
+    hatalar: list = []
+
+    def _is():
+        try:
+            for _ in range(3):
+                HavuzOturumu(havuz=havuz).get(sunucu.url + "/yavas", timeout=10)
+        except Exception as exc:           # pragma: no cover - teşhis için
+            hatalar.append(exc)
+
+    isciler = [threading.Thread(target=_is) for _ in range(8)]
+    for t in isciler:
+        t.start()
+    for t in isciler:
+        t.join(30)
+
+    sayac = havuz.istatistikler()["localhost"]
+    assert hatalar == []
+    assert sayac["istek"] == 24
+    assert sunucu.en_cok_eszamanli <= 2
+    assert sunucu.baglanti == sayac["el_sikisma"] == 2
+    assert sayac["bekleme"] > 0 and sayac["acik"] == 2
+
+
+def test_bosta_kalan_oturum_tahliye_ediliyor(sunucu):
+    saat = Saat()
+    havuz = OturumHavuzu(bosta_sure=60, saat=saat)
+    oturum = HavuzOturumu(havuz=havuz)
+    oturum.get(sunucu.url + "/", timeout=5)
+
+    saat.simdi += 59
+    havuz.temizle()
+    assert havuz.istatistikler()["localhost"]["acik"] == 1
+
+    saat.simdi += 2
+    havuz.temizle()
+    sayac = havuz.istatistikler()["localhost"]
+    assert sayac["tahliye"] == 1 and sayac["acik"] == 0
+
+    oturum.get(sunucu.url + "/", timeout=5)
+    assert sunucu.baglanti == 2
+    assert havuz.istatistikler()["localhost"]["el_sikisma"] == 2
+
+
+def test_hatali_istegin_oturumu_havuza_donmuyor():
+    kapanan: list = []
+
+    class Bozuk:
+        def __init__(self, **_kw):
+            pass
+
+        def get(self, *_a, **_kw):
+            raise ConnectionError("koptu")
+
+        def close(self):
+            kapanan.append(self)
+
+    havuz = OturumHavuzu()
+    with pytest.raises(ConnectionError):
+        HavuzOturumu(havuz=havuz, sinif=Bozuk).get("https://ornek.test/x")
+    sayac = havuz.istatistikler()["ornek.test"]
+    assert sayac["atilan"] == 1 and sayac["acik"] == 0 and len(kapanan) == 1
+
+
+def test_sinirda_bekleyen_kiralama_iptal_ediliyor():
+    class Sahte:
+        def __init__(self, **_kw):
+            pass
+
+        def close(self):
+            pass
+
+    havuz = OturumHavuzu(host_basina=1)
+    baglam = iptal.IptalBaglami()
+    sonuc: list = []
+
+    def _bekle():
+        with iptal.etkin(baglam):
+            try:
+                with havuz.kirala("https://ornek.test/", sinif=Sahte):
+                    sonuc.append("kiraladı")
+            except IptalEdildi:
+                sonuc.append("iptal")
+
+    with havuz.kirala("https://ornek.test/", sinif=Sahte):
+        t = threading.Thread(target=_bekle)
+        t.start()
+        time.sleep(0.1)
+        baglam.iptal()
+        t.join(2)
+    assert sonuc == ["iptal"]
+    assert havuz.istatistikler()["ornek.test"]["kirada"] == 0
+
+
+@pytest.mark.parametrize("modul, fabrika", [
+    ("turkanime_api.sources.animedepo", "_session"),
+    ("turkanime_api.sources.tranimaci", "_new_session"),
+    ("turkanime_api.sources.tranime", "_get_session"),
+])
+def test_kaynaklar_havuzu_kullaniyor(modul, fabrika):
+    import importlib
+
+    oturum = getattr(importlib.import_module(modul), fabrika)()
+    assert isinstance(oturum, HavuzOturumu)
+    assert oturum.havuz is oturum_havuzu.havuz()
@@ -173,6 +173,26 @@ def test_gomulu_kopya_da_yoksa_hata_yutulmuyor(monkeypatch):
         req.gereksinim_listesi_getir()
 
 
+def test_modul_requests_sahtesi_kullaniliyor(monkeypatch):
+    """`requirements.requests`'i değiştirmek yetmeli (gerçek modüle dokunmadan).
+
+    Fonksiyonlar eskiden kendi içinde `import requests` yapıyordu; modül
+    özniteliğini sahteleyen test gerçek ağa çıkıyordu.
+    """
+    from types import SimpleNamespace
+
+    from turkanime_api.common import requirements as req
+
+    def _ag_yok(*_a, **_k):
+        raise OSError("ağ yok")
+
+    monkeypatch.setattr(req, "requests", SimpleNamespace(get=_ag_yok), raising=False)
+    monkeypatch.setattr(req, "gomulu_gereksinim_yolu", lambda: None)
+
+    with pytest.raises(OSError, match="ağ yok"):
+        req.gereksinim_listesi_getir()
+
+
 def test_gomulu_dosya_pakete_konuyor():
     """Yedek ancak pakete girerse yedektir — spec onu datas'a koymalı."""
     assert "('gereksinimler.json', '.')" in SPEC.read_text(encoding="utf-8")
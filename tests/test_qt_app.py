@@ -10,10 +10,11 @@ from turkanime_api.gui.qt.app import NAV_ITEMS, MainWindow
 
 def test_window_builds_all_pages(main_window):
     for key, _label in NAV_ITEMS:
-        assert key in main_window.pages, f"{key} sayfası kurulmadı"
-    # Bölüm sayfası menüde yok ama stack'te olmalı (arama sonucundan açılır)
+        assert key in main_window.pages, f"{key} sayfası kayıtlı değil"
+    # Bölüm sayfası menüde yok ama kayıtlı olmalı (arama sonucundan açılır)
     assert "episodes" in main_window.pages
-    assert main_window.stack.count() == len(main_window.pages)
+    # Sayfalar ilk ziyarette kuruluyor; stack yalnızca kurulanları taşır.
+    assert main_window.stack.count() == len(main_window.pages.built())
 
 
 def test_page_switching(main_window):
@@ -74,6 +75,7 @@ COCUK_KAPANIS = """
 import os, sys, time
 sys.path.insert(0, {repo!r})
 os.environ["QT_QPA_PLATFORM"] = "offscreen"
+os.environ["TURKANIME_TEK_ORNEK"] = "turkanime-test-kapanis-%d" % os.getpid()
 
 from turkanime_api.gui.qt import app as app_mod
 from turkanime_api.gui.qt.workers import run_bg
@@ -88,6 +90,9 @@ class SahtePencere(QMainWindow):
         run_bg(lambda: time.sleep(25), long_running=True)
         QTimer.singleShot(600, self.close)
 
+    def handle_request(self, istek):
+        pass
+
 
 app_mod.MainWindow = SahtePencere
 sys.exit(app_mod.run())
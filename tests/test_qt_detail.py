@@ -294,6 +294,9 @@ def fake_engine(monkeypatch):
             def search_all_sources_rich(self, query, limit_per_source=10):
                 return results
 
+            def search_all_sources_rich_iter(self, query, limit_per_source=10):
+                yield from results.items()
+
         monkeypatch.setattr(adapters_mod, "SearchEngine", FakeEngine)
 
     return _install
@@ -392,6 +395,9 @@ def test_elle_secim_gercek_arka_plan_isiyle_de_korunuyor(qtbot, page, fake_fetch
             kapi.wait(5)
             return {"TürkAnime": [{"slug": "otomatik-yanlis", "title": query}]}
 
+        def search_all_sources_rich_iter(self, query, limit_per_source=10):
+            yield from self.search_all_sources_rich(query, limit_per_source).items()
+
     monkeypatch.setattr(adapters_mod, "SearchEngine", GecikenEngine)
 
     page.show_anime(make_anime(), source="AnimeDepo", slug="depo-slug")
@@ -407,6 +413,29 @@ def test_elle_secim_gercek_arka_plan_isiyle_de_korunuyor(qtbot, page, fake_fetch
     assert slugs["AnimeDepo"] == "depo-slug"
 
 
+def test_tek_kaynak_eslesmesi_yavas_kaynaklari_beklemiyor(page, monkeypatch):
+    """İstenen kaynak gelince karar verilir; akışın kalanı çekilmez."""
+    import turkanime_api.common.adapters as adapters_mod
+
+    cekilen: list = []
+
+    class AkanEngine:
+        def search_all_sources_rich_iter(self, query, limit_per_source=10):
+            for kaynak in ("AniList", "TürkAnime", "AnimeDepo"):
+                cekilen.append(kaynak)
+                yield kaynak, [{"slug": f"{kaynak}-slug", "title": query}]
+
+    monkeypatch.setattr(adapters_mod, "SearchEngine", AkanEngine)
+    yayilan: list = []
+    page.sources_resolved.disconnect()
+    page.sources_resolved.connect(yayilan.append)
+
+    page._do_resolve(7, "Cowboy Bebop", {}, False, "TürkAnime")
+
+    assert cekilen == ["AniList", "TürkAnime"], "istenen kaynaktan sonra beklendi"
+    assert yayilan == [(7, {"TürkAnime": "TürkAnime-slug"}, False, "TürkAnime")]
+
+
 def test_apply_match_binds_source_and_saves(page, _no_match_save):
     page.show_anime(make_anime())
     page.apply_match("AnimeDepo", "cowboy-bebop", "Cowboy Bebop (TR)")
@@ -448,18 +477,19 @@ def test_search_result_opens_detail_then_episodes(qtbot, main_window, fake_fetch
 
     detail.load_episodes()
     episodes = main_window.pages["episodes"]
-    qtbot.waitUntil(lambda: main_window.stack.currentWidget() is episodes,
-                    timeout=5000)
+    qtbot.waitUntil(lambda: main_window.stack.currentWidget() is episodes
+                    and episodes.model.rowCount() > 0, timeout=5000)
     assert len(episodes.visible_rows()) == 2
     assert "Cowboy Bebop — TürkAnime" == episodes.lblTitle.text()
 
 
-def test_episode_page_does_not_refetch_when_given_list(main_window, fake_fetch):
+def test_episode_page_does_not_refetch_when_given_list(qtbot, main_window, fake_fetch):
     """Devralınan liste ikinci kez ağdan çekilmemeli."""
     calls = fake_fetch(result=[{"title": "1. Bölüm", "obj": object()}])
     episodes = main_window.pages["episodes"]
-    episodes.load("TürkAnime", "cb", "Cowboy Bebop",
-                  episodes=[{"title": "1. Bölüm", "obj": object()}])
+    with qtbot.waitSignal(episodes.list_ready, timeout=5000):
+        episodes.load("TürkAnime", "cb", "Cowboy Bebop",
+                      episodes=[{"title": "1. Bölüm", "obj": object()}])
 
     assert calls == []
     assert len(episodes.visible_rows()) == 1
@@ -205,8 +205,8 @@ def test_page_builds_cards_in_every_mode(qtbot, fake_sources, mode):
     page.refresh()
 
     qtbot.waitUntil(lambda: len(page.cards()) == 5, timeout=5000)
-    assert page.results.grid.count() == 5
-    assert [c.lblTitle.text() for c in page.cards()][0] == "Anime 0"
+    assert page.results.count() == 5
+    assert [c.title for c in page.cards()][0] == "Anime 0"
     assert "5" in page.lblStatus.text()
 
 
@@ -219,7 +219,7 @@ def test_page_shows_fallback_data(qtbot, fake_sources):
     page.refresh()
 
     qtbot.waitUntil(lambda: len(page.cards()) == 1, timeout=5000)
-    assert page.cards()[0].lblTitle.text() == "AniList Anime"
+    assert page.cards()[0].title == "AniList Anime"
 
 
 def test_sezon_sayfasi_bos_kalinca_trend_verisi_gostermez(qtbot, fake_sources):
@@ -232,7 +232,7 @@ def test_sezon_sayfasi_bos_kalinca_trend_verisi_gostermez(qtbot, fake_sources):
     page.refresh()
 
     qtbot.waitUntil(lambda: page.btnRefresh.isEnabled(), timeout=5000)
-    assert [c.lblTitle.text() for c in page.cards()] == []
+    assert [c.title for c in page.cards()] == []
     assert "sezonu" in page.lblSubtitle.text()
     assert "Sezon verisi alınamadı" in page.lblStatus.text()
 
@@ -252,8 +252,8 @@ def test_ana_sayfa_ve_trend_sayfalari_ayni_listeyi_gostermez(qtbot, fake_sources
     qtbot.waitUntil(lambda: len(home.cards()) == 6, timeout=5000)
     qtbot.waitUntil(lambda: len(trending.cards()) == 3, timeout=5000)
 
-    assert home.cards()[0].lblTitle.text() == "S0"
-    assert trending.cards()[0].lblTitle.text() == "T0"
+    assert home.cards()[0].title == "S0"
+    assert trending.cards()[0].title == "T0"
 
 
 def test_page_reports_empty_result(qtbot, fake_sources):
@@ -309,10 +309,10 @@ def test_score_badge_uses_score_color(qtbot, fake_sources):
     qtbot.waitUntil(lambda: len(page.cards()) == 3, timeout=5000)
 
     good, bad, none = page.cards()
-    assert good.lblSource.text() == "★ 9.0"
-    assert ACCENT in good.lblSource.styleSheet()
-    assert DANGER in bad.lblSource.styleSheet()
-    assert none.lblSource.text() == "Puansız"
+    assert good.source == "★ 9.0"
+    assert good.badge_color == ACCENT
+    assert bad.badge_color == DANGER
+    assert none.source == "Puansız"
 
 
 def test_card_click_opens_detail_page(qtbot, main_window, fake_sources):
@@ -330,7 +330,8 @@ def test_card_click_opens_detail_page(qtbot, main_window, fake_sources):
     page.refresh()
     qtbot.waitUntil(lambda: len(page.cards()) == 1, timeout=5000)
 
-    qtbot.mouseClick(page.cards()[0], Qt.MouseButton.LeftButton)
+    qtbot.mouseClick(page.results.viewport(), Qt.MouseButton.LeftButton,
+                     pos=page.results.item_rect(0).center())
 
     detail = main_window.pages["detail"]
     assert main_window.stack.currentWidget() is detail
@@ -378,21 +379,26 @@ def _izgara_sayfasi(qtbot, fake_sources, adet=12, width=1200, kapak=None):
     return page
 
 
+def _kutular(page):
+    """Kartların viewport'taki dikdörtgenleri (kart widget'ı yok, boyanıyor)."""
+    return [page.results.item_rect(i) for i in range(page.results.count())]
+
+
 def _satirlar(page):
-    """Kartları y konumuna göre satırlara ayır (soldan sağa sıralı)."""
+    """Kart kutularını y konumuna göre satırlara ayır (soldan sağa sıralı)."""
     satirlar: dict = {}
-    for card in page.cards():
-        satirlar.setdefault(card.y(), []).append(card)
+    for kutu in _kutular(page):
+        satirlar.setdefault(kutu.y(), []).append(kutu)
     return [sorted(satirlar[y], key=lambda c: c.x()) for y in sorted(satirlar)]
 
 
 def test_izgara_sutunlari_esit_genislikte(qtbot, fake_sources):
     page = _izgara_sayfasi(qtbot, fake_sources, adet=12, width=1200)
 
-    genislikler = page.results.grid.column_widths()
+    genislikler = page.results.column_widths()
     assert len(genislikler) == page.results.columns() >= 2
-    # TAM eşitlik: bölünmeden artan pikseller sütunlara dağıtılmaz, sağdaki
-    # yutucu sütuna bırakılır.
+    # TAM eşitlik: bölünmeden artan pikseller sütunlara dağıtılmaz, sağda
+    # boş kalır.
     assert len(set(genislikler)) == 1
 
 
@@ -445,8 +451,8 @@ def test_kartlar_genis_pencerede_orantisiz_buyumez(qtbot, fake_sources):
     for width in (700, 900, 1200, 1600, 2000):
         _yerles(qtbot, page, width)
         assert page.results.columns() >= 2, width
-        for card in page.cards():
-            assert CARD_MIN_WIDTH <= card.width() < 2 * CARD_MIN_WIDTH, width
+        for kutu in _kutular(page):
+            assert CARD_MIN_WIDTH <= kutu.width() < 2 * CARD_MIN_WIDTH, width
 
 
 def test_pencere_daralinca_sutun_sayisi_azalir(qtbot, fake_sources):
@@ -473,9 +479,8 @@ def test_kartlar_gorunen_alani_asmaz(qtbot, fake_sources):
     for width in (1600, 1200, 900, 700, 500, 1400):
         _yerles(qtbot, page, width)
         gorunen = page.results.available_width()
-        assert page.results.grid.width() <= gorunen
-        for card in page.cards():
-            assert card.x() + card.width() <= gorunen
+        for kutu in _kutular(page):
+            assert kutu.x() + kutu.width() <= gorunen
 
 
 def test_izgara_her_genislikte_tutarli(qtbot, fake_sources):
@@ -492,10 +497,9 @@ def test_izgara_her_genislikte_tutarli(qtbot, fake_sources):
     for width in genislikler:
         _yerles(qtbot, page, width)
         gorunen = page.results.available_width()
-        assert page.results.grid.width() <= gorunen, width
-        assert len(set(page.results.grid.column_widths())) == 1, width
-        for card in page.cards():
-            assert card.x() + card.width() <= gorunen, width
+        assert len(set(page.results.column_widths())) == 1, width
+        for kutu in _kutular(page):
+            assert kutu.x() + kutu.width() <= gorunen, width
 
 
 def test_poster_kartlari_ayni_satirda_ayni_hizada(qtbot, fake_sources):
@@ -514,7 +518,7 @@ def test_poster_kartlari_ayni_satirda_ayni_hizada(qtbot, fake_sources):
         # görsel satır iki ayrı gruba bölünür ve grup sayısı artardı.
         beklenen_satir = -(-len(page.cards()) // page.results.columns())
         assert len(satirlar) == beklenen_satir, width
-        assert len({c.height() for c in page.cards()}) == 1, width
+        assert len({c.height() for c in _kutular(page)}) == 1, width
 
 
 def test_izgara_uste_hizali(qtbot, fake_sources):
@@ -523,17 +527,16 @@ def test_izgara_uste_hizali(qtbot, fake_sources):
 
     ilk_satir = _satirlar(page)[0]
     assert [c.y() for c in ilk_satir] == [0] * len(ilk_satir)
-    # Izgara gövdesi kaydırma alanının tepesinde durur ve yalnızca kartların
-    # kapladığı yeri tutar.
-    assert page.results.grid.y() == 0
-    assert page.results.grid.height() < page.results.viewport().height()
+    # Kartlar yalnızca kapladıkları yeri tutar; kaydırılacak bir şey yok.
+    assert page.results.content_height() < page.results.viewport().height()
+    assert page.results.verticalScrollBar().maximum() == 0
 
 
 def test_sutun_hesabi_hicbir_genislikte_tasmaz():
     """Sütun sayısı formülünün kendisi (Qt geometrisi olmadan)."""
-    from turkanime_api.gui.qt.pages._grid import GRID_GAP, CardGridBody
+    from turkanime_api.gui.qt.pages._grid import GRID_GAP, CardGrid
 
-    body = CardGridBody()
+    body = CardGrid()
     onceki = 0
     for available in range(0, 2400, 7):
         cols = body.columns_for(available)
@@ -9,11 +9,14 @@ sahtelenir. Testlerin ana derdi üç davranış:
 """
 from __future__ import annotations
 
+import threading
+
 import pytest
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QDialog
 
 from turkanime_api.gui.qt.pages import detail as detail_mod
+from turkanime_api.gui.qt.pages import episodes as episodes_mod
 from turkanime_api.gui.qt.pages.detail import DetailPage
 from turkanime_api.gui.qt.pages.episodes import (
     EpisodePage, SourceSelectDialog, active_sources, as_sources_data,
@@ -37,6 +40,27 @@ def page(qtbot):
     return widget
 
 
+def yukle(qtbot, page, *args, **kwargs):
+    """`load` listeyi arka planda hazırlıyor; modele yerleşmesini bekle."""
+    with qtbot.waitSignal(page.list_ready, timeout=5000):
+        page.load(*args, **kwargs)
+
+
+def satir(page, i):
+    """Görünen ``i``'inci satırın geometrisi (düğmeler widget değil, kutu)."""
+    return page.view.geometry_for(page.proxy.index(i, 0))
+
+
+def kaynak_dugmeleri(page, i):
+    return {name for kind, name, *_ in satir(page, i).actions if kind == "play"}
+
+
+def tikla(qtbot, page, rect):
+    page.show()
+    qtbot.waitExposed(page)
+    qtbot.mouseClick(page.view.viewport(), Qt.MouseButton.LeftButton, pos=rect.center())
+
+
 # ── Saf yardımcılar ─────────────────────────────────────────────────────────
 def test_as_sources_data_iki_sekli_de_kabul_ediyor():
     """Tek kaynak düz liste, çok kaynak sözlük gönderiyor."""
@@ -78,48 +102,49 @@ def test_source_counts():
 
 
 # ── Tek kaynak: sade görünüm ────────────────────────────────────────────────
-def test_tek_kaynakta_sade_satir(page):
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(2))
+def test_tek_kaynakta_sade_satir(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(2))
 
     assert len(page.visible_rows()) == 2
-    row = page._rows[0]
-    assert row.btnPlay is not None and row.btnPlay.text() == "Oynat"
-    assert row.btnDl is not None and row.btnDl.text() == "İndir"
-    assert list(row.source_buttons) == ["TürkAnime"]
+    row = satir(page, 0)
+    assert row.single and row.badges == []
+    assert [(kind, name, label) for kind, name, label, *_ in row.actions] == [
+        ("play", "TürkAnime", "Oynat"), ("download", "TürkAnime", "İndir")]
     assert page.lblTitle.text() == "Cowboy Bebop — TürkAnime"
     assert not page.lblSources.isVisible()
 
 
 def test_tek_kaynak_oynat_ham_kaydi_yayiyor(qtbot, page):
     entries = numbered(1)
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=entries)
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=entries)
 
     with qtbot.waitSignal(page.play_requested, timeout=1000) as blocker:
-        qtbot.mouseClick(page._rows[0].btnPlay, Qt.MouseButton.LeftButton)
+        tikla(qtbot, page, page.view.action_rect(0, "play"))
     assert blocker.args[0] is entries[0]
 
 
 # ── Çok kaynak: birleşik satır ──────────────────────────────────────────────
-def test_cok_kaynak_tek_satirda_birlesiyor(page):
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes={
+def test_cok_kaynak_tek_satirda_birlesiyor(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes={
         "TürkAnime": [ep("Cowboy Bebop 1. Bölüm"), ep("Cowboy Bebop 2. Bölüm")],
         "AnimeciX": [ep("1. Bölüm"), ep("2. Bölüm"), ep("3. Bölüm")],
         "Anizle": [ep("Bölüm 1")],
     })
 
     assert len(page.visible_rows()) == 3
-    assert set(page._rows[0].source_buttons) == {"TürkAnime", "AnimeciX", "Anizle"}
+    assert kaynak_dugmeleri(page, 0) == {"TürkAnime", "AnimeciX", "Anizle"}
     # 2. bölüm Anizle'de yok: rozet de olmamalı
-    assert set(page._rows[1].source_buttons) == {"TürkAnime", "AnimeciX"}
+    assert kaynak_dugmeleri(page, 1) == {"TürkAnime", "AnimeciX"}
     # Tek kaynakta bulunan bölüm de rozet göstermeli (hangi kaynak belli olsun)
-    assert set(page._rows[2].source_buttons) == {"AnimeciX"}
-    assert page._rows[2].btnPlay is None
+    assert kaynak_dugmeleri(page, 2) == {"AnimeciX"}
+    assert [name for name, _ in satir(page, 2).badges] == ["AnimeciX"]
+    assert not satir(page, 2).single
     assert page.lblTitle.text() == "Cowboy Bebop — 3 kaynak"
     assert "Anizle" in page.lblSources.text()
     assert "3 kaynak" in page.lblStatus.text()
 
 
-def test_addaki_rakam_kaynaklari_ayirmiyor(page):
+def test_addaki_rakam_kaynaklari_ayirmiyor(qtbot, page):
     """Sayfa anime adını birleştiriciye veriyor mu?
 
     Vermezse "86 2nd Season 5. Bölüm" (2,5), Anizle'nin "5. Bölüm"ü (1,5)
@@ -127,7 +152,7 @@ def test_addaki_rakam_kaynaklari_ayirmiyor(page):
     indirmede yarısı "bu kaynakta yok" diye atlanıyor.
     """
     ad = "86 2nd Season"
-    page.load("AnimeDepo", "86-2nd-season", ad, episodes={
+    yukle(qtbot, page, "AnimeDepo", "86-2nd-season", ad, episodes={
         "AnimeDepo": [ep(f"{ad} {n}. Bölüm") for n in range(1, 13)],
         "Anizle": [ep(f"{n}. Bölüm") for n in range(1, 13)],
     })
@@ -139,59 +164,55 @@ def test_addaki_rakam_kaynaklari_ayirmiyor(page):
     assert len(page.selected_episodes()) == 12
 
 
-def test_ara_bolum_ayri_satirda_secilebiliyor(page):
+def test_ara_bolum_ayri_satirda_secilebiliyor(qtbot, page):
     """"5. Bölüm" ile "5.5. Bölüm" aynı satır anahtarını paylaşmamalı."""
-    page.load("AnimeDepo", "ggo", "GGO", episodes={
+    yukle(qtbot, page, "AnimeDepo", "ggo", "GGO", episodes={
         "AnimeDepo": [ep("GGO 5. Bölüm"), ep("GGO 5.5. Bölüm"), ep("GGO 6. Bölüm")],
     })
 
     assert [e["title"] for e in page._all] == ["5. Bölüm", "5.5. Bölüm", "6. Bölüm"]
-    page._rows[1].set_checked(True)
-    page._on_row_toggled(page._rows[1].key, True)
+    page.model.set_checked(1, True)
     assert [e["title"] for e in page.selected_episodes()] == ["5.5. Bölüm"]
 
 
 def test_satir_dugmesi_kendi_kaynagini_yayiyor(qtbot, page):
     animecix = ep("1. Bölüm")
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes={
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes={
         "TürkAnime": [ep("Cowboy Bebop 1. Bölüm")],
         "AnimeciX": [animecix],
     })
-    play, download = page._rows[0].source_buttons["AnimeciX"]
-
     with qtbot.waitSignal(page.play_requested, timeout=1000) as blocker:
-        qtbot.mouseClick(play, Qt.MouseButton.LeftButton)
+        tikla(qtbot, page, page.view.action_rect(0, "play", "AnimeciX"))
     assert blocker.args[0] is animecix
 
     with qtbot.waitSignal(page.download_requested, timeout=1000) as blocker:
-        qtbot.mouseClick(download, Qt.MouseButton.LeftButton)
+        tikla(qtbot, page, page.view.action_rect(0, "download", "AnimeciX"))
     assert blocker.args[0] is animecix
 
 
-def test_bos_kaynak_liste_basligini_kirletmiyor(page):
+def test_bos_kaynak_liste_basligini_kirletmiyor(qtbot, page):
     """Yüklenemeyen kaynak rozet üretmemeli."""
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes={
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes={
         "TürkAnime": numbered(1), "Anizle": [],
     })
-    assert list(page._rows[0].source_buttons) == ["TürkAnime"]
+    assert kaynak_dugmeleri(page, 0) == {"TürkAnime"}
+    assert satir(page, 0).single
     assert page.lblTitle.text() == "Cowboy Bebop — TürkAnime"
 
 
-# ── Mevcut davranışlar: sayfalama / filtre / seçim ──────────────────────────
-def test_sayfalama_30ar_yukluyor(page):
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(70))
+# ── Mevcut davranışlar: liste / filtre / seçim ──────────────────────────────
+def test_tum_bolumler_sayfalamasiz_listede(qtbot, page):
+    """Sanal liste: "Daha fazla yükle" yok, satır başına widget yok."""
+    from PySide6.QtWidgets import QWidget
+
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(70))
 
-    assert len(page._rows) == 30
-    assert page.btnMore.isVisibleTo(page)
-    page._load_more()
-    assert len(page._rows) == 60
-    page._load_more()
-    assert len(page._rows) == 70
-    assert not page.btnMore.isVisibleTo(page)
+    assert page.proxy.rowCount() == 70
+    assert len(page.view.findChildren(QWidget)) < 10
 
 
-def test_filtre_satirlari_isaretliyor(page):
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(12))
+def test_filtre_satirlari_isaretliyor(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(12))
     page.txtFilter.setText("1")
 
     # 1, 10, 11, 12
@@ -201,8 +222,8 @@ def test_filtre_satirlari_isaretliyor(page):
     assert len(page.visible_rows()) == 12
 
 
-def test_tumunu_sec_yalnizca_filtrelenenleri_aliyor(page):
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(12))
+def test_tumunu_sec_yalnizca_filtrelenenleri_aliyor(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(12))
     page.txtFilter.setText("3")
     page.btnAll.setChecked(True)
 
@@ -211,9 +232,9 @@ def test_tumunu_sec_yalnizca_filtrelenenleri_aliyor(page):
     assert page.btnAll.text() == "Seçimi Kaldır"
 
 
-def test_filtre_secimi_daraltiyor(page):
+def test_filtre_secimi_daraltiyor(qtbot, page):
     """Filtresiz seçilenler, filtre uygulanınca indirmeye gitmemeli."""
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(12))
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(12))
     page.btnAll.setChecked(True)
     assert len(page.selected_entries()) == 12
 
@@ -221,32 +242,30 @@ def test_filtre_secimi_daraltiyor(page):
     assert len(page.selected_entries()) == 1
 
 
-def test_secim_yuklenmemis_sayfalari_da_kapsiyor(page):
+def test_secim_yuklenmemis_sayfalari_da_kapsiyor(qtbot, page):
     """Eski GUI `get_selected_episodes` davranışı: seçim satıra bağlı değil."""
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(70))
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(70))
     page.btnAll.setChecked(True)
 
-    assert len(page._rows) == 30
     assert len(page.selected_episodes()) == 70
     assert len(page.selected_entries()) == 70
-
-    page._load_more()
-    assert page._rows[45].checked, "sonradan yüklenen satır seçimi göstermiyor"
+    assert page.proxy.index(45, 0).data(Qt.ItemDataRole.CheckStateRole) \
+        == Qt.CheckState.Checked
 
 
-def test_yeni_anime_secimi_sifirliyor(page):
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(5))
+def test_yeni_anime_secimi_sifirliyor(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(5))
     page.btnAll.setChecked(True)
     assert len(page.selected_episodes()) == 5
 
-    page.load("TürkAnime", "trigun", "Trigun", episodes=numbered(3))
+    yukle(qtbot, page, "TürkAnime", "trigun", "Trigun", episodes=numbered(3))
     assert page.selected_episodes() == []
     assert page.btnAll.text() == "Tümünü Seç"
 
 
-def test_secilen_kaynaktan_kayit_donuyor(page):
+def test_secilen_kaynaktan_kayit_donuyor(qtbot, page):
     turkanime, animecix = ep("Cowboy Bebop 1. Bölüm"), ep("1. Bölüm")
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes={
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes={
         "TürkAnime": [turkanime], "AnimeciX": [animecix],
     })
     page.btnAll.setChecked(True)
@@ -262,7 +281,7 @@ def test_tek_kaynakta_dialog_sorulmuyor(qtbot, page, monkeypatch):
     monkeypatch.setattr(page, "_ask_source",
                         lambda counts, total: asked.append(counts))
 
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(3))
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(3))
     page.btnAll.setChecked(True)
 
     queued = []
@@ -273,7 +292,7 @@ def test_tek_kaynakta_dialog_sorulmuyor(qtbot, page, monkeypatch):
     assert len(queued) == 3
 
 
-def test_cok_kaynakta_dialog_soruluyor(page, monkeypatch):
+def test_cok_kaynakta_dialog_soruluyor(qtbot, page, monkeypatch):
     asked = []
 
     def fake_ask(counts, total):
@@ -282,7 +301,7 @@ def test_cok_kaynakta_dialog_soruluyor(page, monkeypatch):
 
     monkeypatch.setattr(page, "_ask_source", fake_ask)
     animecix = numbered(2, "Bölüm {}")
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes={
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes={
         "TürkAnime": numbered(2), "AnimeciX": animecix,
     })
     page.btnAll.setChecked(True)
@@ -295,9 +314,9 @@ def test_cok_kaynakta_dialog_soruluyor(page, monkeypatch):
     assert queued == animecix, "seçilen kaynağın kayıtları kuyruğa girmedi"
 
 
-def test_iptal_edilen_dialog_indirmiyor(page, monkeypatch):
+def test_iptal_edilen_dialog_indirmiyor(qtbot, page, monkeypatch):
     monkeypatch.setattr(page, "_ask_source", lambda counts, total: None)
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes={
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes={
         "TürkAnime": numbered(2), "AnimeciX": numbered(2, "Bölüm {}"),
     })
     page.btnAll.setChecked(True)
@@ -310,9 +329,9 @@ def test_iptal_edilen_dialog_indirmiyor(page, monkeypatch):
     assert "iptal" in page.lblStatus.text().lower()
 
 
-def test_secilen_kaynakta_olmayan_bolum_atlaniyor(page, monkeypatch):
+def test_secilen_kaynakta_olmayan_bolum_atlaniyor(qtbot, page, monkeypatch):
     monkeypatch.setattr(page, "_ask_source", lambda counts, total: "Anizle")
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes={
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes={
         "TürkAnime": numbered(3),
         "Anizle": [ep("Bölüm 1")],
     })
@@ -338,8 +357,8 @@ def test_dialog_secimi_donduruyor(qtbot):
     assert dialog.result() == QDialog.DialogCode.Accepted
 
 
-def test_secim_yokken_uyari(page):
-    page.load("TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(3))
+def test_secim_yokken_uyari(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "cb", "Cowboy Bebop", episodes=numbered(3))
     page._download_selected()
     assert "en az bir bölüm" in page.lblStatus.text()
 
@@ -365,6 +384,10 @@ def fake_engine(monkeypatch):
                 calls.append((query, limit_per_source))
                 return results
 
+            def search_all_sources_rich_iter(self, query, limit_per_source=10):
+                calls.append((query, limit_per_source))
+                yield from results.items()
+
         monkeypatch.setattr(adapters_mod, "SearchEngine", FakeEngine)
         return calls
 
@@ -424,6 +447,31 @@ def test_cok_kaynak_yuklemesi_kismi_hatayi_raporluyor(qtbot, detail, fake_engine
     assert detail.btnEpisodes.isEnabled()
 
 
+def test_cok_kaynak_sayimi_gui_threadinde_birlestirmiyor(qtbot, detail, fake_engine,
+                                                        fake_fetch, monkeypatch):
+    """Durum metnindeki satır sayısı arka planda, önbellekli birleştirmeyle."""
+    episodes_mod.clear_merge_cache()
+    threadler: list = []
+    asil = episodes_mod.merge_episodes
+    monkeypatch.setattr(episodes_mod, "merge_episodes", lambda s, t="": (
+        threadler.append(threading.current_thread()) or asil(s, t)))
+    fake_engine(ALL_MATCHES)
+    fake_fetch({"TürkAnime": numbered(3), "AnimeciX": numbered(3, "Bölüm {}"),
+                "Anizle": numbered(2)})
+    detail.show_match("TürkAnime", "cowboy-bebop", "Cowboy Bebop")
+    detail.chkAllSources.setChecked(True)
+
+    with qtbot.waitSignal(detail.episodes_ready, timeout=5000) as blocker:
+        detail.load_episodes()
+
+    assert "3 bölüm" in detail.lblStatus.text()
+    assert len(threadler) == 1 and threadler[0] is not threading.main_thread()
+    # Bölüm sayfasının hazırlığı aynı planı önbellekten alıyor.
+    episodes_mod.merge_cached(blocker.args[3], "Cowboy Bebop")
+    assert len(threadler) == 1
+    episodes_mod.clear_merge_cache()
+
+
 def test_cok_kaynak_yuklemesi_dogru_slug_kullaniyor(qtbot, detail, fake_engine,
                                                     fake_fetch):
     """Her kaynak KENDİ slug'ıyla çekilmeli (slug'lar kaynağa özgü)."""
@@ -524,15 +572,16 @@ def test_eski_sonuc_yeni_animeyi_ezmiyor(detail):
 
 
 # ── Ana pencere kablolaması ─────────────────────────────────────────────────
-def test_ana_pencere_cok_kaynakli_yuku_devraliyor(main_window):
+def test_ana_pencere_cok_kaynakli_yuku_devraliyor(qtbot, main_window):
     episodes = main_window.pages["episodes"]
-    main_window.pages["detail"].episodes_ready.emit(
-        "TürkAnime", "cowboy-bebop", "Cowboy Bebop", {
-            "TürkAnime": [ep("Cowboy Bebop 1. Bölüm")],
-            "AnimeciX": [ep("1. Bölüm")],
-        })
+    with qtbot.waitSignal(episodes.list_ready, timeout=5000):
+        main_window.pages["detail"].episodes_ready.emit(
+            "TürkAnime", "cowboy-bebop", "Cowboy Bebop", {
+                "TürkAnime": [ep("Cowboy Bebop 1. Bölüm")],
+                "AnimeciX": [ep("1. Bölüm")],
+            })
 
     assert main_window.stack.currentWidget() is episodes
     assert len(episodes.visible_rows()) == 1
-    assert set(episodes._rows[0].source_buttons) == {"TürkAnime", "AnimeciX"}
+    assert kaynak_dugmeleri(episodes, 0) == {"TürkAnime", "AnimeciX"}
     assert episodes.lblTitle.text() == "Cowboy Bebop — 2 kaynak"
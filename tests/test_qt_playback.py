@@ -11,7 +11,7 @@ from __future__ import annotations
 import pytest
 
 from turkanime_api.gui.qt import prefs
-from turkanime_api.gui.qt.pages.episodes import EpisodePage, EpisodeRow
+from turkanime_api.gui.qt.pages.episodes import EpisodeModel, EpisodePage
 from turkanime_api.gui.qt.progress_dialog import ProgressDialog
 
 
@@ -214,32 +214,38 @@ def _episode(bolum, title="1. Bölüm", source="TürkAnime"):
             "sources": {source: {"title": title, "obj": bolum}}}
 
 
-def test_satirda_izlendi_ve_indirildi_rozeti(qtbot):
-    bolum = SahteBolum()
-    row = EpisodeRow(_episode(bolum),
-                     gecmis=SahteGecmis(izlendi=[bolum.slug], indirildi=[bolum.slug]))
-    qtbot.addWidget(row)
+def yukle(qtbot, page, *args, **kwargs):
+    """`load` listeyi arka planda hazırlıyor; modele yerleşmesini bekle."""
+    with qtbot.waitSignal(page.list_ready, timeout=5000):
+        page.load(*args, **kwargs)
+
+
+def _model(episode, gecmis):
+    model = EpisodeModel()
+    model.set_episodes([episode], multi=False)
+    model.set_gecmis(gecmis)
+    return model
 
-    assert row.izlendi and row.indirildi
-    assert row.lblHistory.isVisibleTo(row)
-    assert "izlendi" in row.lblHistory.toolTip()
+
+def test_satirda_izlendi_ve_indirildi_rozeti():
+    bolum = SahteBolum()
+    model = _model(_episode(bolum),
+                   SahteGecmis(izlendi=[bolum.slug], indirildi=[bolum.slug]))
+    assert model.history(0) == (True, True)
 
 
-def test_satirda_gecmis_yoksa_rozet_gizli(qtbot):
-    row = EpisodeRow(_episode(SahteBolum()), gecmis=SahteGecmis())
-    qtbot.addWidget(row)
-    assert not row.izlendi and not row.indirildi
-    assert not row.lblHistory.isVisibleTo(row)
+def test_satirda_gecmis_yoksa_rozet_gizli():
+    assert _model(_episode(SahteBolum()), SahteGecmis()).history(0) == (False, False)
 
 
 def test_ikon_ayari_kapaliyken_gecmis_okunmuyor(qtbot, ayarla):
     ayarla(**{"izlendi ikonu": False})
     page = EpisodePage()
     qtbot.addWidget(page)
-    page.load("TürkAnime", "naruto-test", "Naruto Test",
+    yukle(qtbot, page, "TürkAnime", "naruto-test", "Naruto Test",
               episodes=[{"title": "1. Bölüm", "obj": SahteBolum()}])
     assert page._gecmis is None
-    assert not page._rows[0].lblHistory.isVisibleTo(page._rows[0])
+    assert page.model.history(0) == (False, False)
 
 
 def test_liste_gercek_gecmisi_okuyor(qtbot, izole_ev):
@@ -256,12 +262,12 @@ def test_liste_gercek_gecmisi_okuyor(qtbot, izole_ev):
 
     page = EpisodePage()
     qtbot.addWidget(page)
-    page.load("TürkAnime", "naruto-test", "Naruto Test",
+    yukle(qtbot, page, "TürkAnime", "naruto-test", "Naruto Test",
               episodes=[{"title": "1. Bölüm", "obj": SahteBolum()}])
 
-    assert page._rows[0].izlendi is True
-    assert page._rows[0].indirildi is False
+    assert page.model.history(0) == (True, False)
 
     Dosyalar().set_gecmis("naruto-test", "naruto-test-1-bolum", "indirildi")
-    page.refresh_history()
-    assert page._rows[0].indirildi is True
+    with qtbot.waitSignal(page.history_ready, timeout=5000):
+        page.refresh_history()
+    assert page.model.history(0) == (True, True)
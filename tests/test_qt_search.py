@@ -45,13 +45,16 @@ def sahte_motor(monkeypatch):
 
     def _kur(sonuc, gecikme: threading.Event | None = None):
         class SahteMotor:
-            def search_all_sources_rich(self, query, limit_per_source=10):
+            def search_all_sources_rich(self, query, limit_per_source=10,
+                                        on_result=None):
                 cagrilar.append((query, limit_per_source))
                 if gecikme is not None:
                     gecikme.wait(10)
-                if callable(sonuc):
-                    return sonuc(query)
-                return sonuc
+                cikti = sonuc(query) if callable(sonuc) else sonuc
+                if on_result is not None and isinstance(cikti, dict):
+                    for kaynak, kayitlar in cikti.items():
+                        on_result(kaynak, kayitlar)
+                return cikti
 
         monkeypatch.setattr(adapters_mod, "SearchEngine", SahteMotor)
         return cagrilar
@@ -112,7 +115,7 @@ def test_gercek_motor_ciktisi_dogrudan_islenebiliyor(page):
 
     page._on_results(sonuc)
 
-    assert [c.lblTitle.text() for c in page.cards()] == [
+    assert [c.title for c in page.cards()] == [
         "Cowboy Bebop", "Cowboy Bebop TR"]
     assert page.cards()[0].payload == ("AniList", "101", "Cowboy Bebop")
     assert page.cards()[1].payload == ("TurkAnime", "cowboy-bebop",
@@ -131,9 +134,9 @@ def test_sonuc_gelince_kart_uretiliyor(qtbot, page, sahte_motor):
 
     qtbot.waitUntil(lambda: len(page.cards()) == 3, timeout=5000)
     # Kaynaklar alfabetik: AnimeDepo önce gelir.
-    assert [c.lblSource.text() for c in page.cards()] == [
+    assert [c.source for c in page.cards()] == [
         "AnimeDepo", "TurkAnime", "TurkAnime"]
-    assert page.results.grid.count() == 3
+    assert page.results.count() == 3
     assert "3 sonuç" in page.lblStatus.text()
     assert cagrilar == [("naruto", LIMIT_PER_SOURCE)]
 
@@ -175,10 +178,55 @@ def test_bos_sonuc_onceki_kartlari_temizliyor(page):
     page._on_results({"TurkAnime": []})
 
     assert page.cards() == []
-    assert page.results.grid.count() == 0
+    assert page.results.count() == 0
     assert "bulunamadı" in page.lblStatus.text()
 
 
+def test_kartlar_kaynak_bittikce_ekleniyor(qtbot, page, monkeypatch):
+    """Hızlı kaynağın kartları yavaş kaynağı beklemeden görünmeli.
+
+    Son sonuç geldiğinde önceden yerleşen kartlar yeniden kurulmaz (görselleri
+    baştan inmesin, kullanıcının baktığı kart yerinden oynamasın).
+    """
+    import turkanime_api.common.adapters as adapters_mod
+
+    kapi = threading.Event()
+
+    class AkanMotor:
+        def search_all_sources_rich(self, query, limit_per_source=10,
+                                    on_result=None):
+            hizli = [kayit("naruto", "Naruto")]
+            on_result("TurkAnime", hizli)
+            kapi.wait(5)
+            yavas = [kayit("naruto-d", "Naruto Depo")]
+            on_result("AnimeDepo", yavas)
+            return {"TurkAnime": hizli, "AnimeDepo": yavas}
+
+    monkeypatch.setattr(adapters_mod, "SearchEngine", AkanMotor)
+
+    page.start_search("naruto")
+    try:
+        qtbot.waitUntil(lambda: len(page.cards()) == 1, timeout=5000)
+        ilk = page.cards()[0]
+        assert page._busy is True
+        assert "aranıyor" in page.lblStatus.text()
+    finally:
+        kapi.set()
+
+    qtbot.waitUntil(lambda: "2 sonuç" in page.lblStatus.text(), timeout=5000)
+    # Geç gelen kaynak alfabetik yerine (öne) yerleşti, ilk kart aynı nesne.
+    assert [c.title for c in page.cards()] == ["Naruto Depo", "Naruto"]
+    assert page.cards()[1] is ilk
+    assert page.results.count() == 2
+
+
+def test_eski_aramanin_kaynak_sonucu_atiliyor(page):
+    page._busy = True
+    page._search_id = 2
+    page._on_source_ready(1, "TurkAnime", [kayit("naruto", "Naruto")])
+    assert page.cards() == []
+
+
 # ── (b) Bozuk kayıtlar ──────────────────────────────────────────────────────
 def test_slugsuz_kayit_cokme_yapmiyor_ve_atiliyor(page):
     """ESKİ HATA: slug'sız kayıt boş payload'lu ölü bir kart üretiyordu.
@@ -192,7 +240,7 @@ def test_slugsuz_kayit_cokme_yapmiyor_ve_atiliyor(page):
         {"slug": "", "title": "Boş slug"},         # slug boş
     ]})
 
-    assert [c.lblTitle.text() for c in page.cards()] == ["Naruto"]
+    assert [c.title for c in page.cards()] == ["Naruto"]
     assert all(c.payload[1] for c in page.cards()), "boş slug'lı kart kaldı"
 
 
@@ -208,7 +256,7 @@ def test_sozluk_olmayan_kayit_slotu_dusurmuyor(page):
         kayit("bleach", "Bleach"),
     ]})
 
-    assert [c.lblTitle.text() for c in page.cards()] == ["Bleach"]
+    assert [c.title for c in page.cards()] == ["Bleach"]
     assert page._busy is False
 
 
@@ -242,7 +290,8 @@ def test_karta_tiklayinca_secim_sinyali_yayiliyor(qtbot, page):
     qtbot.waitExposed(page)
 
     with qtbot.waitSignal(page.anime_selected, timeout=2000) as sinyal:
-        qtbot.mouseClick(page.cards()[0], Qt.MouseButton.LeftButton)
+        qtbot.mouseClick(page.results.viewport(), Qt.MouseButton.LeftButton,
+                         pos=page.results.item_rect(0).center())
 
     assert sinyal.args == ["TurkAnime", "naruto", "Naruto"]
 
@@ -259,7 +308,8 @@ def test_arama_hatasi_bildiriliyor_ve_busy_sifirlaniyor(qtbot, page, monkeypatch
     import turkanime_api.common.adapters as adapters_mod
 
     class PatlayanMotor:
-        def search_all_sources_rich(self, query, limit_per_source=10):
+        def search_all_sources_rich(self, query, limit_per_source=10,
+                                    on_result=None):
             raise RuntimeError("kaynaklar kapalı")
 
     monkeypatch.setattr(adapters_mod, "SearchEngine", PatlayanMotor)
@@ -298,24 +348,24 @@ def test_gorsel_baytlari_karta_uygulaniyor(page):
 
     page._apply_thumb(kart, png_baytlari())
 
-    assert not kart.lblThumb.pixmap().isNull()
+    assert kart.pixmap is not None and not kart.pixmap.isNull()
 
 
 def test_silinmis_karta_gorsel_uygulamak_cokmuyor(page):
-    """ESKİ HATA: görsel inerken yeni arama yapılırsa kart C++'ta yıkılmış olur.
+    """ESKİ HATA: görsel inerken yeni arama yapılırsa kart ızgaradan atılmış olur.
 
-    O anda `set_thumbnail` `RuntimeError` fırlatıp UI thread'ini düşürüyordu.
+    Widget kartlar döneminde `set_thumbnail` `RuntimeError` fırlatıp UI
+    thread'ini düşürüyordu; artık atılan kartın ızgarayla bağı kopuyor.
     """
-    shiboken6 = pytest.importorskip("shiboken6")
-
     page._on_results({"AniList": [kayit("1", "Bebop", "http://kapak/1.jpg")]})
     kart = page.cards()[0]
-    shiboken6.delete(kart)
+    page.results.clear()
 
     page._apply_thumb(kart, png_baytlari())      # istisna fırlatmamalı
+    assert kart._on_changed is None
 
 
-def test_gorselsiz_kayit_icin_indirme_kuyruga_alinmiyor(page, monkeypatch):
+def test_gorselsiz_kayit_icin_indirme_kuyruga_alinmiyor(qtbot, page, monkeypatch):
     """ESKİ HATA: `image=None` olan kaynaklar için boşuna iş açılıyordu."""
     import turkanime_api.gui.qt.pages.search as search_mod
 
@@ -325,5 +375,9 @@ def test_gorselsiz_kayit_icin_indirme_kuyruga_alinmiyor(page, monkeypatch):
 
     page._on_results({"TurkAnime": [kayit("naruto", "Naruto")],
                       "AniList": [kayit("1", "Bebop", "http://kapak/1.jpg")]})
+    # Kapaklar ızgara kartları görünür alana aldıkça istenir.
+    page.show()
+    qtbot.waitExposed(page)
+    qtbot.waitUntil(lambda: bool(isler), timeout=2000)
 
     assert [a[1] for a in isler] == ["http://kapak/1.jpg"]
@@ -282,8 +282,8 @@ def test_her_durum_ayri_filtreleniyor(qtbot, sahte_anilist, durum, etiket):
 
     qtbot.waitUntil(lambda: len(page.cards()) == 1, timeout=5000)
     assert page.durum() == durum
-    assert page.cards()[0].lblTitle.text() == f"{durum} Anime"
-    assert page.cards()[0].lblSource.text() == etiket
+    assert page.cards()[0].title == f"{durum} Anime"
+    assert page.cards()[0].source == etiket
     assert ("list", 7, durum) in ist.cagrilar
 
 
@@ -297,10 +297,11 @@ def test_kart_alanlari_ilerleme_ve_skor(qtbot, sahte_anilist):
     qtbot.waitUntil(lambda: len(page.cards()) == 1, timeout=5000)
 
     kart = page.cards()[0]
-    assert kart.lblProgress.text() == "İzlenen: 7/28"
-    assert (kart.barProgress.maximum(), kart.barProgress.value()) == (28, 7)
-    assert kart.lblScore.text() == "★ 92"
-    assert kart.lblSource.text() == "İzliyorum"
+    assert kart.progress_text == "İzlenen: 7/28"
+    assert (kart.toplam, kart.izlenen) == (28, 7)
+    assert kart.progress_ratio() == pytest.approx(7 / 28)
+    assert kart.score_text == "★ 92"
+    assert kart.source == "İzliyorum"
 
 
 def test_kart_bilinmeyen_toplam_ve_skorsuz(qtbot, sahte_anilist):
@@ -314,9 +315,9 @@ def test_kart_bilinmeyen_toplam_ve_skorsuz(qtbot, sahte_anilist):
     qtbot.waitUntil(lambda: len(page.cards()) == 1, timeout=5000)
 
     kart = page.cards()[0]
-    assert kart.lblProgress.text() == "İzlenen: 3/?"
-    assert kart.barProgress.value() == 0
-    assert kart.lblScore.text() == "Puansız"
+    assert kart.progress_text == "İzlenen: 3/?"
+    assert kart.progress_ratio() == 0
+    assert kart.score_text == "Puansız"
 
 
 def test_izlenen_toplami_asarsa_cubuk_tasmiyor(qtbot, sahte_anilist):
@@ -326,7 +327,7 @@ def test_izlenen_toplami_asarsa_cubuk_tasmiyor(qtbot, sahte_anilist):
     page = sayfa(qtbot, AniListService())
     page.refresh()
     qtbot.waitUntil(lambda: len(page.cards()) == 1, timeout=5000)
-    assert page.cards()[0].barProgress.value() == 12
+    assert page.cards()[0].progress_ratio() == 1
 
 
 def test_bos_liste_mesaji(qtbot, sahte_anilist):
@@ -374,7 +375,8 @@ def test_kart_tiklamasi_detay_sayfasini_aciyor(qtbot, main_window, sahte_anilist
     page.refresh()
     qtbot.waitUntil(lambda: len(page.cards()) == 1, timeout=5000)
 
-    qtbot.mouseClick(page.cards()[0], Qt.MouseButton.LeftButton)
+    qtbot.mouseClick(page.results.viewport(), Qt.MouseButton.LeftButton,
+                     pos=page.results.item_rect(0).center())
 
     detay = main_window.pages["detail"]
     assert main_window.stack.currentWidget() is detay
@@ -0,0 +1,170 @@
+"""Sanal bölüm listesi: satır başına widget yok, filtre ön hesaplı ve gecikmeli.
+
+Eskiden `EpisodePage` her bölüm için düğmeli bir `EpisodeRow` kuruyor, filtre
+her tuşta bütün satırları dolaşıyordu; One Piece gibi 1000+ bölümlük
+serilerde açılış ve yazma takılıyordu. Ağa çıkılmaz.
+
+Açılış ölçümü `pytest -s` ile görünür.
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import Qt  # noqa: E402
+from PySide6.QtWidgets import QWidget  # noqa: E402
+
+from turkanime_api.gui.qt.pages import episodes as episodes_mod  # noqa: E402
+from turkanime_api.gui.qt.pages.episodes import EpisodeDelegate, EpisodePage  # noqa: E402
+
+ADET = 1500
+
+
+def bolumler(adet=ADET):
+    return [{"title": f"{i}. Bölüm", "obj": object()} for i in range(1, adet + 1)]
+
+
+@pytest.fixture
+def page(qtbot):
+    widget = EpisodePage()
+    qtbot.addWidget(widget)
+    widget.resize(900, 700)
+    return widget
+
+
+def yukle(qtbot, page, *args, **kwargs):
+    """`load` listeyi arka planda hazırlıyor; modele yerleşmesini bekle."""
+    with qtbot.waitSignal(page.list_ready, timeout=5000):
+        page.load(*args, **kwargs)
+
+
+def goster(qtbot, page):
+    page.show()
+    qtbot.waitExposed(page)
+    qtbot.wait(20)
+
+
+def beklenen(needle, adet=ADET):
+    """Eski `episode_matches` anlamı: başlıkta geçiyor ya da numara onunla başlıyor."""
+    return sum(1 for i in range(1, adet + 1)
+               if needle in f"{i}. bölüm" or str(i).startswith(needle))
+
+
+def gorunen_satir_sayisi(page):
+    return page.view.viewport().height() // (episodes_mod.ROW_HEIGHT
+                                             + episodes_mod.ROW_GAP) + 2
+
+
+class SayanGecmis:
+    def __init__(self):
+        self.cagri = 0
+
+    def durum(self, obj):
+        self.cagri += 1
+        return True, False
+
+
+def test_acilis_satir_sayisindan_bagimsiz(qtbot, page):
+    t0 = time.perf_counter()
+    yukle(qtbot, page, "TürkAnime", "op", "One Piece", episodes=bolumler())
+    goster(qtbot, page)
+    sure = time.perf_counter() - t0
+    print(f"\n{ADET} bölüm: açılış + ilk boyama {sure * 1000:.0f} ms, "
+          f"{len(page.view.findChildren(QWidget))} widget")
+
+    assert page.proxy.rowCount() == ADET
+    assert len(page.view.findChildren(QWidget)) < 10
+    assert sure < 2.0
+
+
+def test_yalnizca_gorunen_satirlar_boyaniyor(qtbot, page, monkeypatch):
+    boyanan: list = []
+    asil = EpisodeDelegate.paint
+    monkeypatch.setattr(EpisodeDelegate, "paint",
+                        lambda self, p, o, index: boyanan.append(index.row())
+                        or asil(self, p, o, index))
+    yukle(qtbot, page, "TürkAnime", "op", "One Piece", episodes=bolumler())
+    goster(qtbot, page)
+    boyanan.clear()
+    page.view.viewport().repaint()
+
+    assert boyanan
+    assert len(set(boyanan)) <= gorunen_satir_sayisi(page)
+
+
+def test_gecmis_rozeti_yalnizca_gorunen_satirlar_icin_hesaplaniyor(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "op", "One Piece", episodes=bolumler())
+    gecmis = SayanGecmis()
+    page.model.set_gecmis(gecmis)
+    goster(qtbot, page)
+
+    assert 0 < gecmis.cagri <= gorunen_satir_sayisi(page)
+    assert page.model.history(0) == (True, False)
+
+
+def test_filtre_yazarken_bir_kez_uygulaniyor(qtbot, page, monkeypatch):
+    yukle(qtbot, page, "TürkAnime", "op", "One Piece", episodes=bolumler())
+    uygulanan: list = []
+    asil = page.proxy.set_needle
+    monkeypatch.setattr(page.proxy, "set_needle",
+                        lambda needle: uygulanan.append(needle) or asil(needle))
+
+    for metin in ("1", "10", "100"):
+        page.txtFilter.setText(metin)
+    assert uygulanan == [], "filtre her tuşta uygulandı"
+
+    qtbot.waitUntil(lambda: bool(uygulanan), timeout=2000)
+    qtbot.wait(episodes_mod.FILTER_DEBOUNCE_MS + 50)
+    assert uygulanan == ["100"]
+    assert page.proxy.rowCount() == beklenen("100")
+
+
+def test_filtre_onceden_hesaplanmis_anahtarlari_kullaniyor(qtbot, page, monkeypatch):
+    yukle(qtbot, page, "TürkAnime", "op", "One Piece", episodes=bolumler())
+    cagri: list = []
+    monkeypatch.setattr(episodes_mod, "filter_key",
+                        lambda e: cagri.append(e) or ("", ""))
+
+    page._apply_filter("12")
+    assert cagri == []
+    assert page.proxy.rowCount() == beklenen("12")
+
+
+def test_tumunu_sec_bekleyen_filtreyi_uyguluyor(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "op", "One Piece", episodes=bolumler(12))
+    page.txtFilter.setText("3")
+    assert page._filter_timer.isActive()
+
+    page.btnAll.setChecked(True)
+    assert [e["number"] for e in page.selected_episodes()] == [3]
+
+
+def test_secim_kutusuna_tiklama(qtbot, page):
+    yukle(qtbot, page, "TürkAnime", "op", "One Piece", episodes=bolumler(5))
+    goster(qtbot, page)
+
+    qtbot.mouseClick(page.view.viewport(), Qt.MouseButton.LeftButton,
+                     pos=page.view.check_rect(2).center())
+    assert [e["number"] for e in page.selected_episodes()] == [3]
+    assert page.lblSelected.text() == "1 seçili"
+
+    # Başlığa tıklamak seçmez (eski satırda yalnızca kutu seçiyordu).
+    baslik = page.view.geometry_for(page.proxy.index(0, 0)).title
+    qtbot.mouseClick(page.view.viewport(), Qt.MouseButton.LeftButton,
+                     pos=baslik.center())
+    assert page.lblSelected.text() == "1 seçili"
+
+
+def test_filtrelenmis_listede_dugme_dogru_bolumu_yayiyor(qtbot, page):
+    items = bolumler(30)
+    yukle(qtbot, page, "TürkAnime", "op", "One Piece", episodes=items)
+    page._apply_filter("25")
+    goster(qtbot, page)
+
+    with qtbot.waitSignal(page.download_requested, timeout=1000) as blocker:
+        qtbot.mouseClick(page.view.viewport(), Qt.MouseButton.LeftButton,
+                         pos=page.view.action_rect(0, "download").center())
+    assert blocker.args[0] is items[24]
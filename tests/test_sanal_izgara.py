@@ -0,0 +1,202 @@
+"""Sanal kart ızgarası: yalnızca görünen kartlar boyanıyor, kapaklar tembel.
+
+Eski `CardGridBody` her sonuç için bir `AnimeCard` widget'ı kuruyordu; bin
+kartlık listede bin widget, bin yerleşim, ekrandan çok uzaktaki kartlar için
+bile anında kapak indirmesi demekti. Artık `CardGrid` bir `QListView`;
+kartlar veri, satırları delegate boyuyor.
+
+Son test eski yolla kurulum süresini karşılaştırıp yazdırır (`pytest -s`).
+"""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QPoint, Qt  # noqa: E402
+from PySide6.QtGui import QColor, QImage, QPixmap  # noqa: E402
+from PySide6.QtWidgets import QWidget  # noqa: E402
+
+from turkanime_api.gui.qt.pages import _grid  # noqa: E402
+from turkanime_api.gui.qt.pages._grid import CardGrid  # noqa: E402
+from turkanime_api.gui.qt.widgets import AnimeCard, CardItem  # noqa: E402
+
+ADET = 1000
+
+
+def kartlar(adet=ADET, kapak=True):
+    return [CardItem(f"Anime {i}", "AniList", payload=i,
+                     image_url=f"https://cdn/{i}.jpg" if kapak else None)
+            for i in range(adet)]
+
+
+@pytest.fixture
+def izgara(qtbot):
+    grid = CardGrid()
+    qtbot.addWidget(grid)
+    grid.resize(1000, 700)
+    istenen: list = []
+    grid.thumbnails_needed.connect(istenen.extend)
+    grid.istenen = istenen
+    return grid
+
+
+def goster(qtbot, grid, items):
+    grid.set_items(items)
+    grid.show()
+    qtbot.waitExposed(grid)
+    qtbot.wait(20)
+
+
+def gorunen_satirlar(grid):
+    ust = grid.indexAt(QPoint(1, 1)).row()
+    alt = grid.indexAt(QPoint(1, grid.viewport().height() - 2)).row()
+    return ust, alt if alt >= 0 else grid.rows() - 1
+
+
+def test_kart_basina_widget_kurulmuyor(qtbot, izgara):
+    goster(qtbot, izgara, kartlar())
+    assert izgara.count() == ADET
+    assert len(izgara.findChildren(QWidget)) < 20
+
+
+def test_yalnizca_gorunen_kartlar_boyaniyor(qtbot, izgara, monkeypatch):
+    boyanan: list = []
+    asil = _grid.paint_card
+    monkeypatch.setattr(_grid, "paint_card",
+                        lambda p, r, card, *a, **k: boyanan.append(card)
+                        or asil(p, r, card, *a, **k))
+    goster(qtbot, izgara, kartlar())
+    boyanan.clear()
+    izgara.viewport().repaint()
+
+    ust, alt = gorunen_satirlar(izgara)
+    cols = izgara.columns()
+    assert boyanan, "hiçbir kart boyanmadı"
+    assert len(boyanan) <= (alt - ust + 1) * cols
+    assert {c.payload for c in boyanan} <= set(range(ust * cols, (alt + 1) * cols))
+
+
+def test_kapaklar_yalnizca_gorunen_satirlar_icin_isteniyor(qtbot, izgara):
+    goster(qtbot, izgara, kartlar())
+    qtbot.waitUntil(lambda: bool(izgara.istenen), timeout=2000)
+
+    _, alt = gorunen_satirlar(izgara)
+    cols = izgara.columns()
+    sinir = (alt + 1 + _grid.PREFETCH_LINES) * cols
+    assert all(c.payload < sinir for c in izgara.istenen)
+    assert len(izgara.istenen) < ADET // 10
+
+    # Kaydırınca yeni satırlar istenir; istenenler tekrar istenmez.
+    ilk = list(izgara.istenen)
+    izgara.verticalScrollBar().setValue(izgara.verticalScrollBar().maximum())
+    qtbot.waitUntil(lambda: len(izgara.istenen) > len(ilk), timeout=2000)
+    payloadlar = [c.payload for c in izgara.istenen]
+    assert len(payloadlar) == len(set(payloadlar))
+    assert ADET - 1 in payloadlar
+
+
+def test_kapaksiz_ve_kapagi_olan_kart_istenmiyor(qtbot, izgara):
+    items = kartlar(6, kapak=False) + kartlar(2)
+    items[-1].pixmap = QPixmap(64, 96)         # kapak zaten yerleşmiş
+    goster(qtbot, izgara, items)
+    qtbot.waitUntil(lambda: bool(izgara.istenen), timeout=2000)
+    assert izgara.istenen == [items[-2]]
+
+
+def test_kapak_gelince_yalnizca_o_satir_guncelleniyor(qtbot, izgara):
+    items = kartlar(60)
+    goster(qtbot, izgara, items)
+    satirlar: list = []
+    izgara.model().dataChanged.connect(
+        lambda ust, alt, *_: satirlar.append((ust.row(), alt.row())))
+
+    img = QImage(64, 96, QImage.Format.Format_RGB32)
+    img.fill(QColor("#336699"))
+    cols = izgara.columns()
+    items[cols + 1].set_thumbnail(img)
+
+    assert satirlar == [(1, 1)]
+    assert items[cols + 1].pixmap is not None
+
+
+def test_atilan_karta_gelen_kapak_izgaraya_dokunmuyor(qtbot, izgara):
+    eski = kartlar(3)
+    goster(qtbot, izgara, eski)
+    izgara.set_items(kartlar(3))
+    satirlar: list = []
+    izgara.model().dataChanged.connect(lambda *a: satirlar.append(a))
+
+    img = QImage(64, 96, QImage.Format.Format_RGB32)
+    img.fill(QColor("#336699"))
+    eski[0].set_thumbnail(img)
+    assert satirlar == []
+
+
+def test_tiklama_ve_uzerine_gelme(qtbot, izgara):
+    items = kartlar(12)
+    goster(qtbot, izgara, items)
+    merkez = izgara.item_rect(5).center()
+
+    qtbot.mouseMove(izgara.viewport(), merkez)
+    qtbot.waitUntil(lambda: izgara.hovered_item() is items[5], timeout=2000)
+    assert izgara.viewport().cursor().shape() == Qt.CursorShape.PointingHandCursor
+
+    with qtbot.waitSignal(izgara.card_clicked, timeout=2000) as sinyal:
+        qtbot.mouseClick(izgara.viewport(), Qt.MouseButton.LeftButton, pos=merkez)
+    assert sinyal.args == [5]
+
+
+def test_bosluga_tiklama_sinyal_yaymiyor(qtbot, izgara):
+    goster(qtbot, izgara, kartlar(2))
+    kutu = izgara.item_rect(0)
+    bosluk = QPoint(kutu.right() + _grid.GRID_GAP // 2, kutu.center().y())
+    assert izgara.item_at(bosluk) is None
+    alt = QPoint(5, izgara.viewport().height() - 5)
+    assert izgara.item_at(alt) is None
+
+    yayilan: list = []
+    izgara.card_clicked.connect(yayilan.append)
+    qtbot.mouseClick(izgara.viewport(), Qt.MouseButton.LeftButton, pos=bosluk)
+    assert yayilan == []
+
+
+def test_poster_genisligi_sutunu_izliyor(qtbot, izgara):
+    items = kartlar(4)
+    goster(qtbot, izgara, items)
+    dar = items[0].thumbnail_target()
+    izgara.resize(2 * izgara.width(), izgara.height())
+    qtbot.wait(20)
+    # Daha geniş pencere ya yeni sütun açar ya kartı büyütür; hedef asla
+    # sütun genişliğinden küçük kalmaz.
+    genis = items[0].thumbnail_target()
+    assert genis.width() >= izgara.column_widths()[0] - 14
+    assert genis.width() >= dar.width() or izgara.columns() > 4
+
+
+# ── Ölçüm ───────────────────────────────────────────────────────────────────
+def test_kurulum_olcumu(qtbot):
+    kap = QWidget()
+    qtbot.addWidget(kap)
+
+    t0 = time.perf_counter()
+    widgetlar = [AnimeCard(f"Anime {i}", "AniList", payload=i,
+                           image_url=f"https://cdn/{i}.jpg", parent=kap)
+                 for i in range(ADET)]
+    eski = time.perf_counter() - t0
+
+    grid = CardGrid()
+    qtbot.addWidget(grid)
+    grid.resize(1000, 700)
+    t0 = time.perf_counter()
+    grid.set_items(kartlar())
+    grid.show()
+    qtbot.waitExposed(grid)
+    yeni = time.perf_counter() - t0
+
+    print(f"\n{ADET} kart: widget kartlar {eski * 1000:.0f} ms "
+          f"({len(widgetlar)} widget), sanal ızgara {yeni * 1000:.0f} ms "
+          f"({len(grid.findChildren(QWidget))} widget)")
+    assert yeni < eski
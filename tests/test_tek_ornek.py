@@ -0,0 +1,219 @@
+"""Tek örnek koruması: ikinci açılış isteğini devredip hemen çıkmalı.
+
+Eskiden her açılış ayrı bir pencere ve ayrı bir indirme kuyruğu kuruyordu.
+Sunucu adı her testte benzersiz; gerçek bir kullanıcı örneğine dokunulmaz.
+`pytest -s` ile devir süreleri görünür.
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6.QtCore import QDir  # noqa: E402
+
+from turkanime_api.gui.qt import tek_ornek  # noqa: E402
+from turkanime_api.gui.qt.tek_ornek import (  # noqa: E402
+    TekOrnekSunucu, ilet, istegi_coz,
+)
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# İkinci açılışın `run()` çağrısından dönüşüne kadar geçen süre (ms). Ölçülen
+# ~130 ms, neredeyse tamamı QtNetwork'ün yüklenmesi; devrin kendisi 1 ms'nin
+# altında. Sınır yavaş makineler için geniş, `app` modülünün (~360 ms)
+# yüklenmesini yine de yakalar.
+DEVIR_SINIRI_MS = 300
+
+
+@pytest.fixture
+def ad(monkeypatch):
+    ad = f"turkanime-test-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    monkeypatch.setenv(tek_ornek.AD_ORTAM_ANAHTARI, ad)
+    return ad
+
+
+@pytest.fixture
+def sunucu(qtbot, ad):
+    s = TekOrnekSunucu(ad)
+    assert s.dinle()
+    yield s
+    s.kapat()
+
+
+def ortam(ad):
+    return dict(os.environ, PYTHONPATH=KOK, QT_QPA_PLATFORM="offscreen",
+                **{tek_ornek.AD_ORTAM_ANAHTARI: ad})
+
+
+def istemci(qtbot, ad, istekler):
+    """İstekleri ayrı bir süreçten sırayla ilet; her birinin sonucu ve süresi.
+
+    İstemci engelleyen çağrılar kullanıyor: aynı süreçte olsa sunucunun olay
+    döngüsü dönemezdi (PySide nesneleri de Python thread'lerinde güvenilmez).
+    """
+    kod = ("import json, sys, time\n"
+           "from turkanime_api.gui.qt.tek_ornek import ilet\n"
+           "for istek in json.loads(sys.argv[1]):\n"
+           "    t0 = time.perf_counter()\n"
+           "    ok = ilet(istek)\n"
+           "    print(ok, (time.perf_counter() - t0) * 1000, flush=True)\n")
+    proc = subprocess.Popen([sys.executable, "-c", kod, json.dumps(istekler)],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            env=ortam(ad), text=True)
+    qtbot.waitUntil(lambda: proc.poll() is not None, timeout=30000)
+    cikti, hata = proc.communicate()
+    assert proc.returncode == 0, hata
+    satirlar = [satir.split() for satir in cikti.splitlines()]
+    return [(ok == "True", float(ms)) for ok, ms in satirlar]
+
+
+# ── Argümanlar ──────────────────────────────────────────────────────────────
+def test_argumanlar_istege_cevriliyor():
+    istek = istegi_coz(["-platform", "offscreen", "--ara", " frieren ",
+                        "--anime", "AnimeciX:123", "--indir", "3-4,1,3"])
+    assert istek == {"ara": "frieren",
+                     "anime": {"kaynak": "AnimeciX", "slug": "123", "baslik": "123"},
+                     "indir": [3, 4, 1]}
+    assert istegi_coz([]) == {}
+
+
+@pytest.mark.parametrize("argv", [["--indir", "1"],
+                                  ["--anime", "slugsuz"],
+                                  ["--anime", "A:b", "--indir", "3-1"]])
+def test_hatali_argumanlar_reddediliyor(argv, capsys):
+    with pytest.raises(SystemExit):
+        istegi_coz(argv)
+
+
+# ── Devir ───────────────────────────────────────────────────────────────────
+def test_ikinci_acilis_istegi_devredip_hizla_cikiyor(qtbot, sunucu, ad):
+    kod = ("import sys, time\n"
+           "t0 = time.perf_counter()\n"
+           "from turkanime_api.gui.qt import run\n"
+           "kod = run()\n"
+           "print(round((time.perf_counter() - t0) * 1000, 1),"
+           " 'turkanime_api.gui.qt.app' in sys.modules)\n"
+           "sys.exit(kod)\n")
+    with qtbot.waitSignal(sunucu.istek_geldi, timeout=20000) as sinyal:
+        proc = subprocess.Popen(
+            [sys.executable, "-c", kod, "--ara", "frieren",
+             "--anime", "AnimeciX:123", "--baslik", "Frieren"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=ortam(ad), text=True)
+    qtbot.waitUntil(lambda: proc.poll() is not None, timeout=20000)
+    cikti, hata = proc.communicate()
+    assert proc.returncode == 0, hata
+    assert sinyal.args[0] == {"ara": "frieren", "anime": {
+        "kaynak": "AnimeciX", "slug": "123", "baslik": "Frieren"}}
+
+    sure, app_yuklendi = cikti.split()
+    print(f"\nikinci açılış: run() {sure} ms içinde döndü")
+    assert app_yuklendi == "False", "devir yolu pencere modüllerini yüklememeli"
+    assert float(sure) <= DEVIR_SINIRI_MS
+
+
+def test_devir_gecikmesi(qtbot, sunucu, ad):
+    gelen: list = []
+    sunucu.istek_geldi.connect(gelen.append)
+    sonuclar = istemci(qtbot, ad, [{"ara": f"q{i}"} for i in range(20)])
+    assert all(ok for ok, _ in sonuclar)
+    assert [g["ara"] for g in gelen] == [f"q{i}" for i in range(20)]
+    sureler = [ms for _, ms in sonuclar]
+    medyan = statistics.median(sureler)
+    print(f"\ndevir: medyan {medyan:.2f} ms, en kötü {max(sureler):.2f} ms")
+    assert medyan < 50
+
+
+def test_calisan_ornek_yoksa_devir_aninda_basarisiz(ad):
+    t0 = time.perf_counter()
+    assert ilet({"ara": "x"}, ad) is False
+    assert (time.perf_counter() - t0) * 1000 < 250
+    assert tek_ornek.devret(["--ara", "x"]) == {"ara": "x"}
+
+
+# ── Sunucu ──────────────────────────────────────────────────────────────────
+def test_canli_ornegin_adi_devralinmiyor(qtbot, sunucu, ad):
+    ikinci = TekOrnekSunucu(ad)
+    assert ikinci.dinle() is False
+    assert istemci(qtbot, ad, [{}])[0][0] is True
+    assert sunucu.dinliyor_mu()
+
+
+@pytest.mark.skipif(sys.platform == "win32",
+                    reason="adlandırılmış borular süreçle birlikte kaybolur")
+def test_coken_ornegin_soket_dosyasi_temizleniyor(qtbot, ad):
+    # Çökmüş örnek: soket dosyası duruyor ama dinleyen yok (bağlanınca ECONNREFUSED).
+    yol = os.path.join(QDir.tempPath(), ad)
+    olu = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    olu.bind(yol)
+    olu.close()
+    assert os.path.exists(yol)
+    assert ilet({}, ad) is False
+
+    s = TekOrnekSunucu(ad)
+    try:
+        assert s.dinle() is True
+        gelen: list = []
+        s.istek_geldi.connect(gelen.append)
+        assert istemci(qtbot, ad, [{"ara": "yeniden"}])[0][0] is True
+        assert gelen == [{"ara": "yeniden"}]
+    finally:
+        s.kapat()
+
+
+def test_bozuk_istek_sunucuyu_dusurmuyor(qtbot, sunucu, ad):
+    from PySide6.QtNetwork import QLocalSocket
+
+    bozuk = QLocalSocket()
+    bozuk.connectToServer(ad)
+    assert bozuk.waitForConnected(1000)
+    bozuk.write(b"{json degil\n")
+    bozuk.flush()
+    qtbot.waitUntil(
+        lambda: bozuk.state() == QLocalSocket.LocalSocketState.UnconnectedState,
+        timeout=5000)
+
+    assert istemci(qtbot, ad, [{"ara": "sonra"}])[0][0] is True
+
+
+# ── Ana pencere ─────────────────────────────────────────────────────────────
+def test_pencere_aramayi_ve_animeyi_uyguluyor(main_window, monkeypatch):
+    aranan: list = []
+    acilan: list = []
+    monkeypatch.setattr(main_window.pages["search"], "start_search", aranan.append)
+    monkeypatch.setattr(main_window.pages["detail"], "show_match",
+                        lambda *a: acilan.append(a))
+
+    main_window.handle_request({"ara": "naruto"})
+    assert aranan == ["naruto"]
+    assert main_window.txtSearch.text() == "naruto"
+
+    main_window.handle_request({"anime": {"kaynak": "AnimeciX", "slug": "9",
+                                          "baslik": "Naruto"}})
+    assert acilan == [("AnimeciX", "9", "Naruto")]
+    assert main_window.stack.currentWidget() is main_window.pages["detail"]
+
+
+def test_pencere_istenen_bolumleri_kuyruga_aliyor(qtbot, main_window, monkeypatch):
+    from turkanime_api.gui.qt import sources_bridge
+
+    liste = [{"title": f"{i}. Bölüm", "obj": object()} for i in range(1, 6)]
+    monkeypatch.setattr(sources_bridge, "fetch_episodes", lambda *a: liste)
+    kuyruk: list = []
+    monkeypatch.setattr(main_window.downloads, "enqueue",
+                        lambda entry, output="": kuyruk.append(entry["title"]))
+
+    main_window.handle_request({"anime": {"kaynak": "AnimeciX", "slug": "9"},
+                                "indir": [2, 4, 9]})
+    qtbot.waitUntil(lambda: len(kuyruk) == 2, timeout=5000)
+    assert kuyruk == ["2. Bölüm", "4. Bölüm"]
+    assert main_window.stack.currentWidget() is main_window.pages["downloads"]
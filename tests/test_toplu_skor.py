@@ -0,0 +1,89 @@
+"""Toplu skor matrisi, çift başına skor fonksiyonlarıyla BİREBİR aynı mı?
+
+`multilang_search` her aday için her alias'ı `fuzzy_score` ile ayrı ayrı
+puanlıyordu: 6 alias × 8 kaynak × 20 sonuç ≈ 1000 çağrı, her birinde iki dizgi
+baştan normalize ediliyordu. `_alakaya_gore_sirala` da aynı sorguyu her aday
+için yeniden normalize ediyordu. `skor_matrisi` her dizgiyi bir kez normalize
+edip rapidfuzz oranlarını küme için tek çağrıda hesaplıyor; değerler değişmemeli.
+"""
+import pytest
+
+import turkanime_api.common.title_match as tm
+from turkanime_api.common.adapters import _alakaya_gore_sirala
+
+SORGULAR = ["one piece", "ワンピース", "Shingeki no Kyojin", "attack on titan",
+            "", "steins gate", "naruto"]
+ADAYLAR = ["One Piece", "One Piece Film: Z", "Koisuru One Piece", "ONE PIECE",
+           "Steins;Gate", "Shingeki no Kyojin Season 2", "Naruto Shippuuden",
+           "", "Attack on Titan", "One Piece", "Bleach"]
+
+
+@pytest.fixture(params=["extract", "yedek"])
+def yol(request, monkeypatch):
+    """numpy yoksa `process.extract` satırları; rapidfuzz yoksa SequenceMatcher."""
+    monkeypatch.setattr(tm, "_cdist_numpy", lambda: None)
+    if request.param == "yedek":
+        monkeypatch.setattr(tm, "_HAS_RF", False)
+    return request.param
+
+
+def test_benzerlik_matrisi_fuzzy_score_ile_ayni(yol):
+    matris = tm.skor_matrisi(SORGULAR, ADAYLAR)
+    for i, q in enumerate(SORGULAR):
+        assert matris[i] == [tm.fuzzy_score(q, c) for c in ADAYLAR]
+
+
+def test_siralama_matrisi_siralama_skoru_ile_ayni(yol):
+    matris = tm.skor_matrisi(SORGULAR, ADAYLAR, "siralama")
+    for i, q in enumerate(SORGULAR):
+        assert matris[i] == [tm.siralama_skoru(q, c) for c in ADAYLAR]
+
+
+@pytest.mark.skipif(not tm._HAS_RF, reason="rapidfuzz yok")
+def test_cdist_yolu_ayni():
+    pytest.importorskip("numpy")
+    tm._numpy_denendi = False
+    assert tm._cdist_numpy() is not None
+    matris = tm.skor_matrisi(SORGULAR, ADAYLAR)
+    for i, q in enumerate(SORGULAR):
+        assert matris[i] == [tm.fuzzy_score(q, c) for c in ADAYLAR]
+
+
+def test_bos_kumeler():
+    assert tm.skor_matrisi([], ADAYLAR) == []
+    assert tm.skor_matrisi(["one piece"], []) == [[]]
+    with pytest.raises(ValueError):
+        tm.skor_matrisi(["a"], ["b"], "bilinmeyen")
+
+
+def test_her_dizgi_bir_kez_normalize_ediliyor(monkeypatch):
+    cagrilar = []
+    asil = tm._normalize
+
+    def sayan(s):
+        cagrilar.append(s)
+        return asil(s)
+
+    monkeypatch.setattr(tm, "_normalize", sayan)
+    tm.skor_matrisi(SORGULAR, ADAYLAR)
+    assert len(cagrilar) == len(SORGULAR) + len(ADAYLAR)
+
+
+@pytest.mark.skipif(not tm._HAS_RF, reason="rapidfuzz yok")
+def test_multilang_search_matrisle_ayni_sonuc():
+    kaynak = {
+        "one piece": [("op", "One Piece"), ("kop", "Koisuru One Piece")],
+        "ワンピース": [("op", "One Piece"), ("film", "One Piece Film: Z")],
+    }
+    yanit = tm.multilang_search(lambda a: kaynak.get(a, []), "one piece",
+                                aliases=["one piece", "ワンピース"], erken_cik=False)
+    assert [r.slug for r in yanit.exact] == ["op", "kop", "film"]
+    for r in yanit.exact + yanit.possible:
+        assert r.score == tm.score_match("one piece", r.title, ["ワンピース"])
+    assert yanit.exact[0].matched_via == "one piece"
+
+
+def test_alakaya_gore_sirala_kararli_ve_ayni():
+    kayitlar = [(i, t) for i, t in enumerate(ADAYLAR)]
+    bekle = sorted(kayitlar, key=lambda k: -tm.siralama_skoru("one piece", k[1]))
+    assert _alakaya_gore_sirala("one piece", kayitlar, lambda k: k[1]) == bekle
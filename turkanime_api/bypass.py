@@ -14,14 +14,19 @@ ve firewall'i kandirmak için gerekli fonksiyonlari / rutinleri içerir.
 """
 import os
 import re
+import threading
 from base64 import b64decode
 import json
 from hashlib import md5
 from appdirs import user_cache_dir
 from tempfile import NamedTemporaryFile
+from urllib.parse import urlparse
 from Crypto.Cipher import AES
 from curl_cffi import requests
 
+from turkanime_api.common import iptal, izin_deposu, oturum_havuzu
+from turkanime_api.common.iptal import IptalEdildi
+
 # CF Bypass modülünü içe aktar
 try:
     from turkanime_api.common.cf_bypass import CFSession, CFBypassError
@@ -41,42 +46,190 @@ def _get_cf_session():
         return None
 
 
+"""
+Eşzamanlı kullanım: CLI paralel indirmeleri ve `best_video` ön-getirmesi
+`fetch`'i aynı anda onlarca thread'den çağırıyor. Eskiden hepsi tek bir
+curl_cffi `Session`'ını paylaşıyordu (curl tutamacı thread-safe değil) ve her
+403'te / her hatada yepyeni bir `CFSession` kurulup challenge baştan
+çözülüyordu. Artık:
+
+- `session`, `oturum_havuzu` cephesi: her istek havuzdan kiralanmış ayrı bir
+  oturumla gider, çerez kavanozu tek ve ortak. Host başına eşzamanlı istek
+  havuzun sınırına (`oturum_havuzu.HOST_BASINA_AZAMI`) tabi.
+- İlk kurulum (ana sayfa + yönlendirme) kilit altında bir kez yapılır.
+- CF yedeği domain başına tek `CFSession`; aynı domainde aynı anda en çok
+  `YEDEK_HOST_BASINA` çözüm koşar. Sırada bekleyen thread, o arada başka
+  bir thread challenge'ı çözdüyse önce ortak çerezlerle tekrar dener.
+- Kurulumda domainin diskte kayıtlı izni (`izin_deposu`: önceki bir çözümün
+  `cf_clearance`'ı + UA) ortak kavanoza yüklenir; soğuk başlangıç challenge'ı
+  atlar. İzinle giden istek 403 alırsa kayıt silinir.
+"""
+# Domain başına aynı anda koşabilecek CF yedeği (challenge çözümü) sayısı.
+YEDEK_HOST_BASINA = 1
+# Kilit/sıra beklerken iptal bağlamına bakma aralığı (sn).
+_BEKLEME_DILIMI = 0.05
+
 session = None
 BASE_URL = "https://turkanime.tv/"
 
+_kurulum_kilidi = threading.Lock()
+_yedek_kilidi = threading.Lock()
+_cf_oturumlari = {}       # host → CFSession
+_yedek_siralari = {}      # host → BoundedSemaphore
+_cozumler = {}            # host → başarılı yedek sayısı (çerez kuşağı)
+
+
+def _bekle_al(kilit):
+    """``kilit``'i al; beklerken etkin iptal bağlamına bak."""
+    while not kilit.acquire(timeout=_BEKLEME_DILIMI):
+        iptal.kontrol()
+
+
+def _host(url):
+    return (urlparse(url).hostname or "").lower()
+
+
+def _cf_oturumu(host):
+    """``host`` için paylaşılan CF yedeği ve sırası; modül yoksa (None, None)."""
+    with _yedek_kilidi:
+        cf_session = _cf_oturumlari.get(host)
+        if cf_session is None:
+            cf_session = _get_cf_session()
+            if cf_session is None:
+                return None, None
+            _cf_oturumlari[host] = cf_session
+        sira = _yedek_siralari.setdefault(
+            host, threading.BoundedSemaphore(YEDEK_HOST_BASINA))
+        return cf_session, sira
+
+
+def _cerezleri_aktar(cf_session, host):
+    """Yedeğin topladığı çerezleri ortak kavanoza yaz, çerez kuşağını ilerlet."""
+    for name, value in cf_session.cookies.items():
+        session.cookies.set(name, value, domain=host)
+    with _yedek_kilidi:
+        _cozumler[host] = _cozumler.get(host, 0) + 1
+
+
+def _izni_yukle(oturum, url):
+    """Domainin diskteki iznini (çerez + UA) kurulmakta olan oturuma yükle."""
+    izin = izin_deposu.depo().al(url)
+    if izin is None:
+        return
+    host = _host(url)
+    for name, value in izin.cerezler.items():
+        oturum.cookies.set(name, value, domain=host)
+    if izin.user_agent:
+        oturum.headers["User-Agent"] = izin.user_agent
+
+
+def _kurulum(yeni):
+    """Ana sayfayı aç, güncel domaini `BASE_URL`'e yaz (gerekirse CF yedeğiyle)."""
+    global BASE_URL
+    try:
+        res = yeni.get(BASE_URL + "/")
+        if res.status_code == 403:
+            izin_deposu.depo().gecersiz_kil(BASE_URL)
+        if res.status_code != 200:
+            raise ConnectionError(f"Status: {res.status_code}")
+        BASE_URL = res.url
+        BASE_URL = BASE_URL[:-1] if BASE_URL.endswith('/') else BASE_URL
+        return
+    except IptalEdildi:
+        raise            # site suçlu değil; sıradaki çağrı baştan kursun
+    except Exception as e:
+        # CF engeli - cf_bypass ile dene
+        print(f"[TurkAnime] curl_cffi başarısız ({e}), CF bypass deneniyor...")
+    cf_session, _ = _cf_oturumu(_host(BASE_URL))
+    if cf_session is None:
+        raise ConnectionError("CF bypass modülü mevcut değil")
+    try:
+        res = cf_session.get(BASE_URL)
+    except CFBypassError:
+        raise ConnectionError("Tüm CF bypass yöntemleri başarısız")
+    if res.status_code == 200:
+        BASE_URL = res.url if hasattr(res, 'url') else BASE_URL
+        BASE_URL = BASE_URL[:-1] if BASE_URL.endswith('/') else BASE_URL
+        # Session çerezlerini aktar
+        for name, value in cf_session.cookies.items():
+            yeni.cookies.set(name, value)
+        print(f"[TurkAnime] CF bypass başarılı ({cf_session.last_method})")
+
+
+def _hazirla():
+    """Ortak oturumu bir kez kur; eşzamanlı çağıranlar kurulumu bekler."""
+    global session
+    if session is not None:
+        return session
+    _bekle_al(_kurulum_kilidi)
+    try:
+        if session is None:
+            yeni = oturum_havuzu.oturum("firefox", allow_redirects=True,
+                                        sinif=requests.Session)
+            _izni_yukle(yeni, BASE_URL)
+            eski_host = _host(BASE_URL)
+            _kurulum(yeni)
+            if _host(BASE_URL) != eski_host:        # yeni domaine yönlendirildi
+                _izni_yukle(yeni, BASE_URL)
+            yeni.headers["X-Requested-With"] = "XMLHttpRequest"
+            session = yeni
+        return session
+    finally:
+        _kurulum_kilidi.release()
+
+
+def _istek(path, headers, data):
+    # Cephe, kiraladığı oturumu iptal bağlamına kendisi bağlıyor.
+    if data:
+        return session.post(path, headers=headers, data=data)
+    return session.get(path, headers=headers)
+
+
+def _yedekle(path, headers, data, kusak):
+    """İsteği domainin paylaşılan CF yedeğiyle at; yedek yoksa None.
+
+    Sıra beklenirken başka bir thread challenge'ı çözmüş olabilir (çerez
+    kuşağı ``kusak``'tan ilerlemişse): önce ortak çerezlerle yeniden denenir,
+    geçerse ikinci bir çözüm yapılmaz.
+    """
+    host = _host(path)
+    cf_session, sira = _cf_oturumu(host)
+    if cf_session is None:
+        return None
+    _bekle_al(sira)
+    try:
+        if _cozumler.get(host, 0) != kusak:
+            try:
+                resp = _istek(path, headers, data)
+                if resp.status_code == 200:
+                    return resp
+            except IptalEdildi:
+                raise
+            except Exception:
+                pass
+        if data and hasattr(cf_session, "post"):
+            resp = cf_session.post(path, headers=headers, data=data)
+        else:
+            resp = cf_session.get(path, headers=headers)
+        if resp.status_code == 200:
+            _cerezleri_aktar(cf_session, host)
+        return resp
+    finally:
+        sira.release()
+
+
 def fetch(path, headers={}, data=None):
     """Curl-cffi kullanarak HTTP/3 ve Firefox TLS Fingerprint Impersonation
-       eyleyerek GET veya POST request atmak IUAM aktif olmadigi sürece CF'yi bypassliyor. """
-    global session, BASE_URL
+       eyleyerek GET veya POST request atmak IUAM aktif olmadigi sürece CF'yi bypassliyor.
+
+       Thread-safe: eşzamanlı çağrılar havuzdan ayrı oturumlarla gider, çerezler
+       ortaktır (bkz. yukarıdaki not).
+
+       Etkin iptal bağlamı (`common.iptal`) iptal edilirse süren istek kesilir ve
+       `IptalEdildi` fırlar; CF yedeğine düşülmez. """
+    iptal.kontrol()
     # Init: Çerezleri cart curt oluştur, yeni domain geldiyse yönlendir.
-    if session is None:
-        session = requests.Session(impersonate="firefox", allow_redirects=True)
-        try:
-            res = session.get(BASE_URL + "/")
-            if res.status_code != 200:
-                raise ConnectionError(f"Status: {res.status_code}")
-            session.headers["X-Requested-With"] = "XMLHttpRequest"
-            BASE_URL = res.url
-            BASE_URL = BASE_URL[:-1] if BASE_URL.endswith('/') else BASE_URL
-        except Exception as e:
-            # CF engeli - cf_bypass ile dene
-            print(f"[TurkAnime] curl_cffi başarısız ({e}), CF bypass deneniyor...")
-            cf_session = _get_cf_session()
-            if cf_session is not None:
-                try:
-                    res = cf_session.get(BASE_URL)
-                    if res.status_code == 200:
-                        BASE_URL = res.url if hasattr(res, 'url') else BASE_URL
-                        BASE_URL = BASE_URL[:-1] if BASE_URL.endswith('/') else BASE_URL
-                        session.headers["X-Requested-With"] = "XMLHttpRequest"
-                        # Session çerezlerini aktar
-                        for name, value in cf_session.cookies.items():
-                            session.cookies.set(name, value)
-                        print(f"[TurkAnime] CF bypass başarılı ({cf_session.last_method})")
-                except CFBypassError:
-                    raise ConnectionError("Tüm CF bypass yöntemleri başarısız")
-            else:
-                raise ConnectionError("CF bypass modülü mevcut değil")
+    _hazirla()
 
     if path is None:
         return ""
@@ -85,40 +238,49 @@ def fetch(path, headers={}, data=None):
     if not path.startswith("http"):
         path = path if path.startswith("/") else "/" + path
         path = BASE_URL + path
+    kusak = _cozumler.get(_host(path), 0)
 
     try:
-        if data:
-            resp = session.post(path, headers=headers, data=data)
-        else:
-            resp = session.get(path, headers=headers)
+        resp = _istek(path, headers, data)
         if resp.status_code == 403:
-            # CF engeli - fallback dene
-            cf_session = _get_cf_session()
-            if cf_session is not None:
-                if data:
-                    resp = cf_session.post(path, headers=headers, data=data) \
-                        if hasattr(cf_session, "post") else cf_session.get(path, headers=headers)
-                else:
-                    resp = cf_session.get(path, headers=headers)
-                if resp.status_code == 200:
-                    return resp.text
+            # CF engeli - fallback dene. Bu istekten beri kimse çözmediyse
+            # kavanozdaki (belki diskten gelen) izin artık geçmiyor demektir.
+            if _cozumler.get(_host(path), 0) == kusak:
+                izin_deposu.depo().gecersiz_kil(path)
+            resp = _yedekle(path, headers, data, kusak)
+            if resp is not None and resp.status_code == 200:
+                return resp.text
             raise ConnectionError("Cloudflare engeli aşılamadı")
         return resp.text
+    except IptalEdildi:
+        raise
     except Exception:
         # Hata durumunda CF bypass ile tekrar dene
-        cf_session = _get_cf_session()
-        if cf_session is not None:
-            try:
-                if data and hasattr(cf_session, "post"):
-                    resp = cf_session.post(path, headers=headers, data=data)
-                else:
-                    resp = cf_session.get(path, headers=headers)
-                return resp.text
-            except CFBypassError:
-                pass
+        try:
+            resp = _yedekle(path, headers, data, kusak)
+        except CFBypassError:
+            resp = None
+        if resp is not None:
+            return resp.text
         raise
 
 
+def reset_session():
+    """Ortak oturumu ve domain başına CF yedeklerini düşür (testler, domain değişimi)."""
+    global session
+    with _yedek_kilidi:
+        eskiler = list(_cf_oturumlari.values())
+        _cf_oturumlari.clear()
+        _yedek_siralari.clear()
+        _cozumler.clear()
+    session = None
+    for cf_session in eskiler:
+        try:
+            cf_session.close()
+        except Exception:
+            pass
+
+
 """
 Videoların gerçek URL'lerini decryptleyen fonksiyonlar
 örn: eyJjdCI6IldXUmRNWFdCMG15T253dXUmRNWFd3V -> https://dv97.sibnet.ru/15/80/112314.mp4
@@ -334,14 +496,7 @@ def unmask_real_url(url_mask, video=None):
 
 def get_m3u8_stream(url):
     """ MPV'nin video'yu oynatabilmesi için en yüksek çözünürlüklü m3u8 stream'i indir"""
-    global session, BASE_URL
-    if session is None:
-        session = requests.Session(impersonate="firefox", allow_redirects=True)
-        res = session.get(BASE_URL)
-        assert res.status_code == 200, ConnectionError
-        BASE_URL = res.url
-        BASE_URL = BASE_URL[:-1] if BASE_URL.endswith('/') else BASE_URL
-
+    _hazirla()
     res = session.get(url)
     m3u8_url = re.findall("https://.*",res.text)[-1]
     res = session.get(m3u8_url)
@@ -1,4 +1,11 @@
-""" TürkAnime Downloader CLI """
+""" TürkAnime Downloader CLI
+
+Ağır bağımlılıklar (questionary/prompt_toolkit, rich, easygui, yt-dlp,
+curl_cffi, kaynak modülleri) ilk kullanıldıkları yerde yükleniyor. Eskiden
+hepsi modül başında çekiliyordu ve `turkanime` komutu menüyü göstermeden
+~0.7 sn import bekliyordu. Soğuk import bütçesi `tests/test_ice_aktarma_butcesi.py`
+ile korunuyor; ölçmek için `python -m turkanime_api.common.ice_aktarma_profili`.
+"""
 from os import environ, name, path
 from time import sleep
 import sys
@@ -6,23 +13,10 @@ import atexit
 import concurrent.futures as cf
 import traceback
 from datetime import datetime
-import easygui
 
-from rich.live import Live
-from rich.table import Table
-from rich import print as rprint
-import questionary as qa
-
-from ..bypass import fetch
 from ..common import requirements as gereksinim   # modül olarak: testler sahteleyebilsin
 from ..common.cf_qt_solver import SOLVER_FLAG
-from ..objects import Anime
-from ..sources import search_animecix, search_anizle
-from ..sources.animecix import CixAnime
-from ..sources.anizle import AnizleAnime, get_episode_streams
-from ..sources.adapter import AdapterAnime, AdapterBolum
 from .dosyalar import Dosyalar
-from .cli_tools import prompt_tema, clear, indirme_task_cli, VidSearchCLI, CliStatus
 from .version import guncel_surum, update_type
 
 # Uygulama dizinini sistem PATH'ına ekle
@@ -30,6 +24,38 @@ SEP = ";" if name == "nt" else ":"
 environ["PATH"] += SEP + Dosyalar().ta_path + SEP
 
 
+# ── Tembel sarmalayıcılar ───────────────────────────────────────────────────
+# Testler bunları modül özniteliği olarak sahteliyor; adlar modülde kalmalı.
+def fetch(*args, **kwargs):
+    """`bypass.fetch` (curl_cffi, Crypto, CF çözücü) ilk çağrıda yüklenir."""
+    from ..bypass import fetch as _fetch
+    return _fetch(*args, **kwargs)
+
+
+def rprint(*args, **kwargs):
+    """`rich.print`; rich ilk çıktıda yüklenir."""
+    from rich import print as _rprint
+    _rprint(*args, **kwargs)
+
+
+def clear():
+    from .cli_tools import clear as _clear
+    _clear()
+
+
+def CliStatus(msg, hide=True):  # noqa: N802 (cli_tools'taki adıyla aynı)
+    from .cli_tools import CliStatus as _CliStatus
+    return _CliStatus(msg, hide)
+
+
+def _anizle_kaynagi():
+    """Anizle modülü; ilk kullanımda CLI'ın katalog yaşı da uygulanır."""
+    from ..sources import anizle
+    if anizle.KATALOG_AZAMI_YAS is None:
+        anizle.KATALOG_AZAMI_YAS = ANIZLE_KATALOG_AZAMI_YAS
+    return anizle
+
+
 def log_error(e):
     """ Hata logunu error.log dosyasına yazar. """
     try:
@@ -42,6 +68,7 @@ def log_error(e):
 
 def select_download_folder(current_path):
     """Klasör seçimi için easygui kullan"""
+    import easygui   # tkinter'ı çekiyor; yalnızca bu ayar için gerekli
     if current_path and path.exists(current_path):
         default = current_path
     else:
@@ -55,6 +82,7 @@ def eps_to_choices(liste, mark_type):
     """
     Bölüm listesi -> questionary.Choice listesi, geçmiş işaretleriyle.
     """
+    import questionary as qa
     assert len(liste) != 0
     slug = getattr(liste[0].anime, 'slug', '')
     recent, choices, gecmis = None, [], []
@@ -73,6 +101,12 @@ def eps_to_choices(liste, mark_type):
     return choices, recent
 
 
+# Anizle katalog anlık görüntüsü bu yaştan gençse CLI ağa hiç çıkmaz. CLI kısa
+# ömürlü; arka plan doğrulaması çoğu zaman süreç kapanmadan bitmiyor bile,
+# yani her açılışta megabaytlık listeyi boşuna istemek demekti.
+ANIZLE_KATALOG_AZAMI_YAS = 24 * 3600
+
+
 SOURCE_TITLES = {
     "turkanime": "TürkAnime",
     "animecix": "AnimeciX (deneysel)",
@@ -108,6 +142,9 @@ def _source_title(code: str) -> str:
 
 def menu_loop():
     """ Ana menü interaktif navigasyonu """
+    import questionary as qa
+    from .cli_tools import prompt_tema, indirme_task_cli, VidSearchCLI
+
     while True:
         clear()
         islem = qa.select(
@@ -120,6 +157,7 @@ def menu_loop():
             break
 
         if "Anime" in islem:
+            from ..sources.adapter import AdapterAnime, AdapterBolum
             try:
                 source = _norm_source(Dosyalar().ayarlar.get("kaynak", "turkanime"))
                 anime = None
@@ -134,6 +172,7 @@ def menu_loop():
                 seri_ismi = ""
 
                 if source == "animecix":
+                    from ..sources.animecix import CixAnime, search_animecix
                     q = qa.text("AnimeciX: aramak için yazın", style=prompt_tema).ask(kbi_msg="")
                     if not q:
                         continue
@@ -155,11 +194,12 @@ def menu_loop():
                     cix_anime = CixAnime(seri_slug, seri_ismi)
                     adapter_anime = AdapterAnime(slug=str(cix_anime.id), title=cix_anime.title)
                 elif source == "anizle":
+                    anizle = _anizle_kaynagi()
                     q = qa.text("Anizle: aramak için yazın", style=prompt_tema).ask(kbi_msg="")
                     if not q:
                         continue
                     with CliStatus("Anizle aranıyor.."):
-                        found = search_anizle(q) or []
+                        found = anizle.search_anizle(q) or []
                     if not found:
                         raise KeyError
                     choices = [qa.Choice(title, (slug, title)) for (slug, title) in found]
@@ -172,7 +212,7 @@ def menu_loop():
                     if not pick:
                         continue
                     seri_slug, seri_ismi = pick
-                    anizle_anime = AnizleAnime(slug=seri_slug, title=seri_ismi)
+                    anizle_anime = anizle.AnizleAnime(slug=seri_slug, title=seri_ismi)
                     adapter_anime = AdapterAnime(slug=anizle_anime.slug, title=anizle_anime.title)
                 elif source == "tranimeizle":
                     # `tranime` modülünde "get_tranime_*" diye bir ad HİÇ olmadı;
@@ -299,6 +339,7 @@ def menu_loop():
                     if seri_ismi is None:
                         continue
                     seri_slug = next(s for s, n in animeler if n == seri_ismi)
+                    from ..objects import Anime
                     anime = Anime(seri_slug)
             except (KeyError, IndexError):
                 rprint("[red][strong]Aradığınız anime bulunamadı.[/strong][red]")
@@ -306,7 +347,8 @@ def menu_loop():
                 continue
 
             anizle_stream_provider = (
-                (lambda slug, _timeout=10: get_episode_streams(slug, timeout=_timeout))
+                (lambda slug, _timeout=10: _anizle_kaynagi().get_episode_streams(
+                    slug, timeout=_timeout))
                 if source == "anizle" else None
             )
 
@@ -559,6 +601,8 @@ def menu_loop():
                     ).ask(kbi_msg="")
                     if not bolumler:
                         break
+                    from rich.live import Live
+                    from rich.table import Table
                     table = Table.grid(expand=False)
                     with Live(table, refresh_per_second=10, vertical_overflow="visible"):
                         futures = []
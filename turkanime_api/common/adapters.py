@@ -1,9 +1,18 @@
 """
 Anime source adapters for the UI components.
 Provides unified interface for searching anime across different sources.
+
+Kaynak modülleri (ve çektikleri curl_cffi, cloudscraper, yt-dlp) adapter'ın
+ilk aramasında yükleniyor. Eskiden bu modülü import etmek altı kaynağı ve
+`objects`'i (yt-dlp) birden yüklüyordu; her kaynak artık kendi arama
+thread'inde, yalnızca gerçekten sorgulandığında yükleniyor.
 """
 
-from typing import Callable, List, Tuple, Optional, Dict, Any
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator, List, Tuple, Optional, Dict, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from concurrent.futures import TimeoutError as FuturesTimeoutError
 
@@ -11,15 +20,32 @@ from concurrent.futures import TimeoutError as FuturesTimeoutError
 # ilk çağrıda yavaş olabildiği için 12 sn yetmiyordu. Bu süre GERÇEK bir üst
 # sınır: dolduğunda arama elindeki sonuçlarla döner (bkz. `_paralel_ara`).
 OVERALL_SEARCH_TIMEOUT = 25
-from ..anilist_client import anilist_client
-from ..objects import Anime
-from ..sources.animecix import search_animecix
-from ..sources.anizle import search_anizle
-from ..sources.tranime import search_tranime
-from ..sources.animedepo import search_animedepo
-from ..sources.openani import search_openani
-from ..sources.tranimaci import search_tranimaci
-from .title_match import siralama_skoru
+# `AsyncSearchEngine`'de kaynak başına süre (sn); `OVERALL_SEARCH_TIMEOUT`'u
+# aşamaz. Tarayıcı destekli ya da slug yoklayan kaynaklar ilk çağrıda yavaş.
+KAYNAK_SURESI = 15.0
+KAYNAK_SURELERI: Dict[str, float] = {"Tranimaci": 25.0, "OpenAnime": 25.0}
+from . import iptal
+from .iptal import IptalEdildi
+from .sonuc_onbellegi import SonucOnbellegi, sorgu_anahtari
+from .title_match import skor_matrisi
+
+# Zengin arama sonuçlarının süreç genelindeki önbelleği (bkz. `arama_onbellegi`)
+ARAMA_ONBELLEK_DOSYASI = Path.home() / ".turkanime" / "arama_onbellegi.json"
+_arama_onbellegi: Optional[SonucOnbellegi] = None
+_onbellek_kilidi = threading.Lock()
+
+
+def arama_onbellegi() -> SonucOnbellegi:
+    """Arama sayfası, otomatik eşleştirme ve eşleştirme diyaloğunun ortak önbelleği.
+
+    Her biri kendi `SearchEngine()`'ini kuruyor; önbellek motorda değil burada
+    durduğu için aynı başlığın ikinci araması kaynaklara gitmez.
+    """
+    global _arama_onbellegi
+    with _onbellek_kilidi:
+        if _arama_onbellegi is None:
+            _arama_onbellegi = SonucOnbellegi(dosya=ARAMA_ONBELLEK_DOSYASI)
+        return _arama_onbellegi
 
 
 def _alakaya_gore_sirala(sorgu: str, kayitlar: list, baslik) -> list:
@@ -37,7 +63,10 @@ def _alakaya_gore_sirala(sorgu: str, kayitlar: list, baslik) -> list:
     if not kayitlar:
         return kayitlar
     try:
-        return sorted(kayitlar, key=lambda k: -siralama_skoru(sorgu, baslik(k)))
+        # Tüm başlıklar tek toplu çağrıda skorlanır; sorgu bir kez normalize edilir.
+        skorlar = skor_matrisi([sorgu], [baslik(k) for k in kayitlar], "siralama")[0]
+        sira = sorted(range(len(kayitlar)), key=lambda i: -skorlar[i])
+        return [kayitlar[i] for i in sira]
     except Exception:
         return kayitlar          # skorlama asla aramayı düşürmesin
 
@@ -46,6 +75,7 @@ class AniListAdapter:
     """Adapter for AniList anime search."""
 
     def __init__(self):
+        from ..anilist_client import anilist_client
         self.client = anilist_client
 
     def search_anime(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
@@ -105,6 +135,7 @@ class TurkAnimeAdapter:
         Returns:
             List of (slug, title) tuples
         """
+        from ..objects import Anime   # yt-dlp'yi çekiyor; ilk aramada yükle
         try:
             results = Anime.arama_yap(query) or []
             if results:
@@ -143,17 +174,31 @@ class AnimeciXAdapter:
             List of (slug, title) tuples
         """
         try:
+            from ..sources.animecix import search_animecix
             results = search_animecix(query)
             return results[:limit]
         except Exception:
             return []
 
+    async def search_anime_async(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
+        """`search_anime`'in asenkron eşi (doğrudan `AsyncSession`, bkz. `AsyncSearchEngine`)."""
+        import asyncio
+        try:
+            from ..sources.animecix import search_animecix_async
+            results = await search_animecix_async(query)
+            return results[:limit]
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return []
+
 
 class AnizleAdapter:
     """Adapter for Anizle website search."""
 
     def search_anime(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
         try:
+            from ..sources.anizle import search_anizle
             results = search_anizle(query, limit=limit)
             return results[:limit]
         except Exception:
@@ -174,6 +219,7 @@ class TRAnimeAdapter:
             List of (slug, title) tuples
         """
         try:
+            from ..sources.tranime import search_tranime
             results = search_tranime(query, limit=limit)
             return results[:limit]
         except Exception:
@@ -185,6 +231,7 @@ class AnimeDepoAdapter:
 
     def search_anime(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
         try:
+            from ..sources.animedepo import search_animedepo
             results = search_animedepo(query, limit=limit)
             return results[:limit]
         except Exception:
@@ -196,6 +243,7 @@ class OpenAnimeAdapter:
 
     def search_anime(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
         try:
+            from ..sources.openani import search_openani
             return (search_openani(query, limit=limit) or [])[:limit]
         except Exception:
             return []
@@ -206,11 +254,29 @@ class TranimaciAdapter:
 
     def search_anime(self, query: str, limit: int = 10) -> List[Tuple[str, str]]:
         try:
+            from ..sources.tranimaci import search_tranimaci
             return (search_tranimaci(query, limit=limit) or [])[:limit]
         except Exception:
             return []
 
 
+# Kaynak sonucu geldikçe çağrılan geri çağrı: (kaynak adı, sonuç listesi).
+SonucGeriCagrisi = Callable[[str, List[Any]], None]
+
+
+@dataclass
+class AramaOlcumu:
+    """Son paralel aramanın zamanlaması (saniye, aramanın başından itibaren).
+
+    ``ilk_sonuc`` ile ``son_sonuc`` ayrı tutulur: kullanıcının ilk kartı
+    görmesi hızlı kaynağa, aramanın bitmesi en yavaş kaynağa bağlı.
+    """
+    ilk_sonuc: Optional[float] = None     # sonuç dönen ilk kaynak
+    son_sonuc: Optional[float] = None     # biten son kaynak (ya da süre sınırı)
+    kaynaklar: Dict[str, float] = field(default_factory=dict)
+    yetismeyen: List[str] = field(default_factory=list)
+
+
 class SearchEngine:
     """Unified search engine for all anime sources.
 
@@ -230,10 +296,11 @@ class SearchEngine:
             "OpenAnime": OpenAnimeAdapter(),
             "Tranimaci": TranimaciAdapter(),
         }
+        self.son_olcum = AramaOlcumu()
     
-    def _paralel_ara(self, gorev: Callable[[str], Any],
-                     timeout: Optional[float] = None) -> Dict[str, Any]:
-        """`gorev`'i her kaynak için paralel çalıştır, süre dolunca ELİNDEKİYLE dön.
+    def _paralel_akis(self, gorev: Callable[[str], Any],
+                      timeout: Optional[float] = None) -> Iterator[Tuple[str, Any]]:
+        """`gorev`'i her kaynak için paralel çalıştır, biten kaynağı HEMEN ver.
 
         `with ThreadPoolExecutor(...)` KULLANILMIYOR: bağlam çıkışında
         `shutdown(wait=True)` çalışır ve hâlâ süren işleri bekler. Yani toplam
@@ -241,15 +308,33 @@ class SearchEngine:
         ama arama, en yavaş kaynak (45 sn) bitene kadar dönmüyordu. Arayüz
         zamanında yanıt versin diye havuz `wait=False` ile bırakılıyor;
         yetişemeyen iş arka planda sessizce ölür, sonucu kimse okumaz.
+
+        Tüketici erken çıkarsa (``break``/``close()``) aynı temizlik yapılır:
+        başlamamış işler iptal, sürenler beklenmez. Zamanlama `son_olcum`'da.
+
+        "Beklenmez" eskiden "sonuna kadar koşar" demekti: bırakılan thread
+        isteğini 60 sn'ye kadar sürdürüp soketi tutuyordu. Her arama artık
+        çağıranın bağlamından türeyen bir iptal bağlamında koşar (bkz.
+        `common.iptal`). Her kaynağın kendi bağlamı var; arama bitince yalnızca
+        hâlâ süren (yetişemeyen) kaynakların bağlamı iptal edilir, onların
+        süren istekleri kesilir. Biten kaynağınki iptal EDİLMEZ: bağlantıları
+        paylaşılan havuzlara dönmüş, başka isteklerin malı olmuş olabilir.
+        Çağıranın bağlamı (ör. GUI işinin belirteci) iptal edilirse arama da
+        iptal olur.
         """
         # Sabit çağrı anında okunur (varsayılan argümanda değil): süre sınırını
         # sahteleyen testler modül sabitini değiştirebilsin diye.
         if timeout is None:
             timeout = OVERALL_SEARCH_TIMEOUT
-        sonuc: Dict[str, Any] = {}
+        olcum = self.son_olcum = AramaOlcumu()
+        basla = time.monotonic()
+        ust = iptal.gecerli()
+        baglamlar = {name: ust.alt() for name in self.adapters}
         havuz = ThreadPoolExecutor(max_workers=len(self.adapters))
+        futures: Dict[Any, str] = {}
         try:
-            futures = {havuz.submit(gorev, name): name for name in self.adapters}
+            futures = {havuz.submit(baglamlar[name].bagla(gorev), name): name
+                       for name in self.adapters}
             # DİKKAT: `as_completed(..., timeout=)` süre dolunca KENDİSİ fırlatır
             # ve bu, aşağıdaki try/except'in DIŞINDADIR. Sarmalanmazsa tek bir
             # yavaş kaynak tüm aramayı çökertir (toplanan sonuçlar da kaybolur).
@@ -259,17 +344,38 @@ class SearchEngine:
                     try:
                         # Future zaten tamamlandı; `result()` beklemez.
                         _, source_results = future.result()
-                        sonuc[name] = source_results
                     except Exception as exc:
                         print(f"{name} arama hatası (timeout/exception): {exc}")
-                        sonuc[name] = []
+                        source_results = []
+                    gecen = time.monotonic() - basla
+                    olcum.kaynaklar[name] = gecen
+                    olcum.son_sonuc = gecen
+                    if source_results and olcum.ilk_sonuc is None:
+                        olcum.ilk_sonuc = gecen
+                    yield name, source_results
             except FuturesTimeoutError:
+                olcum.yetismeyen = [n for n in self.adapters if n not in olcum.kaynaklar]
+                olcum.son_sonuc = time.monotonic() - basla
                 print("[Arama] Bazı kaynaklar zaman aşımına uğradı, "
                       "mevcut sonuçlar döndürülüyor.")
         finally:
-            # Başlamamış işler iptal, sürenler beklenmez (bkz. yukarıdaki not).
+            # Başlamamış işler iptal, sürenlerin istekleri kesilir (bkz. not).
             havuz.shutdown(wait=False, cancel_futures=True)
+            for future, name in futures.items():
+                if not future.done():
+                    baglamlar[name].iptal()
+            for baglam in baglamlar.values():
+                baglam.kapat()
 
+    def _paralel_ara(self, gorev: Callable[[str], Any],
+                     timeout: Optional[float] = None,
+                     on_result: Optional[SonucGeriCagrisi] = None) -> Dict[str, Any]:
+        """`_paralel_akis`'ı topla: süre dolunca ELİNDEKİYLE dön, yetişemeyen boş."""
+        sonuc: Dict[str, Any] = {}
+        for name, source_results in self._paralel_akis(gorev, timeout):
+            sonuc[name] = source_results
+            if on_result is not None:
+                on_result(name, source_results)
         for name in self.adapters:          # yetişemeyenler boş
             sonuc.setdefault(name, [])
         return sonuc
@@ -297,36 +403,283 @@ class SearchEngine:
             adapter = self.adapters[source_name]
             try:
                 ciftler = adapter.search_anime(query, limit=limit_per_source) or []
+                iptal.kontrol()
                 return source_name, _alakaya_gore_sirala(query, ciftler,
                                                          lambda c: c[1])
+            except IptalEdildi:
+                return source_name, []
             except Exception as exc:
                 print(f"{source_name} arama hatası: {exc}")
                 return source_name, []
 
         return self._paralel_ara(_search_single)
 
+    def _zengin_gorev(self, query: str, limit_per_source: int):
+        """Tek kaynakta zengin arama yapan görev (`_paralel_akis` için).
+
+        Sonuç `arama_onbellegi()`nden gelir; aynı sorgu başka bir thread'de
+        sürüyorsa kaynağa ikinci kez gidilmez. Boş sonuç saklanmaz: kaynakların
+        çoğu ağ hatasını boş liste olarak yutuyor.
+        """
+        onbellek = arama_onbellegi()
+
+        def _ara(adapter) -> List[Dict[str, Any]]:
+            if hasattr(adapter, "search_rich"):
+                kayitlar = adapter.search_rich(query, limit=limit_per_source) or []
+            else:
+                pairs = adapter.search_anime(query, limit=limit_per_source) or []
+                kayitlar = [{"slug": s, "title": t, "image": None}
+                            for s, t in pairs]
+            # Adapterler hataları (iptalin kestiği isteği de) boş listeye
+            # çeviriyor; iptal edilmiş bir sonuç aynı sorguyu bekleyen başka
+            # aramaya "boş" diye verilmesin (bkz. `SonucOnbellegi.getir`).
+            iptal.kontrol()
+            return _alakaya_gore_sirala(
+                query, kayitlar, lambda k: k.get("title") or "")
+
+        def _one(source_name: str):
+            adapter = self.adapters[source_name]
+            try:
+                kayitlar = onbellek.getir(
+                    sorgu_anahtari(query, source_name, limit_per_source),
+                    lambda: _ara(adapter), sakla=bool)
+                # Çağıran listeyi/kayıtları değiştirse de önbellek bozulmasın.
+                return source_name, [dict(k) if isinstance(k, dict) else k
+                                     for k in kayitlar]
+            except IptalEdildi:
+                return source_name, []
+            except Exception as exc:
+                print(f"{source_name} arama hatası: {exc}")
+                return source_name, []
+
+        return _one
+
     def search_all_sources_rich(
-        self, query: str, limit_per_source: int = 10
+        self, query: str, limit_per_source: int = 10,
+        on_result: Optional[SonucGeriCagrisi] = None,
     ) -> Dict[str, List[Dict[str, Any]]]:
         """`search_all_sources` gibi, ama sonuçlar sözlük ve görsel taşıyabilir.
 
         Adapter `search_rich` sağlıyorsa o kullanılır; sağlamıyorsa
         `search_anime`'in (slug, title) çıktısı `image=None` ile sarılır.
         Böylece mevcut adapterlerin hiçbiri değişmek zorunda kalmaz.
+
+        ``on_result`` verilirse her kaynak bittiği anda (aramayı başlatan
+        thread'de) ``on_result(kaynak, kayıtlar)`` çağrılır; dönüş değeri yine
+        tüm kaynakların sözlüğüdür.
         """
-        def _one(source_name: str):
-            adapter = self.adapters[source_name]
+        return self._paralel_ara(self._zengin_gorev(query, limit_per_source),
+                                 on_result=on_result)
+
+    def search_all_sources_rich_iter(
+        self, query: str, limit_per_source: int = 10
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """`search_all_sources_rich`'in akış hâli: ``(kaynak, kayıtlar)`` bittikçe.
+
+        Yavaş bir kaynak (Tranimaci/OpenAnime) hızlıların sonucunu artık
+        bekletmez. Süre sınırına yetişemeyen kaynak hiç verilmez; tüketici
+        aradığını bulunca döngüden çıkabilir, kalan işler beklenmez.
+        """
+        return self._paralel_akis(self._zengin_gorev(query, limit_per_source))
+
+
+class AsyncSearchEngine(SearchEngine):
+    """`SearchEngine`'in tek olay döngüsünde koşan eşi.
+
+    Kaynaklar (ve `multilang_search_all`'da her kaynağın alias'ları) ortak
+    asenkron döngüde görev olarak koşar (bkz. `common.asenkron`): sorgu başına
+    kaynak × alias kadar thread açılmaz. `search_anime_async`/`search_rich_async`
+    sunan adapter doğrudan `AsyncSession` kullanır; sunmayanın eşzamanlı
+    metodu paylaşılan havuz thread'inde koşar ve süresi dolunca iptal edilir.
+
+    Her kaynağın kendi süresi var (`KAYNAK_SURELERI`, yoksa `KAYNAK_SURESI`;
+    ikisi de toplam süreyi aşamaz). Süresi dolan kaynağın görevi iptal
+    edilir, sonucu verilmez, adı `son_olcum.yetismeyen`'e yazılır.
+
+    Eşzamanlı cephe: `search_all_sources_rich`, `_iter` ve `multilang_search_all`
+    thread tabanlı çağıranlar için aynı sözleşmeyle duruyor (``on_result``
+    yine aramayı başlatan thread'de çağrılır); asenkron çağıranlar `*_async`
+    eşlerini `await` eder.
+    """
+
+    def __init__(self, adapters: Optional[Dict[str, Any]] = None):
+        super().__init__()
+        if adapters is not None:
+            self.adapters = dict(adapters)
+
+    @staticmethod
+    def _kaynak_suresi(name: str, timeout: Optional[float]) -> float:
+        if timeout is None:
+            timeout = OVERALL_SEARCH_TIMEOUT
+        return min(KAYNAK_SURELERI.get(name, KAYNAK_SURESI), timeout)
+
+    async def _paralel_akis_async(self, gorev: Callable[[str], Any],
+                                  timeout: Optional[float] = None,
+                                  pay: float = 0.0):
+        """`_paralel_akis`'ın asenkron eşi: ``await gorev(kaynak)`` bittikçe ver.
+
+        ``pay``: süresini kendisi yöneten görevlere (alias bütçesi) sonucunu
+        teslim etmeleri için tanınan ek süre.
+        """
+        import asyncio
+
+        olcum = self.son_olcum = AramaOlcumu()
+        dongu = asyncio.get_running_loop()
+        basla = dongu.time()
+
+        async def _kaynak(name: str):
             try:
-                if hasattr(adapter, "search_rich"):
-                    kayitlar = adapter.search_rich(query, limit=limit_per_source) or []
-                else:
-                    pairs = adapter.search_anime(query, limit=limit_per_source) or []
-                    kayitlar = [{"slug": s, "title": t, "image": None}
-                                for s, t in pairs]
-                return source_name, _alakaya_gore_sirala(
-                    query, kayitlar, lambda k: k.get("title") or "")
+                sure = self._kaynak_suresi(name, timeout) + pay
+                return name, await asyncio.wait_for(gorev(name), sure)
+            except asyncio.TimeoutError:
+                return name, None
             except Exception as exc:
-                print(f"{source_name} arama hatası: {exc}")
-                return source_name, []
+                print(f"{name} arama hatası: {exc}")
+                return name, []
+
+        gorevler = [asyncio.ensure_future(_kaynak(n)) for n in self.adapters]
+        try:
+            for sonraki in asyncio.as_completed(gorevler):
+                name, sonuc = await sonraki
+                gecen = dongu.time() - basla
+                olcum.son_sonuc = gecen
+                if sonuc is None:
+                    olcum.yetismeyen.append(name)
+                    print(f"[Arama] {name} süresinde yetişmedi, sonucu bırakıldı.")
+                    continue
+                olcum.kaynaklar[name] = gecen
+                if sonuc and olcum.ilk_sonuc is None:
+                    olcum.ilk_sonuc = gecen
+                yield name, sonuc
+        finally:
+            # Tüketici erken çıktı ya da arama iptal edildi: kalanlar kesilir.
+            for g in gorevler:
+                g.cancel()
+
+    @staticmethod
+    async def _ciftler(adapter, query: str, limit: int) -> List[Tuple[str, str]]:
+        """Adapter'dan (slug, title) çiftleri: yerel asenkron yol ya da thread."""
+        from .asenkron import thread_ile
+        if hasattr(adapter, "search_anime_async"):
+            return await adapter.search_anime_async(query, limit=limit) or []
+        return await thread_ile(adapter.search_anime, query, limit=limit) or []
+
+    def _zengin_gorev_async(self, query: str, limit_per_source: int):
+        """`_zengin_gorev`'in asenkron eşi; aynı önbelleği kullanır.
+
+        Önbellek okuma/yazması (disk) havuz thread'inde yapılır, döngü
+        bloklanmaz. Süren aynı sorguyla birleştirme yalnızca eşzamanlı yolda
+        var; burada aynı sorgu zaten tek görevde aranır.
+        """
+        from .asenkron import thread_ile
+        onbellek = arama_onbellegi()
+
+        async def _ara(adapter) -> List[Dict[str, Any]]:
+            if hasattr(adapter, "search_rich_async"):
+                kayitlar = await adapter.search_rich_async(query, limit=limit_per_source) or []
+            elif hasattr(adapter, "search_rich"):
+                kayitlar = await thread_ile(adapter.search_rich, query,
+                                            limit=limit_per_source) or []
+            else:
+                kayitlar = [{"slug": s, "title": t, "image": None} for s, t in
+                            await self._ciftler(adapter, query, limit_per_source)]
+            return _alakaya_gore_sirala(
+                query, kayitlar, lambda k: k.get("title") or "")
+
+        async def _one(source_name: str) -> List[Dict[str, Any]]:
+            anahtar = sorgu_anahtari(query, source_name, limit_per_source)
+            kayitlar = await thread_ile(onbellek.al, anahtar)
+            if kayitlar is None:
+                kayitlar = await _ara(self.adapters[source_name])
+                if kayitlar:
+                    await thread_ile(onbellek.koy, anahtar, kayitlar)
+            return [dict(k) if isinstance(k, dict) else k for k in kayitlar]
+
+        return _one
+
+    # ── Asenkron uçlar ──────────────────────────────────────────────────────
+    def search_all_sources_rich_aiter(self, query: str, limit_per_source: int = 10):
+        """``async for kaynak, kayitlar in ...``: kaynaklar bittikçe."""
+        return self._paralel_akis_async(self._zengin_gorev_async(query, limit_per_source))
+
+    async def search_all_sources_rich_async(
+        self, query: str, limit_per_source: int = 10,
+        on_result: Optional[SonucGeriCagrisi] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        sonuc: Dict[str, Any] = {}
+        async for name, kayitlar in self.search_all_sources_rich_aiter(query, limit_per_source):
+            sonuc[name] = kayitlar
+            if on_result is not None:
+                on_result(name, kayitlar)
+        for name in self.adapters:          # yetişemeyenler boş
+            sonuc.setdefault(name, [])
+        return sonuc
+
+    async def multilang_search_all_async(
+        self, query: str, aliases: Optional[List[str]] = None,
+        threshold: float = 0.95, limit_per_source: int = 10,
+        timeout: Optional[float] = None, **secenekler: Any,
+    ) -> Dict[str, Any]:
+        """Her kaynakta `multilang_search_async`; hepsi aynı döngüde.
+
+        Alias listesi bir kez çözülür. Kaynağın alias bütçesi kendi süresi;
+        süresine yetişemeyen kaynak boş `SearchResponse` alır.
+        ``secenekler`` `multilang_search_async`'e gider (``possible_floor``,
+        ``max_aliases``, ``paralel``, ``erken_cik``).
+        """
+        from .asenkron import thread_ile
+        from .title_match import (SearchResponse, get_title_aliases,
+                                  multilang_search_async)
+        if aliases is None:
+            aliases = await thread_ile(get_title_aliases, query)
+
+        def _gorev(name: str):
+            adapter = self.adapters[name]
+
+            async def _arayici(alias: str):
+                return await self._ciftler(adapter, alias, limit_per_source)
+
+            return multilang_search_async(
+                _arayici, query, threshold=threshold, aliases=aliases,
+                butce=self._kaynak_suresi(name, timeout), **secenekler)
+
+        sonuc: Dict[str, Any] = {}
+        async for name, yanit in self._paralel_akis_async(_gorev, timeout, pay=1.0):
+            sonuc[name] = yanit
+        bos = aliases[:secenekler.get("max_aliases", 6)]
+        for name in self.adapters:
+            sonuc.setdefault(name, SearchResponse(aliases=list(bos)))
+        return sonuc
+
+    # ── Eşzamanlı cephe ─────────────────────────────────────────────────────
+    def search_all_sources_rich_iter(
+        self, query: str, limit_per_source: int = 10
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """`SearchEngine.search_all_sources_rich_iter` sözleşmesi, ortak döngüde.
+
+        Çağıranın bağlamı iptal edilirse akış sessizce biter (eşzamanlı motor
+        gibi: iptal aramayı hata olarak yükseltmez).
+        """
+        from .asenkron import akis
+        try:
+            yield from akis(self.search_all_sources_rich_aiter(query, limit_per_source))
+        except IptalEdildi:
+            return
+
+    def search_all_sources_rich(
+        self, query: str, limit_per_source: int = 10,
+        on_result: Optional[SonucGeriCagrisi] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        sonuc: Dict[str, Any] = {}
+        for name, kayitlar in self.search_all_sources_rich_iter(query, limit_per_source):
+            sonuc[name] = kayitlar
+            if on_result is not None:
+                on_result(name, kayitlar)
+        for name in self.adapters:
+            sonuc.setdefault(name, [])
+        return sonuc
 
-        return self._paralel_ara(_one)
+    def multilang_search_all(self, query: str, **secenekler: Any) -> Dict[str, Any]:
+        """`multilang_search_all_async`'in eşzamanlı cephesi."""
+        from .asenkron import calistir
+        return calistir(self.multilang_search_all_async(query, **secenekler))
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""Başlık alias önbelleği — tek SQLite dosyası.
+
+`title_match` eskiden her sorgu için `~/.turkanime/title_cache` altına ayrı bir
+JSON dosyası yazıyor ve hiçbirini silmiyordu. Uzun süre açık kalan sunucuda
+klasör sınırsız büyüyor, her arama ayrı bir dosya açılışı oluyordu; üstelik
+dosya adı yalnızca ASCII harf/rakamdan kurulduğu için bütün Japonca sorgular
+aynı `q.json`'a düşüyordu.
+
+Burada tek dosya, tek tablo:
+
+- **TTL** — yazıldıktan ``ttl`` saniye sonra kayıt okunmaz ve silinir.
+- **Sınır + LRU** — satır sayısı ``kapasite``yi aşınca en uzun süre
+  okunmayanlar atılır (`erisim_ts` indeksli).
+- **Sayaçlar** — isabet / ıskalama / tahliye, süreç içi.
+- **Eşzamanlılık** — thread'ler tek bağlantıyı `RLock` ile paylaşır; süreçler
+  (Flask uygulaması + tarayıcı) WAL kipi ve `busy_timeout` ile aynı dosyayı
+  güvenle kullanır.
+
+Önbellek yalnızca hız içindir: dosya açılamaz ya da bozuksa işlemler sessizce
+ıskalama sayılır, arama asla bu yüzden düşmez.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from threading import RLock
+from typing import Any, Callable, Dict, Optional
+
+VARSAYILAN_TTL = 7 * 24 * 3600     # 1 hafta
+VARSAYILAN_KAPASITE = 5000
+
+SEMA = """
+CREATE TABLE IF NOT EXISTS alias (
+    anahtar   TEXT PRIMARY KEY,
+    veri      TEXT NOT NULL,
+    yazma_ts  REAL NOT NULL,
+    erisim_ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_alias_erisim ON alias(erisim_ts);
+"""
+
+
+def alias_anahtari(sorgu: str) -> str:
+    """Sorgu anahtarı: büyük/küçük harf ve boşluk duyarsız, alfabe korunur."""
+    return " ".join((sorgu or "").casefold().split())
+
+
+class AliasDeposu:
+    """Sorgu → alias yükü (JSON) eşlemesi; TTL, boyut sınırı ve LRU tahliyeli."""
+
+    def __init__(self, yol: Path | str, ttl: float = VARSAYILAN_TTL,
+                 kapasite: int = VARSAYILAN_KAPASITE,
+                 simdi: Callable[[], float] = time.time):
+        self.yol = Path(yol)
+        self.ttl = ttl
+        self.kapasite = kapasite
+        self._simdi = simdi
+        self._kilit = RLock()
+        self.isabet = 0
+        self.iskalama = 0
+        self.tahliye = 0
+        if str(self.yol) != ":memory:":
+            self.yol.parent.mkdir(parents=True, exist_ok=True)
+        # Başka süreç yazarken beklenir; `database is locked` yerine gecikme.
+        self._db = sqlite3.connect(str(self.yol), timeout=10,
+                                   check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SEMA)
+        self._db.commit()
+
+    # ── Yaşam döngüsü ───────────────────────────────────────────────────────
+    def kapat(self) -> None:
+        with self._kilit:
+            try:
+                self._db.commit()
+            finally:
+                self._db.close()
+
+    def __enter__(self) -> "AliasDeposu":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.kapat()
+
+    # ── Okuma / yazma ───────────────────────────────────────────────────────
+    def al(self, sorgu: str) -> Optional[Dict[str, Any]]:
+        """Taze kaydı döndür ve erişim zamanını tazele; yoksa ``None``."""
+        anahtar = alias_anahtari(sorgu)
+        simdi = self._simdi()
+        with self._kilit:
+            try:
+                satir = self._db.execute(
+                    "SELECT veri, yazma_ts FROM alias WHERE anahtar=?",
+                    (anahtar,)).fetchone()
+                if satir is not None and satir[1] + self.ttl < simdi:
+                    self._db.execute("DELETE FROM alias WHERE anahtar=?", (anahtar,))
+                    self._db.commit()
+                    satir = None
+                if satir is None:
+                    self.iskalama += 1
+                    return None
+                veri = json.loads(satir[0])
+                self._db.execute("UPDATE alias SET erisim_ts=? WHERE anahtar=?",
+                                 (simdi, anahtar))
+                self._db.commit()
+            except (sqlite3.Error, ValueError):
+                self.iskalama += 1
+                return None
+            self.isabet += 1
+            return veri
+
+    def koy(self, sorgu: str, veri: Dict[str, Any],
+            yazma_ts: Optional[float] = None) -> None:
+        """Kaydı yaz (varsa üstüne); sınır aşılırsa en eskiyi tahliye et."""
+        anahtar = alias_anahtari(sorgu)
+        simdi = self._simdi()
+        ts = simdi if yazma_ts is None else yazma_ts
+        with self._kilit:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO alias (anahtar, veri, yazma_ts, erisim_ts) "
+                    "VALUES (?,?,?,?)",
+                    (anahtar, json.dumps(veri, ensure_ascii=False), ts, simdi))
+                self._tahliye_et(simdi)
+                self._db.commit()
+            except (sqlite3.Error, TypeError, ValueError):
+                try:
+                    self._db.rollback()
+                except sqlite3.Error:
+                    pass
+
+    def _tahliye_et(self, simdi: float) -> None:
+        """Süresi dolanları, sonra sınırı aşan en eski erişilenleri sil."""
+        cur = self._db.execute("DELETE FROM alias WHERE yazma_ts < ?",
+                               (simdi - self.ttl,))
+        silinen = max(cur.rowcount, 0)
+        fazla = self._db.execute("SELECT COUNT(*) FROM alias").fetchone()[0] \
+            - self.kapasite
+        if fazla > 0:
+            cur = self._db.execute(
+                "DELETE FROM alias WHERE anahtar IN ("
+                "SELECT anahtar FROM alias ORDER BY erisim_ts LIMIT ?)", (fazla,))
+            silinen += max(cur.rowcount, 0)
+        self.tahliye += silinen
+
+    def temizle(self) -> None:
+        with self._kilit:
+            self._db.execute("DELETE FROM alias")
+            self._db.commit()
+
+    def __len__(self) -> int:
+        with self._kilit:
+            return self._db.execute("SELECT COUNT(*) FROM alias").fetchone()[0]
+
+    def istatistik(self) -> Dict[str, Any]:
+        toplam = self.isabet + self.iskalama
+        return {
+            "kayit": len(self),
+            "isabet": self.isabet,
+            "iskalama": self.iskalama,
+            "tahliye": self.tahliye,
+            "isabet_orani": self.isabet / toplam if toplam else 0.0,
+        }
+
+    # ── Eski biçimden geçiş ─────────────────────────────────────────────────
+    def eski_klasoru_aktar(self, klasor: Path) -> int:
+        """Sorgu başına JSON dosyalarını depoya al ve dosyaları sil.
+
+        Eski dosya adı sorgudan kayıplı türetildiği için anahtar dosya adından
+        değil yükün ilk alias'ından (her zaman sorgunun kendisi) kurulur.
+        Süresi dolmuş ya da okunamayan dosyalar yalnızca silinir.
+        """
+        klasor = Path(klasor)
+        if not klasor.is_dir():
+            return 0
+        aktarilan = 0
+        esik = self._simdi() - self.ttl
+        for dosya in sorted(klasor.glob("*.json")):
+            try:
+                veri = json.loads(dosya.read_text(encoding="utf-8"))
+                ts = float(veri.pop("ts", 0))
+                aliases = veri.get("aliases")
+                if ts >= esik and isinstance(aliases, list) and aliases:
+                    self.koy(str(aliases[0]), veri, yazma_ts=ts)
+                    aktarilan += 1
+            except (OSError, ValueError, TypeError, AttributeError):
+                pass
+            try:
+                dosya.unlink()
+            except OSError:
+                pass
+        try:
+            klasor.rmdir()
+        except OSError:
+            pass
+        return aktarilan
+
+
+__all__ = ["AliasDeposu", "alias_anahtari", "VARSAYILAN_TTL", "VARSAYILAN_KAPASITE"]
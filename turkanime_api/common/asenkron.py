@@ -0,0 +1,238 @@
+"""Asyncio taşıması: kaynak aramalarını tek olay döngüsünde yürütmek.
+
+Eskiden bütün adapterler eşzamanlıydı: `SearchEngine` her sorguda kaynak
+başına bir OS thread'i açıyor, `multilang_search` her kaynak için ayrıca alias
+başına thread kuruyordu; sunucunun `/search`'ü ise kaynakları **sırayla**
+arıyordu (beş kaynak × altı alias'a kadar ardışık istek). Burada:
+
+- **Tek döngü** — `dongu()` süreç genelinde tek bir arka plan olay döngüsü
+  (daemon thread) kurar. Asenkron aramaların hepsi orada koşar; thread sayısı
+  kaynak ve alias sayısından bağımsızdır.
+- **AsyncSession** — `getir()` curl_cffi `AsyncSession`'ını döngü ve taklit
+  profili başına bir kez kurar; bağlantılar aramalar arasında açık kalır.
+  Görev iptal edilince (kaynak süresi doldu) süren istek de bırakılır.
+- **Eşzamanlı kaynaklar için köprü** — yerel asenkron yolu olmayan kaynak
+  fonksiyonu `thread_ile()` ile havuz thread'inde koşar; asyncio görevi iptal
+  edilince thread'in iptal bağlamı da iptal edilir ve süren isteği kesilir
+  (bkz. `iptal`).
+- **Eşzamanlı cephe** — `calistir(coro)` ve `akis(agen)` thread tabanlı
+  çağıranlar (GUI işçileri, Flask) için: iş ortak döngüye gönderilir, sonuç
+  çağıranın thread'inde beklenir. Çağıranın iptal bağlamı iptal edilirse
+  döngüdeki görev de iptal edilir.
+
+curl_cffi yoksa `getir()` isteği `oturum_havuzu` cephesiyle `thread_ile`
+üzerinden yapar; davranış aynı, yalnızca bağlantı başına bir thread harcanır.
+"""
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import queue
+import threading
+import weakref
+from typing import (Any, AsyncIterator, Awaitable, Callable, Dict, Iterator,
+                    Optional, TypeVar)
+
+from . import iptal
+
+T = TypeVar("T")
+
+VARSAYILAN_PROFIL = "chrome131"
+# Döngü başına, profil başına eşzamanlı curl tutamacı (`AsyncSession.max_clients`).
+# Sekiz kaynak × üç paralel alias aynı anda sığsın.
+AZAMI_ISTEMCI = 32
+# `thread_ile` havuzunun boyutu. Yerel asenkron yolu olmayan kaynaklar ve
+# önbellek/disk işleri burada koşar.
+THREAD_HAVUZU = 16
+
+_dongu: Optional[asyncio.AbstractEventLoop] = None
+_dongu_thread: Optional[threading.Thread] = None
+_dongu_kilidi = threading.Lock()
+_havuz: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_havuz_kilidi = threading.Lock()
+# Döngü → {profil: AsyncSession}. `AsyncSession` kurulduğu döngüye bağlı;
+# `asyncio.run` ile açılıp kapanan döngülerin oturumları döngüyle birlikte gider.
+_oturumlar: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = \
+    weakref.WeakKeyDictionary()
+
+
+# ── Ortak döngü ────────────────────────────────────────────────────────────
+def dongu() -> asyncio.AbstractEventLoop:
+    """Süreç genelindeki arka plan olay döngüsü (ilk çağrıda kurulur)."""
+    global _dongu, _dongu_thread
+    with _dongu_kilidi:
+        if _dongu is None or _dongu.is_closed():
+            yeni = asyncio.new_event_loop()
+            hazir = threading.Event()
+
+            def _kos():
+                asyncio.set_event_loop(yeni)
+                yeni.call_soon(hazir.set)
+                yeni.run_forever()
+
+            _dongu_thread = threading.Thread(target=_kos, name="asenkron-dongu",
+                                             daemon=True)
+            _dongu_thread.start()
+            hazir.wait()
+            _dongu = yeni
+        return _dongu
+
+
+def _dongude_mi() -> bool:
+    return _dongu_thread is not None and threading.current_thread() is _dongu_thread
+
+
+def calistir(coro: Awaitable[T], zaman_asimi: Optional[float] = None) -> T:
+    """``coro``'yu ortak döngüde koştur, sonucunu bu thread'de bekle.
+
+    Çağıranın iptal bağlamı iptal edilirse görev iptal edilir ve
+    `IptalEdildi` fırlar; ``zaman_asimi`` dolarsa görev iptal edilir ve
+    `TimeoutError` fırlar.
+    """
+    if _dongude_mi():
+        raise RuntimeError("calistir() ortak döngünün içinden çağrılamaz; await kullanın")
+    baglam = iptal.gecerli()
+    try:
+        baglam.kontrol()
+    except iptal.IptalEdildi:
+        _kapat_coro(coro)
+        raise
+    gelecek = asyncio.run_coroutine_threadsafe(coro, dongu())
+    sok = baglam.kapanis_ekle(gelecek.cancel)
+    try:
+        return gelecek.result(zaman_asimi)
+    except concurrent.futures.CancelledError:
+        if baglam.iptal_edildi:
+            raise iptal.IptalEdildi() from None
+        raise
+    except concurrent.futures.TimeoutError:
+        gelecek.cancel()
+        raise TimeoutError(f"asenkron iş {zaman_asimi} sn içinde bitmedi") from None
+    finally:
+        sok()
+
+
+def akis(akim: AsyncIterator[T]) -> Iterator[T]:
+    """Asenkron üreteci ortak döngüde tüket, öğelerini bu thread'de ver.
+
+    Tüketici erken çıkarsa (``break``/``close()``) döngüdeki üreteç iptal
+    edilir. Çağıranın iptal bağlamı iptal edilirse `IptalEdildi` fırlar.
+    """
+    if _dongude_mi():
+        raise RuntimeError("akis() ortak döngünün içinden çağrılamaz; async for kullanın")
+    kuyruk: "queue.Queue[tuple]" = queue.Queue()
+
+    async def _pompala():
+        try:
+            async for oge in akim:
+                kuyruk.put((True, oge))
+        except BaseException as exc:
+            kuyruk.put((False, exc))
+            raise
+        kuyruk.put((False, None))
+
+    baglam = iptal.gecerli()
+    baglam.kontrol()
+    gelecek = asyncio.run_coroutine_threadsafe(_pompala(), dongu())
+    sok = baglam.kapanis_ekle(gelecek.cancel)
+    try:
+        while True:
+            devam, oge = kuyruk.get()
+            if devam:
+                yield oge
+                continue
+            if oge is None:
+                return
+            if isinstance(oge, asyncio.CancelledError) and baglam.iptal_edildi:
+                raise iptal.IptalEdildi()
+            raise oge
+    finally:
+        sok()
+        gelecek.cancel()
+
+
+def _kapat_coro(coro: Any) -> None:
+    """Hiç koşmayacak eşyordamı kapat ("never awaited" uyarısı çıkmasın)."""
+    kapat = getattr(coro, "close", None)
+    if kapat is not None:
+        kapat()
+
+
+# ── Eşzamanlı köprü ────────────────────────────────────────────────────────
+def _thread_havuzu() -> concurrent.futures.ThreadPoolExecutor:
+    global _havuz
+    with _havuz_kilidi:
+        if _havuz is None:
+            _havuz = concurrent.futures.ThreadPoolExecutor(
+                max_workers=THREAD_HAVUZU, thread_name_prefix="asenkron-is")
+        return _havuz
+
+
+async def thread_ile(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Eşzamanlı ``fn``'i havuz thread'inde koştur, sonucunu bekle.
+
+    ``fn`` kendi iptal bağlamında koşar; bekleyen görev iptal edilirse bağlam
+    da iptal edilir: denetim noktaları `IptalEdildi` fırlatır, süren
+    curl/requests isteği kesilir. Thread yine de kendi hızında biter ama
+    soketi tutmaz.
+    """
+    baglam = iptal.IptalBaglami()
+    cagri = baglam.bagla(functools.partial(fn, *args, **kwargs))
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_thread_havuzu(), cagri)
+    except asyncio.CancelledError:
+        baglam.iptal()
+        raise
+
+
+# ── HTTP ───────────────────────────────────────────────────────────────────
+def _oturum(profil: str) -> Any:
+    """Çalışan döngünün ``profil`` için `AsyncSession`'ı; curl_cffi yoksa None."""
+    dongu_ = asyncio.get_running_loop()
+    oturumlar = _oturumlar.setdefault(dongu_, {})
+    oturum = oturumlar.get(profil)
+    if oturum is None:
+        try:
+            from curl_cffi.requests import AsyncSession
+        except ImportError:
+            return None
+        oturum = oturumlar[profil] = AsyncSession(impersonate=profil,
+                                                  max_clients=AZAMI_ISTEMCI)
+    return oturum
+
+
+async def getir(url: str, yontem: str = "GET", *, profil: str = VARSAYILAN_PROFIL,
+                **ayar: Any) -> Any:
+    """``url``'i istek yap, yanıt nesnesini döndür (curl_cffi `Response`).
+
+    ``ayar`` doğrudan isteğe gider (``headers``, ``timeout``, ``data``,
+    ``allow_redirects`` …). Durum kodu denetlenmez; bkz. `getir_json`.
+    """
+    oturum = _oturum(profil)
+    if oturum is None:
+        from . import oturum_havuzu
+        cephe = oturum_havuzu.oturum(profil)
+        return await thread_ile(cephe.request, yontem, url, **ayar)
+    return await oturum.request(yontem, url, **ayar)
+
+
+async def getir_json(url: str, **ayar: Any) -> Any:
+    """GET + durum denetimi + JSON çözümleme."""
+    yanit = await getir(url, **ayar)
+    yanit.raise_for_status()
+    return yanit.json()
+
+
+async def oturumlari_kapat() -> None:
+    """Çalışan döngünün `AsyncSession`'larını kapat (testler, kapanış)."""
+    oturumlar = _oturumlar.pop(asyncio.get_running_loop(), {})
+    for oturum in oturumlar.values():
+        try:
+            await oturum.close()
+        except Exception:
+            pass
+
+
+__all__ = ["dongu", "calistir", "akis", "thread_ile", "getir", "getir_json",
+           "oturumlari_kapat", "VARSAYILAN_PROFIL"]
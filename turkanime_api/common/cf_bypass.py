@@ -10,6 +10,20 @@ farklı yöntemleri bir arada sunar:
 4. QtWebEngine - Yerel gömülü Chromium (ayrı süreçte; Selenium'un yerini aldı)
 5. Normal requests - Fallback
 
+Zincirden önce, domainin diskte kayıtlı izni (önceki bir çözümden kalan
+`cf_clearance` + UA, bkz. `izin_deposu`) denenir; geçerliyse challenge hiç
+çözülmez. Çözücü basamaklar (cloudscraper, FlareSolverr, QtWebEngine) yeni
+izni kaydeder; izinle giden istek yine challenge görürse kayıt silinir.
+
+Zincirin sırası domain başına öğrenilir (bkz. `yontem_gecmisi`): son
+başarılı ve en ucuz yöntemden başlanır, daha ucuz yöntemler üssel aralıklarla
+yeniden yoklanır. `yontem_istatistikleri()` yöntem başına sayaçları ve atlanan
+denemelerle kazanılan süreyi verir.
+
+İptal: zincir `common.iptal` bağlamına bakar. İptal edilen bir iş sıradaki
+yönteme geçmez, yeniden deneme beklemesinden hemen uyanır; süren curl_cffi ve
+requests istekleri kesilir (bkz. `iptal.izle`).
+
 Kullanım:
     from turkanime_api.common.cf_bypass import CFSession
 
@@ -24,7 +38,7 @@ import threading
 import time
 import random
 from urllib.parse import urlparse
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional
 
 # curl_cffi - TLS fingerprint taklidi için
 try:
@@ -43,6 +57,9 @@ except ImportError:
 # requests - Fallback için
 import requests
 
+from . import iptal, izin_deposu, oturum_havuzu, yontem_gecmisi
+from .iptal import IptalEdildi
+
 # QtWebEngine çözücü - Selenium/undetected-chromedriver'ın yerini aldı.
 # Gerçek bir Chromium'u ayrı süreçte çalıştırır (yerel, gömülü FlareSolverr gibi).
 try:
@@ -109,11 +126,15 @@ class CFSession:
     Cloudflare korumalı sitelere erişim için akıllı session yöneticisi.
     
     Sırasıyla şu yöntemleri dener:
+    0. Diskteki izin (domainin önceki çözümden kalan çerezleri + UA)
     1. curl_cffi (Firefox TLS fingerprint)
     2. cloudscraper (JS Challenge)
     3. FlareSolverr (uzak headless browser — opsiyonel)
     4. QtWebEngine (yerel gömülü Chromium, ayrı süreçte)
     5. Normal requests (fallback)
+
+    Bu varsayılan (ucuzdan pahalıya) sıradır; domainin geçmişi varsa zincir
+    en iyi yöntemden başlar (bkz. `yontem_gecmisi`).
     """
 
     # Varsayılan FlareSolverr adresi
@@ -209,6 +230,57 @@ class CFSession:
             return False          # geçici sunucu hatası: yeniden denemeye değer
         return not CFSession._is_challenge(resp)
 
+    def _try_izin(self, url: str, headers: Dict[str, str], method: str = "GET", **kwargs) -> Optional[requests.Response]:
+        """Domainin kayıtlı izniyle (çerez + UA) istek at; geçmezse izni sil.
+
+        Yalnızca sitenin gerçek cevabı döndürülür; aksi hâlde ``None`` ve
+        zincir her zamanki gibi yürür.
+        """
+        depo = izin_deposu.depo()
+        izin = depo.al(url)
+        if izin is None:
+            return None
+        kwargs.setdefault("timeout", self.timeout)
+        headers = dict(headers)
+        if izin.user_agent:
+            headers["User-Agent"] = izin.user_agent
+        host = (urlparse(url).hostname or "").lower()
+        try:
+            if HAS_CURL_CFFI:
+                session = oturum_havuzu.oturum(
+                    self.impersonate, allow_redirects=True, sinif=curl_requests.Session)
+                for name, value in izin.cerezler.items():
+                    session.cookies.set(name, value, domain=host)
+                resp = session.request(method.upper(), url, headers=headers, **kwargs)
+            else:
+                kwargs.setdefault("cookies", {}).update(izin.cerezler)
+                resp = requests.request(method.upper(), url, headers=headers, **kwargs)
+        except IptalEdildi:
+            raise
+        except Exception as e:
+            if not iptal.gecerli().iptal_edildi:
+                print(f"[CF Bypass] kayıtlı izin hatası: {e}")
+            return None
+        if self._mesru_yanit(resp):
+            self._cookies.update(izin.cerezler)
+            if izin.user_agent:
+                self._flaresolverr_user_agent = izin.user_agent
+            self._last_method = f"izin ({izin.kaynak or 'kayıtlı'})"
+            return resp
+        if self._is_challenge(resp) or getattr(resp, "status_code", 0) == 403:
+            depo.gecersiz_kil(url)
+            print(f"[CF Bypass] {host} için kayıtlı izin artık geçmiyor, silindi")
+        return None
+
+    def _izni_kaydet(self, url: str, cookies: Dict[str, str], user_agent: Optional[str],
+                     kaynak: str, bitis: Optional[float] = None) -> None:
+        """Çözücünün verdiği çerezleri domainin izni olarak diske yaz."""
+        try:
+            izin_deposu.depo().koy(url, cookies, user_agent=user_agent,
+                                   bitis=bitis, kaynak=kaynak)
+        except Exception as e:
+            print(f"[CF Bypass] izin kaydedilemedi: {e}")
+
     def _get_curl_session(self):
         """curl_cffi session'ı lazy-load et."""
         if self._curl_session is None and HAS_CURL_CFFI:
@@ -307,9 +379,11 @@ class CFSession:
             # olanları alıyoruz. Aksi hâlde bir sitenin cf_clearance'ı başka
             # siteye iliştirilip 403/challenge döngüsü yaratır.
             host = (urlparse(url).hostname or "").lower()
+            host_cerezleri: Dict[str, str] = {}
             for name, value in (data.get("cookies") or {}).items():
                 if self._cookie_matches_host(name, value, host, data):
-                    self._cookies[name] = value
+                    host_cerezleri[name] = value
+            self._cookies.update(host_cerezleri)
             ua = data.get("user_agent")
             if ua:
                 self._flaresolverr_user_agent = ua
@@ -321,6 +395,11 @@ class CFSession:
             fake_resp.headers["Content-Type"] = "text/html; charset=utf-8"
             fake_resp.url = data.get("url") or url
 
+            if self._mesru_yanit(fake_resp):
+                bitisler = [float(b) for a, b in (data.get("cookie_expires") or {}).items()
+                            if a in host_cerezleri and b]
+                self._izni_kaydet(url, host_cerezleri, ua, "qtwebengine",
+                                  min(bitisler) if bitisler else None)
             self._last_method = "qtwebengine"
             return fake_resp
         except Exception as e:
@@ -356,11 +435,11 @@ class CFSession:
         
         for imp in impersonate_options:
             try:
-                session = curl_requests.Session(
-                    impersonate=imp,
-                    allow_redirects=True,
-                )
-                
+                # Bağlantı süreç geneli havuzdan (host, profil) başına; eskiden
+                # her deneme yeni oturum ve yeni TLS el sıkışmasıydı. Çerez
+                # kavanozu yine deneme başına temiz.
+                session = oturum_havuzu.oturum(
+                    imp, allow_redirects=True, sinif=curl_requests.Session)
                 if method.upper() == "GET":
                     resp = session.get(url, headers=headers, **kwargs)
                 else:
@@ -380,6 +459,8 @@ class CFSession:
                 except Exception:
                     pass
                 return resp
+            except IptalEdildi:
+                raise
             except Exception as e:
                 # Bu impersonate desteklenmiyor, sonrakini dene
                 if "not supported" in str(e).lower():
@@ -399,19 +480,27 @@ class CFSession:
         
         try:
             session = self._get_cloud_session()
-            if method.upper() == "GET":
-                resp = session.get(url, headers=headers, **kwargs)
-            else:
-                resp = session.post(url, headers=headers, **kwargs)
+            # Oturum (ve keep-alive soketleri) CFSession'ı paylaşan thread'lerin
+            # ortak malı: soket yalnızca bu istek sürerken bağlama kayıtlı.
+            with iptal.izle(session):
+                if method.upper() == "GET":
+                    resp = session.get(url, headers=headers, **kwargs)
+                else:
+                    resp = session.post(url, headers=headers, **kwargs)
             
             if resp.status_code not in ENGEL_DURUMLARI and resp.status_code < 500:
                 self._last_method = "cloudscraper"
-                self._cookies.update(session.cookies.get_dict())
+                cerezler = session.cookies.get_dict()
+                self._cookies.update(cerezler)
+                if "cf_clearance" in cerezler and not self._is_challenge(resp):
+                    self._izni_kaydet(url, cerezler, session.headers.get("User-Agent"),
+                                      "cloudscraper")
                 return resp
         except cloudscraper.exceptions.CloudflareChallengeError as e:
             print(f"[CF Bypass] cloudscraper JS challenge hatası: {e}")
         except Exception as e:
-            print(f"[CF Bypass] cloudscraper hatası: {e}")
+            if not iptal.gecerli().iptal_edildi:
+                print(f"[CF Bypass] cloudscraper hatası: {e}")
         return None
 
     def _try_flaresolverr(self, url: str, method: str = "GET", post_data: Optional[str] = None) -> Optional[requests.Response]:
@@ -458,11 +547,16 @@ class CFSession:
                 return None
 
             # Çerezleri kaydet
+            cozum_cerezleri: Dict[str, str] = {}
+            bitisler = []
             for cookie in solution.get("cookies", []):
                 name = cookie.get("name", "")
                 value = cookie.get("value", "")
                 if name and value:
-                    self._cookies[name] = value
+                    cozum_cerezleri[name] = value
+                    if (cookie.get("expires") or 0) > 0:
+                        bitisler.append(float(cookie["expires"]))
+            self._cookies.update(cozum_cerezleri)
 
             # User-Agent'i sakla
             ua = solution.get("userAgent")
@@ -477,10 +571,16 @@ class CFSession:
             fake_resp.headers["Content-Type"] = "text/html; charset=utf-8"
             fake_resp.url = solution.get("url", url)
 
+            if self._mesru_yanit(fake_resp):
+                self._izni_kaydet(url, cozum_cerezleri, ua, "flaresolverr",
+                                  min(bitisler) if bitisler else None)
             self._last_method = "flaresolverr"
             return fake_resp
 
         except requests.exceptions.ConnectionError:
+            # İptalin kestiği bağlantı sunucunun suçu değil; devre açılmasın.
+            if iptal.gecerli().iptal_edildi:
+                return None
             self._flaresolverr_down = True
             print("[CF Bypass] FlareSolverr sunucusuna bağlanılamadı "
                   "— bu oturumda tekrar denenmeyecek")
@@ -515,12 +615,98 @@ class CFSession:
             self._last_method = "requests"
             return resp
         except Exception as e:
-            print(f"[CF Bypass] requests hatası: {e}")
+            if not iptal.gecerli().iptal_edildi:
+                print(f"[CF Bypass] requests hatası: {e}")
         return None
 
+    def _yontemler(self, url: str, headers: Dict[str, str], method: str,
+                   **kwargs) -> "Dict[str, Callable[[], Optional[requests.Response]]]":
+        """Zincirin basamakları, varsayılan (ucuzdan pahalıya) sırada."""
+        post_data = None
+        if method == "POST":
+            post_data = kwargs.get("data", "")
+            if isinstance(post_data, dict):
+                from urllib.parse import urlencode
+                post_data = urlencode(post_data)
+            post_data = str(post_data) if post_data else None
+        yontemler = {
+            "curl_cffi": lambda: self._try_curl_cffi(url, headers, method, **kwargs),
+            "cloudscraper": lambda: self._try_cloudscraper(url, headers, method, **kwargs),
+            "flaresolverr": lambda: self._try_flaresolverr(url, method, post_data=post_data),
+            # Yerel gömülü Chromium, ayrı süreçte; yalnızca GET.
+            "qtwebengine": lambda: self._try_qtwebengine(url),
+            "requests": lambda: self._try_requests_fallback(url, headers, method, **kwargs),
+        }
+        if method != "GET":
+            del yontemler["qtwebengine"]
+        return yontemler
+
+    def _zincir(self, url: str, headers: Dict[str, str], method: str,
+                kabul: Callable[[Any], bool], titreme: bool, **kwargs) -> requests.Response:
+        """Yöntemleri domainin geçmişine göre sıralı dene (bkz. `yontem_gecmisi`).
+
+        Sıra her denemede aynı; hiçbir yöntem düşmez, yalnızca yerleri değişir.
+        ``requests`` son çaredir: kabul edilmese de cevabı, başka yöntem
+        kalmadıysa döndürülür.
+        """
+        baglam = iptal.gecerli()
+        # 0. Kayıtlı izin (önceki süreçten kalan çözüm)
+        baglam.kontrol()
+        resp = self._try_izin(url, headers, method, **kwargs)
+        if resp is not None:
+            return resp
+
+        yontemler = self._yontemler(url, headers, method, **kwargs)
+        varsayilan = list(yontemler)
+        gecmis = yontem_gecmisi.gecmis()
+        sira = gecmis.sira(url, varsayilan)
+        for attempt in range(self.max_retries):
+            denemeler = []          # (yöntem, başarılı, süre)
+            son_care = None
+            try:
+                for ad in sira:
+                    # Çözücüler kesilemez; yalnızca öncesinde bakılır.
+                    baglam.kontrol()
+                    t0 = time.monotonic()
+                    resp = yontemler[ad]()
+                    sure = time.monotonic() - t0
+                    if baglam.iptal_edildi:      # iptalin kestiği deneme ölçü değil
+                        raise IptalEdildi()
+                    if kabul(resp):
+                        denemeler.append((ad, True, sure))
+                        atlanan = varsayilan[:varsayilan.index(ad)]
+                        gecmis.atlandi(url, [y for y in atlanan
+                                             if y not in {d[0] for d in denemeler}])
+                        return resp
+                    denemeler.append((ad, False, sure))
+                    if ad == "requests" and resp is not None:
+                        son_care = resp
+            finally:
+                # Başarı önce: aynı istekte başarısız olan ucuz yöntemler yeni
+                # en iyiye göre hemen aralığa alınsın.
+                for ad, basarili, sure in sorted(denemeler, key=lambda d: not d[1]):
+                    gecmis.kaydet(url, ad, basarili, sure, varsayilan)
+            if son_care is not None:
+                return son_care
+
+            # Retry delay
+            if attempt < self.max_retries - 1:
+                delay = self.retry_delay * (attempt + 1)
+                if titreme:
+                    delay += random.uniform(0, 1)
+                    print(f"[CF Bypass] Deneme {attempt + 1} başarısız, {delay:.1f}s bekliyor...")
+                if baglam.bekle(delay):
+                    raise IptalEdildi()
+
+        raise CFBypassError(f"Cloudflare bypass başarısız{'' if method == 'GET' else ' (POST)'}: {url}")
+
     def get(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
         """
         GET isteği at, CF bypass yöntemlerini sırayla dene.
+
+        Sıra domainin geçmişine göre: son başarılı/en ucuz yöntemden başlanır,
+        daha ucuz yöntemler üssel aralıklarla yeniden yoklanır
+        (bkz. `yontem_gecmisi`).
         
         Args:
             url: Hedef URL
@@ -536,73 +722,13 @@ class CFSession:
         headers = headers or {}
         headers.setdefault("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8")
         headers.setdefault("Accept-Language", "tr-TR,tr;q=0.9,en-US;q=0.8,en;q=0.7")
-        
-        last_error = None
-        
-        for attempt in range(self.max_retries):
-            # 1. curl_cffi dene
-            resp = self._try_curl_cffi(url, headers, "GET", **kwargs)
-            if self._mesru_yanit(resp):
-                return resp
-
-            # 2. cloudscraper dene
-            resp = self._try_cloudscraper(url, headers, "GET", **kwargs)
-            if self._mesru_yanit(resp):
-                return resp
-
-            # 3. FlareSolverr dene
-            resp = self._try_flaresolverr(url, "GET")
-            if self._mesru_yanit(resp):
-                return resp
-
-            # 4. QtWebEngine dene (yerel gömülü Chromium, ayrı süreçte)
-            resp = self._try_qtwebengine(url)
-            if self._mesru_yanit(resp):
-                return resp
-
-            # 5. Normal requests dene (son çare: challenge olsa bile döndür)
-            resp = self._try_requests_fallback(url, headers, "GET", **kwargs)
-            if resp is not None:
-                return resp
-            
-            # Retry delay
-            if attempt < self.max_retries - 1:
-                delay = self.retry_delay * (attempt + 1) + random.uniform(0, 1)
-                print(f"[CF Bypass] Deneme {attempt + 1} başarısız, {delay:.1f}s bekliyor...")
-                time.sleep(delay)
-        
-        raise CFBypassError(f"Cloudflare bypass başarısız: {url}")
+        return self._zincir(url, headers, "GET", self._mesru_yanit, True, **kwargs)
 
     def post(self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
         """POST isteği at."""
         headers = headers or {}
-        
-        for attempt in range(self.max_retries):
-            resp = self._try_curl_cffi(url, headers, "POST", **kwargs)
-            if resp is not None:
-                return resp
-            
-            resp = self._try_cloudscraper(url, headers, "POST", **kwargs)
-            if resp is not None:
-                return resp
-            
-            # FlareSolverr POST desteği
-            post_data = kwargs.get("data", "")
-            if isinstance(post_data, dict):
-                from urllib.parse import urlencode
-                post_data = urlencode(post_data)
-            resp = self._try_flaresolverr(url, "POST", post_data=str(post_data) if post_data else None)
-            if resp is not None:
-                return resp
-            
-            resp = self._try_requests_fallback(url, headers, "POST", **kwargs)
-            if resp is not None:
-                return resp
-            
-            if attempt < self.max_retries - 1:
-                time.sleep(self.retry_delay * (attempt + 1))
-        
-        raise CFBypassError(f"Cloudflare bypass başarısız (POST): {url}")
+        return self._zincir(url, headers, "POST", lambda resp: resp is not None,
+                            False, **kwargs)
 
     def close(self):
         """Tüm session ve driver'ları kapat."""
@@ -691,6 +817,11 @@ def reset_cf_session() -> None:
             pass
 
 
+def yontem_istatistikleri() -> Dict[str, Dict[str, Any]]:
+    """Yöntem başına başarı/hata/atlanan sayaçları ve kazanılan süre (sn)."""
+    return yontem_gecmisi.istatistikler()
+
+
 def cf_get(url: str, headers: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
     """Kısayol: CF bypass ile GET isteği."""
     return get_cf_session().get(url, headers, **kwargs)
@@ -709,6 +840,7 @@ __all__ = [
     "flaresolverr_ayari",
     "get_cf_session",
     "reset_cf_session",
+    "yontem_istatistikleri",
     "cf_get",
     "cf_post",
     "HAS_CURL_CFFI",
@@ -11,6 +11,7 @@ Pratikte bu, *yerel ve gömülü bir FlareSolverr*'dır — uzak sunucuya ihtiya
 Protokol (satır başına bir JSON):
     istek : {"url": "...", "timeout": 60}
     cevap : {"ok": true, "status": 200, "html": "...", "cookies": {...},
+             "cookie_domains": {...}, "cookie_expires": {...},
              "url": "...", "user_agent": "..."}
             {"ok": false, "error": "..."}
 
@@ -80,6 +81,9 @@ def main() -> int:
 
     cookies: dict[str, str] = {}
     cookie_domains: dict[str, str] = {}
+    # Çerez → bitiş (epoch sn; 0 = oturum çerezi). Çağıran izni diske yazarken
+    # ömrünü buradan alır (bkz. `izin_deposu`).
+    cookie_expires: dict[str, int] = {}
     store = profile.cookieStore()
 
     def _on_cookie(c) -> None:
@@ -89,6 +93,8 @@ def main() -> int:
         name = bytes(c.name()).decode("utf-8", "replace")
         cookies[name] = bytes(c.value()).decode("utf-8", "replace")
         cookie_domains[name] = c.domain()
+        exp = c.expirationDate()
+        cookie_expires[name] = max(0, exp.toSecsSinceEpoch()) if exp.isValid() else 0
 
     store.cookieAdded.connect(_on_cookie)
 
@@ -144,6 +150,7 @@ def main() -> int:
                         "html": html,
                         "cookies": dict(cookies),
                         "cookie_domains": dict(cookie_domains),
+                        "cookie_expires": dict(cookie_expires),
                         "url": page.url().toString() or url,
                         "user_agent": profile.httpUserAgent(),
                     })
@@ -0,0 +1,181 @@
+"""İçe aktarma (import) maliyeti profili ve bütçesi.
+
+Soğuk açılış yavaşladığında sebebi çoğu zaman yeni bir modül başı import'u:
+bir kaynak modülünün curl_cffi'yi, CLI'ın yt-dlp'yi zincirleme çekmesi
+gibi. Bu modül ölçümü, ayrı ve temiz bir yorumlayıcıda
+`python -X importtime` ile yapar. Ağa çıkılmaz; sonuç modül başına
+**kümülatif** süredir (modülün kendisi + çektiği her şey).
+
+Komut satırı::
+
+    python -m turkanime_api.common.ice_aktarma_profili turkanime_api.cli.__main__
+    python -m turkanime_api.common.ice_aktarma_profili --ilk 30 turkanime_api.common.adapters
+
+Bütçeler `BUTCELER`'de; `tests/test_ice_aktarma_butcesi.py` onları zorlar.
+Yavaş bir makinede `TURKANIME_ICE_AKTARMA_CARPANI` (ör. ``2``) bütçeleri
+ölçekler.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+# Soğuk import bütçeleri (ms). Ölçülen değerin birkaç katı: CI makineleri bu
+# geliştirme makinesinden yavaş olabilir, bütçe gerilemeyi yakalamak için —
+# yt-dlp (~200 ms) ya da questionary+rich (~160 ms) geri gelirse aşılır.
+BUTCELER: Dict[str, float] = {
+    "turkanime_api.cli.__main__": 150.0,
+    "turkanime_api.common.adapters": 150.0,
+    "turkanime_api.sources": 60.0,
+}
+CARPAN_ORTAM_ANAHTARI = "TURKANIME_ICE_AKTARMA_CARPANI"
+
+# Bu modüller yüklendiyse bütçe ne olursa olsun tembellik bozulmuştur.
+YASAKLI: Dict[str, Sequence[str]] = {
+    "turkanime_api.cli.__main__": (
+        "yt_dlp", "questionary", "prompt_toolkit", "rich", "easygui",
+        "curl_cffi", "cloudscraper", "requests", "turkanime_api.objects",
+        "turkanime_api.bypass", "turkanime_api.sources.animecix",
+    ),
+    "turkanime_api.common.adapters": (
+        "yt_dlp", "curl_cffi", "cloudscraper", "turkanime_api.objects",
+        "turkanime_api.sources.animecix", "turkanime_api.sources.anizle",
+        "turkanime_api.sources.tranime", "turkanime_api.sources.openani",
+        "turkanime_api.sources.tranimaci", "turkanime_api.sources.animedepo",
+    ),
+    "turkanime_api.sources": (
+        "turkanime_api.sources.animecix", "turkanime_api.sources.openani",
+        "curl_cffi", "cloudscraper",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ModulMaliyeti:
+    """`-X importtime` satırı: modülün kendi ve kümülatif süresi (µs)."""
+
+    modul: str
+    kendi_us: int
+    toplam_us: int
+    derinlik: int
+
+    @property
+    def toplam_ms(self) -> float:
+        return self.toplam_us / 1000
+
+
+@dataclass
+class Profil:
+    """Bir modülün soğuk import ölçümü."""
+
+    hedef: str
+    maliyetler: List[ModulMaliyeti]
+    yuklenen: List[str]
+
+    @property
+    def toplam_ms(self) -> float:
+        """Hedefin kümülatif süresi; hedef satırı yoksa (zaten yüklü) 0."""
+        for m in reversed(self.maliyetler):
+            if m.modul == self.hedef:
+                return m.toplam_ms
+        return 0.0
+
+    def en_pahalilar(self, adet: int = 20) -> List[ModulMaliyeti]:
+        return sorted(self.maliyetler, key=lambda m: -m.toplam_us)[:adet]
+
+    def rapor(self, adet: int = 20) -> str:
+        satirlar = [f"{self.hedef}: {self.toplam_ms:.1f} ms (soğuk import)"]
+        for m in self.en_pahalilar(adet):
+            satirlar.append(f"{m.toplam_ms:9.1f} ms  {m.kendi_us / 1000:7.1f} ms  "
+                            f"{'  ' * m.derinlik}{m.modul}")
+        return "\n".join(satirlar)
+
+
+def cozumle(cikti: str) -> List[ModulMaliyeti]:
+    """`-X importtime` stderr çıktısını satır satır çözümle."""
+    sonuc: List[ModulMaliyeti] = []
+    for satir in cikti.splitlines():
+        if not satir.startswith("import time:"):
+            continue
+        try:
+            kendi, toplam, ad = satir[len("import time:"):].split("|", 2)
+            kendi_us, toplam_us = int(kendi), int(toplam)
+        except ValueError:
+            continue             # başlık satırı ("self [us] | cumulative | ...")
+        girinti = len(ad) - len(ad.lstrip(" "))
+        sonuc.append(ModulMaliyeti(ad.strip(), kendi_us, toplam_us,
+                                   max(0, (girinti - 1) // 2)))
+    return sonuc
+
+
+def olc(hedef: str, python: Optional[str] = None,
+        zaman_asimi: float = 120) -> Profil:
+    """``hedef``'i yeni bir yorumlayıcıda import et ve maliyeti ölç.
+
+    Alt süreç bu sürecin `sys.path`'ini alır (test kökünden çalışırken paket
+    kurulu olmasa da bulunur); çıktısı yalnızca yüklenen modüllerin adlarıdır.
+    """
+    kod = ("import sys\n"
+           f"import {hedef}\n"
+           "print('\\n'.join(sorted(sys.modules)))\n")
+    ortam = dict(os.environ)
+    ortam["PYTHONPATH"] = os.pathsep.join(p for p in sys.path if p)
+    ortam.pop("PYTHONIMPORTTIME", None)
+    sonuc = subprocess.run([python or sys.executable, "-X", "importtime", "-c", kod],
+                           capture_output=True, text=True, timeout=zaman_asimi,
+                           env=ortam, check=False)
+    if sonuc.returncode != 0:
+        raise RuntimeError(f"{hedef} import edilemedi:\n{sonuc.stderr[-2000:]}")
+    return Profil(hedef, cozumle(sonuc.stderr), sonuc.stdout.split())
+
+
+def butce(hedef: str) -> Optional[float]:
+    """``hedef``'in bütçesi (ms), ortam çarpanı uygulanmış; yoksa None."""
+    taban = BUTCELER.get(hedef)
+    if taban is None:
+        return None
+    try:
+        carpan = float(os.environ.get(CARPAN_ORTAM_ANAHTARI) or 1)
+    except ValueError:
+        carpan = 1.0
+    return taban * carpan
+
+
+def yasak_yuklenenler(profil: Profil) -> List[str]:
+    """Hedef için yasaklı olup yine de yüklenen modüller."""
+    yuklu = set(profil.yuklenen)
+    return [m for m in YASAKLI.get(profil.hedef, ()) if m in yuklu]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    ayr = argparse.ArgumentParser(
+        prog="python -m turkanime_api.common.ice_aktarma_profili",
+        description="Modül başına kümülatif soğuk import maliyeti.")
+    ayr.add_argument("hedefler", nargs="*", default=list(BUTCELER),
+                     help="ölçülecek modüller (varsayılan: bütçeli olanlar)")
+    ayr.add_argument("--ilk", type=int, default=20, help="listelenecek modül sayısı")
+    args = ayr.parse_args(argv)
+
+    asim = False
+    for hedef in args.hedefler:
+        profil = olc(hedef)
+        print(profil.rapor(args.ilk))
+        sinir = butce(hedef)
+        if sinir is not None:
+            durum = "AŞILDI" if profil.toplam_ms > sinir else "tamam"
+            print(f"  bütçe {sinir:.0f} ms: {durum}")
+            asim |= profil.toplam_ms > sinir
+        yasak = yasak_yuklenenler(profil)
+        if yasak:
+            print(f"  tembel olması gereken modüller yüklendi: {', '.join(yasak)}")
+            asim = True
+        print()
+    return 1 if asim else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
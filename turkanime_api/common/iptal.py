@@ -0,0 +1,376 @@
+"""Ağ çağrılarına yayılan iptal bağlamı.
+
+Terk edilen bir iş (sayfadan çıkıldı, arama süre sınırına takıldı, tüketici
+akıştan erken çıktı) eskiden yalnızca *sonucu* bırakıyordu: `_paralel_akis`
+havuzu `shutdown(wait=False)` ile bırakınca yetişemeyen kaynak thread'i
+curl_cffi/requests çağrısını sonuna kadar — bazen 60 sn — sürdürüp thread'i ve
+soketi tutuyordu. Artık:
+
+- **Bağlam** (`IptalBaglami`) thread'e `etkin()` ile takılır, çağrı zinciri
+  onu `gecerli()` ile okur; `alt()` ile türeyen bağlam üstü iptal edilince
+  kendiliğinden iptal olur. `bagla(fn)` bağlamı havuz thread'lerine taşır.
+- **Denetim noktaları**: `kontrol()` iptal edilmiş bağlamda `IptalEdildi`
+  fırlatır; `CFSession` ve `bypass.fetch` her istekten ve yöntem
+  değiştirmeden önce, yeniden deneme beklemesinde (`bekle`) de bakar.
+- **Süren bağlantılar kapatılır**: curl_cffi isteği `izle()` altında libcurl
+  ilerleme geri çağrısıyla (``CURLOPT_XFERINFOFUNCTION``) en geç ~1 sn'de
+  durdurulur; requests/urllib soketleri ``socket.connect`` denetim kancasıyla
+  bağlama kaydedilir ve iptalde `shutdown` edilir. İkisi de başka thread'den
+  güvenli: curl tutamacına dokunulmaz, soket kapatılmaz yalnızca kesilir.
+- **Kayıt isteğe bağlı**: soket, bağlandığı isteğin (`izle()`; izlenmeyen
+  çağrılarda `etkin()` bloğunun) sonunda bağlamdan silinir. Eskiden bağlam
+  bitene kadar kalıyordu; keep-alive bağlantısı havuza dönüp başka bir işin
+  isteğini taşırken ilk bağlamın iptali onu da kesiyordu.
+
+Bağlam dışındaki çağrılar (CLI, testler) hiç iptal edilmeyen kök bağlamı görür;
+davranışları değişmez. Modül Qt'siz; GUI tarafında `workers.CancelToken` bu
+sınıftan türer.
+"""
+from __future__ import annotations
+
+import socket
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+
+class IptalEdildi(Exception):
+    """İş, bağlamı iptal edildiği için yarıda bırakıldı."""
+
+
+class IptalBaglami:
+    """İşbirlikçi iptal bağlamı (thread güvenli).
+
+    `iptal()` olayı kurar, kayıtlı kapatıcıları (süren bağlantılar, alt
+    bağlamlar) çağırır. Kapatıcılar iptal eden thread'de çalışır; bu yüzden
+    yalnızca başka thread'den güvenle çağrılabilecek işler kaydedilir.
+    """
+
+    def __init__(self, ust: Optional["IptalBaglami"] = None):
+        self._olay = threading.Event()
+        self._kilit = threading.Lock()
+        self._kapaticilar: List[Callable[[], Any]] = []
+        self._ustten_kop: Optional[Callable[[], None]] = None
+        if ust is not None:
+            self._ustten_kop = ust.kapanis_ekle(self.iptal)
+
+    # ── Durum ───────────────────────────────────────────────────────────────
+    @property
+    def iptal_edildi(self) -> bool:
+        return self._olay.is_set()
+
+    @property
+    def iptal_edilebilir(self) -> bool:
+        """Kök bağlam hiç iptal edilmez; izleme maliyetine girmeye gerek yok."""
+        return True
+
+    def iptal(self) -> None:
+        with self._kilit:
+            if self._olay.is_set():
+                return
+            self._olay.set()
+            kapaticilar, self._kapaticilar = self._kapaticilar, []
+        for kapat in kapaticilar:
+            try:
+                kapat()
+            except Exception:
+                pass          # kapanmış soket, bitmiş istek: iptal yine geçerli
+
+    def kontrol(self) -> None:
+        """İptal edildiyse `IptalEdildi` fırlat."""
+        if self._olay.is_set():
+            raise IptalEdildi()
+
+    def bekle(self, sure: float) -> bool:
+        """``sure`` kadar uyu, iptalde hemen uyan. Dönüş: iptal edildi mi."""
+        return self._olay.wait(sure)
+
+    # ── Kapatıcılar ve alt bağlamlar ────────────────────────────────────────
+    def kapanis_ekle(self, kapat: Callable[[], Any]) -> Callable[[], None]:
+        """İptalde çağrılacak ``kapat``'ı kaydet; dönüş kaydı silen fonksiyon.
+
+        Bağlam zaten iptal edildiyse ``kapat`` hemen çağrılır.
+        """
+        with self._kilit:
+            if not self._olay.is_set():
+                self._kapaticilar.append(kapat)
+                return lambda: self._kapanis_sil(kapat)
+        try:
+            kapat()
+        except Exception:
+            pass
+        return lambda: None
+
+    def _kapanis_sil(self, kapat: Callable[[], Any]) -> None:
+        with self._kilit:
+            try:
+                self._kapaticilar.remove(kapat)
+            except ValueError:
+                pass
+
+    def alt(self) -> "IptalBaglami":
+        """Bu bağlam iptal edilince iptal olan yeni bağlam."""
+        return IptalBaglami(self)
+
+    def kapat(self) -> None:
+        """Alt bağlamı üstünden ayır (iş bitti; üstün kapatıcı listesi büyümesin)."""
+        kop, self._ustten_kop = self._ustten_kop, None
+        if kop is not None:
+            kop()
+
+    def bagla(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """``fn``'i bu bağlam etkinken çalıştıran sarmalayıcı (havuz thread'leri için)."""
+        def _sarili(*args, **kwargs):
+            with etkin(self):
+                return fn(*args, **kwargs)
+        return _sarili
+
+    # ── Soketler ────────────────────────────────────────────────────────────
+    def _soket_ekle(self, sock: socket.socket, adres: Any) -> Callable[[], None]:
+        kayit = (weakref.ref(sock), sock.fileno(), _adres_anahtari(adres))
+        return self.kapanis_ekle(lambda: _soketi_kes(kayit))
+
+
+class _KokBaglam(IptalBaglami):
+    """Bağlam dışı çağrıların gördüğü, hiç iptal edilmeyen bağlam."""
+
+    @property
+    def iptal_edilebilir(self) -> bool:
+        return False
+
+    def iptal(self) -> None:
+        raise RuntimeError("kök iptal bağlamı iptal edilemez; alt() kullanın")
+
+    def kapanis_ekle(self, kapat: Callable[[], Any]) -> Callable[[], None]:
+        return lambda: None
+
+
+_KOK = _KokBaglam()
+_yerel = threading.local()
+
+
+def gecerli() -> IptalBaglami:
+    """Bu thread'de etkin bağlam (yoksa hiç iptal edilmeyen kök)."""
+    return getattr(_yerel, "baglam", None) or _KOK
+
+
+def kontrol() -> None:
+    """Etkin bağlam iptal edildiyse `IptalEdildi` fırlat."""
+    gecerli().kontrol()
+
+
+@contextmanager
+def etkin(baglam: Optional[IptalBaglami]) -> Iterator[IptalBaglami]:
+    """``baglam``'ı bu thread'de etkinleştir; çıkışta öncekini geri koy."""
+    onceki = getattr(_yerel, "baglam", None)
+    _yerel.baglam = baglam
+    if baglam is None or not baglam.iptal_edilebilir:
+        try:
+            yield baglam or _KOK
+        finally:
+            _yerel.baglam = onceki
+        return
+    _soket_kancasini_kur()
+    try:
+        with _istek_kapsami():
+            yield baglam
+    finally:
+        _yerel.baglam = onceki
+
+
+@contextmanager
+def _istek_kapsami() -> Iterator[None]:
+    """Bu blokta bağlanan soketlerin bağlam kaydı blok bitince silinir."""
+    ust = getattr(_yerel, "kapsam", None)
+    kapsam: List[Callable[[], None]] = []
+    _yerel.kapsam = kapsam
+    try:
+        yield
+    finally:
+        _yerel.kapsam = ust
+        for sil in kapsam:
+            sil()
+
+
+# ── requests / urllib: soket kancası ───────────────────────────────────────
+#
+# urllib3 ve urllib soketi kendi içinde açıyor; süren isteği dışarıdan kesmenin
+# tek kütüphane bağımsız yolu soketin kendisi. ``socket.connect`` denetim olayı
+# bağlanan thread'de yayılır; o thread'in bağlamı iptal edilebilirse soket ona
+# kaydedilir. Kanca süreç boyunca kalır ama ilk satırı dışında bir şey yapmaz.
+#
+# Kayıt, soketi açan isteğin kapsamına (`_istek_kapsami`) bağlı: istek bitince
+# silinir. requests/cloudscraper soketi havuza geri koyar; sonraki istek — başka
+# bir thread'in, başka bir bağlamın da olabilir — aynı soketi `connect`
+# yapmadan kullanır. Kayıt kalsaydı ilk bağlamın iptali o isteği keserdi.
+# Bedeli: havuzdan yeniden kullanılan soket kaydedilmez; böyle bir istek iptalde
+# kesilmez, `kontrol()` noktalarında ve kendi süresiyle biter (curl_cffi
+# isteğini ilerleme geri çağrısı her durumda keser).
+_kanca_kilidi = threading.Lock()
+_kanca_kuruldu = False
+
+
+def _soket_kancasi(olay: str, args: Tuple[Any, ...]) -> None:
+    if olay != "socket.connect":
+        return
+    baglam = getattr(_yerel, "baglam", None)
+    kapsam = getattr(_yerel, "kapsam", None)
+    if baglam is None or kapsam is None or not baglam.iptal_edilebilir:
+        return
+    try:
+        kapsam.append(baglam._soket_ekle(args[0], args[1]))
+    except Exception:
+        pass              # kanca asla bağlantıyı düşürmemeli
+
+
+def _soket_kancasini_kur() -> None:
+    global _kanca_kuruldu
+    if _kanca_kuruldu:
+        return
+    with _kanca_kilidi:
+        if not _kanca_kuruldu:
+            sys.addaudithook(_soket_kancasi)
+            _kanca_kuruldu = True
+
+
+def _adres_anahtari(adres: Any) -> Any:
+    # connect'e verilen (ip, port[, flow, scope]) ile getpeername karşılaştırılır.
+    return tuple(adres[:2]) if isinstance(adres, tuple) else adres
+
+
+def _soketi_kes(kayit) -> None:
+    """Süren isteğin soketini `shutdown` et (kapatmaz; sahibi kapatır).
+
+    TLS sarmalayıcısı asıl soket nesnesini ayırıp (detach) aynı fd ile yenisini
+    kurduğu için nesne artık -1 gösteriyorsa fd'ye gidilir; fd bu arada başka
+    bir bağlantıya verilmiş olabileceğinden karşı uç adresi eşleşmeden
+    dokunulmaz.
+    """
+    ref, fd, adres = kayit
+    sock = ref()
+    if sock is not None and sock.fileno() != -1:
+        sock.shutdown(socket.SHUT_RDWR)
+        return
+    if fd is None or fd < 0:
+        return
+    gecici = socket.socket(fileno=fd)
+    try:
+        if _adres_anahtari(gecici.getpeername()) == adres:
+            gecici.shutdown(socket.SHUT_RDWR)
+    finally:
+        gecici.detach()
+
+
+# ── curl_cffi: ilerleme geri çağrısı ───────────────────────────────────────
+#
+# curl tutamacını başka thread'den kapatmak (`Session.close`) libcurl'de tanımsız
+# davranış. Belgelenmiş yol ilerleme geri çağrısı: sıfırdan farklı dönerse
+# aktarım CURLE_ABORTED_BY_CALLBACK ile biter. libcurl onu boşta beklerken de
+# saniyede en az bir kez çağırır. Geri çağrı aktarımı yapan thread'de koştuğu
+# için tek bir modül düzeyi fonksiyon `gecerli()`'ye bakması yeterli.
+_xferinfo = None
+
+
+def _curl_geri_cagrisi():
+    global _xferinfo
+    if _xferinfo is None:
+        from curl_cffi._wrapper import ffi
+
+        @ffi.callback("int(void*, int64_t, int64_t, int64_t, int64_t)")
+        def _geri_cagri(_p, _dt, _dn, _ut, _un):
+            return 1 if gecerli().iptal_edildi else 0
+
+        _xferinfo = _geri_cagri
+    return _xferinfo
+
+
+def _curl_ilerleme(curl: Any, acik: bool) -> bool:
+    """Bu thread'in curl tutamacında iptal geri çağrısını aç/kapat."""
+    tutamac = getattr(curl, "_curl", None)
+    if tutamac is None:
+        return False
+    try:
+        from curl_cffi import CurlOpt
+        from curl_cffi._wrapper import ffi, lib
+        if acik:
+            lib._curl_easy_setopt(tutamac, CurlOpt.XFERINFOFUNCTION,
+                                  ffi.cast("void*", _curl_geri_cagrisi()))
+        lib._curl_easy_setopt(tutamac, CurlOpt.NOPROGRESS, ffi.new("long*", 0 if acik else 1))
+    except Exception:
+        return False
+    return True
+
+
+@contextmanager
+def izle(oturum: Any) -> Iterator[None]:
+    """``oturum`` üzerindeki isteği etkin bağlama bağla.
+
+    Önce `kontrol()`; curl_cffi oturumuysa aktarım iptalde durdurulur, bloğun
+    açtığı soketler yalnızca blok sürerken bağlama kayıtlı kalır; istek
+    iptal yüzünden patladıysa `IptalEdildi` fırlar (çağıranın genel
+    ``except Exception``'ı bunu da yutabilir; iş yine erken biter).
+    """
+    baglam = gecerli()
+    baglam.kontrol()
+    if not baglam.iptal_edilebilir:
+        yield
+        return
+    # `Session.curl` thread'e özgü tutamaç; curl_cffi her istekten sonra onu
+    # sıfırlıyor, biz de istisna yolunda kapatıyoruz.
+    curl = getattr(oturum, "curl", None) if "curl_cffi" in type(oturum).__module__ else None
+    acik = curl is not None and _curl_ilerleme(curl, True)
+    try:
+        with _istek_kapsami():
+            yield
+    except Exception as exc:
+        if baglam.iptal_edildi:
+            raise IptalEdildi() from exc
+        raise
+    finally:
+        if acik:
+            _curl_ilerleme(curl, False)
+
+
+class _IzlenenOturum:
+    """Her isteği `izle()` altında yapan oturum sarmalayıcısı."""
+
+    _ISTEKLER = frozenset({"request", "get", "post", "head", "put", "patch", "delete", "options"})
+
+    def __init__(self, oturum: Any):
+        object.__setattr__(self, "_oturum", oturum)
+
+    def __getattr__(self, ad: str) -> Any:
+        nesne = getattr(self._oturum, ad)
+        if ad not in self._ISTEKLER:
+            return nesne
+
+        def _istek(*args, **kwargs):
+            with izle(self._oturum):
+                return nesne(*args, **kwargs)
+        return _istek
+
+    def __setattr__(self, ad: str, deger: Any) -> None:
+        setattr(self._oturum, ad, deger)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        close = getattr(self._oturum, "close", None)
+        if close is not None:
+            close()
+        return False
+
+
+def izlenen(oturum: Any) -> Any:
+    """``oturum``'u (curl_cffi ya da requests) iptal edilebilir istek yapan hâle sar."""
+    if oturum is None or isinstance(oturum, _IzlenenOturum):
+        return oturum
+    return _IzlenenOturum(oturum)
+
+
+__all__ = [
+    "IptalEdildi", "IptalBaglami", "gecerli", "kontrol", "etkin", "izle", "izlenen",
+]
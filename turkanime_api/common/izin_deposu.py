@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""Domain başına Cloudflare izni (clearance çerezi + User-Agent) — diskte.
+
+Eskiden her süreç açılışı `CFSession` zincirini (curl_cffi → cloudscraper →
+FlareSolverr → QtWebEngine) baştan yürüyüp `cf_clearance` alıyordu; oysa bu
+çerez saatlerce geçerli. `cf_qt_solver`'ın döndürdüğü çerezler de oturumla
+birlikte ölüyordu, çerez tarayıcısı ise her açılışta challenge'ı yeniden
+çözdürüyordu.
+
+Burada tek JSON dosyası, domain başına tek kayıt:
+
+- **Kayıt** — çözücünün verdiği çerezler, çerezlerin bağlı olduğu UA (izin
+  UA'ya bağlı; başka UA ile gönderilen `cf_clearance` reddedilir), bitiş
+  zamanı ve kaydı üreten yöntem.
+- **Süre** — çerezin kendi bitişi biliniyorsa o, bilinmiyorsa
+  `VARSAYILAN_OMUR`; hiçbiri `AZAMI_OMUR`'u aşamaz. Süresi dolan kayıt okunmaz.
+- **Geçersiz kılma** — izinle gönderilen istek yine challenge görürse
+  (`CFSession._is_challenge`) kayıt silinir; sıradaki istek zinciri yürür.
+- **Alt alan adları** — ``www.ornek.com`` için kayıt yoksa ``ornek.com``'a
+  bakılır (çerez tarayıcısı izni kök domaine yazar).
+
+Depo yalnızca hız içindir: dosya okunamaz ya da yazılamazsa sessizce boş
+sayılır, istek asla bu yüzden düşmez.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+IZIN_DOSYASI = Path.home() / ".turkanime" / "cf_izinleri.json"
+# Çerezin kendi bitişi bilinmiyorsa (QtWebEngine oturum çerezi, cloudscraper)
+# kaydın ömrü. Cloudflare'in "Challenge Passage" süresi site başına ayarlı;
+# yanılırsak ilk challenge kaydı zaten siler.
+VARSAYILAN_OMUR = 6 * 3600.0
+# `cf_clearance` çoğu zaman bir yıllık `Expires` ile gelir ama sunucu onu çok
+# daha kısa kabul eder; diskte bundan uzun tutulmaz.
+AZAMI_OMUR = 24 * 3600.0
+
+
+@dataclass
+class Izin:
+    """Bir domainin kayıtlı izni."""
+
+    cerezler: Dict[str, str]
+    user_agent: Optional[str] = None
+    bitis: float = 0.0
+    kaynak: str = ""
+    alan: str = field(default="", compare=False)   # kaydın domaini
+
+
+def _alan(url_ya_da_host: str) -> str:
+    if "//" in url_ya_da_host:
+        url_ya_da_host = urlparse(url_ya_da_host).hostname or ""
+    return url_ya_da_host.strip().lstrip(".").lower()
+
+
+def _ust_alanlar(host: str):
+    """``a.b.ornek.com`` → ``a.b.ornek.com``, ``b.ornek.com``, ``ornek.com``."""
+    parcalar = host.split(".")
+    for i in range(max(1, len(parcalar) - 1)):
+        yield ".".join(parcalar[i:])
+
+
+class IzinDeposu:
+    """Domain → `Izin` eşlemesi; thread-safe, isteğe bağlı olarak diskte."""
+
+    def __init__(self, dosya: Optional[Path] = None,
+                 saat: Callable[[], float] = time.time):
+        self.dosya = Path(dosya) if dosya else None
+        self._saat = saat
+        self._kilit = threading.Lock()
+        self._kayitlar: Dict[str, Izin] = {}
+        self._yuklendi = self.dosya is None
+        self.isabet = 0
+        self.iskalama = 0
+        self.gecersiz = 0
+
+    # ── Okuma / yazma ───────────────────────────────────────────────────────
+    def al(self, url_ya_da_host: str) -> Optional[Izin]:
+        """Host'un (ya da üst domaininin) taze izni; yoksa ``None``."""
+        host = _alan(url_ya_da_host)
+        with self._kilit:
+            self._diskten_yukle()
+            simdi = self._saat()
+            for alan in _ust_alanlar(host) if host else ():
+                izin = self._kayitlar.get(alan)
+                if izin is None:
+                    continue
+                if izin.bitis <= simdi:
+                    del self._kayitlar[alan]
+                    continue
+                self.isabet += 1
+                return Izin(dict(izin.cerezler), izin.user_agent, izin.bitis,
+                            izin.kaynak, alan)
+            self.iskalama += 1
+            return None
+
+    def koy(self, url_ya_da_host: str, cerezler: Dict[str, str],
+            user_agent: Optional[str] = None, bitis: Optional[float] = None,
+            kaynak: str = "") -> None:
+        """``cerezler``'i domainin izni olarak kaydet (boşsa hiçbir şey yapma).
+
+        ``bitis`` çerezin kendi bitişi (epoch sn; 0/None = bilinmiyor).
+        """
+        alan = _alan(url_ya_da_host)
+        cerezler = {str(a): str(d) for a, d in (cerezler or {}).items() if a}
+        if not alan or not cerezler:
+            return
+        simdi = self._saat()
+        omur = simdi + VARSAYILAN_OMUR
+        if bitis and bitis > simdi:
+            omur = bitis
+        omur = min(omur, simdi + AZAMI_OMUR)
+        with self._kilit:
+            self._diskten_yukle()
+            self._kayitlar[alan] = Izin(cerezler, user_agent or None, omur, kaynak)
+            self._diske_yaz()
+
+    def gecersiz_kil(self, url_ya_da_host: str) -> bool:
+        """Host'a uygulanan izni sil (challenge yeniden göründü)."""
+        host = _alan(url_ya_da_host)
+        with self._kilit:
+            self._diskten_yukle()
+            for alan in _ust_alanlar(host) if host else ():
+                if self._kayitlar.pop(alan, None) is not None:
+                    self.gecersiz += 1
+                    self._diske_yaz()
+                    return True
+            return False
+
+    def temizle(self) -> None:
+        with self._kilit:
+            self._kayitlar.clear()
+            self._yuklendi = True
+            self._diske_yaz()
+
+    def istatistik(self) -> Dict[str, Any]:
+        with self._kilit:
+            return {"kayit": len(self._kayitlar), "isabet": self.isabet,
+                    "iskalama": self.iskalama, "gecersiz": self.gecersiz}
+
+    def __len__(self) -> int:
+        with self._kilit:
+            return len(self._kayitlar)
+
+    # ── İç yardımcılar (kilit tutulurken çağrılır) ──────────────────────────
+    def _diskten_yukle(self) -> None:
+        """İlk erişimde diskteki kopyayı yükle; süresi dolanlar atılır."""
+        if self._yuklendi:
+            return
+        self._yuklendi = True
+        try:
+            veri = json.loads(self.dosya.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        simdi = self._saat()
+        for alan, kayit in (veri.items() if isinstance(veri, dict) else ()):
+            try:
+                izin = Izin(dict(kayit["cerezler"]), kayit.get("user_agent"),
+                            float(kayit["bitis"]), str(kayit.get("kaynak") or ""))
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+            if izin.bitis > simdi and izin.cerezler:
+                self._kayitlar[_alan(alan)] = izin
+
+    def _diske_yaz(self) -> None:
+        """Atomik yaz (yalnızca sahibi okuyabilir); yazılamazsa sessizce geç.
+
+        Kilit altında: yazımlar seyrek (yalnızca çözüm ve geçersiz kılma),
+        eski bir anlık görüntünün yenisini ezme ihtimali böylece hiç yok.
+        """
+        if self.dosya is None:
+            return
+        anlik = json.dumps({alan: {k: v for k, v in asdict(izin).items() if k != "alan"}
+                            for alan, izin in self._kayitlar.items()},
+                           ensure_ascii=False)
+        gecici = self.dosya.with_name(
+            f".{self.dosya.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.dosya.parent.mkdir(parents=True, exist_ok=True)
+            gecici.write_text(anlik, encoding="utf-8")
+            try:
+                os.chmod(gecici, 0o600)
+            except OSError:
+                pass
+            os.replace(gecici, self.dosya)
+        except OSError:
+            try:
+                gecici.unlink()
+            except OSError:
+                pass
+
+
+# ── Süreç geneli depo ──────────────────────────────────────────────────────
+_depo: Optional[IzinDeposu] = None
+_depo_kilidi = threading.Lock()
+
+
+def depo() -> IzinDeposu:
+    """Süreç geneli depo (`IZIN_DOSYASI`; ilk kullanımda kurulur)."""
+    global _depo
+    if _depo is None:
+        with _depo_kilidi:
+            if _depo is None:
+                _depo = IzinDeposu(IZIN_DOSYASI)
+    return _depo
+
+
+__all__ = ["Izin", "IzinDeposu", "depo", "IZIN_DOSYASI", "VARSAYILAN_OMUR",
+           "AZAMI_OMUR"]
@@ -0,0 +1,402 @@
+"""Süreç geneli HTTP oturum havuzu: (host, taklit profili) başına bağlantı yeniden kullanımı.
+
+Eskiden kaynaklar oturumu istek başına kuruyordu: `animedepo.fetch_json` her
+çağrıda yeni bir curl_cffi `Session`, `anizle._http_get`/`_http_post` her
+istekte yeni bir oturum, `CFSession` her taklit denemesinde yenisi. Her yeni
+oturum yeni bir TCP + TLS el sıkışması demek; keep-alive hiç işlemiyordu.
+
+Artık oturumlar (host, profil) anahtarıyla havuzda tutulur:
+
+- Bir oturum aynı anda tek isteğe **kiralanır** (curl tutamacı thread'ler
+  arasında paylaşılmaz); istek bitince havuza döner ve bağlantısı açık kalır.
+- Host başına aynı anda en çok `HOST_BASINA_AZAMI` oturum kirada olabilir;
+  fazlası sırada bekler (beklerken iptal bağlamına bakar, bkz. `iptal`).
+- `BOSTA_AZAMI_SURE`'den uzun süre kullanılmayan oturumlar kapatılır.
+- Her host için istek, el sıkışma (yeni bağlantı) ve yeniden kullanılan
+  bağlantı sayaçları tutulur (`istatistikler()`).
+
+Kaynaklar havuzu doğrudan değil `oturum(profil)` cephesiyle kullanır: cephe
+`get`/`post`/... sunar, her isteği o URL'in host'u için havuzdan kiralanmış
+oturumla yapar. Çerezler **cepheye** aittir (havuzdaki oturuma istek süresince
+takılır); iki kaynak aynı bağlantıyı paylaşsa da birbirinin çerezini görmez.
+
+curl_cffi yoksa havuz düz `requests.Session` kurar (taklit yok, sayaçlardan
+yalnızca istek sayısı tutulur).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from . import iptal
+
+VARSAYILAN_PROFIL = "chrome131"
+# Tarayıcıların host başına eşzamanlı bağlantı sınırıyla aynı.
+HOST_BASINA_AZAMI = 6
+# Sunucuların çoğu boştaki keep-alive bağlantısını 60-120 sn'de kapatır;
+# daha uzun tutmak yalnızca bir sonraki istekte yeniden bağlanmak demek.
+BOSTA_AZAMI_SURE = 60.0
+# Kirada oturum beklerken iptal bağlamına bakma aralığı (sn).
+_BEKLEME_DILIMI = 0.05
+
+# curl_cffi yoksa düz requests oturumları bu UA ile kurulur.
+VARSAYILAN_UA = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                 "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36")
+
+_ISTEKLER = frozenset({"get", "post", "head", "put", "patch", "delete", "options"})
+
+
+@dataclass
+class HostSayaclari:
+    """Bir host'un havuz sayaçları."""
+
+    istek: int = 0
+    el_sikisma: int = 0          # yeni açılan bağlantı (TCP + TLS)
+    yeniden_kullanim: int = 0    # açık bağlantı üzerinden giden istek
+    olusturulan: int = 0         # kurulan oturum
+    tahliye: int = 0             # boşta kaldığı için kapatılan oturum
+    atilan: int = 0              # istek hatayla bittiği için atılan oturum
+    bekleme: int = 0             # host sınırı dolu olduğu için bekleyen kiralama
+    acik: int = 0                # şu an yaşayan oturum (boşta + kirada)
+    kirada: int = 0
+
+
+def _host(url: str) -> str:
+    host = urlparse(url).hostname if "//" in url else url
+    return (host or url or "").lower()
+
+
+def _varsayilan_sinif() -> Callable[..., Any]:
+    """curl_cffi `Session`'ı; yoksa `requests.Session` (çağrı anında çözülür)."""
+    try:
+        from curl_cffi import requests as curl_requests
+        return curl_requests.Session
+    except ImportError:
+        import requests
+        return requests.Session
+
+
+def _tur(nesne: Any) -> str:
+    """``"curl"``, ``"requests"`` ya da tanınmayan sahte oturumlar için ``""``."""
+    modul = getattr(nesne, "__module__", "") or type(nesne).__module__
+    if modul.startswith("curl_cffi"):
+        return "curl"
+    if modul.startswith("requests"):
+        return "requests"
+    return ""
+
+
+class _Oturum:
+    """Havuzdaki tek oturum ve son kullanım anı."""
+
+    __slots__ = ("nesne", "tur", "son_kullanim")
+
+    def __init__(self, nesne: Any, tur: str, simdi: float):
+        self.nesne = nesne
+        self.tur = tur
+        self.son_kullanim = simdi
+
+
+class OturumHavuzu:
+    """(host, profil) başına yeniden kullanılan, thread-safe oturum havuzu."""
+
+    def __init__(self, host_basina: int = HOST_BASINA_AZAMI,
+                 bosta_sure: float = BOSTA_AZAMI_SURE,
+                 saat: Callable[[], float] = time.monotonic):
+        if host_basina < 1:
+            raise ValueError("host_basina en az 1 olmalı")
+        self.host_basina = host_basina
+        self.bosta_sure = bosta_sure
+        self._saat = saat
+        self._kosul = threading.Condition()
+        # (host, profil, sınıf) → boştaki oturumlar (en son bırakılan sonda).
+        self._bos: Dict[Tuple[str, str, Any], List[_Oturum]] = {}
+        self._sayac: Dict[str, HostSayaclari] = {}
+
+    # ── Kiralama ───────────────────────────────────────────────────────────
+    @contextmanager
+    def kirala(self, url: str, profil: str = VARSAYILAN_PROFIL,
+               sinif: Optional[Callable[..., Any]] = None) -> Iterator[Any]:
+        """``url``'in host'u için bir oturumu istek süresince özel kullanıma ver.
+
+        Blok istisnayla biterse oturum havuza dönmez: yarım kalmış bir
+        aktarımın bağlantısını bir sonraki isteğe devretmek güvenli değil.
+        """
+        host = _host(url)
+        sinif = sinif or _varsayilan_sinif()
+        anahtar = (host, profil, sinif)
+        oturum = self._al(anahtar)
+        temiz = False
+        try:
+            yield oturum.nesne
+            temiz = True
+        finally:
+            self._birak(anahtar, oturum, temiz)
+
+    def _al(self, anahtar: Tuple[str, str, Any]) -> _Oturum:
+        host = anahtar[0]
+        with self._kosul:
+            sayac = self._sayac.setdefault(host, HostSayaclari())
+            self._tahliye_et()
+            bekledi = False
+            while True:
+                bos = self._bos.get(anahtar)
+                if bos:
+                    oturum = bos.pop()
+                    break
+                if sayac.kirada < self.host_basina:
+                    if sayac.acik >= self.host_basina:
+                        # Sınır başka profillerin boştaki oturumlarıyla dolu:
+                        # en eskisini kapatıp yer aç.
+                        self._en_eskiyi_kapat(host)
+                    oturum = None
+                    break
+                if not bekledi:
+                    bekledi = True
+                    sayac.bekleme += 1
+                self._kosul.wait(_BEKLEME_DILIMI)
+                iptal.kontrol()
+            sayac.kirada += 1
+            if oturum is not None:
+                return oturum
+            sayac.acik += 1
+            sayac.olusturulan += 1
+        # Kurulum kilit dışında: curl tutamacı açmak diğer host'ları bekletmesin.
+        try:
+            return self._kur(*anahtar)
+        except BaseException:
+            with self._kosul:
+                sayac.kirada -= 1
+                sayac.acik -= 1
+                self._kosul.notify_all()
+            raise
+
+    def _kur(self, host: str, profil: str, sinif: Callable[..., Any]) -> _Oturum:
+        tur = _tur(sinif)
+        if tur == "curl":
+            from curl_cffi.const import CurlInfo
+            nesne = sinif(impersonate=profil, use_thread_local_curl=False,
+                          curl_infos=[CurlInfo.NUM_CONNECTS])
+        elif tur == "requests":
+            nesne = sinif()
+            nesne.headers["User-Agent"] = VARSAYILAN_UA
+        else:
+            nesne = sinif(impersonate=profil)
+        return _Oturum(nesne, tur, self._saat())
+
+    def _birak(self, anahtar: Tuple[str, str, Any], oturum: _Oturum, temiz: bool) -> None:
+        with self._kosul:
+            sayac = self._sayac[anahtar[0]]
+            sayac.kirada -= 1
+            if temiz:
+                oturum.son_kullanim = self._saat()
+                self._bos.setdefault(anahtar, []).append(oturum)
+            else:
+                sayac.atilan += 1
+                sayac.acik -= 1
+                _kapat(oturum)
+            self._kosul.notify_all()
+
+    # ── Tahliye ────────────────────────────────────────────────────────────
+    def _tahliye_et(self) -> None:
+        """Boşta `bosta_sure`'den uzun kalan oturumları kapat (kilit altında)."""
+        sinir = self._saat() - self.bosta_sure
+        for anahtar, bos in list(self._bos.items()):
+            kalan = [o for o in bos if o.son_kullanim > sinir]
+            for oturum in bos:
+                if oturum.son_kullanim <= sinir:
+                    sayac = self._sayac[anahtar[0]]
+                    sayac.tahliye += 1
+                    sayac.acik -= 1
+                    _kapat(oturum)
+            if kalan:
+                self._bos[anahtar] = kalan
+            else:
+                del self._bos[anahtar]
+
+    def _en_eskiyi_kapat(self, host: str) -> None:
+        adaylar = [(o.son_kullanim, anahtar, o) for anahtar, bos in self._bos.items()
+                   if anahtar[0] == host for o in bos]
+        if not adaylar:
+            return
+        _, anahtar, oturum = min(adaylar, key=lambda a: a[0])
+        self._bos[anahtar].remove(oturum)
+        if not self._bos[anahtar]:
+            del self._bos[anahtar]
+        sayac = self._sayac[host]
+        sayac.tahliye += 1
+        sayac.acik -= 1
+        _kapat(oturum)
+
+    def temizle(self) -> None:
+        """Süresi dolan boştaki oturumları şimdi kapat."""
+        with self._kosul:
+            self._tahliye_et()
+
+    def kapat(self) -> None:
+        """Boştaki bütün oturumları kapat; sayaçlar sıfırlanır."""
+        with self._kosul:
+            for bos in self._bos.values():
+                for oturum in bos:
+                    _kapat(oturum)
+            self._bos.clear()
+            self._sayac = {h: HostSayaclari(kirada=s.kirada, acik=s.kirada)
+                           for h, s in self._sayac.items() if s.kirada}
+
+    # ── Sayaçlar ───────────────────────────────────────────────────────────
+    def _kaydet(self, host: str, yeni_baglanti: Optional[int]) -> None:
+        with self._kosul:
+            sayac = self._sayac.setdefault(host, HostSayaclari())
+            sayac.istek += 1
+            if yeni_baglanti is None:
+                return
+            if yeni_baglanti > 0:
+                sayac.el_sikisma += yeni_baglanti
+            else:
+                sayac.yeniden_kullanim += 1
+
+    def istatistikler(self) -> Dict[str, Dict[str, int]]:
+        """Host başına sayaçların kopyası."""
+        with self._kosul:
+            self._tahliye_et()
+            return {host: asdict(s) for host, s in sorted(self._sayac.items())}
+
+
+def _kapat(oturum: _Oturum) -> None:
+    try:
+        oturum.nesne.close()
+    except Exception:
+        pass
+
+
+def _yeni_baglanti(yanit: Any) -> Optional[int]:
+    """curl_cffi yanıtının bu aktarımda açtığı bağlantı sayısı; bilinmiyorsa None."""
+    bilgiler = getattr(yanit, "infos", None)
+    if not isinstance(bilgiler, dict):
+        return None
+    try:
+        from curl_cffi.const import CurlInfo
+    except ImportError:
+        return None
+    deger = bilgiler.get(CurlInfo.NUM_CONNECTS)
+    return int(deger) if isinstance(deger, int) else None
+
+
+# ── Cephe ──────────────────────────────────────────────────────────────────
+class HavuzOturumu:
+    """Kaynakların kullandığı oturum yüzü: her istek havuzdan kiralanır.
+
+    `requests.Session`'ın kaynaklarda kullanılan kısmını sunar: `get`,
+    `post`, `request`..., `headers` (her isteğe eklenir) ve `cookies`.
+    Çerez kavanozu bu nesneye aittir; `cookies` curl_cffi için `Cookies`,
+    requests için `RequestsCookieJar` döner.
+    """
+
+    def __init__(self, profil: str = VARSAYILAN_PROFIL,
+                 headers: Optional[Dict[str, str]] = None,
+                 allow_redirects: Optional[bool] = None,
+                 havuz: Optional[OturumHavuzu] = None,
+                 sinif: Optional[Callable[..., Any]] = None):
+        self.profil = profil
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.allow_redirects = allow_redirects
+        self._havuz = havuz
+        self._sinif = sinif or _varsayilan_sinif()
+        self._tur = _tur(self._sinif)
+        self._cerezler: Any = None
+
+    @property
+    def havuz(self) -> OturumHavuzu:
+        return self._havuz or havuz()
+
+    @property
+    def cookies(self) -> Any:
+        if self._cerezler is None:
+            if self._tur == "curl":
+                from curl_cffi.requests import Cookies
+                self._cerezler = Cookies()
+            else:
+                from requests.cookies import RequestsCookieJar
+                self._cerezler = RequestsCookieJar()
+        return self._cerezler
+
+    def request(self, method: str, url: str, **kwargs) -> Any:
+        if self.headers:
+            kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        if self.allow_redirects is not None:
+            kwargs.setdefault("allow_redirects", self.allow_redirects)
+        with self.havuz.kirala(url, self.profil, self._sinif) as oturum:
+            tur = _tur(oturum)
+            if tur == "curl":
+                # `Cookies` değil kavanozun kendisi: setter `Cookies`'i kopyalıyor.
+                oturum.cookies = self.cookies.jar
+            elif tur == "requests":
+                oturum.cookies = self.cookies
+            # Kısayol metodu varsa o: bazı taşımalar (ve test sahteleri)
+            # yalnızca get/post sunar.
+            kisayol = getattr(oturum, method.lower(), None) \
+                if method.lower() in _ISTEKLER else None
+            with iptal.izle(oturum):
+                yanit = (kisayol(url, **kwargs) if kisayol is not None
+                         else oturum.request(method, url, **kwargs))
+        self.havuz._kaydet(_host(url), _yeni_baglanti(yanit))
+        return yanit
+
+    def __getattr__(self, ad: str) -> Any:
+        if ad not in _ISTEKLER:
+            raise AttributeError(ad)
+        metot = ad.upper()
+        return lambda url, **kwargs: self.request(metot, url, **kwargs)
+
+    def close(self) -> None:
+        """Havuzdaki bağlantılar paylaşılıyor; kapatılacak bir şey yok."""
+
+    def __enter__(self) -> "HavuzOturumu":
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+# ── Süreç geneli havuz ─────────────────────────────────────────────────────
+_havuz: Optional[OturumHavuzu] = None
+_havuz_kilidi = threading.Lock()
+
+
+def havuz() -> OturumHavuzu:
+    """Süreç geneli havuz (ilk kullanımda kurulur)."""
+    global _havuz
+    if _havuz is None:
+        with _havuz_kilidi:
+            if _havuz is None:
+                _havuz = OturumHavuzu()
+    return _havuz
+
+
+def oturum(profil: str = VARSAYILAN_PROFIL, **ayar) -> HavuzOturumu:
+    """Süreç geneli havuzu kullanan yeni bir cephe (kendi çerez kavanozuyla)."""
+    return HavuzOturumu(profil, **ayar)
+
+
+def istatistikler() -> Dict[str, Dict[str, int]]:
+    return havuz().istatistikler()
+
+
+def sifirla() -> None:
+    """Süreç geneli havuzu kapat ve unut (testler, ayar değişiklikleri)."""
+    global _havuz
+    with _havuz_kilidi:
+        eski, _havuz = _havuz, None
+    if eski is not None:
+        eski.kapat()
+
+
+__all__ = [
+    "OturumHavuzu", "HavuzOturumu", "HostSayaclari", "havuz", "oturum",
+    "istatistikler", "sifirla", "VARSAYILAN_PROFIL", "HOST_BASINA_AZAMI",
+    "BOSTA_AZAMI_SURE",
+]
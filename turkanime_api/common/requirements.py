@@ -24,10 +24,28 @@ from shutil import move
 from typing import Any, Callable, Dict, List, Optional, Sequence
 from zipfile import ZipFile
 
-import requests
-
 from .utils import get_arch, get_os
 
+
+def __getattr__(ad):
+    """`requests` ilk erişimde yüklenir (PEP 562).
+
+    CLI ve GUI bu modülü açılışta `path_hazirla` için yüklüyor; ağ yalnızca
+    sihirbaz indirirken gerekiyor. Ad modülde duruyor ki testler
+    `requirements.requests.get`'i sahteleyebilsin.
+    """
+    if ad == "requests":
+        import requests
+        globals()[ad] = requests
+        return requests
+    raise AttributeError(f"module {__name__!r} has no attribute {ad!r}")
+
+
+def _requests():
+    """Modül içinden `requests` — düz ad araması `__getattr__`'a uğramıyor."""
+    return globals().get("requests") or __getattr__("requests")
+
+
 GEREKSINIM_URL = ("https://raw.githubusercontent.com/KebabLord/"
                   "turkanime-indirici/master/gereksinimler.json")
 
@@ -192,7 +210,7 @@ def gereksinim_listesi_getir(url: str = GEREKSINIM_URL,
     "böyle bir araç yok"a çevirirdi.
     """
     try:
-        yanit = requests.get(url, timeout=timeout)
+        yanit = _requests().get(url, timeout=timeout)
         yanit.raise_for_status()
         liste = _liste_suz(yanit.json())
     except Exception:
@@ -274,7 +292,7 @@ def indir_ve_kur(ad: str, url: str, hedef_dizin: str,
 
     with tempfile.TemporaryDirectory() as tmp:
         indirilen = os.path.join(tmp, os.path.basename(url.split("?")[0]) or ad)
-        yanit = requests.get(url, stream=True, timeout=INDIRME_ZAMAN_ASIMI)
+        yanit = _requests().get(url, stream=True, timeout=INDIRME_ZAMAN_ASIMI)
         yanit.raise_for_status()
         toplam = int(yanit.headers.get("content-length") or 0)
         inen = 0
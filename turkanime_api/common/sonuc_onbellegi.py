@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+"""Süreç genelinde kaynak arama sonucu önbelleği.
+
+Arama sayfası, bölüm sayfasının otomatik eşleştirmesi (`DetailPage._do_resolve`)
+ve "İstediğin anime değil mi?" diyaloğu (`AnimeMatchDialog._do_search`) aynı
+başlığı saniyeler arayla sekiz kaynakta baştan arıyordu. Sonuçlar burada
+``(sorgu, kaynak, limit)`` anahtarıyla tutulur:
+
+- **TTL** — kaynakların katalogları değişir; eski sonuç sonsuza dek kalmaz.
+- **LRU** — kapasite dolunca en uzun süre dokunulmayan kayıt atılır.
+- **Disk** — isteğe bağlı; yeniden başlatmadan sonra da ilk arama anlık.
+- **Birleştirme** — aynı anahtar için süren bir çağrı varken gelen ikinci
+  çağrı kaynağa ikinci kez gitmez, ilkinin sonucunu bekler.
+
+Sorgu yalnızca büyük/küçük harf ve boşluk bakımından normalize edilir;
+noktalama kaynakların kendi arama motorlarında sonucu değiştirebildiği için
+(`Re:Zero` / `Re Zero`) anahtarın parçası kalır.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from . import iptal
+
+# Varsayılan yaşam süresi (sn) ve kayıt sınırı
+VARSAYILAN_TTL = 600.0
+VARSAYILAN_KAPASITE = 512
+
+Anahtar = Tuple[str, str, int]
+
+
+def sorgu_anahtari(sorgu: str, kaynak: str, limit: int) -> Anahtar:
+    """``(normalize sorgu, kaynak, limit)`` anahtarı."""
+    return (" ".join((sorgu or "").casefold().split()), kaynak, int(limit))
+
+
+class SonucOnbellegi:
+    """TTL'li, LRU tahliyeli, eşzamanlı çağrıları birleştiren önbellek.
+
+    Thread güvenlidir; hesaplama kilit DIŞINDA yapılır, yani yavaş bir kaynak
+    diğer anahtarların okunmasını bekletmez.
+    """
+
+    def __init__(self, ttl: float = VARSAYILAN_TTL,
+                 kapasite: int = VARSAYILAN_KAPASITE,
+                 dosya: Optional[Path] = None,
+                 saat: Callable[[], float] = time.time):
+        self.ttl = ttl
+        self.kapasite = kapasite
+        self.dosya = Path(dosya) if dosya else None
+        self._saat = saat
+        self._kilit = threading.Lock()
+        # anahtar → (bitiş zamanı, değer); sıra = LRU sırası (sonda en yeni)
+        self._kayitlar: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._suren: Dict[Hashable, Future] = {}
+        # Disk yazımları kilit dışında; eski anlık görüntü yenisini ezmesin.
+        self._yazma_kilidi = threading.Lock()
+        self._surum = 0
+        self._yazilan = 0
+        self._yuklendi = self.dosya is None
+        self.isabet = 0
+        self.iskalama = 0
+        self.birlesen = 0
+
+    # ── Okuma / yazma ───────────────────────────────────────────────────────
+    def al(self, anahtar: Hashable) -> Optional[Any]:
+        """Taze kaydı döndür; yoksa ya da süresi dolmuşsa ``None``."""
+        with self._kilit:
+            self._diskten_yukle()
+            return self._taze(anahtar)
+
+    def koy(self, anahtar: Hashable, deger: Any) -> None:
+        with self._kilit:
+            self._diskten_yukle()
+            self._koy(anahtar, deger)
+            anlik = self._anlik_goruntu()
+        self._diske_yaz(anlik)
+
+    def getir(self, anahtar: Hashable, hesapla: Callable[[], Any],
+              sakla: Callable[[Any], bool] = lambda _d: True) -> Any:
+        """Önbellekten döndür ya da ``hesapla()`` ile üret.
+
+        Aynı anahtar için süren bir hesaplama varsa onun sonucu (ya da
+        istisnası) beklenir. ``sakla(deger)`` yanlışsa sonuç yalnızca o anda
+        bekleyenlere verilir, önbelleğe yazılmaz. Süren hesaplamanın sahibi
+        iptal edildiyse (`iptal.IptalEdildi`) bekleyen, kendisi iptal
+        edilmemişse hesaplamayı kendisi üstlenir.
+        """
+        with self._kilit:
+            self._diskten_yukle()
+            deger = self._taze(anahtar)
+            if deger is not None:
+                self.isabet += 1
+                return deger
+            suren = self._suren.get(anahtar)
+            if suren is None:
+                self.iskalama += 1
+                gelecek: Future = Future()
+                self._suren[anahtar] = gelecek
+            else:
+                self.birlesen += 1
+        if suren is not None:
+            try:
+                return suren.result()
+            except iptal.IptalEdildi:
+                iptal.kontrol()
+                return self.getir(anahtar, hesapla, sakla)
+
+        try:
+            deger = hesapla()
+        except BaseException as exc:
+            with self._kilit:
+                self._suren.pop(anahtar, None)
+            gelecek.set_exception(exc)
+            raise
+        anlik = None
+        with self._kilit:
+            self._suren.pop(anahtar, None)
+            if sakla(deger):
+                self._koy(anahtar, deger)
+                anlik = self._anlik_goruntu()
+        gelecek.set_result(deger)
+        if anlik is not None:
+            self._diske_yaz(anlik)
+        return deger
+
+    def temizle(self) -> None:
+        with self._kilit:
+            self._kayitlar.clear()
+            self._yuklendi = True
+            anlik = self._anlik_goruntu()
+        self._diske_yaz(anlik)
+
+    def istatistik(self) -> Dict[str, Any]:
+        with self._kilit:
+            toplam = self.isabet + self.iskalama
+            return {
+                "kayit": len(self._kayitlar),
+                "isabet": self.isabet,
+                "iskalama": self.iskalama,
+                "birlesen": self.birlesen,
+                "isabet_orani": self.isabet / toplam if toplam else 0.0,
+            }
+
+    def __len__(self) -> int:
+        with self._kilit:
+            return len(self._kayitlar)
+
+    # ── İç yardımcılar (kilit tutulurken çağrılır) ──────────────────────────
+    def _taze(self, anahtar: Hashable) -> Optional[Any]:
+        kayit = self._kayitlar.get(anahtar)
+        if kayit is None:
+            return None
+        bitis, deger = kayit
+        if bitis <= self._saat():
+            del self._kayitlar[anahtar]
+            return None
+        self._kayitlar.move_to_end(anahtar)
+        return deger
+
+    def _koy(self, anahtar: Hashable, deger: Any) -> None:
+        self._kayitlar[anahtar] = (self._saat() + self.ttl, deger)
+        self._kayitlar.move_to_end(anahtar)
+        while len(self._kayitlar) > self.kapasite:
+            self._kayitlar.popitem(last=False)
+
+    def _anlik_goruntu(self):
+        if self.dosya is None:
+            return None
+        self._surum += 1
+        return self._surum, [[list(a) if isinstance(a, tuple) else a, bitis, deger]
+                             for a, (bitis, deger) in self._kayitlar.items()]
+
+    def _diskten_yukle(self) -> None:
+        """İlk erişimde diskteki kopyayı yükle; süresi dolanlar atılır."""
+        if self._yuklendi:
+            return
+        self._yuklendi = True
+        try:
+            kayitlar = json.loads(self.dosya.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        simdi = self._saat()
+        for kayit in kayitlar if isinstance(kayitlar, list) else []:
+            try:
+                anahtar, bitis, deger = kayit
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(bitis, (int, float)) or bitis <= simdi:
+                continue
+            anahtar = tuple(anahtar) if isinstance(anahtar, list) else anahtar
+            self._kayitlar[anahtar] = (bitis, deger)
+        while len(self._kayitlar) > self.kapasite:
+            self._kayitlar.popitem(last=False)
+
+    def _diske_yaz(self, anlik) -> None:
+        """Atomik yaz; yazılamazsa sessizce geç (yalnızca önbellek)."""
+        if anlik is None or self.dosya is None:
+            return
+        surum, kayitlar = anlik
+        gecici = self.dosya.with_name(
+            f".{self.dosya.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._yazma_kilidi:
+            if surum <= self._yazilan:
+                return
+            try:
+                self.dosya.parent.mkdir(parents=True, exist_ok=True)
+                gecici.write_text(json.dumps(kayitlar, ensure_ascii=False),
+                                  encoding="utf-8")
+                os.replace(gecici, self.dosya)
+                self._yazilan = surum
+            except (OSError, TypeError, ValueError):
+                try:
+                    gecici.unlink()
+                except OSError:
+                    pass
+
+
+__all__ = ["SonucOnbellegi", "sorgu_anahtari", "VARSAYILAN_TTL",
+           "VARSAYILAN_KAPASITE"]
@@ -10,6 +10,9 @@ Multi-language anime title search + fuzzy matching.
     - ``score_match(query, candidate, aliases=None)`` — sorgu + alias listesini
                                          aday başlığa karşı skorlar, en iyi
                                          skoru döndürür.
+    - ``skor_matrisi(sorgular, adaylar, olcut)`` — sorgu kümesi × aday kümesi
+                                         skorlarını tek çağrıda hesaplar (her
+                                         dizgi bir kez normalize edilir).
     - ``multilang_search(searcher, query, threshold=0.95)`` — verilen kaynak
                                          arama fonksiyonunu tüm alias'lar
                                          üzerinde dener, sonuçları benzersizleştirip
@@ -20,32 +23,56 @@ Olası eşleşme varsa UI buna göre kullanıcıya popup açabilir.
 """
 from __future__ import annotations
 
-import json
 import re
+import threading
 import time
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
 from dataclasses import dataclass, field
+from functools import lru_cache
 from difflib import SequenceMatcher
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
 # rapidfuzz varsa öncelikli — çok daha hızlı + doğru
 try:
-    from rapidfuzz import fuzz as _rf_fuzz  # type: ignore
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process  # type: ignore
     _HAS_RF = True
 except ImportError:
     _HAS_RF = False
 
+# `process.cdist` numpy dizisi döndürüyor; numpy yalnızca ilk toplu skorlamada
+# aranır — import zamanında çekmek her `title_match` kullanıcısına ~0.1 sn.
+_numpy = None
+_numpy_denendi = False
 
+
+# Alias önbelleği tek SQLite dosyası (bkz. `alias_deposu`). `_CACHE_DIR` eski
+# sorgu başına JSON klasörü: yalnızca ilk açılışta içeri aktarılıp silinir.
+_CACHE_DB = Path.home() / ".turkanime" / "title_cache.sqlite3"
 _CACHE_DIR = Path.home() / ".turkanime" / "title_cache"
 _CACHE_TTL = 7 * 24 * 3600  # 1 hafta
+_CACHE_KAPASITE = 5000
+_depo = None
+_depo_kilidi = threading.Lock()
+
+# `multilang_search`'te bir kaynak için aynı anda denenen alias sayısı ve o
+# kaynağa ayrılan toplam süre (sn). Kaynak başına sınır: sunucunun `/search`'ü
+# bunu her kaynak için ayrı ayrı çağırıyor.
+ALIAS_PARALEL = 3
+ALIAS_BUTCESI = 20.0
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Skor
 # ─────────────────────────────────────────────────────────────────────────────
-def _normalize(s: str) -> str:
-    """Lower-case, aksan kaldır, sembolleri boşluğa çevir, çoklu boşluğu tek yap."""
+def _normalize_nfkd(s: str) -> str:
+    """Referans normalizasyon: NFKD + birleşik iz filtresi + regex.
+
+    `_normalize` bununla birebir aynı çıktıyı verir; tablo bu fonksiyonun
+    tek karakterlik sonuçlarından kurulur.
+    """
     if not s:
         return ""
     s = unicodedata.normalize("NFKD", s)
@@ -55,6 +82,74 @@ def _normalize(s: str) -> str:
     return s.strip()
 
 
+def _karakter_cevir(c: str) -> str:
+    """Tek karakterin `_normalize_nfkd` hattındaki karşılığı (kırpma/birleştirme yok).
+
+    Hat karakter karakter ayrışıyor: NFKD ayrıştırması karaktere özgü, yeniden
+    sıralama yalnızca zaten atılan birleşik izleri etkiliyor; `lower()` sonrası
+    a-z0-9 dışında kalan her şey boşluk oluyor.
+    """
+    c = unicodedata.normalize("NFKD", c)
+    c = "".join(h for h in c if not unicodedata.combining(h)).lower()
+    return re.sub(r"[^a-z0-9]", " ", c)
+
+
+class _KarakterHaritasi(dict):
+    """`str.translate` tablosu; tabloda olmayan karakter ilk görüldüğünde eklenir."""
+
+    def __missing__(self, kod: int) -> str:
+        deger = self[kod] = _karakter_cevir(chr(kod))
+        return deger
+
+
+_HARITA = _KarakterHaritasi()
+for _kod in range(0x250):      # ASCII, Latin-1, Latin Extended-A/B (Türkçe harfler dahil)
+    _HARITA[_kod]
+del _kod
+
+_NORMALIZE_ONBELLEK = 16384
+
+
+@lru_cache(maxsize=_NORMALIZE_ONBELLEK)
+def _normalize(s: str) -> str:
+    """Lower-case, aksan kaldır, sembolleri boşluğa çevir, çoklu boşluğu tek yap.
+
+    Aynı başlıklar (küme başlıkları, alias'lar, kaynak sonuçları) tekrar tekrar
+    skorlandığı için sonuç sınırlı LRU'da tutulur; ıskalamada tek bir
+    `str.translate` geçişi NFKD + regex hattının yerini alır.
+    """
+    if not s:
+        return ""
+    return " ".join(s.translate(_HARITA).split())
+
+
+def normalize_kiyasla(basliklar: Optional[List[str]] = None,
+                      tekrar: int = 20000) -> Dict[str, float]:
+    """Normalizasyonun çağrı başı maliyeti (µs): referans, tablo, önbellek isabeti."""
+    basliklar = basliklar or [
+        "Shingeki no Kyojin: The Final Season", "Şeytan Öldüren: Kimetsu no Yaiba",
+        "Steins;Gate 0", "Re:Zero kara Hajimeru Isekai Seikatsu", "Pokémon (2019)",
+        "ONE PIECE FILM: RED", "Kaguya-sama wa Kokurasetai ~Ultra Romantic~",
+        "Sousou no Frieren", "Çağrı ve Işık", "Jujutsu Kaisen 2nd Season",
+    ]
+    tablo = _normalize.__wrapped__
+
+    def olc(fn) -> float:
+        bas = time.perf_counter()
+        for i in range(tekrar):
+            fn(basliklar[i % len(basliklar)])
+        return (time.perf_counter() - bas) / tekrar * 1e6
+
+    for b in basliklar:
+        _normalize(b)
+    return {
+        "referans_us": round(olc(_normalize_nfkd), 3),
+        "tablo_us": round(olc(tablo), 3),
+        "onbellek_us": round(olc(_normalize), 3),
+        "ayni": all(_normalize_nfkd(b) == tablo(b) for b in basliklar),
+    }
+
+
 def fuzzy_score(a: str, b: str) -> float:
     """İki başlık arasında 0..1 benzerlik skoru. Karakter+token bazlı.
 
@@ -114,46 +209,133 @@ def siralama_skoru(query: str, candidate: str) -> float:
 
 def score_match(query: str, candidate: str, aliases: Optional[List[str]] = None) -> float:
     """Sorgu + alias listesi içinde aday başlığa en yakın eşleşmenin skorunu döndür."""
-    best = fuzzy_score(query, candidate)
-    if aliases:
-        for alt in aliases:
-            sc = fuzzy_score(alt, candidate)
-            if sc > best:
-                best = sc
-            if best >= 1.0:
-                break
-    return best
+    sorgular = [query, *(aliases or [])]
+    return max(satir[0] for satir in skor_matrisi(sorgular, [candidate]))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Toplu skor
+# ─────────────────────────────────────────────────────────────────────────────
+def _cdist_numpy():
+    """`process.cdist` kullanılabiliyorsa numpy modülü, değilse ``None``."""
+    global _numpy, _numpy_denendi
+    if not _numpy_denendi:
+        _numpy_denendi = True
+        if _HAS_RF and hasattr(_rf_process, "cdist"):
+            try:
+                import numpy
+                _numpy = numpy
+            except ImportError:
+                _numpy = None
+    return _numpy
+
+
+def _ham_matris(scorer, sorgular: List[str], adaylar: List[str]) -> List[List[float]]:
+    """rapidfuzz ``scorer`` ile 0..100 matrisi (satır: sorgu, sütun: aday).
+
+    numpy varsa `process.cdist` tüm matrisi C tarafında tek çağrıda doldurur;
+    yoksa her satır `process.extract` ile (yine C döngüsünde) hesaplanır.
+    """
+    np = _cdist_numpy()
+    if np is not None:
+        return _rf_process.cdist(sorgular, adaylar, scorer=scorer,
+                                 dtype=np.float64).tolist()
+    matris = []
+    for sorgu in sorgular:
+        satir = [0.0] * len(adaylar)
+        for _, skor, j in _rf_process.extract(sorgu, adaylar, scorer=scorer,
+                                              limit=None):
+            satir[j] = skor
+        matris.append(satir)
+    return matris
+
+
+def skor_matrisi(sorgular: List[str], adaylar: List[str],
+                 olcut: str = "benzerlik") -> List[List[float]]:
+    """Her sorgu × her aday skoru; ``matris[i][j]`` = sorgu i, aday j.
+
+    ``olcut``:
+        ``"benzerlik"`` — `fuzzy_score` ile birebir aynı değerler.
+        ``"siralama"``  — `siralama_skoru` ile birebir aynı değerler.
+
+    Çift başına fonksiyon çağırmaktan farkı: her dizgi bir kez normalize
+    edilir, aynı normalize biçime sahip adaylar bir kez skorlanır ve
+    rapidfuzz oranları tüm küme için tek çağrıda hesaplanır.
+    """
+    if olcut not in ("benzerlik", "siralama"):
+        raise ValueError(f"bilinmeyen ölçüt: {olcut}")
+    ns = [_normalize(q) for q in sorgular]
+    na_tum = [_normalize(c) for c in adaylar]
+    tekil: Dict[str, int] = {}
+    for n in na_tum:
+        tekil.setdefault(n, len(tekil))
+    na = list(tekil)
+    sutun = [tekil[n] for n in na_tum]
+    if not ns or not na:
+        return [[0.0] * len(adaylar) for _ in sorgular]
+
+    if _HAS_RF:
+        oran = [[v / 100.0 for v in satir]
+                for satir in _ham_matris(_rf_fuzz.ratio, ns, na)]
+        if olcut == "benzerlik":
+            kume = _ham_matris(_rf_fuzz.token_set_ratio, ns, na)
+            kismi = _ham_matris(_rf_fuzz.partial_ratio, ns, na)
+    else:
+        # Yedek: stdlib SequenceMatcher (tekil adaylar üzerinde)
+        oran = [[SequenceMatcher(None, a, b).ratio() for b in na] for a in ns]
+
+    sonuc: List[List[float]] = []
+    for i, a in enumerate(ns):
+        satir_tekil = []
+        for j, b in enumerate(na):
+            if not a or not b:
+                skor = 0.0
+            elif a == b:
+                skor = 1.0
+            elif olcut == "benzerlik" and _HAS_RF:
+                skor = max(kume[i][j] / 100.0, kismi[i][j] / 100.0, oran[i][j])
+            elif olcut == "benzerlik":
+                skor = oran[i][j]
+            else:
+                skor = oran[i][j]
+                if b.startswith(a + " "):
+                    skor += 0.25
+                elif f" {a} " in f" {b} ":
+                    skor += 0.05
+                skor = min(skor, 0.99)
+            satir_tekil.append(skor)
+        sonuc.append([satir_tekil[k] for k in sutun])
+    return sonuc
 
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Multi-language alias getirme (AniList + Jikan)
 # ─────────────────────────────────────────────────────────────────────────────
-def _cache_path(query: str) -> Path:
-    safe = re.sub(r"[^a-z0-9]+", "_", query.lower()).strip("_") or "q"
-    return _CACHE_DIR / f"{safe}.json"
+def _alias_deposu():
+    """Süreç başına tek `AliasDeposu`; açılamazsa ``None`` (önbelleksiz çalış)."""
+    global _depo
+    with _depo_kilidi:
+        if _depo is None:
+            from .alias_deposu import AliasDeposu
+            try:
+                _depo = AliasDeposu(_CACHE_DB, ttl=_CACHE_TTL,
+                                    kapasite=_CACHE_KAPASITE)
+                _depo.eski_klasoru_aktar(_CACHE_DIR)
+            except Exception:
+                if _depo is None:
+                    _depo = False            # her aramada yeniden denenmesin
+        return _depo if _depo is not False else None
 
 
 def _load_cache(query: str) -> Optional[Dict]:
-    p = _cache_path(query)
-    if not p.exists():
-        return None
-    try:
-        data = json.loads(p.read_text(encoding="utf-8"))
-        if time.time() - data.get("ts", 0) > _CACHE_TTL:
-            return None
-        return data
-    except Exception:
-        return None
+    depo = _alias_deposu()
+    return depo.al(query) if depo is not None else None
 
 
 def _save_cache(query: str, payload: Dict):
-    try:
-        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        p = _cache_path(query)
-        p.write_text(json.dumps({"ts": time.time(), **payload},
-                                ensure_ascii=False), encoding="utf-8")
-    except Exception:
-        pass
+    depo = _alias_deposu()
+    if depo is not None:
+        depo.koy(query, payload)
 
 
 def _fetch_anilist_titles(query: str) -> List[str]:
@@ -225,7 +407,9 @@ def _fetch_jikan_titles(query: str) -> List[str]:
 def get_title_aliases(query: str, use_cache: bool = True) -> List[str]:
     """Sorgu için tüm dillerdeki anime title varyantlarını döndür.
 
-    Sırasıyla dener: cache → AniList → Jikan. İkisinden de gelirse birleştirir.
+    Önce cache; yoksa AniList ve Jikan AYNI ANDA sorgulanır (ikisi de ~1 sn
+    süren ayrı servisler, sırayla beklemek süreyi ikiye katlıyordu). Birleştirme
+    sırası yine AniList → Jikan, yani sonuç hangisinin önce döndüğüne bağlı değil.
     """
     if not query or not query.strip():
         return []
@@ -240,9 +424,12 @@ def get_title_aliases(query: str, use_cache: bool = True) -> List[str]:
     # Sorgunun kendisi her zaman ilk alias
     seen.add(_normalize(q))
     out.append(q)
-    for fetcher in (_fetch_anilist_titles, _fetch_jikan_titles):
+    fetchers = (_fetch_anilist_titles, _fetch_jikan_titles)
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as havuz:
+        futures = [havuz.submit(fetcher, q) for fetcher in fetchers]
+    for future in futures:
         try:
-            for t in fetcher(q) or []:
+            for t in future.result() or []:
                 n = _normalize(t)
                 if n and n not in seen:
                     seen.add(n)
@@ -293,6 +480,44 @@ class SearchResponse:
 
 
 SearchFn = Callable[[str], Iterable[Tuple[str, str]]]
+# Bir alias aramasının sonuçları ve onların tüm alias'lara karşı skor sütunları
+_AliasParcasi = Tuple[List[Tuple[str, str]], List[List[float]]]
+
+
+def _alias_aramalari(searcher: SearchFn, alias_listesi: List[str],
+                     threshold: float, paralel: int, butce: float,
+                     erken_cik: bool) -> Dict[int, _AliasParcasi]:
+    """Alias'ları sınırlı paralellikle ara; her sonucu gelir gelmez skorla.
+
+    `with ThreadPoolExecutor(...)` kullanılmıyor: bağlam çıkışı süren işleri
+    bekler, erken çıkış da bütçe de anlamsızlaşırdı (bkz. `SearchEngine`).
+    """
+    parcalar: Dict[int, _AliasParcasi] = {}
+    if not alias_listesi:
+        return parcalar
+
+    def _ara(alias: str) -> List[Tuple[str, str]]:
+        return list(searcher(alias)) or []
+
+    havuz = ThreadPoolExecutor(max_workers=max(1, min(paralel, len(alias_listesi))))
+    try:
+        futures = {havuz.submit(_ara, a): i for i, a in enumerate(alias_listesi)}
+        try:
+            for future in as_completed(futures, timeout=butce):
+                try:
+                    sonuc = future.result()
+                except Exception:
+                    continue
+                parca = skor_matrisi(alias_listesi, [t for _, t in sonuc]) \
+                    if sonuc else [[] for _ in alias_listesi]
+                parcalar[futures[future]] = (sonuc, parca)
+                if erken_cik and any(sc >= threshold for satir in parca for sc in satir):
+                    break
+        except FuturesTimeoutError:
+            pass
+    finally:
+        havuz.shutdown(wait=False, cancel_futures=True)
+    return parcalar
 
 
 def multilang_search(
@@ -302,9 +527,17 @@ def multilang_search(
     possible_floor: float = 0.55,
     max_aliases: int = 6,
     aliases: Optional[List[str]] = None,
+    paralel: Optional[int] = None,
+    butce: Optional[float] = None,
+    erken_cik: bool = True,
 ) -> SearchResponse:
     """Bir kaynak arama fonksiyonunu tüm dillerde dener.
 
+    Alias aramaları en fazla ``paralel`` tanesi aynı anda olacak şekilde
+    yürür; ``threshold``'u geçen ilk sonuçta başlamamış aramalar iptal edilir,
+    sürenler beklenmez. ``butce`` saniye dolunca da elde olanla dönülür.
+    Sonuçlar her durumda alias sırasıyla birleştirilir.
+
     Args:
         searcher: kaynak adapter'ın ``search(query) -> [(slug, title), ...]`` fonksiyonu.
         query: kullanıcının yazdığı orijinal sorgu.
@@ -312,6 +545,9 @@ def multilang_search(
         possible_floor: ``possible`` listesine girmek için minimum skor.
         max_aliases: kaç farklı dil/varyant denenecek (rate-limit'i koru).
         aliases: hazır alias listesi (verilirse harici API çağrısı atlanır).
+        paralel: eşzamanlı alias araması sınırı (varsayılan ``ALIAS_PARALEL``).
+        butce: bu kaynağa ayrılan toplam süre (varsayılan ``ALIAS_BUTCESI``).
+        erken_cik: tam eşleşme bulununca kalan alias'ları denememek.
 
     Returns:
         :class:`SearchResponse` — exact + possible bölünmüş, skor sıralı.
@@ -322,28 +558,40 @@ def multilang_search(
     aliases_list = aliases if aliases is not None else get_title_aliases(query)
     tried_aliases = aliases_list[:max_aliases]
 
+    # Alias sırası → (sonuçlar, skor matrisi). Matris sütunları adaydan
+    # bağımsız; parça parça hesaplayıp yan yana koymak tek matrisle aynı.
+    parcalar = _alias_aramalari(searcher, tried_aliases, threshold,
+                                ALIAS_PARALEL if paralel is None else paralel,
+                                ALIAS_BUTCESI if butce is None else butce,
+                                erken_cik)
+    return _yanit_kur(tried_aliases, parcalar, threshold, possible_floor)
+
+
+def _yanit_kur(tried_aliases: List[str], parcalar: Dict[int, _AliasParcasi],
+               threshold: float, possible_floor: float) -> SearchResponse:
+    """Alias parçalarını alias sırasıyla birleştirip skorla ve böl."""
+    toplanan: List[Tuple[str, str]] = []
+    matris: List[List[float]] = [[] for _ in tried_aliases]
+    for i in sorted(parcalar):
+        sonuc, parca = parcalar[i]
+        toplanan.extend(sonuc)
+        for satir, ek in zip(matris, parca):
+            satir.extend(ek)
     seen: Dict[str, MatchResult] = {}
-
-    for alias in tried_aliases:
-        try:
-            results = list(searcher(alias)) or []
-        except Exception:
-            continue
-        for slug, title in results:
-            # Her aday için en iyi skoru tüm alias'lara karşı hesapla
-            best_score = 0.0
-            best_alias = ""
-            for a in tried_aliases:
-                sc = fuzzy_score(a, title)
-                if sc > best_score:
-                    best_score = sc
-                    best_alias = a
-                if best_score >= 1.0:
-                    break
-            mr = MatchResult(slug=slug, title=title, score=best_score, matched_via=best_alias)
-            prev = seen.get(slug)
-            if prev is None or mr.score > prev.score:
-                seen[slug] = mr
+    for j, (slug, title) in enumerate(toplanan):
+        best_score = 0.0
+        best_alias = ""
+        for i, a in enumerate(tried_aliases):
+            sc = matris[i][j]
+            if sc > best_score:
+                best_score = sc
+                best_alias = a
+            if best_score >= 1.0:
+                break
+        mr = MatchResult(slug=slug, title=title, score=best_score, matched_via=best_alias)
+        prev = seen.get(slug)
+        if prev is None or mr.score > prev.score:
+            seen[slug] = mr
 
     all_results = sorted(seen.values(), key=lambda r: r.score, reverse=True)
     exact = [r for r in all_results if r.score >= threshold]
@@ -351,11 +599,85 @@ def multilang_search(
     return SearchResponse(exact=exact, possible=possible, aliases=tried_aliases)
 
 
+AsyncSearchFn = Callable[[str], Awaitable[Iterable[Tuple[str, str]]]]
+
+
+async def _alias_aramalari_async(searcher: AsyncSearchFn, alias_listesi: List[str],
+                                 threshold: float, paralel: int, butce: float,
+                                 erken_cik: bool) -> Dict[int, _AliasParcasi]:
+    """`_alias_aramalari`'nın asenkron eşi: thread yerine görev.
+
+    Paralellik bir semaforla sınırlanır; erken çıkışta ve bütçe dolunca
+    kalan görevler iptal edilir (süren istekleri de bırakılır).
+    """
+    import asyncio
+
+    parcalar: Dict[int, _AliasParcasi] = {}
+    if not alias_listesi:
+        return parcalar
+    kapi = asyncio.Semaphore(max(1, paralel))
+
+    async def _ara(i: int, alias: str) -> Tuple[int, List[Tuple[str, str]]]:
+        async with kapi:
+            return i, list(await searcher(alias) or [])
+
+    gorevler = [asyncio.ensure_future(_ara(i, a)) for i, a in enumerate(alias_listesi)]
+    try:
+        for sonraki in asyncio.as_completed(gorevler, timeout=butce):
+            try:
+                i, sonuc = await sonraki
+            except asyncio.TimeoutError:
+                break
+            except Exception:
+                continue
+            parca = skor_matrisi(alias_listesi, [t for _, t in sonuc]) \
+                if sonuc else [[] for _ in alias_listesi]
+            parcalar[i] = (sonuc, parca)
+            if erken_cik and any(sc >= threshold for satir in parca for sc in satir):
+                break
+    finally:
+        for gorev in gorevler:
+            gorev.cancel()
+    return parcalar
+
+
+async def multilang_search_async(
+    searcher: AsyncSearchFn,
+    query: str,
+    threshold: float = 0.95,
+    possible_floor: float = 0.55,
+    max_aliases: int = 6,
+    aliases: Optional[List[str]] = None,
+    paralel: Optional[int] = None,
+    butce: Optional[float] = None,
+    erken_cik: bool = True,
+) -> SearchResponse:
+    """`multilang_search`'ün asenkron eşi; ``searcher`` bir eşyordam.
+
+    Parametreler ve çıktı aynı. Alias listesi verilmezse (AniList/Jikan
+    eşzamanlı istemcileri) bir havuz thread'inde çözülür.
+    """
+    if not query or not query.strip():
+        return SearchResponse()
+    if aliases is None:
+        from .asenkron import thread_ile
+        aliases = await thread_ile(get_title_aliases, query)
+    tried_aliases = aliases[:max_aliases]
+    parcalar = await _alias_aramalari_async(
+        searcher, tried_aliases, threshold,
+        ALIAS_PARALEL if paralel is None else paralel,
+        ALIAS_BUTCESI if butce is None else butce,
+        erken_cik)
+    return _yanit_kur(tried_aliases, parcalar, threshold, possible_floor)
+
+
 __all__ = [
     "MatchResult",
     "SearchResponse",
     "fuzzy_score",
     "score_match",
+    "skor_matrisi",
     "get_title_aliases",
     "multilang_search",
+    "multilang_search_async",
 ]
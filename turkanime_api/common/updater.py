@@ -19,8 +19,6 @@ import sys
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import urlsplit
 
-import requests
-
 from .utils import get_os
 
 VERSION_URL = ("https://raw.githubusercontent.com/barkeser2002/"
@@ -106,6 +104,8 @@ def mevcut_surum(varsayilan: Optional[str] = None) -> str:
 def surum_bilgisi_getir(url: str = VERSION_URL,
                         timeout: int = ZAMAN_ASIMI) -> Dict[str, Any]:
     """`version.json`'ı indir. Ağ/biçim hatasında `requests` istisnası yükselir."""
+    import requests  # tembel: GUI açılışında modül yüklenirken gerekmiyor
+
     yanit = requests.get(url, timeout=timeout)
     yanit.raise_for_status()
     veri = yanit.json()
@@ -162,6 +162,8 @@ def indir_ve_dogrula(url: str, hedef_dizin: str, checksum: str = "",
     dosya_adi = os.path.basename(urlsplit(url).path) or "turkanime-guncelleme"
     yol = os.path.join(hedef_dizin, dosya_adi)
 
+    import requests
+
     yanit = requests.get(url, stream=True, timeout=INDIRME_ZAMAN_ASIMI)
     yanit.raise_for_status()
     toplam = int(yanit.headers.get("content-length") or 0)
@@ -10,7 +10,6 @@ import importlib
 import sysconfig
 import sys
 from typing import Optional, Dict, Any
-from yt_dlp import YoutubeDL
 
 # bin/ klasörü yolu (mpv, aria2c, ffmpeg vb. içerir)
 # PyInstaller ile paketlendiğinde _MEIPASS kullanılır
@@ -162,6 +161,9 @@ def get_video_resolution_mpv(url: str, referer: Optional[str] = None) -> Optiona
 
 def extract_video_info(url: str, ydl_opts: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     """YoutubeDL kullanarak video bilgilerini çıkarır."""
+    # Tembel: bu modülün geri kalanı (platform/mimari tespiti) gereksinim
+    # denetiminden çağrılıyor; yt-dlp'yi (~0.2 sn) onlar için yüklemeyelim.
+    from yt_dlp import YoutubeDL
     try:
         with YoutubeDL(ydl_opts) as ydl:  # type: ignore
             raw_info = ydl.extract_info(url, download=False)
@@ -0,0 +1,282 @@
+# -*- coding: utf-8 -*-
+"""Domain başına CF yöntem geçmişi: zincire en iyi yöntemden başlamak.
+
+`CFSession` zinciri her istekte baştan yürüyordu. Yalnızca FlareSolverr ya
+da QtWebEngine ile açılan bir domain her istekte başarısız curl_cffi (on bir
+taklit profili) ve cloudscraper denemelerini, ardından `time.sleep`'li
+yeniden denemeleri ödüyordu.
+
+Burada, domain ve yöntem başına (diskte kalıcı):
+
+- **Gecikme** ve **hata oranı** — üssel hareketli ortalama; eski sonuçlar
+  zamanla etkisini yitirir. Yöntemin maliyeti ``ort_sure / başarı oranı``.
+- **En iyi yöntem** — en az bir kez başarmış yöntemlerin en düşük maliyetlisi.
+  Zincir ondan başlar; o da başarısız olursa kalan yöntemler varsayılan
+  (ucuzdan pahalıya) sırayla denenir, yani sıra hiçbir yöntemi kaybettirmez.
+- **Yeniden yoklama** — en iyiden ucuz olan bir yöntem başarısız olunca
+  `YOKLAMA_ILK` saniye atlanır; her yeni başarısızlıkta aralık ikiye katlanır
+  (`YOKLAMA_AZAMI`'ya kadar). Vakti gelen ucuz yöntem en iyiden önce denenir;
+  başarırsa aralığı sıfırlanır ve en iyi yeniden hesaplanır (site korumayı
+  kaldırmış olabilir).
+- **Kazanılan süre** — atlanan her denemenin tahmini bedeli (o yöntemin
+  domaindeki ortalama başarısızlık süresi) `istatistikler()`'de birikir.
+
+Geçmiş yalnızca hız içindir: dosya okunamaz ya da yazılamazsa boş sayılır.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+GECMIS_DOSYASI = Path.home() / ".turkanime" / "cf_yontemleri.json"
+# Başarısız ucuz yöntemin ilk atlanma süresi ve üst sınırı (sn).
+YOKLAMA_ILK = 60.0
+YOKLAMA_AZAMI = 6 * 3600.0
+# Üssel ortalamada son ölçümün ağırlığı.
+AGIRLIK = 0.3
+# Diske en sık bu aralıkla yazılır (kalan değişiklik süreç çıkışında yazılır).
+YAZMA_ARALIGI = 5.0
+
+
+@dataclass
+class YontemKaydi:
+    """Bir domainde bir yöntemin geçmişi."""
+
+    basari: int = 0
+    hata: int = 0
+    ort_sure: float = 0.0          # başarılı denemelerin ortalama süresi (sn)
+    ort_hata_suresi: float = 0.0   # başarısız denemelerin ortalama süresi (sn)
+    hata_orani: float = 0.0        # üssel ortalama, 0..1
+    son_basari: float = 0.0        # epoch sn
+    yoklama_araligi: float = 0.0   # 0 = atlanmıyor
+    sonraki_yoklama: float = 0.0   # epoch sn
+    atlanan: int = 0
+    kazanilan_sure: float = 0.0    # atlanan denemelerin tahmini toplam bedeli (sn)
+
+    @property
+    def maliyet(self) -> float:
+        """Bir başarı için beklenen süre."""
+        return self.ort_sure / max(1.0 - self.hata_orani, 0.05)
+
+
+def _ortalama(eski: float, yeni: float, ilk: bool) -> float:
+    return yeni if ilk else (1 - AGIRLIK) * eski + AGIRLIK * yeni
+
+
+def _alan(url_ya_da_host: str) -> str:
+    if "//" in url_ya_da_host:
+        url_ya_da_host = urlparse(url_ya_da_host).hostname or ""
+    return url_ya_da_host.strip().lower()
+
+
+class YontemGecmisi:
+    """Domain → yöntem → `YontemKaydi`; thread-safe, isteğe bağlı olarak diskte."""
+
+    def __init__(self, dosya: Optional[Path] = None,
+                 saat: Callable[[], float] = time.time):
+        self.dosya = Path(dosya) if dosya else None
+        self._saat = saat
+        self._kilit = threading.Lock()
+        self._kayitlar: Dict[str, Dict[str, YontemKaydi]] = {}
+        self._yuklendi = self.dosya is None
+        self._kirli = False
+        self._son_yazma = 0.0
+
+    # ── Sıra ────────────────────────────────────────────────────────────────
+    def sira(self, url: str, varsayilan: Iterable[str]) -> List[str]:
+        """Bu istek için deneme sırası (``varsayilan`` ucuzdan pahalıya)."""
+        varsayilan = list(varsayilan)
+        host = _alan(url)
+        with self._kilit:
+            self._diskten_yukle()
+            kayitlar = self._kayitlar.get(host) or {}
+            en_iyi = self._en_iyi(kayitlar, varsayilan)
+            if en_iyi is None:
+                return varsayilan
+            simdi = self._saat()
+            ucuzlar = varsayilan[:varsayilan.index(en_iyi)]
+            vakti_gelen = [ad for ad in ucuzlar
+                           if ad not in kayitlar
+                           or kayitlar[ad].sonraki_yoklama <= simdi]
+            basta = vakti_gelen + [en_iyi]
+            return basta + [ad for ad in varsayilan if ad not in basta]
+
+    @staticmethod
+    def _en_iyi(kayitlar: Dict[str, YontemKaydi], varsayilan: List[str]) -> Optional[str]:
+        adaylar = [ad for ad in varsayilan
+                   if ad in kayitlar and kayitlar[ad].basari > 0]
+        if not adaylar:
+            return None
+        # Eşitlikte varsayılan sıra (daha ucuz olan) kazanır.
+        return min(adaylar, key=lambda ad: (kayitlar[ad].maliyet, varsayilan.index(ad)))
+
+    def en_iyi(self, url: str, varsayilan: Iterable[str]) -> Optional[str]:
+        with self._kilit:
+            self._diskten_yukle()
+            return self._en_iyi(self._kayitlar.get(_alan(url)) or {}, list(varsayilan))
+
+    # ── Kayıt ───────────────────────────────────────────────────────────────
+    def kaydet(self, url: str, yontem: str, basarili: bool, sure: float,
+               varsayilan: Iterable[str] = ()) -> None:
+        """Bir denemenin sonucunu yaz.
+
+        ``varsayilan`` verilirse başarısız yöntem o andaki en iyiden ucuzsa
+        yoklama aralığı ikiye katlanır.
+        """
+        host = _alan(url)
+        varsayilan = list(varsayilan)
+        with self._kilit:
+            self._diskten_yukle()
+            kayitlar = self._kayitlar.setdefault(host, {})
+            kayit = kayitlar.setdefault(yontem, YontemKaydi())
+            simdi = self._saat()
+            if basarili:
+                kayit.ort_sure = _ortalama(kayit.ort_sure, sure, kayit.basari == 0)
+                kayit.basari += 1
+                kayit.son_basari = simdi
+                kayit.yoklama_araligi = kayit.sonraki_yoklama = 0.0
+            else:
+                kayit.ort_hata_suresi = _ortalama(kayit.ort_hata_suresi, sure,
+                                                  kayit.hata == 0)
+                kayit.hata += 1
+                en_iyi = self._en_iyi(kayitlar, varsayilan) if varsayilan else None
+                if (en_iyi is not None and yontem in varsayilan
+                        and varsayilan.index(yontem) < varsayilan.index(en_iyi)):
+                    kayit.yoklama_araligi = min(
+                        kayit.yoklama_araligi * 2 or YOKLAMA_ILK, YOKLAMA_AZAMI)
+                    kayit.sonraki_yoklama = simdi + kayit.yoklama_araligi
+            kayit.hata_orani = (1 - AGIRLIK) * kayit.hata_orani + AGIRLIK * (not basarili)
+            self._degisti()
+
+    def atlandi(self, url: str, yontemler: Iterable[str]) -> None:
+        """İstek, ``yontemler`` denenmeden başarıyla bitti: kazancı yaz."""
+        with self._kilit:
+            self._diskten_yukle()
+            kayitlar = self._kayitlar.get(_alan(url))
+            if not kayitlar:
+                return
+            for ad in yontemler:
+                kayit = kayitlar.get(ad)
+                if kayit is None:
+                    continue
+                kayit.atlanan += 1
+                kayit.kazanilan_sure += kayit.ort_hata_suresi
+            self._degisti()
+
+    def temizle(self) -> None:
+        with self._kilit:
+            self._kayitlar.clear()
+            self._yuklendi = True
+            self._kirli = True
+        self.diske_yaz()
+
+    # ── İstatistik ──────────────────────────────────────────────────────────
+    def istatistikler(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Domain → yöntem → sayaçlar (+ ``maliyet``)."""
+        with self._kilit:
+            self._diskten_yukle()
+            return {host: {ad: dict(asdict(k), maliyet=k.maliyet)
+                           for ad, k in kayitlar.items()}
+                    for host, kayitlar in self._kayitlar.items()}
+
+    def yontem_ozeti(self) -> Dict[str, Dict[str, Any]]:
+        """Yöntem başına tüm domainlerin toplamı; ``kazanilan_sure`` dahil."""
+        ozet: Dict[str, Dict[str, Any]] = {}
+        for kayitlar in self.istatistikler().values():
+            for ad, k in kayitlar.items():
+                o = ozet.setdefault(ad, {"basari": 0, "hata": 0, "atlanan": 0,
+                                         "kazanilan_sure": 0.0, "en_iyi_domain": 0})
+                for alan in ("basari", "hata", "atlanan", "kazanilan_sure"):
+                    o[alan] += k[alan]
+        with self._kilit:
+            for kayitlar in self._kayitlar.values():
+                en_iyi = self._en_iyi(kayitlar, list(kayitlar))
+                if en_iyi is not None:
+                    ozet[en_iyi]["en_iyi_domain"] += 1
+        for o in ozet.values():
+            toplam = o["basari"] + o["hata"]
+            o["basari_orani"] = o["basari"] / toplam if toplam else 0.0
+        return ozet
+
+    # ── Disk ────────────────────────────────────────────────────────────────
+    def _degisti(self) -> None:
+        """(Kilit tutulurken) kirli işaretle; aralık dolduysa hemen yaz."""
+        self._kirli = True
+        if self.dosya is not None and self._saat() - self._son_yazma >= YAZMA_ARALIGI:
+            self._yaz()
+
+    def diske_yaz(self) -> None:
+        """Bekleyen değişiklikleri hemen yaz (süreç çıkışı, testler)."""
+        with self._kilit:
+            self._yaz()
+
+    def _yaz(self) -> None:
+        """Atomik yaz; yazılamazsa sessizce geç. Kilit tutulurken çağrılır."""
+        if not self._kirli or self.dosya is None:
+            return
+        self._kirli = False
+        self._son_yazma = self._saat()
+        veri = {host: {ad: asdict(k) for ad, k in kayitlar.items()}
+                for host, kayitlar in self._kayitlar.items()}
+        gecici = self.dosya.with_name(
+            f".{self.dosya.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.dosya.parent.mkdir(parents=True, exist_ok=True)
+            gecici.write_text(json.dumps(veri), encoding="utf-8")
+            os.replace(gecici, self.dosya)
+        except (OSError, TypeError, ValueError):
+            try:
+                gecici.unlink()
+            except OSError:
+                pass
+
+    def _diskten_yukle(self) -> None:
+        if self._yuklendi:
+            return
+        self._yuklendi = True
+        try:
+            veri = json.loads(self.dosya.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        bilinen = {f.name for f in fields(YontemKaydi)}
+        for host, kayitlar in (veri.items() if isinstance(veri, dict) else ()):
+            if not isinstance(kayitlar, dict):
+                continue
+            for ad, k in kayitlar.items():
+                try:
+                    kayit = YontemKaydi(**{a: d for a, d in k.items() if a in bilinen})
+                except (AttributeError, TypeError):
+                    continue
+                self._kayitlar.setdefault(_alan(host), {})[ad] = kayit
+
+
+# ── Süreç geneli geçmiş ────────────────────────────────────────────────────
+_gecmis: Optional[YontemGecmisi] = None
+_gecmis_kilidi = threading.Lock()
+
+
+def gecmis() -> YontemGecmisi:
+    """Süreç geneli geçmiş (`GECMIS_DOSYASI`; ilk kullanımda kurulur)."""
+    global _gecmis
+    if _gecmis is None:
+        with _gecmis_kilidi:
+            if _gecmis is None:
+                _gecmis = YontemGecmisi(GECMIS_DOSYASI)
+                atexit.register(_gecmis.diske_yaz)
+    return _gecmis
+
+
+def istatistikler() -> Dict[str, Dict[str, Any]]:
+    """Yöntem başına özet (bkz. `YontemGecmisi.yontem_ozeti`)."""
+    return gecmis().yontem_ozeti()
+
+
+__all__ = ["YontemKaydi", "YontemGecmisi", "gecmis", "istatistikler",
+           "GECMIS_DOSYASI", "YOKLAMA_ILK", "YOKLAMA_AZAMI"]
@@ -2,8 +2,48 @@
 
 Projenin tek arayüzü. Faz 9'da CustomTkinter yığını silindi ve hem
 `turkanime-gui` hem `turkanime-qt` giriş noktaları buradaki `run`'a bağlandı.
+
+Adlar **tembel** (PEP 562): giriş noktası önce çalışan bir örneğe devretmeyi
+dener (bkz. `tek_ornek`); uygulama açıksa pencere modülleri hiç yüklenmez.
 """
-from .app import MainWindow, run, prepare_qt_env  # noqa: F401
-from .workers import UiBridge, WorkerSignals, run_bg  # noqa: F401
+from typing import TYPE_CHECKING
 
 __all__ = ["MainWindow", "run", "prepare_qt_env", "WorkerSignals", "run_bg", "UiBridge"]
+
+if TYPE_CHECKING:
+    from .app import MainWindow, prepare_qt_env
+    from .workers import UiBridge, WorkerSignals, run_bg
+
+_TEMBEL = {
+    "MainWindow": "app",
+    "prepare_qt_env": "app",
+    "UiBridge": "workers",
+    "WorkerSignals": "workers",
+    "run_bg": "workers",
+}
+
+
+def run() -> int:
+    """GUI'yi başlat; uygulama zaten açıksa isteği ona iletip hemen çık."""
+    from .tek_ornek import devret
+    istek = devret()
+    if istek is None:
+        return 0
+    from .app import run as _run
+    return _run(istek)
+
+
+def __getattr__(ad):
+    """İlk erişimde ilgili modülü yükle (PEP 562)."""
+    try:
+        modul_adi = _TEMBEL[ad]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {ad!r}") from None
+    from importlib import import_module
+    nesne = getattr(import_module(f".{modul_adi}", __name__), ad)
+    globals()[ad] = nesne
+    return nesne
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TEMBEL))
@@ -5,6 +5,7 @@ CF çözücü alt-süreci uygulamanın **kendisini** özel bir bayrakla yeniden
 Bu dosya o bayrağı yakalayıp GUI yerine çözücüyü çalıştırır.
 
     python -m turkanime_api.gui.qt                 -> GUI
+    python -m turkanime_api.gui.qt --ara frieren   -> GUI (açıksa ona iletilir)
     <app.exe> --cf-qt-solver                       -> CF çözücü alt-süreci
 
 Release iş akışı ayrı bir donmuş CLI de üretiyor; aynı karşılama
@@ -25,7 +26,9 @@ def main() -> int:
     if SOLVER_FLAG in sys.argv:
         from turkanime_api.common.cf_qt_solver import main as solver_main
         return solver_main()
-    from turkanime_api.gui.qt.app import run
+    # Paket tembel: uygulama zaten açıksa `run` isteği iletip pencere
+    # modüllerini yüklemeden döner.
+    from turkanime_api.gui.qt import run
     return run()
 
 
@@ -22,7 +22,7 @@ from typing import Any, Dict, List, Optional, Tuple
 from PySide6.QtCore import QObject, Signal
 
 from . import prefs
-from .workers import run_bg
+from .workers import LANE_BACKGROUND, run_bg
 
 # AniList `MediaListStatus` -> (Türkçe etiket). Sıra, filtre kutusundaki sıradır.
 DURUMLAR: List[Tuple[str, str]] = [
@@ -394,7 +394,7 @@ class AniListService(QObject):
         if not giris_var_mi():
             self._kullaniciyi_ata(None)
             return
-        run_bg(self._kullanici_getir)
+        run_bg(self._kullanici_getir, lane=LANE_BACKGROUND)
 
     def _kullanici_getir(self) -> None:
         """Arka plan thread'i: kullanıcıyı çek, avatarı indir."""
@@ -416,8 +416,8 @@ class AniListService(QObject):
     def _avatar_getir(self, url: str) -> None:
         """Arka plan: avatarı indir, baytları sinyalle taşı (widget'a dokunma)."""
         try:
-            import requests
-            data = requests.get(url, timeout=10).content
+            from .images import gorsel_servisi
+            data = gorsel_servisi().baytlar(url)
         except Exception:
             return
         if data:
@@ -460,7 +460,8 @@ class AniListService(QObject):
         arama_adi = (ad or "").strip() or deslug(seri)
         if not arama_adi:
             return False
-        run_bg(self._ilerleme_yaz, str(seri), int(bolum_no), arama_adi)
+        run_bg(self._ilerleme_yaz, str(seri), int(bolum_no), arama_adi,
+               lane=LANE_BACKGROUND)
         return True
 
     def _ilerleme_yaz(self, seri: str, bolum_no: int, ad: str) -> None:
@@ -506,7 +507,7 @@ class AniListService(QObject):
         """CURRENT listesini çekip yerel ilerlemeyi güncelle (arka planda)."""
         if not giris_var_mi():
             return False
-        run_bg(self._senkronla)
+        run_bg(self._senkronla, lane=LANE_BACKGROUND)
         return True
 
     def _senkronla(self) -> None:
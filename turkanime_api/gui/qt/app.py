@@ -6,30 +6,34 @@ fazlarda `QStackedWidget` içine doldurulur.
 
 Eski akış:  ctk.set_appearance_mode -> MainWindow(ctk.CTk) -> app.mainloop()
 Yeni akış:  prepare_qt_env() -> QApplication -> MainWindow(QMainWindow) -> exec()
+
+Sayfalar `PageRegistry` üzerinden ilk ziyarette kurulur; açılışta yalnızca ana
+sayfa var. Ağır modüller ilk kareden sonra arka planda ısınır ve aşama
+süreleri `startup.timeline()`'a yazılır (bkz. `startup`).
 """
 from __future__ import annotations
 
+# Açılış çizelgesi ilk iş başlasın: aşağıdaki içe aktarmalar da ölçülüyor.
+from . import startup  # noqa: I001
+from .startup import timeline
+
 import os
 import sys
-from typing import Dict
+import threading
+from typing import Callable, Dict, Iterator, Optional
 
 from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtGui import QIcon, QKeySequence, QPixmap, QShortcut
 from PySide6.QtWidgets import (
     QApplication, QButtonGroup, QFrame, QHBoxLayout, QLabel, QLineEdit,
-    QMainWindow, QPushButton, QSizePolicy, QStackedWidget, QVBoxLayout, QWidget,
+    QMainWindow, QMessageBox, QPushButton, QSizePolicy, QStackedWidget,
+    QVBoxLayout, QWidget,
 )
 
 from . import prefs
 from .anilist import AniListService
 from .discord import DiscordService
-from .pages.detail import DetailPage
-from .pages.discover import DiscoverPage
-from .pages.downloads import DownloadManager, DownloadsPage
-from .pages.episodes import EpisodePage
-from .pages.search import SearchPage
-from .pages.settings import SettingsPage
-from .pages.watchlist import WatchlistPage
+from .pages.downloads import DownloadManager
 from .progress_dialog import ProgressDialog, anime_adi
 from .requirements import RequirementsDialog, RequirementsService
 from .theme import ACCENT, apply_theme
@@ -49,6 +53,9 @@ ACILIS_DENETIM_GECIKMESI = 1500
 # süreç zorla sonlandırılır (bkz. `run`).
 KAPANIS_MUHLETI = 3000
 
+# Tek örnek yarışında (bkz. `run`) diğer açılışın onayı için beklenen süre.
+TEK_ORNEK_YARIS_MUHLETI = 5000
+
 # Sol menü: (anahtar, etiket). Sonraki fazlarda her biri gerçek sayfayla dolacak.
 NAV_ITEMS = [
     ("home", "Ana Sayfa"),
@@ -72,6 +79,52 @@ def _resource_path(rel: str) -> str:
     return os.path.join(root, rel)
 
 
+class PageRegistry:
+    """Sayfa fabrikaları; bir sayfa ilk istendiğinde kurulup stack'e eklenir.
+
+    Eskiden ana pencere yedi menü sayfasını, detay ve bölüm sayfalarını
+    (ve onların içe aktardığı her şeyi) pencere görünmeden önce kuruyordu.
+    `get`/`[]` sayfayı gerektiğinde kurar; yalnızca kurulmuş sayfalara
+    bakmak isteyen (ör. geçmiş tazeleme) `peek`/`built` kullanır.
+    """
+
+    def __init__(self, stack: QStackedWidget):
+        self._stack = stack
+        self._factories: Dict[str, Callable[[], QWidget]] = {}
+        self._built: Dict[str, QWidget] = {}
+
+    def register(self, key: str, factory: Callable[[], QWidget]) -> None:
+        self._factories[key] = factory
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __getitem__(self, key: str) -> QWidget:
+        page = self._built.get(key)
+        if page is None:
+            factory = self._factories[key]
+            with timeline().measure(f"sayfa: {key}"):
+                page = factory()
+                self._stack.addWidget(page)
+            self._built[key] = page
+        return page
+
+    def get(self, key: str, default: Optional[QWidget] = None) -> Optional[QWidget]:
+        if key not in self._factories:
+            return default
+        return self[key]
+
+    def peek(self, key: str) -> Optional[QWidget]:
+        """Kurulmuşsa sayfa; kurulmamışsa None (kurmaz)."""
+        return self._built.get(key)
+
+    def built(self) -> Dict[str, QWidget]:
+        return dict(self._built)
+
+
 def prepare_qt_env() -> None:
     """QApplication kurulmadan **önce** çağrılmalı.
 
@@ -139,12 +192,16 @@ class MainWindow(QMainWindow):
         # Detay sayfasındaki "← Geri" hangi sekmeden gelindiyse oraya dönmeli.
         self._detail_origin = "home"
         self._current_page = "home"    # Discord durumu buradan türetiliyor
-        self.pages: Dict[str, QWidget] = {}
+        self._first_paint = False
+        timeline().mark("servisler")
         self._build_ui()
+        timeline().mark("pencere iskeleti")
         self.show_page("home")
+        timeline().mark("ana sayfa")
         # Jeton diskte duruyor olabilir; kullanıcı adını/avatarı arka planda al.
         self.anilist.baslat()
         QTimer.singleShot(ACILIS_DENETIM_GECIKMESI, self._acilis_denetimleri)
+        QShortcut(QKeySequence("Ctrl+Shift+T"), self, self.show_startup_report)
 
     # ── Kurulum ─────────────────────────────────────────────────────────────
     def _build_ui(self) -> None:
@@ -163,58 +220,80 @@ class MainWindow(QMainWindow):
         body.addWidget(self._build_sidebar())
 
         self.stack = QStackedWidget()
+        self.pages = PageRegistry(self.stack)
         for key, label in NAV_ITEMS:
-            page = self._make_page(key, label)
-            self.pages[key] = page
-            self.stack.addWidget(page)
-
+            self.pages.register(key, self._page_factory(key, label))
         # Detay ve bölüm listesi menüde yer almaz; keşif/arama sonucundan açılır.
-        detail = DetailPage()
-        detail.episodes_ready.connect(self._on_detail_episodes)
-        detail.back_requested.connect(self._on_detail_back)
-        self.pages["detail"] = detail
-        self.stack.addWidget(detail)
-
-        episodes = EpisodePage()
-        episodes.play_requested.connect(self._on_play)
-        episodes.download_requested.connect(self._on_download)
-        self.pages["episodes"] = episodes
-        self.stack.addWidget(episodes)
+        self.pages.register("detail", self._make_detail)
+        self.pages.register("episodes", self._make_episodes)
 
         body.addWidget(self.stack, 1)
 
         outer.addLayout(body, 1)
 
-    def _make_page(self, key: str, label: str) -> QWidget:
-        """`NAV_ITEMS` anahtarına karşılık gelen sayfayı üret.
+    def _page_factory(self, key: str, label: str) -> Callable[[], QWidget]:
+        """`NAV_ITEMS` anahtarına karşılık gelen sayfanın fabrikası.
 
-        Aşağıdaki dallar `NAV_ITEMS`'ın yedi anahtarını da karşılıyor, yani
-        sona düşmek mümkün değil. Yine de sessizce `None` dönüp çağıranın
-        `addWidget`'ında anlamsız bir hatayla patlamak yerine burada
-        bağırıyoruz: `NAV_ITEMS`'a dalı yazılmamış bir anahtar eklenirse
-        hata, sebebini söyleyerek açılışta çıksın.
+        Sayfa ilk ziyarette kurulur ama fabrika eşlemesi açılışta yapılıyor:
+        `NAV_ITEMS`'a dalı yazılmamış bir anahtar eklenirse hata, kullanıcı o
+        menüye tıkladığında değil, sebebini söyleyerek açılışta çıksın.
         """
         if key == "search":
-            page = SearchPage()
-            page.anime_selected.connect(self._on_anime_selected)
-            return page
+            return self._make_search
         if key in ("home", "trending", "season"):
-            page = DiscoverPage(key)
-            page.anime_selected.connect(self._on_discover_selected)
-            return page
+            return lambda: self._make_discover(key)
         if key == "downloads":
-            return DownloadsPage(self.downloads)
+            return self._make_downloads
         if key == "watchlist":
-            page = WatchlistPage(self.anilist)
-            page.anime_selected.connect(self._on_discover_selected)
-            page.settings_requested.connect(self._goto_settings)
-            return page
+            return self._make_watchlist
         if key == "settings":
-            return SettingsPage(self.anilist, discord=self.discord,
-                                updates=self.updates,
-                                requirements=self.requirements)
+            return self._make_settings
         raise ValueError(f"NAV_ITEMS anahtarı {key!r} ({label}) için sayfa dalı yok")
 
+    # Sayfa modülleri fabrikaların içinde içe aktarılıyor: kurulmayan sayfanın
+    # modülü (ve çektiği bağımlılıklar) açılışta hiç yüklenmez.
+    def _make_search(self) -> QWidget:
+        from .pages.search import SearchPage
+        page = SearchPage()
+        page.anime_selected.connect(self._on_anime_selected)
+        return page
+
+    def _make_discover(self, key: str) -> QWidget:
+        from .pages.discover import DiscoverPage
+        page = DiscoverPage(key)
+        page.anime_selected.connect(self._on_discover_selected)
+        return page
+
+    def _make_downloads(self) -> QWidget:
+        from .pages.downloads import DownloadsPage
+        return DownloadsPage(self.downloads)
+
+    def _make_watchlist(self) -> QWidget:
+        from .pages.watchlist import WatchlistPage
+        page = WatchlistPage(self.anilist)
+        page.anime_selected.connect(self._on_discover_selected)
+        page.settings_requested.connect(self._goto_settings)
+        return page
+
+    def _make_settings(self) -> QWidget:
+        from .pages.settings import SettingsPage
+        return SettingsPage(self.anilist, discord=self.discord,
+                            updates=self.updates, requirements=self.requirements)
+
+    def _make_detail(self) -> QWidget:
+        from .pages.detail import DetailPage
+        page = DetailPage()
+        page.episodes_ready.connect(self._on_detail_episodes)
+        page.back_requested.connect(self._on_detail_back)
+        return page
+
+    def _make_episodes(self) -> QWidget:
+        from .pages.episodes import EpisodePage
+        page = EpisodePage()
+        page.play_requested.connect(self._on_play)
+        page.download_requested.connect(self._on_download)
+        return page
+
     def _goto_settings(self) -> None:
         """"Ayarlar'a Git" yönlendirmesi (sol menü de senkron kalmalı)."""
         self.show_page("settings")
@@ -306,7 +385,7 @@ class MainWindow(QMainWindow):
 
     # ── Davranış ────────────────────────────────────────────────────────────
     def show_page(self, key: str) -> None:
-        page = self.pages.get(key)
+        page = self.pages.get(key)   # ilk ziyarette kurulur
         if page is not None:
             self.stack.setCurrentWidget(page)
             self._current_page = key
@@ -319,7 +398,7 @@ class MainWindow(QMainWindow):
         self.show_page("search")
         self._sync_nav("search")
         page = self.pages.get("search")
-        if isinstance(page, SearchPage):
+        if page is not None:
             page.start_search(query)
 
     def _sync_nav(self, key: str) -> None:
@@ -335,15 +414,14 @@ class MainWindow(QMainWindow):
         kaynaklarındaki karşılığı bilinmiyor. Kullanıcı detay sayfasında
         "Bölümleri Getir"e basınca eşleştirme diyaloğu devreye girer.
         """
-        page = self.pages.get("detail")
-        if isinstance(item, dict) and item and isinstance(page, DetailPage):
+        if isinstance(item, dict) and item:
+            page = self.pages["detail"]
             self._open_detail(lambda: page.show_anime(item))
 
     def _on_anime_selected(self, source: str, slug: str, title: str) -> None:
         """Arama sonucundan anime seçildi: kaynağı bağlı detay sayfasını aç."""
-        page = self.pages.get("detail")
-        if isinstance(page, DetailPage):
-            self._open_detail(lambda: page.show_match(source, slug, title))
+        page = self.pages["detail"]
+        self._open_detail(lambda: page.show_match(source, slug, title))
 
     def _open_detail(self, populate) -> None:
         """Detay sayfasına geç ve dönüş noktasını hatırla.
@@ -352,7 +430,7 @@ class MainWindow(QMainWindow):
         (ör. ana sayfa) kullanıcıyı aramasından koparırdı.
         """
         current = self.stack.currentWidget()
-        for key, page in self.pages.items():
+        for key, page in self.pages.built().items():
             if page is current and key not in ("detail", "episodes"):
                 self._detail_origin = key
                 break
@@ -370,10 +448,9 @@ class MainWindow(QMainWindow):
         `EpisodePage.load` burada `episodes` ile çağrılır; parametresiz çağrı
         aynı listeyi ikinci kez ağdan indirirdi.
         """
-        page = self.pages.get("episodes")
-        if isinstance(page, EpisodePage):
-            self.show_page("episodes")
-            page.load(source, slug, title, episodes=episodes)
+        page = self.pages["episodes"]
+        self.show_page("episodes")
+        page.load(source, slug, title, episodes=episodes)
 
     # ── Oynatma / indirme ───────────────────────────────────────────────────
     def _status(self, msg: str, timeout: int = 6000) -> None:
@@ -477,8 +554,9 @@ class MainWindow(QMainWindow):
         self.statusBar().showMessage(mesaj, 8000)
 
     def _refresh_episode_history(self) -> None:
-        page = self.pages.get("episodes")
-        if isinstance(page, EpisodePage):
+        # Sayfa hiç açılmadıysa tazelenecek rozet de yok; kurmaya gerek yok.
+        page = self.pages.peek("episodes")
+        if page is not None:
             page.refresh_history()
 
     def _on_download(self, entry) -> None:
@@ -510,6 +588,81 @@ class MainWindow(QMainWindow):
         """İndirme klasörü (ayarlardan; bkz. `prefs.indirme_dizini`)."""
         return prefs.indirme_dizini()
 
+    # ── Dış istekler (tek örnek) ────────────────────────────────────────────
+    def handle_request(self, istek: Dict) -> None:
+        """İkinci açılışın isteği (bkz. `tek_ornek`): pencereyi öne getir, uygula.
+
+        İlk açılışın kendi argümanları da buradan geçer; `turkanime-gui --ara x`
+        uygulama kapalıyken de açıkken de aynı şeyi yapar.
+        """
+        if self.isMinimized():
+            self.showNormal()
+        self.show()
+        self.raise_()
+        self.activateWindow()
+        sorgu = (istek or {}).get("ara")
+        if isinstance(sorgu, str) and sorgu.strip():
+            self.txtSearch.setText(sorgu.strip())
+            self._on_search()
+        anime = (istek or {}).get("anime")
+        if not isinstance(anime, dict) or not anime.get("kaynak") or not anime.get("slug"):
+            return
+        kaynak, slug = str(anime["kaynak"]), str(anime["slug"])
+        baslik = str(anime.get("baslik") or slug)
+        bolumler = [n for n in (istek.get("indir") or []) if isinstance(n, int) and n > 0]
+        if bolumler:
+            self._status(f"{baslik} — bölümler getiriliyor…")
+            run_bg(self._enqueue_remote, kaynak, slug, baslik, bolumler)
+        else:
+            self._on_anime_selected(kaynak, slug, baslik)
+
+    def _enqueue_remote(self, kaynak: str, slug: str, baslik: str, bolumler) -> None:
+        """Arka plan: bölüm listesini çek, istenen sıra numaralarını kuyruğa al."""
+        from .sources_bridge import fetch_episodes
+
+        try:
+            liste = fetch_episodes(kaynak, slug, baslik)
+        except Exception as exc:
+            self._status(f"{baslik} — bölümler alınamadı: {exc}")
+            return
+        secilen = [liste[n - 1] for n in bolumler if n <= len(liste)]
+        if not secilen:
+            self._status(f"{baslik} — istenen bölümler bulunamadı ({len(liste)} bölüm var).")
+            return
+
+        def _kuyruga_al() -> None:
+            for entry in secilen:
+                self._on_download(entry)
+        self.ui.post(_kuyruga_al)
+
+    # ── Açılış ölçümü ───────────────────────────────────────────────────────
+    def paintEvent(self, event) -> None:  # noqa: N802 (Qt imzası)
+        super().paintEvent(event)
+        if not self._first_paint:
+            self._first_paint = True
+            timeline().mark("ilk çizim")
+            # Çizim olayının içinden değil, döngü bir tur dönünce başla.
+            QTimer.singleShot(0, self._after_first_paint)
+
+    def _after_first_paint(self) -> None:
+        """Ağır modülleri kullanıcı beklemeden, arka planda yükle.
+
+        Havuz yerine kendi thread'i: ısınma saniyeye yakın sürebilir ve
+        kullanıcının ilk araması havuzda onun arkasında beklememeli.
+        """
+        threading.Thread(target=_warm_up_and_report, name="acilis-isinma",
+                         daemon=True).start()
+
+    def show_startup_report(self) -> None:
+        """Açılış çizelgesini göster (Ctrl+Shift+T; hata ayıklama için)."""
+        box = QMessageBox(self)
+        box.setWindowTitle("Açılış süreleri")
+        box.setText("Açılış aşamaları (ms):")
+        box.setDetailedText(timeline().report())
+        box.setInformativeText(f"Rapor dosyası: {startup.LOG_PATH}")
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        box.open()
+
     # ── Çevresel servisler ──────────────────────────────────────────────────
     def _acilis_denetimleri(self) -> None:
         """Açılıştaki sessiz denetimler (pencere çizildikten sonra)."""
@@ -576,9 +729,37 @@ class MainWindow(QMainWindow):
         super().closeEvent(event)
 
 
-def run() -> int:
-    """GUI'yi başlat. `turkanime-gui` giriş noktası buraya bağlanacak."""
+_isinma_lock = threading.Lock()
+_isindi = False
+
+
+def _warm_up_and_report() -> None:
+    """Süreç başına bir kez: modülleri ısıt, sonra çizelgeyi yaz."""
+    global _isindi
+    with _isinma_lock:
+        if _isindi:
+            return
+        _isindi = True
+    startup.warm_up()
+    startup.finish()
+
+
+def run(istek: Optional[Dict] = None) -> int:
+    """GUI'yi başlat.
+
+    `istek` giriş noktasının çözdüğü komut satırı isteğidir (bkz.
+    `tek_ornek.devret`); verilmezse burada çözülür ve uygulama açıksa ona
+    iletilir.
+    """
+    from . import tek_ornek
+
+    if istek is None:
+        istek = tek_ornek.devret()
+        if istek is None:
+            return 0
+    timeline().mark("modüller")
     prepare_qt_env()
+    timeline().mark("qt ortamı")
     # mpv/ffmpeg/aria2c uygulama dizininde ya da gömülü `bin/` altında olabilir;
     # eski CTk giriş noktası PATH'i böyle hazırlıyordu, Qt'ninki unutmuştu.
     try:
@@ -590,10 +771,23 @@ def run() -> int:
     app = QApplication.instance() or QApplication(sys.argv)
     apply_theme(app)
     app.setApplicationName(APP_TITLE)
+    timeline().mark("QApplication + tema")
+
+    # Devir ile dinleme arasında başka bir açılış davranmış olabilir (iki
+    # çift tıklama): ad canlı bir örnekteyse istek ona gider. O örnek henüz
+    # olay döngüsüne girmemiş olabileceği için onay daha uzun beklenir.
+    sunucu = tek_ornek.TekOrnekSunucu()
+    if not sunucu.dinle() and tek_ornek.ilet(istek, zaman_asimi_ms=TEK_ORNEK_YARIS_MUHLETI):
+        return 0
 
     window = MainWindow()
+    sunucu.istek_geldi.connect(window.handle_request)
     window.show()
+    timeline().mark("show")
+    if istek:
+        QTimer.singleShot(0, lambda: window.handle_request(istek))
     kod = app.exec()
+    sunucu.kapat()
 
     # `~QThreadPool` yıkıcısı ZAMAN AŞIMSIZ `waitForDone()` çağırır: havuzda
     # hâlâ koşan bir iş varsa normal dönüş süreci bitirmez, yorumlayıcı kapanışta
@@ -12,6 +12,11 @@ kontrolünü/captcha'yı aynı pencerede çözer; cookie'ler `QWebEngineCookieSt
 Public kontrat eski modülle birebir aynıdır (`on_status` / `on_cookies` /
 `on_error`, `start()` / `stop()` / `is_running`) ve üretilen Netscape metni de
 aynı formatta olduğu için `tranime.set_session_cookie()` değişmeden çalışır.
+
+Cloudflare izni (`cf_clearance` vb. + tarayıcının UA'sı) ayrıca
+`izin_deposu`'na yazılır ve bir sonraki açılışta profile geri tohumlanır;
+izin hâlâ geçerliyse kullanıcı bot kontrolünü yeniden çözmek zorunda kalmaz.
+`CFSession` ve `bypass.fetch` aynı depodan okur.
 """
 from __future__ import annotations
 
@@ -29,6 +34,9 @@ TARGET_ANIME = f"{TRANIME_BASE}/anime/naruto-izle"
 COOKIE_DOMAIN = "tranimeizle.io"
 REQUIRED_COOKIES = {".AitrWeb.Session"}
 MAX_WAIT_SECONDS = 300  # 5 dakika
+# Cloudflare'in izin/bot çerezleri; yalnızca bunlar izin deposuna yazılır.
+# Oturum çerezi (`REQUIRED_COOKIES`) zaten `ayarlar.json`'da.
+IZIN_ONEKLERI = ("cf_", "__cf", "_cfuvid")
 
 
 def is_available() -> bool:
@@ -92,6 +100,37 @@ def _filter_tranime_cookies(cookies: List[Dict]) -> List[Dict]:
     return [c for c in cookies if COOKIE_DOMAIN in c.get("domain", "")]
 
 
+def _izin_cerezleri(cookies: List[Dict]) -> List[Dict]:
+    return [c for c in cookies
+            if c.get("name", "").startswith(IZIN_ONEKLERI) and c.get("value")]
+
+
+def _izni_kaydet(cookies: List[Dict], user_agent: Optional[str]) -> bool:
+    """Toplanan Cloudflare çerezlerini domainin izni olarak diske yaz."""
+    izin = _izin_cerezleri(cookies)
+    if not izin:
+        return False
+    from ...common import izin_deposu
+    bitisler = [c["expiry"] for c in izin if c.get("expiry")]
+    izin_deposu.depo().koy(COOKIE_DOMAIN, {c["name"]: c["value"] for c in izin},
+                           user_agent=user_agent,
+                           bitis=min(bitisler) if bitisler else None,
+                           kaynak="cookie_browser")
+    return True
+
+
+def _kayitli_izin():
+    """Diskteki izin: (çerez sözlükleri, UA); yoksa ``([], None)``."""
+    from ...common import izin_deposu
+    izin = izin_deposu.depo().al(COOKIE_DOMAIN)
+    if izin is None:
+        return [], None
+    cookies = [{"domain": "." + COOKIE_DOMAIN, "path": "/", "secure": True,
+                "expiry": int(izin.bitis), "name": ad, "value": deger}
+               for ad, deger in izin.cerezler.items()]
+    return _izin_cerezleri(cookies), izin.user_agent
+
+
 # ── Gömülü tarayıcı diyaloğu ────────────────────────────────────────────────
 class CookieBrowserDialog(QDialog):
     """İçinde gerçek bir tarayıcı olan cookie toplama penceresi."""
@@ -169,6 +208,7 @@ class CookieBrowserDialog(QDialog):
             pass
 
         self._seed_age_cookie(store)
+        self._seed_izin(store)
 
         view = QWebEngineView(self)
         from PySide6.QtWebEngineCore import QWebEnginePage
@@ -187,6 +227,21 @@ class CookieBrowserDialog(QDialog):
         except Exception:
             pass
 
+    def _seed_izin(self, store) -> None:
+        """Önceki oturumdan kalan Cloudflare iznini profile yükle."""
+        try:
+            cookies, ua = _kayitli_izin()
+            if ua:
+                self._profile.setHttpUserAgent(ua)
+            for c in cookies:
+                cookie = QNetworkCookie(c["name"].encode(), c["value"].encode())
+                cookie.setDomain(c["domain"])
+                cookie.setPath(c["path"])
+                cookie.setSecure(c["secure"])
+                store.setCookie(cookie, QUrl(TRANIME_BASE))
+        except Exception:
+            pass
+
     # ── Akış ────────────────────────────────────────────────────────────────
     def begin(self) -> None:
         """Yüklemeyi başlat.
@@ -201,6 +256,7 @@ class CookieBrowserDialog(QDialog):
         # Yükleme başlamadan hemen önce tekrar tohumla: WebEngine çekirdeği ilk
         # yüklemeyle ayağa kalktığı için bu, çerezin kesinlikle uygulanmasını garantiler.
         self._seed_age_cookie(store)
+        self._seed_izin(store)
         self.view.load(QUrl(TARGET_ANIME))
 
     def _set_status(self, msg: str) -> None:
@@ -232,6 +288,10 @@ class CookieBrowserDialog(QDialog):
             return False
         self._finished = True
         self._timeout.stop()
+        try:
+            _izni_kaydet(cookies, self._profile.httpUserAgent())
+        except Exception:
+            pass
         self._set_status("Oturum çerezi alındı.")
         self.cookies_ready.emit(_cookies_to_netscape(cookies))
         QTimer.singleShot(400, self.accept)
@@ -342,4 +402,5 @@ __all__ = [
     "COOKIE_DOMAIN",
     "REQUIRED_COOKIES",
     "MAX_WAIT_SECONDS",
+    "IZIN_ONEKLERI",
 ]
@@ -0,0 +1,350 @@
+"""Ortak kapak/küçük resim servisi — bellek + disk önbelleği, tek HTTP oturumu.
+
+Arama, keşif, izleme listesi, detay sayfası ve AniList avatarı aynı
+AniList/Jikan posterlerini her sayfa ziyaretinde çıplak
+`requests.get(url).content` ile yeniden indiriyordu; bağlantı da
+paylaşılmıyordu. Artık hepsi bu servisten geçer:
+
+- **Bellek** — çözülmüş `QPixmap`'lerin LRU'su (yalnızca GUI thread'i). Aynı
+  poster ikinci kez görünürken ne ağa ne diske ne de çözücüye gidilir.
+- **Disk** — URL'nin SHA-1'iyle adlandırılmış dosyalar, toplam boyut sınırlı,
+  en uzun süre dokunulmayan önce silinir. Tazeliği geçen kayıt ETag /
+  Last-Modified ile koşullu istekle doğrulanır; 304 gövde indirmez.
+- **Oturum** — tek havuzlu `requests.Session`; TLS el sıkışması sayfa başına
+  değil süreç başına.
+- **Birleştirme** — aynı URL için süren indirme varken gelen ikinci istek
+  ağa çıkmaz, ilkini bekler (aynı poster bir ızgarada birkaç kez olabiliyor).
+- **Küçültülmüş çözme** — `kucuk_resim` worker thread'inde `QImageReader`'a
+  hedef boyutu verip görseli doğrudan o boyutta çözer. GUI thread'ine yalnızca
+  kartın poster kutusu kadarlık `QImage` gelir; orada tam çözünürlüklü
+  çözme/ölçekleme yapılmaz, bellekte de tam boy pixmap tutulmaz.
+
+`istatistik()` isabet oranını ve ağdan indirilmeyen bayt miktarını verir.
+Önbellek yalnızca hız içindir: disk yazılamazsa servis önbelleksiz çalışır.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PySide6.QtGui import QImage, QImageReader, QPixmap
+
+CACHE_DIR = Path.home() / ".turkanime" / "gorsel_cache"
+# Disk önbelleğinin toplam sınırı ve bir kaydın doğrulamasız kullanılma süresi
+DISK_SINIRI = 128 * 1024 * 1024
+TAZELIK = 24 * 3600
+# Bellekte tutulan çözülmüş görsel sayısı (bir ızgara + geri dönüş payı)
+BELLEK_KAPASITESI = 300
+ZAMAN_ASIMI = 10
+
+
+def kucult(data: bytes, hedef: Optional[QSize] = None) -> Optional[QImage]:
+    """Baytları ``hedef`` kutusunu dolduracak en küçük boyutta çöz.
+
+    Her thread'den çağrılabilir (QImage GUI thread'ine bağlı değildir).
+    JPEG çözücü ölçeği çözme sırasında uygular; tam boy görüntü hiç
+    oluşmaz. Kaynak hedeften küçükse büyütülmez. Çözülemezse ``None``.
+    """
+    if not data:
+        return None
+    ba = QByteArray(bytes(data))
+    buf = QBuffer(ba)
+    buf.open(QIODevice.OpenModeFlag.ReadOnly)
+    okuyucu = QImageReader(buf)
+    okuyucu.setAutoTransform(True)
+    kaynak = okuyucu.size()
+    if (hedef is not None and hedef.isValid() and kaynak.isValid()
+            and (kaynak.width() > hedef.width() or kaynak.height() > hedef.height())):
+        # Kutuyu taşarak doldur: kart posteri ortadan kırpar, boşluk kalmasın.
+        okuyucu.setScaledSize(
+            kaynak.scaled(hedef, Qt.AspectRatioMode.KeepAspectRatioByExpanding))
+    img = okuyucu.read()
+    buf.close()
+    return None if img.isNull() else img
+
+
+def _oturum_kur():
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    oturum = requests.Session()
+    # Kart ızgarası aynı CDN'e onlarca paralel istek atıyor; varsayılan 10'luk
+    # havuz dolunca bağlantılar atılıp yeniden kuruluyordu.
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+    oturum.mount("https://", adapter)
+    oturum.mount("http://", adapter)
+    return oturum
+
+
+class GorselServisi:
+    """Kapak baytlarını ve çözülmüş pixmap'leri önbellekleyen servis.
+
+    `baytlar` ve `kucuk_resim` her thread'den çağrılabilir; `pixmap` yalnızca
+    GUI thread'inden (QPixmap GUI thread'ine bağlıdır).
+    """
+
+    def __init__(self, dizin: Optional[Path] = None,
+                 disk_siniri: int = DISK_SINIRI,
+                 tazelik: float = TAZELIK,
+                 bellek_kapasitesi: int = BELLEK_KAPASITESI,
+                 oturum_fabrikasi: Callable[[], Any] = _oturum_kur,
+                 saat: Callable[[], float] = time.time):
+        self.dizin = Path(dizin) if dizin is not None else None
+        self.disk_siniri = disk_siniri
+        self.tazelik = tazelik
+        self.bellek_kapasitesi = bellek_kapasitesi
+        self._oturum_fabrikasi = oturum_fabrikasi
+        self._oturum = None
+        self._saat = saat
+        self._kilit = threading.Lock()
+        self._suren: Dict[str, Future] = {}
+        # disk anahtarı → boyut, erişim sırasıyla (sonda en yeni); ilk kullanımda
+        # dizinden kurulur
+        self._disk: Optional["OrderedDict[str, int]"] = None
+        self._disk_toplam = 0
+        # (url, hedef genişlik, hedef yükseklik) → pixmap; (url, 0, 0) tam boy
+        self._pixmaplar: "OrderedDict[tuple, QPixmap]" = OrderedDict()
+        self.sayac = {"bellek": 0, "disk": 0, "dogrulanan": 0, "birlesen": 0,
+                      "indirilen": 0, "hata": 0}
+        self.tasarruf_bayt = 0
+        self.indirilen_bayt = 0
+
+    # ── Bellek (GUI thread'i) ───────────────────────────────────────────────
+    def pixmap(self, url: str, data=None,
+               hedef: Optional[QSize] = None) -> Optional[QPixmap]:
+        """``hedef`` boyutlu çözülmüş görseli döndür; yoksa ``data``dan kur.
+
+        ``data`` worker'da hazırlanmış bir `QImage` (yalnızca pixmap'e
+        çevrilir) ya da ham bayt olabilir (burada, küçültülerek çözülür).
+        """
+        if not url:
+            return None
+        anahtar = (url, hedef.width(), hedef.height()) if hedef is not None \
+            else (url, 0, 0)
+        pix = self._pixmaplar.get(anahtar)
+        if pix is not None:
+            self._pixmaplar.move_to_end(anahtar)
+            if data is None:
+                with self._kilit:
+                    self.sayac["bellek"] += 1
+            return pix
+        if data is None:
+            return None
+        img = data if isinstance(data, QImage) else kucult(data, hedef)
+        if img is None or img.isNull():
+            return None
+        pix = QPixmap.fromImage(img)
+        self._pixmaplar[anahtar] = pix
+        while len(self._pixmaplar) > self.bellek_kapasitesi:
+            self._pixmaplar.popitem(last=False)
+        return pix
+
+    # ── Bayt (her thread) ───────────────────────────────────────────────────
+    def baytlar(self, url: str) -> Optional[bytes]:
+        """Görsel baytları: disk → (koşullu) ağ. Başarısızsa ``None``."""
+        if not url:
+            return None
+        with self._kilit:
+            suren = self._suren.get(url)
+            if suren is None:
+                gelecek: Future = Future()
+                self._suren[url] = gelecek
+        if suren is not None:
+            data = suren.result()
+            if data:
+                with self._kilit:
+                    self.sayac["birlesen"] += 1
+                    self.tasarruf_bayt += len(data)
+            return data
+        data = None
+        try:
+            data = self._getir(url)
+        finally:
+            with self._kilit:
+                self._suren.pop(url, None)
+            gelecek.set_result(data)
+        return data
+
+    def kucuk_resim(self, url: str, hedef: Optional[QSize]) -> Optional[QImage]:
+        """Worker thread'i: baytları getir ve ``hedef`` boyutunda çöz."""
+        data = self.baytlar(url)
+        return kucult(data, hedef) if data else None
+
+    def _getir(self, url: str) -> Optional[bytes]:
+        anahtar = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        meta, govde = self._diskten_oku(anahtar)
+        simdi = self._saat()
+        if govde is not None and simdi - meta.get("ts", 0) < self.tazelik:
+            self._say("disk", len(govde))
+            self._dokun(anahtar)
+            return govde
+
+        basliklar = {}
+        if govde is not None:
+            if meta.get("etag"):
+                basliklar["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                basliklar["If-Modified-Since"] = meta["last_modified"]
+        try:
+            yanit = self._oturum_al().get(url, headers=basliklar, timeout=ZAMAN_ASIMI)
+        except Exception:
+            yanit = None
+        durum = getattr(yanit, "status_code", None)
+        if durum == 304 and govde is not None:
+            meta["ts"] = simdi
+            self._meta_yaz(anahtar, meta)
+            self._say("dogrulanan", len(govde))
+            self._dokun(anahtar)
+            return govde
+        if durum == 200 and yanit.content:
+            data = bytes(yanit.content)
+            with self._kilit:
+                self.sayac["indirilen"] += 1
+                self.indirilen_bayt += len(data)
+            hdr = getattr(yanit, "headers", None) or {}
+            self._diske_yaz(anahtar, data, {
+                "url": url, "ts": simdi,
+                "etag": hdr.get("ETag"), "last_modified": hdr.get("Last-Modified"),
+            })
+            return data
+        if govde is not None:
+            # Ağ yok / sunucu hata verdi: bayat kopya hiç yoktan iyidir.
+            self._say("disk", len(govde))
+            return govde
+        with self._kilit:
+            self.sayac["hata"] += 1
+        return None
+
+    def _say(self, tur: str, boyut: int) -> None:
+        with self._kilit:
+            self.sayac[tur] += 1
+            self.tasarruf_bayt += boyut
+
+    def _oturum_al(self):
+        with self._kilit:
+            if self._oturum is None:
+                self._oturum = self._oturum_fabrikasi()
+            return self._oturum
+
+    # ── Disk ────────────────────────────────────────────────────────────────
+    def _yollar(self, anahtar: str):
+        return self.dizin / f"{anahtar}.img", self.dizin / f"{anahtar}.json"
+
+    def _disk_indeksi(self) -> "OrderedDict[str, int]":
+        """Kilit tutulurken çağrılır: dizini bir kez tara, erişim sırasıyla diz."""
+        if self._disk is None:
+            kayitlar = []
+            if self.dizin is not None and self.dizin.is_dir():
+                for yol in self.dizin.glob("*.img"):
+                    try:
+                        st = yol.stat()
+                    except OSError:
+                        continue
+                    kayitlar.append((st.st_mtime, yol.stem, st.st_size))
+            kayitlar.sort()
+            self._disk = OrderedDict((a, b) for _, a, b in kayitlar)
+            self._disk_toplam = sum(self._disk.values())
+        return self._disk
+
+    def _diskten_oku(self, anahtar: str):
+        if self.dizin is None:
+            return {}, None
+        with self._kilit:
+            if anahtar not in self._disk_indeksi():
+                return {}, None
+        govde_yolu, meta_yolu = self._yollar(anahtar)
+        try:
+            meta = json.loads(meta_yolu.read_text(encoding="utf-8"))
+            return (meta if isinstance(meta, dict) else {}), govde_yolu.read_bytes()
+        except (OSError, ValueError):
+            return {}, None
+
+    def _dokun(self, anahtar: str) -> None:
+        """LRU: erişim sırasını ve dosya zamanını tazele (yeniden açılışa kalsın)."""
+        if self.dizin is None:
+            return
+        with self._kilit:
+            if anahtar in self._disk_indeksi():
+                self._disk.move_to_end(anahtar)
+        try:
+            os.utime(self._yollar(anahtar)[0])
+        except OSError:
+            pass
+
+    def _meta_yaz(self, anahtar: str, meta: Dict[str, Any]) -> None:
+        try:
+            self._yollar(anahtar)[1].write_text(json.dumps(meta), encoding="utf-8")
+        except OSError:
+            pass
+
+    def _diske_yaz(self, anahtar: str, data: bytes, meta: Dict[str, Any]) -> None:
+        if self.dizin is None or len(data) > self.disk_siniri:
+            return
+        govde_yolu, meta_yolu = self._yollar(anahtar)
+        gecici = govde_yolu.with_name(f".{anahtar}.{threading.get_ident()}.tmp")
+        try:
+            self.dizin.mkdir(parents=True, exist_ok=True)
+            gecici.write_bytes(data)
+            os.replace(gecici, govde_yolu)
+            meta_yolu.write_text(json.dumps(meta), encoding="utf-8")
+        except OSError:
+            try:
+                gecici.unlink()
+            except OSError:
+                pass
+            return
+        silinecek = []
+        with self._kilit:
+            indeks = self._disk_indeksi()
+            self._disk_toplam += len(data) - indeks.pop(anahtar, 0)
+            indeks[anahtar] = len(data)
+            while self._disk_toplam > self.disk_siniri and len(indeks) > 1:
+                eski, boyut = indeks.popitem(last=False)
+                self._disk_toplam -= boyut
+                silinecek.append(eski)
+        for eski in silinecek:
+            for yol in self._yollar(eski):
+                try:
+                    yol.unlink()
+                except OSError:
+                    pass
+
+    # ── Rapor ───────────────────────────────────────────────────────────────
+    def istatistik(self) -> Dict[str, Any]:
+        with self._kilit:
+            s = dict(self.sayac)
+            isabet = s["bellek"] + s["disk"] + s["dogrulanan"] + s["birlesen"]
+            toplam = isabet + s["indirilen"] + s["hata"]
+            return {
+                **s,
+                "isabet_orani": isabet / toplam if toplam else 0.0,
+                "tasarruf_bayt": self.tasarruf_bayt,
+                "indirilen_bayt": self.indirilen_bayt,
+                "disk_bayt": self._disk_toplam if self._disk is not None else 0,
+                "bellek_kayit": len(self._pixmaplar),
+            }
+
+
+_servis: Optional[GorselServisi] = None
+_servis_kilidi = threading.Lock()
+
+
+def gorsel_servisi() -> GorselServisi:
+    """Süreç genelindeki tek servis (sayfalar ve AniList köprüsü paylaşır)."""
+    global _servis
+    with _servis_kilidi:
+        if _servis is None:
+            _servis = GorselServisi(CACHE_DIR)
+        return _servis
+
+
+__all__ = ["GorselServisi", "gorsel_servisi", "kucult", "CACHE_DIR", "DISK_SINIRI",
+           "TAZELIK", "BELLEK_KAPASITESI"]
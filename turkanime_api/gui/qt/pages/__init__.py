@@ -1,11 +1,47 @@
-"""PySide6 GUI sayfaları."""
-from .detail import DetailPage  # noqa: F401
-from .discover import DiscoverPage  # noqa: F401
-from .downloads import DownloadManager, DownloadsPage  # noqa: F401
-from .episodes import EpisodePage  # noqa: F401
-from .search import SearchPage  # noqa: F401
-from .settings import SettingsPage  # noqa: F401
-from .watchlist import WatchlistPage  # noqa: F401
+"""PySide6 GUI sayfaları.
+
+Sınıflar **tembel** açılıyor (PEP 562): `pages.detail`'i içe aktarmak eskiden
+bu dosya üzerinden yedi sayfanın hepsini ve çektikleri modülleri yüklüyordu.
+Ana pencere sayfaları ilk ziyarette kurduğu için açılışta yalnızca ana sayfa
+modülü yüklenmeli.
+"""
+from typing import TYPE_CHECKING
 
 __all__ = ["SearchPage", "EpisodePage", "DownloadsPage", "DownloadManager",
            "SettingsPage", "DiscoverPage", "DetailPage", "WatchlistPage"]
+
+if TYPE_CHECKING:
+    from .detail import DetailPage
+    from .discover import DiscoverPage
+    from .downloads import DownloadManager, DownloadsPage
+    from .episodes import EpisodePage
+    from .search import SearchPage
+    from .settings import SettingsPage
+    from .watchlist import WatchlistPage
+
+_TEMBEL = {
+    "DetailPage": "detail",
+    "DiscoverPage": "discover",
+    "DownloadManager": "downloads",
+    "DownloadsPage": "downloads",
+    "EpisodePage": "episodes",
+    "SearchPage": "search",
+    "SettingsPage": "settings",
+    "WatchlistPage": "watchlist",
+}
+
+
+def __getattr__(ad):
+    """İlk erişimde ilgili sayfa modülünü yükle (PEP 562)."""
+    try:
+        modul_adi = _TEMBEL[ad]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {ad!r}") from None
+    from importlib import import_module
+    nesne = getattr(import_module(f".{modul_adi}", __name__), ad)
+    globals()[ad] = nesne
+    return nesne
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TEMBEL))
@@ -30,239 +30,452 @@ Doğru ölçü **viewport genişliğidir**: dikey kaydırma çubuğu çıktığ
 küçülür ve ızgaranın kendi asgarisinden etkilenmez. Sütun sayısı buradan
 hesaplandığı sürece ``cols*MIN_W + (cols-1)*GAP <= viewport`` her zaman
 sağlanır, yani içerik hiçbir genişlikte taşmaz.
+
+Sanal ızgara
+------------
+Eski gövde her sonuç için gerçek bir `AnimeCard` widget'ı kuruyordu; widget
+sayısı, yerleşim maliyeti ve bellek sonuç sayısıyla doğrusal büyüyordu. Artık
+`CardGrid` bir `QListView`: kartlar `CardModel`'de düz veri (`CardItem`)
+olarak durur, görünüm ızgaranın her SATIRINI tek bir öğe olarak gösterir ve
+`CardDelegate` yalnızca ekrandaki satırların kartlarını boyar. Satır başına
+öğe seçimi bilinçli: `IconMode` hücreleri kendi ölçüsüne göre ortalıyor ve
+son sütunu görünen alanın 1px altında sarıyordu; satır öğesinde sütun
+geometrisi yukarıdaki kuralların birebir aynısıyla buradan hesaplanır.
+Kapaklar da tembel: yalnızca görünür alana giren satırlar için
+`thumbnails_needed` yayılır.
 """
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 
-from PySide6.QtCore import QEvent, Qt
-from PySide6.QtWidgets import QGridLayout, QScrollArea, QVBoxLayout, QWidget
+from PySide6.QtCore import (
+    QAbstractListModel, QEvent, QModelIndex, QPoint, QRect, QSize, Qt, QTimer,
+    Signal,
+)
+from PySide6.QtWidgets import (
+    QAbstractItemView, QListView, QStyledItemDelegate, QToolTip, QWidget,
+)
 
-from ..widgets import CARD_MIN_WIDTH
+from ..widgets import (
+    CARD_BORDER, CARD_MIN_WIDTH, CARD_PAD, CardItem, card_height, paint_card,
+)
 
 #: Sütunlar ve satırlar arasındaki sabit boşluk. Sütun genişliği pencereyle
 #: birlikte değişir, bu boşluk değişmez.
 GRID_GAP = 12
 
+#: Modellerin kart (`CardModel`) ya da satır kartları (`_LineModel`) rolü
+CARD_ROLE = Qt.ItemDataRole.UserRole + 1
 
-class CardGridBody(QWidget):
-    """Kartları eşit genişlikte sütunlara dizen ızgara gövdesi.
-
-    Yerleşim üç kurala indirgenir:
+#: Görünür alanın altında önceden kapağı istenen satır sayısı
+PREFETCH_LINES = 1
 
-    1. **Sütunların hepsi TAM eşit genişliktedir** (bkz. `_apply_column_widths`).
-    2. **Boşluk sabittir.** Fazla genişlik boşluğa değil sütunlara gider;
-       sütunlara bölünemeyen birkaç piksel sağdaki yutucu sütuna kalır.
-    3. **Kartlar üste hizalıdır.** Eksik satırlar ızgarayı esnetmez.
 
-    Son satır eksik kalsa bile sütun sayısı değişmez: 12 kart 5 sütuna
-    dizildiğinde son satırdaki 2 kart, üst satırdakilerle aynı genişliktedir.
-    """
+class CardModel(QAbstractListModel):
+    """Izgaranın düz kart listesi: bir satır = bir `CardItem`."""
 
-    def __init__(self, min_item_width: int = CARD_MIN_WIDTH,
-                 gap: int = GRID_GAP, parent: Optional[QWidget] = None):
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self._min_item_width = max(1, int(min_item_width))
-        self._gap = max(0, int(gap))
-        self._items: List[QWidget] = []
-        self._columns = 0
-        self._available = 0
-
-        self._grid = QGridLayout(self)
-        self._grid.setContentsMargins(0, 0, 0, 0)
-        self._grid.setSpacing(self._gap)
-        # Kartlar dikeyde yayılmasın: eksik satırlar ızgarayı esnetmek yerine
-        # altta boşluk bırakır (bkz. `CardGrid` içindeki alt stretch).
-        self._grid.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self._items: List[CardItem] = []
+        self._rows: Dict[int, int] = {}
+
+    # ── Qt modeli ───────────────────────────────────────────────────────────
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._items):
+            return None
+        card = self._items[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return card.title
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return card.tooltip
+        if role == CARD_ROLE:
+            return card
+        return None
 
     # ── Genel API ───────────────────────────────────────────────────────────
-    def set_items(self, items: List[QWidget]) -> None:
-        """Izgarayı verilen kartlarla doldur (öncekiler silinir)."""
-        self.clear()
+    def items(self) -> List[CardItem]:
+        return list(self._items)
+
+    def set_items(self, items: List[CardItem]) -> None:
+        self.beginResetModel()
+        self._release(self._items)
         self._items = list(items)
-        for item in self._items:
-            item.setParent(self)
-        self._place(force=True)
+        self._adopt(self._items)
+        self._reindex()
+        self.endResetModel()
+
+    def insert_items(self, index: int, items: List[CardItem]) -> None:
+        if not items:
+            return
+        index = max(0, min(index, len(self._items)))
+        self.beginInsertRows(QModelIndex(), index, index + len(items) - 1)
+        self._items[index:index] = list(items)
+        self._adopt(items)
+        self._reindex()
+        self.endInsertRows()
 
     def clear(self) -> None:
-        while self._grid.count():
-            entry = self._grid.takeAt(0)
-            widget = entry.widget()
-            if widget is not None:
-                widget.setParent(None)
-                widget.deleteLater()
-        self._items = []
-        self._columns = 0
+        self.set_items([])
 
-    def count(self) -> int:
-        return len(self._items)
+    # ── İç işleyiş ──────────────────────────────────────────────────────────
+    def _adopt(self, items: List[CardItem]) -> None:
+        for card in items:
+            card._on_changed = self._card_changed
+            card.thumb_requested = False
+
+    @staticmethod
+    def _release(items: List[CardItem]) -> None:
+        # Silinen karta geç gelen kapak artık ızgaraya dokunmaz.
+        for card in items:
+            card._on_changed = None
+
+    def _reindex(self) -> None:
+        self._rows = {id(card): row for row, card in enumerate(self._items)}
+
+    def _card_changed(self, card: CardItem) -> None:
+        row = self._rows.get(id(card))
+        if row is None or self._items[row] is not card:
+            return
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+
+class _LineModel(QAbstractListModel):
+    """`CardModel`'i ızgara satırlarına bölen görünüm modeli.
+
+    Satır ``i``, düz listedeki ``[i*cols, (i+1)*cols)`` kartlarıdır. Kart
+    eklenip silinince satır sınırları kaydığı için model sıfırlanır; kapak
+    gelmesi gibi veri değişiklikleri yalnızca ilgili satırı günceller.
+    """
+
+    def __init__(self, cards: CardModel, parent=None):
+        super().__init__(parent)
+        self._cards = cards
+        self._columns = 1
+        cards.modelReset.connect(self._reset)
+        cards.rowsInserted.connect(self._reset)
+        cards.rowsRemoved.connect(self._reset)
+        cards.dataChanged.connect(self._cards_changed)
 
     def columns(self) -> int:
-        """Şu an kullanılan sütun sayısı (kart yokken 0)."""
         return self._columns
 
-    def rows(self) -> int:
-        if not self._items or self._columns <= 0:
-            return 0
-        return -(-len(self._items) // self._columns)   # yukarı yuvarlama
-
-    def columns_for(self, available: int) -> int:
-        """Verilen genişliğe kaç sütun sığar.
+    def set_columns(self, columns: int) -> None:
+        columns = max(1, int(columns))
+        if columns != self._columns:
+            self.beginResetModel()
+            self._columns = columns
+            self.endResetModel()
 
-        ``cols*MIN_W + (cols-1)*GAP <= available`` eşitsizliğinin en büyük
-        çözümü; `available` tek kart bile almıyorsa 1 (kırpılmış tek sütun,
-        boş ekrandan iyidir).
-        """
-        usable = max(int(available), self._min_item_width)
-        return max(1, int((usable + self._gap) // (self._min_item_width + self._gap)))
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        if parent.isValid():
+            return 0
+        return -(-self._cards.rowCount() // self._columns)   # yukarı yuvarlama
 
-    def relayout(self, available: int) -> None:
-        """Kullanılabilir genişlik değişti: gerekiyorsa yeniden diz."""
-        self._available = max(0, int(available))
-        self._place()
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != CARD_ROLE:
+            return None
+        bas = index.row() * self._columns
+        return self._cards._items[bas:bas + self._columns]
 
-    def column_widths(self) -> List[int]:
-        """Yerleşmiş sütunların piksel genişlikleri (ölçüm ve test için).
+    def _reset(self, *_args) -> None:
+        self.beginResetModel()
+        self.endResetModel()
 
-        Widget geometrisinden okunur, layout'un niyetinden değil: testin
-        doğruladığı şey kullanıcının gördüğü genişlik olmalı.
-        """
-        widths: List[int] = []
-        for column in range(self._columns):
-            item = self._grid.itemAtPosition(0, column)
-            widget = item.widget() if item is not None else None
-            if widget is None:
-                break
-            widths.append(widget.width())
-        return widths
+    def _cards_changed(self, top: QModelIndex, bottom: QModelIndex, *_args) -> None:
+        ilk = self.index(top.row() // self._columns)
+        son = self.index(bottom.row() // self._columns)
+        self.dataChanged.emit(ilk, son)
 
-    # ── İç işleyiş ──────────────────────────────────────────────────────────
-    def column_width_for(self, available: int, cols: int) -> int:
-        """Bir sütuna düşen TAM genişlik (kalan piksel dahil edilmez).
 
-        `available` sütun sayısına tam bölünmediğinde artan 1-2 piksel
-        sütunlara dağıtılmaz, sağdaki yutucu sütuna bırakılır — bkz.
-        `_apply_column_widths`.
-        """
-        if cols <= 0:
-            return self._min_item_width
-        net = int(available) - (cols - 1) * self._gap
-        return max(self._min_item_width, net // cols)
+class CardDelegate(QStyledItemDelegate):
+    """Bir ızgara satırındaki kartları boyar (widget kurmadan)."""
 
-    def _apply_column_widths(self, cols: int) -> None:
-        """Sütunları tam olarak eşit genişliğe sabitle.
+    def __init__(self, grid: "CardGrid"):
+        super().__init__(grid)
+        self._grid = grid
 
-        Sütunlara esneme payı verilseydi Qt artan pikselleri sütunlara TEK TEK
-        dağıtırdı ve aralarında 1px fark kalırdı. Kompakt kartta bu görünmez;
-        poster kartında görünür, çünkü kart yüksekliği genişliğinden türetiliyor
-        (2:3) — 1px genişlik farkı 1-2px yükseklik farkına, o da aynı satırdaki
-        kartların dikeyde kaymasına dönüşür. Ölçüldü: 1200px'te kart
-        genişlikleri 227/228, kart y'leri 0/1 idi.
+    def sizeHint(self, option, index: QModelIndex) -> QSize:  # noqa: N802
+        return QSize(self._grid.available_width(), self._grid.line_height(index.row()))
 
-        Bunun yerine gerçek sütunlar sabit genişlikte (stretch 0) tutulur ve
-        SAĞA, esneme payı olan boş bir "yutucu" sütun eklenir; bölünmeden artan
-        birkaç piksel oraya gider.
-        """
-        genislik = self.column_width_for(self._available, cols)
-        # Yutucu sütun. `setColumnStretch` layout'un sütun sayısını da büyütür,
-        # bu yüzden önce o kuruluyor. Asgari genişliğinin SIFIRLANMASI şart:
-        # sütun sayısı düştüğünde bu indeks daha önce gerçek bir sütundu ve
-        # eski asgari genişliğini koruyordu — ızgara o kadar geniş kalıp
-        # görünen alandan taşıyordu (ölçüldü: 320px pencerede gövde 531px).
-        self._grid.setColumnStretch(cols, 1)
-        self._grid.setColumnMinimumWidth(cols, 0)
-        for column in range(cols):
-            self._grid.setColumnStretch(column, 0)
-            self._grid.setColumnMinimumWidth(column, genislik)
-        # `QGridLayout.columnCount()` küçülmez: sütun sayısı 7'den 4'e
-        # düştüğünde 5.-7. sütunlar layout'ta kalır. Esneme payları
-        # sıfırlanmazsa bu hayalet sütunlar fazla genişliği paylaşmaya devam
-        # eder ve gerçek kartlar olduğundan dar görünür.
-        for column in range(cols + 1, self._grid.columnCount()):
-            self._grid.setColumnStretch(column, 0)
-            self._grid.setColumnMinimumWidth(column, 0)
-
-    def _place(self, force: bool = False) -> None:
-        cols = self.columns_for(self._available)
-        if not self._items:
-            self._columns = 0
-            return
+    def paint(self, painter, option, index: QModelIndex) -> None:
+        cards = index.data(CARD_ROLE) or []
+        for column, card in enumerate(cards):
+            rect = self._grid.card_rect_in_line(option.rect, column, card)
+            paint_card(painter, rect, card, option.font,
+                       hovered=card is self._grid.hovered_item())
 
-        if cols != self._columns or force:
-            self._columns = cols
-            while self._grid.count():
-                self._grid.takeAt(0)
-            for index, item in enumerate(self._items):
-                self._grid.addWidget(item, index // cols, index % cols)
 
-        # Sütun sayısı aynı kalsa da genişlik her piksellik değişimde yeniden
-        # hesaplanmalı: sabit genişlikli sütunların pencereyi izlemesinin tek
-        # yolu bu.
-        self._apply_column_widths(cols)
+class CardGrid(QListView):
+    """Kartları eşit genişlikte sütunlara dizen sanal ızgara.
 
+    Yerleşim üç kurala indirgenir:
 
-class CardGrid(QScrollArea):
-    """`CardGridBody`'yi dikey kaydırma içinde sunan sarmalayıcı.
+    1. **Sütunların hepsi TAM eşit genişliktedir.** Bölünmeden artan birkaç
+       piksel sütunlara dağıtılmaz, sağda boş kalır.
+    2. **Boşluk sabittir.** Fazla genişlik boşluğa değil sütunlara gider.
+    3. **Kartlar üste hizalıdır.** Az kart varken boş yer altta kalır.
 
-    Sütun sayısını **viewport** genişliğinden hesaplar (modül başlığındaki
-    mandal sorunu), kartları üste hizalar ve artan yeri altta toplar.
+    Sütun sayısı **viewport** genişliğinden hesaplanır (modül başlığındaki
+    mandal sorunu). Son satır eksik kalsa bile sütun sayısı değişmez.
     """
 
+    #: Kart tıklandı (kartın ``payload``'ı)
+    card_clicked = Signal(object)
+    #: Görünür alana giren, kapağı henüz istenmemiş kartlar
+    thumbnails_needed = Signal(list)
+
     def __init__(self, min_item_width: int = CARD_MIN_WIDTH,
                  gap: int = GRID_GAP, parent: Optional[QWidget] = None):
         super().__init__(parent)
-        self.setWidgetResizable(True)
+        self.setObjectName("CardGrid")
+        self._min_item_width = max(1, int(min_item_width))
+        self._gap = max(0, int(gap))
+        self._column_width = self._min_item_width
+        self._line_heights: List[int] = []
+        self._hover: Optional[CardItem] = None
+        self._laying_out = False
+
+        self._cards = CardModel(self)
+        self._lines = _LineModel(self._cards, self)
+        self.setModel(self._lines)
+        self.setItemDelegate(CardDelegate(self))
+        self._cards.modelReset.connect(self._relayout)
+        self._cards.rowsInserted.connect(self._relayout)
+
+        self.setViewMode(QListView.ViewMode.ListMode)
+        self.setUniformItemSizes(False)
+        self.setSpacing(0)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.verticalScrollBar().setSingleStep(24)
         # Yatay kaydırma yok: sütun sayısı zaten viewport'a sığacak şekilde
         # seçiliyor, dolayısıyla taşma olmuyor.
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QListView.Shape.NoFrame)
+        self.setMouseTracking(True)
 
-        container = QWidget()
-        outer = QVBoxLayout(container)
-        outer.setContentsMargins(0, 0, 0, 0)
-        outer.setSpacing(0)
+        self._thumb_timer = QTimer(self)
+        self._thumb_timer.setSingleShot(True)
+        self._thumb_timer.setInterval(0)
+        self._thumb_timer.timeout.connect(self._request_visible_thumbnails)
+        # `start`'a doğrudan bağlanmıyor: kaydırma değeri aralık diye okunurdu.
+        self.verticalScrollBar().valueChanged.connect(
+            lambda _deger: self._thumb_timer.start())
 
-        self.grid = CardGridBody(min_item_width, gap)
-        outer.addWidget(self.grid, 0)
-        # Az kart varken kartlar sayfaya yayılmasın: boş yer altta toplanır.
-        outer.addStretch(1)
+    # ── Genel API ───────────────────────────────────────────────────────────
+    def card_model(self) -> CardModel:
+        return self._cards
 
-        self.setWidget(container)
+    def items(self) -> List[CardItem]:
+        return self._cards.items()
 
-        # Dikey kaydırma çubuğunun görünmesi pencereyi değil yalnızca
-        # viewport'u daraltır; `resizeEvent` o durumda gelmez, bu yüzden
-        # viewport'un kendi resize olayını dinliyoruz.
-        self.viewport().installEventFilter(self)
+    def set_items(self, items: List[CardItem]) -> None:
+        """Izgarayı verilen kartlarla doldur (öncekiler atılır)."""
+        self._hover = None
+        self._cards.set_items(items)
 
-    # ── Genel API (eski `ScrollableGrid` ile uyumlu) ────────────────────────
-    def available_width(self) -> int:
-        """Kartların paylaşabileceği genişlik."""
-        return self.viewport().width()
-
-    def set_items(self, items: List[QWidget]) -> None:
-        self.grid.set_items(items)
-        self._sync()
+    def insert_items(self, index: int, items: List[CardItem]) -> None:
+        """Kartları ``index`` konumuna ekle; mevcut kartlar korunur."""
+        self._cards.insert_items(index, items)
 
     def clear(self) -> None:
-        self.grid.clear()
+        self._hover = None
+        self._cards.clear()
 
     def count(self) -> int:
-        return self.grid.count()
+        return self._cards.rowCount()
 
     def columns(self) -> int:
-        return self.grid.columns()
+        """Şu an kullanılan sütun sayısı (kart yokken 0)."""
+        return self._lines.columns() if self.count() else 0
 
-    # ── Olaylar ─────────────────────────────────────────────────────────────
-    def _sync(self) -> None:
-        self.grid.relayout(self.available_width())
+    def rows(self) -> int:
+        return self._lines.rowCount()
 
-    def resizeEvent(self, event):  # noqa: N802 (Qt imzası)
-        super().resizeEvent(event)
-        self._sync()
+    def available_width(self) -> int:
+        """Kartların paylaşabileceği genişlik."""
+        return self.viewport().width()
 
-    def eventFilter(self, obj, event):  # noqa: N802 (Qt imzası)
-        if obj is self.viewport() and event.type() == QEvent.Type.Resize:
-            self._sync()
-        return super().eventFilter(obj, event)
+    def column_widths(self) -> List[int]:
+        """Yerleşmiş sütunların piksel genişlikleri (ölçüm ve test için)."""
+        return [self._column_width] * min(self.columns(), self.count())
 
+    def content_height(self) -> int:
+        """Kartların kapladığı toplam yükseklik."""
+        return sum(self._line_heights)
 
-__all__ = ["CardGrid", "CardGridBody", "GRID_GAP"]
+    def columns_for(self, available: int) -> int:
+        """Verilen genişliğe kaç sütun sığar.
+
+        ``cols*MIN_W + (cols-1)*GAP <= available`` eşitsizliğinin en büyük
+        çözümü; `available` tek kart bile almıyorsa 1 (kırpılmış tek sütun,
+        boş ekrandan iyidir).
+        """
+        usable = max(int(available), self._min_item_width)
+        return max(1, int((usable + self._gap) // (self._min_item_width + self._gap)))
+
+    def column_width_for(self, available: int, cols: int) -> int:
+        """Bir sütuna düşen TAM genişlik (kalan piksel dahil edilmez)."""
+        if cols <= 0:
+            return self._min_item_width
+        net = int(available) - (cols - 1) * self._gap
+        return max(self._min_item_width, net // cols)
+
+    # ── Geometri ────────────────────────────────────────────────────────────
+    def line_height(self, line: int) -> int:
+        if 0 <= line < len(self._line_heights):
+            return self._line_heights[line]
+        return 0
+
+    def card_rect_in_line(self, line_rect: QRect, column: int, card: CardItem) -> QRect:
+        x = line_rect.x() + column * (self._column_width + self._gap)
+        return QRect(x, line_rect.y(), self._column_width,
+                     card_height(card, self._column_width, self.font()))
+
+    def item_rect(self, index: int) -> QRect:
+        """``index``'inci kartın viewport koordinatlarındaki dikdörtgeni."""
+        cols = self._lines.columns()
+        if not 0 <= index < self.count():
+            return QRect()
+        line_rect = self.visualRect(self._lines.index(index // cols))
+        return self.card_rect_in_line(line_rect, index % cols,
+                                      self._cards._items[index])
+
+    def item_at(self, pos: QPoint) -> Optional[CardItem]:
+        """Viewport'taki ``pos`` noktasındaki kart (boşlukta ``None``)."""
+        line = self.indexAt(pos)
+        if not line.isValid():
+            return None
+        cols = self._lines.columns()
+        line_rect = self.visualRect(line)
+        column = (pos.x() - line_rect.x()) // (self._column_width + self._gap)
+        index = line.row() * cols + column
+        if not 0 <= column < cols or index >= self.count():
+            return None
+        card = self._cards._items[index]
+        rect = self.card_rect_in_line(line_rect, column, card)
+        return card if rect.contains(pos) else None
+
+    def hovered_item(self) -> Optional[CardItem]:
+        return self._hover
+
+    def _relayout(self, *_args) -> None:
+        """Genişlik ya da kartlar değişti: sütunları ve satır yüksekliklerini kur."""
+        if self._laying_out:
+            return
+        self._laying_out = True
+        try:
+            # Yerleşim kaydırma çubuğunu açıp kapatabilir, o da viewport'u
+            # daraltıp genişletir: genişlik oturana kadar (en çok üç tur)
+            # yeniden hesaplanır.
+            for _ in range(3):
+                available = self.available_width()
+                self._layout_lines(available)
+                self.doItemsLayout()
+                if self.available_width() == available:
+                    break
+        finally:
+            self._laying_out = False
+        self._thumb_timer.start()
+
+    def _layout_lines(self, available: int) -> None:
+        cols = self.columns_for(available)
+        self._column_width = self.column_width_for(available, cols)
+        poster = self._column_width - 2 * (CARD_PAD + CARD_BORDER)
+        dpr = self.devicePixelRatioF()
+        font = self.font()
+        items = self._cards._items
+        for card in items:
+            card.poster_width = poster
+            card.device_pixel_ratio = dpr
+        self._lines.set_columns(cols)
+        self._line_heights = []
+        for bas in range(0, len(items), cols):
+            yukseklik = max(card_height(c, self._column_width, font)
+                            for c in items[bas:bas + cols])
+            son = bas + cols >= len(items)
+            self._line_heights.append(yukseklik + (0 if son else self._gap))
+
+    # ── Kapaklar ────────────────────────────────────────────────────────────
+    def _request_visible_thumbnails(self) -> None:
+        """Görünür (ve hemen altındaki) satırların eksik kapaklarını iste."""
+        lines = self._lines.rowCount()
+        if not lines or not self.isVisible():
+            return
+        ilk = self.indexAt(QPoint(1, 1))
+        son = self.indexAt(QPoint(1, max(1, self.viewport().height() - 2)))
+        bas = ilk.row() if ilk.isValid() else 0
+        bit = son.row() if son.isValid() else lines - 1
+        bit = min(lines - 1, bit + PREFETCH_LINES)
+        cols = self._lines.columns()
+        istenen = []
+        for card in self._cards._items[bas * cols:(bit + 1) * cols]:
+            if card.image_url and card.pixmap is None and not card.thumb_requested:
+                card.thumb_requested = True
+                istenen.append(card)
+        if istenen:
+            self.thumbnails_needed.emit(istenen)
+
+    # ── Olaylar ─────────────────────────────────────────────────────────────
+    def viewportEvent(self, event) -> bool:  # noqa: N802 (Qt imzası)
+        tur = event.type()
+        if tur == QEvent.Type.Resize:
+            # Dikey kaydırma çubuğunun görünmesi pencereyi değil yalnızca
+            # viewport'u daraltır; sütunlar buradan yeniden hesaplanır.
+            sonuc = super().viewportEvent(event)
+            self._relayout()
+            return sonuc
+        if tur == QEvent.Type.ToolTip:
+            card = self.item_at(event.pos())
+            if card is not None:
+                QToolTip.showText(event.globalPos(), card.tooltip, self.viewport())
+            else:
+                QToolTip.hideText()
+                event.ignore()
+            return True
+        if tur == QEvent.Type.Leave:
+            self._set_hover(None)
+        return super().viewportEvent(event)
+
+    def showEvent(self, event):  # noqa: N802 (Qt imzası)
+        super().showEvent(event)
+        # Sayfa gizlenince bekleyen kapak işleri iptal ediliyor (bkz.
+        # `workers.TaskGroup`); gelmeyen kapaklar yeniden istenebilsin.
+        for card in self._cards._items:
+            if card.pixmap is None:
+                card.thumb_requested = False
+        self._relayout()
+
+    def mouseMoveEvent(self, event):  # noqa: N802 (Qt imzası)
+        self._set_hover(self.item_at(event.position().toPoint()))
+        super().mouseMoveEvent(event)
+
+    def mousePressEvent(self, event):  # noqa: N802 (Qt imzası)
+        if event.button() == Qt.MouseButton.LeftButton:
+            card = self.item_at(event.position().toPoint())
+            if card is not None:
+                self.card_clicked.emit(card.payload)
+        super().mousePressEvent(event)
+
+    def _set_hover(self, card: Optional[CardItem]) -> None:
+        if card is self._hover:
+            return
+        eski, self._hover = self._hover, card
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor if card is not None
+                                  else Qt.CursorShape.ArrowCursor)
+        for kart in (eski, card):
+            if kart is None:
+                continue
+            try:
+                index = self._cards._items.index(kart)
+            except ValueError:
+                continue
+            self.viewport().update(self.item_rect(index).adjusted(-1, -1, 1, 1))
+
+
+__all__ = ["CardGrid", "CardModel", "CardDelegate", "CARD_ROLE", "GRID_GAP"]
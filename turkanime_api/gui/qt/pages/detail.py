@@ -21,21 +21,21 @@ import html
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QSize, Qt, Signal
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import (
     QCheckBox, QComboBox, QDialog, QFrame, QHBoxLayout, QLabel, QLineEdit,
     QPushButton, QScrollArea, QTextBrowser, QTreeWidget, QTreeWidgetItem,
     QVBoxLayout, QWidget,
 )
 
-from ....common.episode_parser import merge_episodes
+from ..images import gorsel_servisi
 from ..sources_bridge import (
     METADATA_ONLY, UnsupportedSource, fetch_episodes, supported_sources,
 )
 from ..theme import ACCENT, BG_ELEV, BG_ELEV_2, BORDER, TEXT_MUTED, score_color
 from ..widgets import StatusLabel
-from ..workers import WorkerSignals, run_bg
+from ..workers import LANE_PREFETCH, WorkerSignals, run_bg
 from .discover import anime_title, cover_url, score_of
 
 COVER_W, COVER_H = 220, 310
@@ -625,26 +625,45 @@ class DetailPage(QWidget):
     # ── Kapak görseli ───────────────────────────────────────────────────────
     def _load_cover(self, rid: int) -> None:
         url = cover_url(self._anime)
-        if url:
-            run_bg(self._fetch_cover, rid, url)
+        if not url:
+            return
+        pix = gorsel_servisi().pixmap(url, hedef=self._cover_target())
+        if pix is not None:
+            self._set_cover(pix)          # bellekte çözülmüş: arka plana gerek yok
+        else:
+            run_bg(self._fetch_cover, rid, url, self._cover_target(),
+                   lane=LANE_PREFETCH)
 
-    def _fetch_cover(self, rid: int, url: str) -> None:
-        """Arka plan: görseli indir, baytları UI thread'ine taşı."""
+    def _cover_target(self) -> QSize:
+        dpr = max(1.0, self.devicePixelRatioF())
+        return QSize(int(COVER_W * dpr), int(COVER_H * dpr))
+
+    def _fetch_cover(self, rid: int, url: str, hedef: QSize) -> None:
+        """Arka plan: görseli indir ve kapak kutusu boyutunda çöz."""
         try:
-            import requests
-            data = requests.get(url, timeout=10).content
+            img = gorsel_servisi().kucuk_resim(url, hedef)
         except Exception:
             return
-        if data:
-            self.cover_ready.emit(rid, data)
+        if img is not None:
+            self.cover_ready.emit(rid, img)
 
-    def _apply_cover(self, rid: int, data: bytes) -> None:
+    def _apply_cover(self, rid: int, data) -> None:
         """GUI thread'i: kapak hâlâ istenen animeye aitse yerleştir."""
         if rid != self._request_id:
             return               # kullanıcı başka animeye geçti
-        pix = QPixmap()
-        if not pix.loadFromData(data):
-            return
+        url = cover_url(self._anime)
+        if url:
+            pix = gorsel_servisi().pixmap(url, data, self._cover_target())
+        elif isinstance(data, QImage):
+            pix = QPixmap.fromImage(data)
+        else:
+            pix = QPixmap()
+            if not pix.loadFromData(data):
+                pix = None
+        if pix is not None:
+            self._set_cover(pix)
+
+    def _set_cover(self, pix: QPixmap) -> None:
         self.lblCover.setPixmap(pix.scaled(
             COVER_W, COVER_H,
             Qt.AspectRatioMode.KeepAspectRatio,
@@ -740,28 +759,33 @@ class DetailPage(QWidget):
 
     def _do_resolve(self, rid: int, title: str, known: Dict[str, str],
                     want_all: bool, wanted: str) -> None:
-        """Arka plan: kaynak başına en iyi adayı bulup slug'a bağla."""
+        """Arka plan: kaynak başına en iyi adayı bulup slug'a bağla.
+
+        Sonuçlar kaynak bittikçe işlenir; bağlanması gereken son kaynak da
+        gelince en yavaş kaynağı beklemeden karar verilir.
+        """
         from ....common.adapters import SearchEngine
 
+        bindings = dict(known)
+        supported = set(supported_sources())
+        remaining = {s for s in supported
+                     if s not in bindings and s not in METADATA_ONLY}
+        if not want_all:
+            remaining &= {wanted}
         try:
-            results = SearchEngine().search_all_sources_rich(
-                title, limit_per_source=AUTO_MATCH_LIMIT)
+            for source, items in SearchEngine().search_all_sources_rich_iter(
+                    title, limit_per_source=AUTO_MATCH_LIMIT):
+                # Aramada olup oynatması olmayan kaynak `remaining`de yoktur.
+                if source in remaining:
+                    remaining.discard(source)
+                    slug = first_slug(items)
+                    if slug:
+                        bindings[source] = slug
+                if not remaining:
+                    break
         except Exception as exc:
             self.signals.emit_error_item((rid, f"Kaynak araması başarısız: {exc}"))
             return
-
-        bindings = dict(known)
-        supported = set(supported_sources())
-        for source, items in (results or {}).items():
-            if source in bindings or source in METADATA_ONLY:
-                continue
-            if source not in supported:
-                continue                      # aramada var ama oynatması yok
-            if not want_all and source != wanted:
-                continue
-            slug = first_slug(items)
-            if slug:
-                bindings[source] = slug
         self.sources_resolved.emit((rid, bindings, want_all, wanted))
 
     def _on_sources_resolved(self, payload) -> None:
@@ -830,13 +854,30 @@ class DetailPage(QWidget):
             # kaynağın kendi hata mesajı gösterilmeli.
             self._on_failed((rid, " • ".join(errors.values())))
             return
+        if len(results) > 1:
+            # Satır sayısı için birleştirme gerekiyor; GUI thread'inde değil.
+            run_bg(self._do_count, rid, state["primary"], state["slug"],
+                   state["title"], results, signals=self.signals, interactive=True)
+            return
         self._on_episodes((rid, state["primary"], state["slug"], state["title"],
                            results))
 
+    def _do_count(self, rid: int, source: str, slug: str, title: str,
+                  results: Dict[str, List[Any]]) -> None:
+        """Arka plan: çok kaynaklı listenin birleşik satır sayısı.
+
+        `merge_cached` üzerinden: bölüm sayfası aynı yükü hazırlarken plan
+        önbellekten gelir, liste ikinci kez birleştirilmez.
+        """
+        from .episodes import merge_cached
+
+        rows = len(merge_cached(results, title))
+        self.signals.emit_found((rid, source, slug, title, results, rows))
+
     def _on_episodes(self, payload) -> None:
         """GUI thread'i: sonuç güncel isteğe aitse bölüm sayfasına devret."""
         try:
-            rid, source, slug, title, episodes = payload
+            rid, source, slug, title, episodes, *rows = payload
         except (TypeError, ValueError):
             return
         if rid != self._request_id:
@@ -852,7 +893,7 @@ class DetailPage(QWidget):
         if isinstance(episodes, dict) and len(episodes) > 1:
             loaded = [s for s, items in episodes.items() if items]
             failed = [s for s, items in episodes.items() if not items]
-            message = (f"{len(merge_episodes(episodes, title))} bölüm • "
+            message = (f"{rows[0] if rows else total} bölüm • "
                        f"{len(episodes)} kaynaktan {len(loaded)} tanesi yüklendi.")
             if failed:
                 message += f" Yüklenemeyen: {', '.join(failed)}."
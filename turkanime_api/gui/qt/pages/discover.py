@@ -25,14 +25,15 @@ from datetime import datetime
 from itertools import zip_longest
 from typing import Any, Dict, List, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSize, Qt, Signal
 from PySide6.QtWidgets import (
     QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget,
 )
 
+from ..images import gorsel_servisi
 from ..theme import TEXT_MUTED, score_color
-from ..widgets import AnimeCard, StatusLabel
-from ..workers import WorkerSignals, run_bg
+from ..widgets import CardItem, StatusLabel
+from ..workers import LANE_PREFETCH, WorkerSignals, current_token, run_bg
 from ._grid import CardGrid
 
 MODES = ("home", "trending", "season")
@@ -217,7 +218,7 @@ class DiscoverPage(QWidget):
     # stüdyo ve kapağı bu sözlükten okur; yalnızca başlık taşınsaydı hepsi
     # yeniden ağdan çekilmek zorunda kalırdı.
     anime_selected = Signal(object)
-    # (AnimeCard, görsel baytları) — arka plandan UI thread'ine
+    # (CardItem, kart boyutunda QImage) — arka plandan UI thread'ine
     thumb_ready = Signal(object, object)
 
     def __init__(self, mode: str = "home", parent: Optional[QWidget] = None):
@@ -226,7 +227,7 @@ class DiscoverPage(QWidget):
         self.limit = HOME_LIMIT if self.mode == "home" else LIST_LIMIT
         self._busy = False
         self._loaded = False
-        self._cards: List[AnimeCard] = []
+        self._cards: List[CardItem] = []
 
         self.signals = WorkerSignals()
         self.signals.connect_found(self._on_items)
@@ -276,6 +277,8 @@ class DiscoverPage(QWidget):
         # kendisine kalırdı ve kaydırma alanı kart sayısıyla birlikte
         # zıplardı.
         self.results = CardGrid()
+        self.results.card_clicked.connect(self._on_card_clicked)
+        self.results.thumbnails_needed.connect(self._request_thumbs)
         layout.addWidget(self.results, 1)
 
         self.lblStatus.info("Yükleniyor…")
@@ -321,15 +324,11 @@ class DiscoverPage(QWidget):
             self.lblStatus.error(self._bos_mesaj())
             return
 
-        cards: List[AnimeCard] = []
-        pending_thumbs: List[tuple] = []
+        cards: List[CardItem] = []
         for item in items:
             if not isinstance(item, dict):
                 continue
-            card = self._make_card(item)
-            cards.append(card)
-            if card.image_url:
-                pending_thumbs.append((card, card.image_url))
+            cards.append(self._make_card(item))
 
         if not cards:
             self.lblStatus.error(self._bos_mesaj())
@@ -338,23 +337,17 @@ class DiscoverPage(QWidget):
         self._cards = cards
         self.results.set_items(list(cards))
         self.lblStatus.ok(f"{len(cards)} anime")
+        # Görseller ızgara kartları görünür alana aldıkça istenir
+        # (`_request_thumbs`); ekran dışındaki 50 kapak beklemede kalır.
 
-        # Görseller kartlar yerleştikten SONRA, arka planda indirilir.
-        for card, url in pending_thumbs:
-            run_bg(self._fetch_thumb, card, url)
-
-    def _make_card(self, item: Dict[str, Any]) -> AnimeCard:
+    def _make_card(self, item: Dict[str, Any]) -> CardItem:
         """Tek bir anime sözlüğünden kart üret (rozet = puan)."""
         title = anime_title(item)
         score = score_of(item)
-        # AnimeCard'ın ikinci alanı bir rozet; keşifte akış kaynağı henüz belli
+        # Kartın ikinci alanı bir rozet; keşifte akış kaynağı henüz belli
         # olmadığı için oraya puanı yazıyoruz.
         badge = f"★ {score / 10:.1f}" if score else "Puansız"
-
-        card = AnimeCard(title, badge, payload=item, image_url=cover_url(item))
         color = score_color(score / 100.0) if score else TEXT_MUTED
-        card.lblSource.setStyleSheet(
-            f"color: {color}; font-size: 11px; font-weight: 600;")
 
         episodes = item.get("episodes")
         tip = [title]
@@ -362,10 +355,8 @@ class DiscoverPage(QWidget):
             tip.append(f"Puan: {score / 10:.1f}/10")
         if episodes:
             tip.append(f"{episodes} bölüm")
-        card.setToolTip("\n".join(tip))
-
-        card.clicked.connect(self._on_card_clicked)
-        return card
+        return CardItem(title, badge, payload=item, image_url=cover_url(item),
+                        tooltip="\n".join(tip), badge_color=color)
 
     def _on_error(self, message: str) -> None:
         self._busy = False
@@ -376,31 +367,39 @@ class DiscoverPage(QWidget):
         if isinstance(payload, dict) and payload:
             self.anime_selected.emit(payload)
 
-    def cards(self) -> List[AnimeCard]:
+    def cards(self) -> List[CardItem]:
         """Ekrandaki kartlar (test ve köprüleme için)."""
         return list(self._cards)
 
     # ── Kapak görselleri ────────────────────────────────────────────────────
-    def _fetch_thumb(self, card, url: str) -> None:
-        """Arka plan: görseli indir, baytları UI thread'ine taşı.
-
-        Widget'a burada DOKUNULMAZ; yalnızca sinyal yayılır (kart bu arada
-        silinmiş olabilir, o yüzden slot tarafında da kontrol var).
+    def _request_thumbs(self, cards: List[CardItem]) -> None:
+        """Izgara görünür alana giren kartların kapağını istedi."""
+        for card in cards:
+            if not card.load_cached_thumbnail():
+                run_bg(self._fetch_thumb, card, card.image_url,
+                       card.thumbnail_target(), lane=LANE_PREFETCH, owner=self)
+
+    def _fetch_thumb(self, card, url: str, hedef: QSize) -> None:
+        """Arka plan: görseli indir ve kart boyutunda çöz, `QImage`'ı taşı.
+
+        Karta burada DOKUNULMAZ; yalnızca sinyal yayılır (kart bu arada
+        ızgaradan atılmış olabilir, o yüzden slot tarafında da kontrol var).
         """
         try:
-            import requests
-            data = requests.get(url, timeout=10).content
+            img = gorsel_servisi().kucuk_resim(url, hedef)
         except Exception:
             return
-        if data:
-            self.thumb_ready.emit(card, data)
+        current_token().raise_if_cancelled()
+        if img is not None:
+            self.thumb_ready.emit(card, img)
 
-    def _apply_thumb(self, card, data: bytes) -> None:
-        """GUI thread'i: görseli karta yerleştir (kart hâlâ yaşıyorsa)."""
-        try:
-            card.set_thumbnail(data)
-        except RuntimeError:
-            pass          # kart bu arada silinmiş (yenileme)
+    def _apply_thumb(self, card, img) -> None:
+        """GUI thread'i: görseli karta yerleştir.
+
+        Kart bu arada atıldıysa (yenileme) ızgaraya bağı kopmuştur;
+        kapak yalnızca artık gösterilmeyen nesneye yazılır.
+        """
+        card.set_thumbnail(img)
 
 
 __all__ = ["DiscoverPage", "fetch_discover", "season_label", "anime_title",
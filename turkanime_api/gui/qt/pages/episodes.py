@@ -5,31 +5,72 @@ Eski `common/ui.py::AccordionSourceEpisodeList` davranışının Qt karşılığ
 - Kaynak başına ayrı liste YOK; bütün kaynaklar `(sezon, bölüm)` anahtarıyla
   tek listede birleşir ve her satır o bölümün bulunduğu kaynakların ▶/⬇
   düğmelerini taşır.
-- Tembel sayfalama (30'ar), arama filtresi, filtreli toplu seçim.
-- Seçim satır widget'ında değil, bölüm anahtarında tutulur: kullanıcı 200
-  bölümü seçip "Daha fazla yükle"ye hiç basmadan indirebilmeli (eski GUI'nin
+- Arama filtresi, filtreli toplu seçim.
+- Seçim satırda değil, bölüm anahtarında tutulur: kullanıcı 200 bölümü seçip
+  hiçbirini ekranda görmeden indirebilmeli (eski GUI'nin
   `get_selected_episodes` davranışı).
 
+Liste sanal: eskiden her bölüm için düğmeli bir `EpisodeRow` QFrame'i
+kuruluyor (30'arlık sayfalarla), filtre de her tuşta bütün satır
+widget'larını dolaşıyordu; One Piece / Conan gibi 1000+ bölümlük serilerde
+açılış ve yazma takılıyordu. Artık bölümler `EpisodeModel`'de veri, filtre
+önceden hesaplanmış küçük harf anahtarlar üzerinden `EpisodeFilterProxy`'de,
+satırları da `EpisodeDelegate` boyuyor — yalnızca ekrandakiler. Filtre
+girdisi kısa bir gecikmeyle (debounce) uygulanır.
+
+Liste GUI thread'inde hazırlanmaz: `merge_episodes` (her başlık için regex),
+ayar + geçmiş dosyası okuma ve satır anahtarları `prepare_episodes` ile arka
+plan havuzunda hesaplanır. Bu sürede liste iskelet satırlar çizer; hazır
+sonuç modele tek bir sıfırlamayla yerleşir. Aynı animenin tekrar açılışında
+birleştirme planı, kaynak yüklerinin özetleriyle anahtarlanmış önbellekten
+gelir (`merge_cached`).
+
 Oynatma/indirme mevcut `best_video()` → yt-dlp/mpv boru hattını kullanır, yani
 kaynak tarafında hiçbir değişiklik gerekmez.
 """
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import (
+    QAbstractListModel, QEvent, QModelIndex, QPoint, QRect, QRectF, QSize,
+    QSortFilterProxyModel, Qt, QTimer, Signal,
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter, QPen
 from PySide6.QtWidgets import (
-    QCheckBox, QDialog, QFrame, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QScrollArea, QVBoxLayout, QWidget,
+    QAbstractItemView, QDialog, QHBoxLayout, QLabel, QLineEdit, QListView,
+    QPushButton, QStyledItemDelegate, QToolTip, QVBoxLayout, QWidget,
 )
 
 from ....common.episode_parser import merge_episodes
 from .. import prefs
 from ..sources_bridge import UnsupportedSource, fetch_episodes
+from ..theme import (
+    ACCENT, ACCENT_HOVER, BG_ELEV, BG_ELEV_2, BORDER, RADIUS, TEXT, TEXT_MUTED,
+)
 from ..widgets import StatusLabel
 from ..workers import WorkerSignals, run_bg
 
-PAGE_SIZE = 30
+# Satır ölçüleri (eski `EpisodeRow`: 6px dikey / 10px yatay kenar, 10px
+# aralık, satırlar arası 6px)
+ROW_HEIGHT = 42
+ROW_GAP = 6
+ROW_MARGIN = 10
+ROW_SPACING = 10
+
+# Filtre kutusuna yazarken her tuşta değil, yazma durunca süzülür.
+FILTER_DEBOUNCE_MS = 150
+
+# Kaç animenin birleştirme planı bellekte tutulur (detay ↔ bölüm gidip gelme
+# ve "geri" ile aynı animeye dönme için birkaç tane yeterli).
+MERGE_CACHE_SIZE = 16
+
+# Model rolleri
+EPISODE_ROLE = Qt.ItemDataRole.UserRole + 1
+KEY_ROLE = Qt.ItemDataRole.UserRole + 2
+HISTORY_ROLE = Qt.ItemDataRole.UserRole + 3
 
 # İzlendi/indirildi rozetleri — eski GUI'deki "izlendi ikonu" ayarı bu ikilinin
 # görünürlüğünü yönetiyordu ama hiçbir widget'a bağlanmamıştı.
@@ -98,10 +139,20 @@ def episode_matches(episode: Dict[str, Any], needle: str) -> bool:
     "S02E12" gibi normalize edilmiş satırlarda da çalışır ama "Bölüm 12"
     yazan kaynaklarda numarayı ayrıca aramak daha isabetli sonuç veriyor.
     """
+    return key_matches(filter_key(episode), needle)
+
+
+def filter_key(episode: Dict[str, Any]) -> Tuple[str, str]:
+    """Filtrenin baktığı ``(küçük harf başlık, numara)`` ikilisi."""
+    return (str(episode.get("title") or "").lower(),
+            str(episode.get("number") or ""))
+
+
+def key_matches(key: Tuple[str, str], needle: str) -> bool:
+    """`episode_matches`'in önceden hesaplanmış anahtar üzerindeki hâli."""
     if not needle:
         return True
-    title = str(episode.get("title") or "").lower()
-    number = str(episode.get("number") or "")
+    title, number = key
     if needle in title:
         return True
     return number.startswith(needle) if needle.isdigit() else needle in number
@@ -125,6 +176,112 @@ def source_counts(episodes: Sequence[Dict[str, Any]]) -> Dict[str, int]:
     return counts
 
 
+# ── Birleştirme önbelleği ───────────────────────────────────────────────────
+# Plan, satırların kaynak kayıtlarını değil `(kaynak, sıra)` konumlarını
+# saklar: aynı liste yeniden çekildiğinde yeni `Bolum` nesneleri kullanılır,
+# yalnızca pahalı başlık ayrıştırma atlanır.
+_merge_cache: "OrderedDict[Tuple[Any, ...], List[Tuple[Any, ...]]]" = OrderedDict()
+_merge_lock = threading.Lock()
+
+
+def payload_hash(episodes: Sequence[Any]) -> int:
+    """Bir kaynak listesinin birleştirmeyi etkileyen alanlarının özeti."""
+    return hash(tuple(
+        (e.get("title"), e.get("episode_number"), e.get("number"),
+         e.get("season_number"), e.get("season")) if isinstance(e, dict) else None
+        for e in episodes))
+
+
+def merge_cached(sources_data: Dict[str, Sequence[Dict[str, Any]]],
+                 anime_title: str = "") -> List[Dict[str, Any]]:
+    """`merge_episodes`, aynı yükler için önbellekten.
+
+    Anahtar anime adı + kaynak başına ``(ad, uzunluk, payload_hash)``; bir
+    kaynak yeni bölüm eklediyse özet değişir ve liste yeniden birleştirilir.
+    """
+    key = (anime_title, tuple(sorted(
+        (name, len(eps), payload_hash(eps))
+        for name, eps in (sources_data or {}).items() if eps)))
+    with _merge_lock:
+        plan = _merge_cache.get(key)
+        if plan is not None:
+            _merge_cache.move_to_end(key)
+    if plan is None:
+        konum = {id(entry): (name, i)
+                 for name, eps in (sources_data or {}).items() if eps
+                 for i, entry in enumerate(eps)}
+        merged = merge_episodes(sources_data, anime_title)
+        plan = [(row["season"], row["number"], row["sub"], row["title"],
+                 tuple(konum[id(entry)] for entry in row["sources"].values()))
+                for row in merged]
+        with _merge_lock:
+            _merge_cache[key] = plan
+            while len(_merge_cache) > MERGE_CACHE_SIZE:
+                _merge_cache.popitem(last=False)
+        return merged
+    return [{"season": season, "number": number, "sub": sub, "title": title,
+             "sources": {name: sources_data[name][i] for name, i in konumlar}}
+            for season, number, sub, title, konumlar in plan]
+
+
+def clear_merge_cache() -> None:
+    with _merge_lock:
+        _merge_cache.clear()
+
+
+class PreparedEpisodes:
+    """Modele yerleşmeye hazır liste; arka plan thread'inde kurulur.
+
+    Qt nesnesi içermez: yalnızca birleşik bölümler, satır ve filtre
+    anahtarları, (ayar açıksa) geçmiş ve her satırın rozet durumu.
+    """
+
+    def __init__(self, episodes: Sequence[Dict[str, Any]], names: Sequence[str] = (),
+                 gecmis: Optional[Any] = None, with_history: bool = False,
+                 multi: Optional[bool] = None):
+        self.episodes = list(episodes)
+        self.names = list(names)
+        self.multi = len(self.names) > 1 if multi is None else multi
+        self.keys = [_key_of(e) for e in self.episodes]
+        self.filter_keys = [filter_key(e) for e in self.episodes]
+        self.gecmis = gecmis
+        self.history: Dict[int, Tuple[bool, bool]] = {}
+        if with_history and gecmis is not None:
+            self.history = {row: episode_history(e, gecmis)
+                            for row, e in enumerate(self.episodes)}
+
+
+def load_gecmis() -> Optional[Any]:
+    """Geçmişi diskten oku (ayar kapalıysa rozet hiç çizilmesin diye None)."""
+    return prefs.Gecmis.yukle() if prefs.oku().izlendi_ikonu else None
+
+
+def prepare_episodes(source: str, title: str, episodes: Any) -> PreparedEpisodes:
+    """Yükü birleştir, geçmişi oku, satır anahtarlarını hesapla (GUI'siz).
+
+    Anime adı birleştiriciye veriliyor: kaynaklar başlığa adı da yazıyor
+    ("86 2nd Season 5. Bölüm") ve addaki rakamlar bölüm/sezon sanılırsa aynı
+    bölüm kaynak başına ayrı satır olur.
+    """
+    sources = as_sources_data(source, episodes)
+    return PreparedEpisodes(merge_cached(sources, title), active_sources(sources),
+                            load_gecmis(), with_history=True)
+
+
+def episode_history(episode: Dict[str, Any], gecmis: Any) -> Tuple[bool, bool]:
+    """``(izlendi, indirildi)``.
+
+    Bir bölüm birden çok kaynakta olabiliyor; herhangi birinden izlendiyse
+    satır izlenmiş sayılır (kullanıcı hangi kaynaktan açtığını hatırlamaz).
+    """
+    izlendi = indirildi = False
+    for entry in (episode.get("sources") or {}).values():
+        watched, downloaded = gecmis.durum((entry or {}).get("obj"))
+        izlendi = izlendi or watched
+        indirildi = indirildi or downloaded
+    return izlendi, indirildi
+
+
 # ── Kaynak seçim diyaloğu ───────────────────────────────────────────────────
 class SourceSelectDialog(QDialog):
     """Toplu indirmede "hangi kaynaktan?" sorusu.
@@ -170,178 +327,473 @@ class SourceSelectDialog(QDialog):
         self.accept()
 
 
-# ── Satır ───────────────────────────────────────────────────────────────────
-class EpisodeRow(QFrame):
-    """Tek bölüm satırı: seçim kutusu + başlık + kaynak başına aksiyonlar."""
+# ── Satır modeli ────────────────────────────────────────────────────────────
+class EpisodeModel(QAbstractListModel):
+    """Birleşik bölüm listesi; satır başına widget değil veri tutar.
 
-    play_requested = Signal(object)
-    download_requested = Signal(object)
-    toggled = Signal(object, bool)          # (bölüm anahtarı, seçili mi)
+    Filtre anahtarları (küçük harf başlık + numara) yüklemede BİR KEZ
+    hesaplanır; geçmiş rozeti ise ilk istendiğinde (satır ekrana girince)
+    hesaplanıp saklanır. Seçim de burada, bölüm anahtarında tutulur.
+    """
 
-    def __init__(self, episode: Dict[str, Any], multi: bool = False,
-                 gecmis: Optional[Any] = None,
-                 parent: Optional[QWidget] = None):
+    #: Seçim değişti (tek satır ya da toplu)
+    selection_changed = Signal()
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.setObjectName("Card")
-        self.episode = episode
-        self.sources: Dict[str, Dict[str, Any]] = dict(episode.get("sources") or {})
-        self.key: Tuple[int, int, int] = _key_of(episode)
-        # Filtre durumunu AÇIKÇA tut: `isVisible()` ata widget'ların görünürlüğüne
-        # bağlı olduğu için seçim/filtre mantığının kaynağı olamaz.
-        self.filtered_out = False
-        self.izlendi = False
-        self.indirildi = False
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(10, 6, 10, 6)
-        layout.setSpacing(10)
+        self._episodes: List[Dict[str, Any]] = []
+        self._keys: List[Tuple[int, int, int]] = []
+        self._filter_keys: List[Tuple[str, str]] = []
+        self._multi = False
+        self._gecmis: Optional[Any] = None
+        self._history: Dict[int, Tuple[bool, bool]] = {}
+        self.selected: set = set()
+
+    # ── Qt modeli ───────────────────────────────────────────────────────────
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._episodes)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._episodes):
+            return None
+        row = index.row()
+        episode = self._episodes[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return str(episode.get("title") or "")
+        if role == Qt.ItemDataRole.ToolTipRole:
+            names = ", ".join(sorted(episode.get("sources") or {})) or "kaynak yok"
+            return f"{episode.get('title') or ''}\nKaynaklar: {names}"
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return (Qt.CheckState.Checked if self._keys[row] in self.selected
+                    else Qt.CheckState.Unchecked)
+        if role == EPISODE_ROLE:
+            return episode
+        if role == KEY_ROLE:
+            return self._keys[row]
+        if role == HISTORY_ROLE:
+            return self.history(row)
+        return None
 
-        self.chk = QCheckBox()
-        self.chk.toggled.connect(lambda state: self.toggled.emit(self.key, state))
-        layout.addWidget(self.chk)
-
-        self.lblHistory = QLabel()
-        self.lblHistory.setFixedWidth(28)
-        self.lblHistory.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.lblHistory.setVisible(False)
-        layout.addWidget(self.lblHistory)
-
-        self.lbl = QLabel(str(episode.get("title") or ""))
-        self.lbl.setWordWrap(False)
-        layout.addWidget(self.lbl, 1)
-
-        self.btnPlay: Optional[QPushButton] = None
-        self.btnDl: Optional[QPushButton] = None
-        self.source_buttons: Dict[str, Tuple[QPushButton, QPushButton]] = {}
-
-        # `multi` listenin tamamına bakar, satıra değil: çok kaynaklı bir listede
-        # tek kaynakta bulunan bölüm de rozet göstermeli, yoksa kullanıcı o
-        # satırın hangi kaynaktan geldiğini bilemez.
-        if multi or len(self.sources) > 1:
-            self._build_multi(layout)
-        else:
-            self._build_single(layout)
+    # ── Yükleme ─────────────────────────────────────────────────────────────
+    def set_episodes(self, episodes: Sequence[Dict[str, Any]], multi: bool) -> None:
+        self.set_prepared(PreparedEpisodes(episodes, gecmis=self._gecmis, multi=multi))
+
+    def set_prepared(self, prepared: PreparedEpisodes) -> None:
+        """Arka planda hazırlanmış listeyi tek sıfırlamayla yerleştir."""
+        self.beginResetModel()
+        self._episodes = prepared.episodes
+        self._keys = prepared.keys
+        self._filter_keys = prepared.filter_keys
+        self._multi = prepared.multi
+        self._gecmis = prepared.gecmis
+        self._history = dict(prepared.history)
+        self.selected.clear()
+        self.endResetModel()
+        self.selection_changed.emit()
 
-        self.setToolTip(self._tooltip())
-        self.apply_history(gecmis)
+    @property
+    def multi(self) -> bool:
+        """Liste çok kaynaklı mı (tek kaynakta bulunan satır da rozet gösterir)."""
+        return self._multi
 
-    # ── Kurulum ─────────────────────────────────────────────────────────────
-    def _build_single(self, layout: QHBoxLayout) -> None:
-        """Tek kaynak: rozet/kısaltma gürültüsü olmadan sade görünüm."""
-        name = next(iter(self.sources), "")
-        entry = self.sources.get(name)
-
-        self.btnPlay = QPushButton("Oynat")
-        self.btnPlay.clicked.connect(lambda: self._emit_play(name))
-        layout.addWidget(self.btnPlay)
-
-        self.btnDl = QPushButton("İndir")
-        self.btnDl.setObjectName("Primary")
-        self.btnDl.clicked.connect(lambda: self._emit_download(name))
-        layout.addWidget(self.btnDl)
-
-        enabled = bool(entry)
-        self.btnPlay.setEnabled(enabled)
-        self.btnDl.setEnabled(enabled)
-        if name:
-            self.source_buttons[name] = (self.btnPlay, self.btnDl)
-
-    def _build_multi(self, layout: QHBoxLayout) -> None:
-        """Çok kaynak: kaynak başına renkli kısaltma + ▶/⬇ ikilisi."""
-        for name in sorted(self.sources):
-            badge = QLabel(source_short(name))
-            badge.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            badge.setFixedWidth(26)
-            badge.setToolTip(name)
-            badge.setStyleSheet(
-                f"background: {source_color(name)}; color: #111111;"
-                "border-radius: 4px; font-size: 10px; font-weight: 700; padding: 2px 0;"
-            )
-            layout.addWidget(badge)
-
-            play = QPushButton("▶")
-            play.setFixedWidth(30)
-            play.setToolTip(f"{name} — oynat")
-            play.clicked.connect(lambda _=False, n=name: self._emit_play(n))
-            layout.addWidget(play)
-
-            download = QPushButton("⬇")
-            download.setFixedWidth(30)
-            download.setToolTip(f"{name} — indir")
-            download.clicked.connect(lambda _=False, n=name: self._emit_download(n))
-            layout.addWidget(download)
-
-            self.source_buttons[name] = (play, download)
-
-    def _tooltip(self) -> str:
-        names = ", ".join(sorted(self.sources)) or "kaynak yok"
-        return f"{self.episode.get('title') or ''}\nKaynaklar: {names}"
+    def episode(self, row: int) -> Dict[str, Any]:
+        return self._episodes[row]
+
+    def key(self, row: int) -> Tuple[int, int, int]:
+        return self._keys[row]
+
+    def matching_rows(self, needle: str) -> List[int]:
+        """Filtreden geçen satırlar — önceden hesaplanmış anahtarlar üzerinden."""
+        if not needle:
+            return list(range(len(self._episodes)))
+        return [row for row, key in enumerate(self._filter_keys)
+                if key_matches(key, needle)]
 
     # ── Geçmiş rozeti ───────────────────────────────────────────────────────
-    def apply_history(self, gecmis: Optional[Any]) -> None:
-        """İzlendi/indirildi rozetini tazele.
+    def set_gecmis(self, gecmis: Optional[Any],
+                   history: Optional[Dict[int, Tuple[bool, bool]]] = None) -> None:
+        """Geçmişi değiştir.
 
-        Bir bölüm birden çok kaynakta olabiliyor; herhangi birinden izlendiyse
-        satır izlenmiş sayılır (kullanıcı hangi kaynaktan açtığını hatırlamaz).
-        `gecmis` None ise ("izlendi ikonu" kapalı) rozet hiç çizilmez.
+        `history` verilmezse rozetler görünen satırlar boyandıkça yeniden
+        hesaplanır.
         """
-        if gecmis is None:
-            self.izlendi = self.indirildi = False
-            self.lblHistory.setVisible(False)
-            return
-        izlendi = indirildi = False
-        for entry in self.sources.values():
-            watched, downloaded = gecmis.durum((entry or {}).get("obj"))
-            izlendi = izlendi or watched
-            indirildi = indirildi or downloaded
-        self.izlendi, self.indirildi = izlendi, indirildi
-
-        parcalar = []
-        if izlendi:
-            parcalar.append(IKON_IZLENDI)
-        if indirildi:
-            parcalar.append(IKON_INDIRILDI)
-        self.lblHistory.setText("".join(parcalar))
-        self.lblHistory.setToolTip(
-            " · ".join(n for n, v in (("izlendi", izlendi), ("indirildi", indirildi)) if v))
-        self.lblHistory.setStyleSheet(
-            "color: #00b894; font-weight: 700;" if izlendi else "color: #74b9ff;")
-        self.lblHistory.setVisible(bool(parcalar))
-
-    # ── Aksiyonlar ──────────────────────────────────────────────────────────
-    def _emit_play(self, name: str) -> None:
-        entry = self.sources.get(name)
-        if entry:
-            self.play_requested.emit(entry)
+        self._gecmis = gecmis
+        self._history = dict(history or {})
+        if self._episodes:
+            self.dataChanged.emit(self.index(0), self.index(len(self._episodes) - 1),
+                                  [HISTORY_ROLE])
 
-    def _emit_download(self, name: str) -> None:
-        entry = self.sources.get(name)
-        if entry:
-            self.download_requested.emit(entry)
+    def history(self, row: int) -> Tuple[bool, bool]:
+        """``(izlendi, indirildi)`` (bkz. `episode_history`).
 
-    # ── Sorgular ────────────────────────────────────────────────────────────
-    @property
-    def entry(self) -> Optional[Dict[str, Any]]:
-        """Varsayılan kaynak kaydı (tek kaynaklı akışlarla uyum için)."""
-        return primary_entry(self.episode)
-
-    def entry_for(self, source: Optional[str]) -> Optional[Dict[str, Any]]:
-        """İstenen kaynağın kaydı; o kaynakta yoksa varsayılana düş."""
-        if source:
-            entry = self.sources.get(source)
-            if entry:
-                return entry
-        return self.entry
+        Geçmiş yoksa ("izlendi ikonu" kapalı) rozet hiç çizilmez.
+        """
+        if self._gecmis is None:
+            return (False, False)
+        cached = self._history.get(row)
+        if cached is None:
+            cached = self._history[row] = episode_history(self._episodes[row],
+                                                          self._gecmis)
+        return cached
+
+    # ── Seçim ───────────────────────────────────────────────────────────────
+    def is_checked(self, row: int) -> bool:
+        return self._keys[row] in self.selected
+
+    def set_checked(self, row: int, checked: bool) -> None:
+        self.select([self._keys[row]], checked)
+
+    def select(self, keys: Sequence[Tuple[int, int, int]], checked: bool) -> None:
+        """Anahtarları seç/bırak; yüklenmemiş ya da filtre dışı satırlar dahil."""
+        if checked:
+            self.selected.update(tuple(k) for k in keys)
+        else:
+            self.selected.difference_update(tuple(k) for k in keys)
+        if self._episodes:
+            # Tek bir sinyal: görünüm yalnızca ekrandaki satırları yeniden boyar.
+            self.dataChanged.emit(self.index(0), self.index(len(self._episodes) - 1),
+                                  [Qt.ItemDataRole.CheckStateRole])
+        self.selection_changed.emit()
 
-    @property
-    def checked(self) -> bool:
-        return self.chk.isChecked()
+    def clear_selection(self) -> None:
+        self.select(list(self.selected), False)
 
-    def set_checked(self, value: bool) -> None:
-        self.chk.setChecked(value)
 
-    def matches(self, needle: str) -> bool:
-        return episode_matches(self.episode, needle)
+class EpisodeFilterProxy(QSortFilterProxyModel):
+    """Metin filtresi: eşleşen satırlar `set_needle`'da tek geçişte bulunur.
+
+    `filterAcceptsRow` yalnızca hazır kümeye bakar; her satır için başlığı
+    yeniden küçültüp aramak gerekmez.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._needle = ""
+        self._accepted: Optional[set] = None
+
+    def needle(self) -> str:
+        return self._needle
+
+    def set_needle(self, needle: str) -> None:
+        model = self.sourceModel()
+        accepted = set(model.matching_rows(needle)) if needle and model else None
+        if hasattr(self, "beginFilterChange"):          # Qt 6.9+
+            self.beginFilterChange()
+            self._needle, self._accepted = needle, accepted
+            self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+        else:
+            self._needle, self._accepted = needle, accepted
+            self.invalidateRowsFilter()
+
+    def refresh(self) -> None:
+        """Kaynak model yeniden yüklendi: filtreyi yeni satırlara uygula."""
+        self.set_needle(self._needle)
+
+    def accepted_source_rows(self) -> List[int]:
+        if self._accepted is None:
+            return list(range(self.sourceModel().rowCount()))
+        return sorted(self._accepted)
+
+    def filterAcceptsRow(self, source_row: int, source_parent) -> bool:  # noqa: N802
+        return self._accepted is None or source_row in self._accepted
+
+
+# ── Satır çizimi ────────────────────────────────────────────────────────────
+class RowGeometry:
+    """Bir satırdaki öğelerin yeri (boyama ve tıklama aynı hesabı kullanır).
+
+    Eski `EpisodeRow` düzeninin birebir karşılığı: solda seçim kutusu ve
+    geçmiş rozeti, ortada başlık, sağda tek kaynakta "Oynat"/"İndir",
+    çok kaynakta kaynak başına renkli kısaltma + ▶/⬇.
+    """
+
+    def __init__(self, rect: QRect, episode: Dict[str, Any], multi: bool,
+                 font: QFont, history: bool):
+        sources = dict(episode.get("sources") or {})
+        fm = QFontMetrics(font)
+        bold = QFont(font)
+        bold.setWeight(QFont.Weight.DemiBold)
+        bfm = QFontMetrics(bold)
+        card = rect.adjusted(0, 0, 0, -ROW_GAP)
+        self.card = card
+        cy = card.center().y()
+        x = card.x() + ROW_MARGIN
+        self.check = QRect(x, cy - 8, 16, 16)
+        x += 16 + ROW_SPACING
+        self.history: Optional[QRect] = None
+        if history:
+            self.history = QRect(x, card.y(), 28, card.height())
+            x += 28 + ROW_SPACING
+
+        # (tür, kaynak, etiket, kutu, etkin mi)
+        self.actions: List[Tuple[str, str, str, QRect, bool]] = []
+        self.badges: List[Tuple[str, QRect]] = []
+        right = card.right() + 1 - ROW_MARGIN
+        bh = fm.height() + 14
+
+        def sag(w: int, h: int) -> QRect:
+            nonlocal right
+            kutu = QRect(right - w, cy - h // 2, w, h)
+            right -= w + ROW_SPACING
+            return kutu
+
+        if multi or len(sources) > 1:
+            for name in reversed(sorted(sources)):
+                enabled = bool(sources.get(name))
+                self.actions.insert(0, ("download", name, "⬇", sag(30, bh), enabled))
+                self.actions.insert(0, ("play", name, "▶", sag(30, bh), enabled))
+                self.badges.insert(0, (name, sag(26, fm.height() + 4)))
+        else:
+            name = next(iter(sources), "")
+            enabled = bool(sources.get(name))
+            dl = sag(bfm.horizontalAdvance("İndir") + 28, bh)
+            play = sag(fm.horizontalAdvance("Oynat") + 28, bh)
+            self.actions = [("play", name, "Oynat", play, enabled),
+                            ("download", name, "İndir", dl, enabled)]
+        self.single = not (multi or len(sources) > 1)
+        self.title = QRect(x, card.y(), max(0, right - x), card.height())
+
+    def action_at(self, pos: QPoint) -> Optional[Tuple[str, str]]:
+        for kind, name, _label, rect, enabled in self.actions:
+            if enabled and rect.contains(pos):
+                return kind, name
+        return None
+
+    def badge_at(self, pos: QPoint) -> Optional[str]:
+        for name, rect in self.badges:
+            if rect.contains(pos):
+                return name
+        return None
+
+
+class EpisodeDelegate(QStyledItemDelegate):
+    """Bölüm satırını boyar; düğmeler widget değil, `RowGeometry` kutuları."""
+
+    def __init__(self, view: "EpisodeListView"):
+        super().__init__(view)
+        self._view = view
+
+    def sizeHint(self, option, index: QModelIndex) -> QSize:  # noqa: N802
+        return QSize(option.rect.width(), ROW_HEIGHT + ROW_GAP)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        episode = index.data(EPISODE_ROLE) or {}
+        izlendi, indirildi = index.data(HISTORY_ROLE) or (False, False)
+        checked = index.data(Qt.ItemDataRole.CheckStateRole) == Qt.CheckState.Checked
+        geo = RowGeometry(option.rect, episode, self._view.source_model().multi,
+                          option.font, izlendi or indirildi)
+        hover = self._view.hovered(index)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(QPen(QColor(BORDER), 1))
+        painter.setBrush(QColor(BG_ELEV))
+        painter.drawRoundedRect(QRectF(geo.card).adjusted(0.5, 0.5, -0.5, -0.5),
+                                RADIUS, RADIUS)
+
+        # Seçim kutusu (`QCheckBox::indicator`)
+        painter.setPen(QPen(QColor(ACCENT if checked else BORDER), 1))
+        painter.setBrush(QColor(ACCENT if checked else BG_ELEV_2))
+        painter.drawRoundedRect(QRectF(geo.check).adjusted(0.5, 0.5, -0.5, -0.5), 4, 4)
+        if checked:
+            painter.setPen(QPen(QColor("#06231d"), 2))
+            c = geo.check
+            painter.drawPolyline([QPoint(c.x() + 4, c.y() + 8), QPoint(c.x() + 7, c.y() + 11),
+                                  QPoint(c.x() + 12, c.y() + 5)])
+
+        bold = QFont(option.font)
+        bold.setWeight(QFont.Weight.Bold)
+        if geo.history is not None:
+            painter.setFont(bold)
+            painter.setPen(QColor("#00b894" if izlendi else "#74b9ff"))
+            metin = (IKON_IZLENDI if izlendi else "") + (IKON_INDIRILDI if indirildi else "")
+            painter.drawText(geo.history, int(Qt.AlignmentFlag.AlignCenter), metin)
+
+        painter.setFont(option.font)
+        painter.setPen(QColor(TEXT))
+        fm = QFontMetrics(option.font)
+        title = fm.elidedText(str(episode.get("title") or ""),
+                              Qt.TextElideMode.ElideRight, geo.title.width())
+        painter.drawText(geo.title, int(Qt.AlignmentFlag.AlignVCenter
+                                        | Qt.AlignmentFlag.AlignLeft), title)
+
+        rozet_font = QFont(option.font)
+        rozet_font.setPixelSize(10)
+        rozet_font.setWeight(QFont.Weight.Bold)
+        for name, rect in geo.badges:
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(source_color(name)))
+            painter.drawRoundedRect(QRectF(rect), 4, 4)
+            painter.setFont(rozet_font)
+            painter.setPen(QColor("#111111"))
+            painter.drawText(rect, int(Qt.AlignmentFlag.AlignCenter), source_short(name))
+
+        demi = QFont(option.font)
+        demi.setWeight(QFont.Weight.DemiBold)
+        for kind, name, label, rect, enabled in geo.actions:
+            primary = geo.single and kind == "download" and enabled
+            ustunde = enabled and hover == (kind, name)
+            if primary:
+                zemin, kenar, yazi = (ACCENT_HOVER if ustunde else ACCENT), None, "#06231d"
+            elif enabled:
+                zemin, kenar, yazi = (BORDER if ustunde else BG_ELEV_2), BORDER, TEXT
+            else:
+                zemin, kenar, yazi = BG_ELEV, BORDER, TEXT_MUTED
+            painter.setPen(QPen(QColor(kenar), 1) if kenar else Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(zemin))
+            painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5),
+                                    RADIUS, RADIUS)
+            painter.setFont(demi if primary else option.font)
+            painter.setPen(QColor(yazi))
+            painter.drawText(rect, int(Qt.AlignmentFlag.AlignCenter), label)
+        painter.restore()
+
+
+class EpisodeListView(QListView):
+    """Sanal bölüm listesi: yalnızca görünen satırlar boyanır.
+
+    Satır yüksekliği sabit (`setUniformItemSizes`), bu yüzden açılış ve
+    kaydırma bölüm sayısından bağımsız. Düğme tıklamaları `RowGeometry`
+    kutularına göre çözülür.
+    """
+
+    #: Kaynak kaydı (`sources[ad]`)
+    play_clicked = Signal(object)
+    download_clicked = Signal(object)
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__(parent)
+        self.setObjectName("EpisodeList")
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setFrameShape(QListView.Shape.NoFrame)
+        self.setMouseTracking(True)
+        self.setItemDelegate(EpisodeDelegate(self))
+        # (görünen satır, düğme türü, kaynak)
+        self._hover: Optional[Tuple[int, str, str]] = None
+        self._skeleton = False
+
+    def set_skeleton(self, on: bool) -> None:
+        """Liste hazırlanırken boş alan yerine iskelet satırlar çiz."""
+        if on != self._skeleton:
+            self._skeleton = on
+            self.viewport().update()
+
+    def is_skeleton(self) -> bool:
+        return self._skeleton
+
+    def source_model(self) -> EpisodeModel:
+        return self.model().sourceModel()
+
+    def geometry_for(self, index: QModelIndex) -> RowGeometry:
+        izlendi, indirildi = index.data(HISTORY_ROLE) or (False, False)
+        return RowGeometry(self.visualRect(index), index.data(EPISODE_ROLE) or {},
+                           self.source_model().multi, self.font(), izlendi or indirildi)
+
+    def action_rect(self, row: int, kind: str, source: Optional[str] = None) -> QRect:
+        """Görünen ``row``'daki düğmenin viewport kutusu (test ve erişim için)."""
+        index = self.model().index(row, 0)
+        for k, name, _label, rect, _enabled in self.geometry_for(index).actions:
+            if k == kind and (source is None or name == source):
+                return rect
+        return QRect()
+
+    def check_rect(self, row: int) -> QRect:
+        return self.geometry_for(self.model().index(row, 0)).check
+
+    def hovered(self, index: QModelIndex) -> Optional[Tuple[str, str]]:
+        if self._hover is not None and self._hover[0] == index.row():
+            return self._hover[1], self._hover[2]
+        return None
+
+    # ── Olaylar ─────────────────────────────────────────────────────────────
+    def paintEvent(self, event):  # noqa: N802 (Qt imzası)
+        if not self._skeleton or self.model().rowCount():
+            super().paintEvent(event)
+            return
+        painter = QPainter(self.viewport())
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setPen(Qt.PenStyle.NoPen)
+        step = ROW_HEIGHT + ROW_GAP
+        width = self.viewport().width()
+        for y in range(0, self.viewport().height(), step):
+            card = QRectF(0, y, width, ROW_HEIGHT)
+            painter.setBrush(QColor(BG_ELEV))
+            painter.drawRoundedRect(card, RADIUS, RADIUS)
+            painter.setBrush(QColor(BG_ELEV_2))
+            painter.drawRoundedRect(QRectF(ROW_MARGIN, y + 13, 16, 16), 4, 4)
+            painter.drawRoundedRect(
+                QRectF(ROW_MARGIN + 16 + ROW_SPACING, y + 15, width * 0.3, 12), 4, 4)
+        painter.end()
+
+    def mousePressEvent(self, event):  # noqa: N802 (Qt imzası)
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        if event.button() == Qt.MouseButton.LeftButton and index.isValid():
+            geo = self.geometry_for(index)
+            row = self.model().mapToSource(index).row()
+            model = self.source_model()
+            if geo.check.adjusted(-4, -4, 4, 4).contains(pos):
+                model.set_checked(row, not model.is_checked(row))
+                event.accept()
+                return
+            hit = geo.action_at(pos)
+            if hit is not None:
+                kind, name = hit
+                entry = (model.episode(row).get("sources") or {}).get(name)
+                if entry:
+                    (self.play_clicked if kind == "play" else self.download_clicked).emit(entry)
+                event.accept()
+                return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):  # noqa: N802 (Qt imzası)
+        pos = event.position().toPoint()
+        index = self.indexAt(pos)
+        hover = None
+        if index.isValid():
+            hit = self.geometry_for(index).action_at(pos)
+            if hit is not None:
+                hover = (index.row(), hit[0], hit[1])
+        self._set_hover(hover)
+        super().mouseMoveEvent(event)
+
+    def viewportEvent(self, event) -> bool:  # noqa: N802 (Qt imzası)
+        tur = event.type()
+        if tur == QEvent.Type.Leave:
+            self._set_hover(None)
+        elif tur == QEvent.Type.ToolTip:
+            index = self.indexAt(event.pos())
+            if index.isValid():
+                geo = self.geometry_for(index)
+                hit = geo.action_at(event.pos())
+                badge = geo.badge_at(event.pos())
+                if hit is not None and not geo.single:
+                    text = f"{hit[1]} — {'oynat' if hit[0] == 'play' else 'indir'}"
+                elif geo.history is not None and geo.history.contains(event.pos()):
+                    izlendi, indirildi = index.data(HISTORY_ROLE)
+                    text = " · ".join(n for n, v in (("izlendi", izlendi),
+                                                     ("indirildi", indirildi)) if v)
+                elif badge is not None:
+                    text = badge
+                else:
+                    text = index.data(Qt.ItemDataRole.ToolTipRole)
+                QToolTip.showText(event.globalPos(), text, self.viewport())
+                return True
+        return super().viewportEvent(event)
+
+    def _set_hover(self, hover: Optional[Tuple[int, str, str]]) -> None:
+        if hover == self._hover:
+            return
+        eski, self._hover = self._hover, hover
+        self.viewport().setCursor(Qt.CursorShape.PointingHandCursor if hover
+                                  else Qt.CursorShape.ArrowCursor)
+        for h in (eski, hover):
+            if h is not None:
+                self.viewport().update(self.visualRect(self.model().index(h[0], 0)))
 
 
 # ── Sayfa ───────────────────────────────────────────────────────────────────
@@ -350,26 +802,40 @@ class EpisodePage(QWidget):
 
     play_requested = Signal(object)
     download_requested = Signal(object)
+    #: Hazırlanan liste modele yerleşti (boş liste dahil)
+    list_ready = Signal()
+    #: `refresh_history` sonrası rozetler tazelendi
+    history_ready = Signal()
 
     def __init__(self, parent: Optional[QWidget] = None):
         super().__init__(parent)
-        self._sources: Dict[str, List[Dict[str, Any]]] = {}
         self._all: List[Dict[str, Any]] = []
-        self._rows: List[EpisodeRow] = []
-        # Seçim satırda değil ANAHTARDA: yüklenmemiş sayfalardaki bölümler de
-        # "Tümünü Seç" ile seçilebilmeli (eski GUI davranışı).
-        self._selected: set = set()
-        self._needle = ""
-        self._shown = 0
         self._busy = False
         self._context = ("", "", "")
-        # Geçmiş tek seferde okunur; satır başına dosya açmak birkaç yüz
-        # bölümlük listede gözle görülür gecikme demek.
+        # Her `load` yeni bir istek; geç gelen eski hazırlık sonucu atılır.
+        self._request_id = 0
+        # Geçmiş tek seferde (arka planda) okunur; satır başına dosya açmak
+        # birkaç yüz bölümlük listede gözle görülür gecikme demek.
         self._gecmis: Optional[prefs.Gecmis] = None
 
+        # Seçim satırda değil ANAHTARDA (`EpisodeModel.selected`): filtre
+        # dışındaki bölümler de "Tümünü Seç" ile seçilebilmeli.
+        self.model = EpisodeModel(self)
+        self.model.selection_changed.connect(self._update_selection_label)
+        self.proxy = EpisodeFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(
+            lambda: self._apply_filter(self.txtFilter.text()))
+
         self.signals = WorkerSignals()
-        self.signals.connect_found(self._on_episodes)
-        self.signals.connect_error(self._on_error)
+        self.signals.connect_found(self._on_prepared)
+        self.signals.connect_error_item(self._on_error)
+        self.history_signals = WorkerSignals()
+        self.history_signals.connect_found(self._on_history)
 
         self._build_ui()
 
@@ -397,7 +863,7 @@ class EpisodePage(QWidget):
         self.txtFilter = QLineEdit()
         self.txtFilter.setPlaceholderText("Bölüm ara…")
         self.txtFilter.setClearButtonEnabled(True)
-        self.txtFilter.textChanged.connect(self._apply_filter)
+        self.txtFilter.textChanged.connect(self._schedule_filter)
         tools.addWidget(self.txtFilter, 1)
 
         self.lblSelected = QLabel("0 seçili")
@@ -415,21 +881,11 @@ class EpisodePage(QWidget):
         tools.addWidget(self.btnDlSel)
         layout.addLayout(tools)
 
-        self.scroll = QScrollArea()
-        self.scroll.setWidgetResizable(True)
-        self.scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        holder = QWidget()
-        self._list = QVBoxLayout(holder)
-        self._list.setContentsMargins(0, 0, 0, 0)
-        self._list.setSpacing(6)
-        self._list.setAlignment(Qt.AlignmentFlag.AlignTop)
-        self.scroll.setWidget(holder)
-        layout.addWidget(self.scroll, 1)
-
-        self.btnMore = QPushButton("Daha fazla yükle")
-        self.btnMore.clicked.connect(self._load_more)
-        self.btnMore.hide()
-        layout.addWidget(self.btnMore)
+        self.view = EpisodeListView()
+        self.view.setModel(self.proxy)
+        self.view.play_clicked.connect(self.play_requested.emit)
+        self.view.download_clicked.connect(self.download_requested.emit)
+        layout.addWidget(self.view, 1)
 
         self.lblStatus.info("Arama sonucundan bir anime seçin.")
 
@@ -447,43 +903,55 @@ class EpisodePage(QWidget):
             self.lblStatus.info("Önceki istek sürüyor, lütfen bekleyin…")
             return
         self._busy = episodes is None
+        self._request_id += 1
         # Yeni anime: seçim durumunu ve "Tümünü Seç" etiketini sıfırla, aksi
         # hâlde buton "Seçimi Kaldır" derken hiçbir satır seçili olmaz.
         self.btnAll.setChecked(False)
         self.txtFilter.clear()
-        self._selected.clear()
-        self._needle = ""
+        self._apply_filter("")
         self._context = (source, slug, title)
-        self._reload_gecmis()
         self.lblTitle.setText(f"{title} — {source}")
         self.lblSources.setVisible(False)
-        self._clear_rows()
-        self.btnMore.hide()
+        self._all = []
+        self.model.set_episodes([], False)
+        self.view.set_skeleton(True)
         if episodes is not None:
-            self._on_episodes(episodes)
+            self.lblStatus.info("Bölümler hazırlanıyor…")
+            run_bg(self._do_prepare, self._request_id, source, title, episodes,
+                   signals=self.signals, interactive=True)
             return
         self.lblStatus.info("Bölümler getiriliyor…")
-        run_bg(self._do_load, source, slug, title, signals=self.signals)
+        run_bg(self._do_load, self._request_id, source, slug, title,
+               signals=self.signals)
 
-    def _do_load(self, source: str, slug: str, title: str) -> None:
+    def _do_load(self, rid: int, source: str, slug: str, title: str) -> None:
         try:
             episodes = fetch_episodes(source, slug, title)
         except UnsupportedSource as exc:
-            self.signals.emit_error(str(exc))
+            self.signals.emit_error_item((rid, str(exc)))
             return
-        self.signals.emit_found(episodes)
+        self._do_prepare(rid, source, title, episodes)
 
-    def _on_episodes(self, episodes: Any) -> None:
+    def _do_prepare(self, rid: int, source: str, title: str, episodes: Any) -> None:
+        """Arka planda: birleştir, geçmişi oku, satır anahtarlarını hesapla."""
+        try:
+            prepared = prepare_episodes(source, title, episodes)
+        except Exception as exc:
+            self.signals.emit_error_item((rid, f"Bölüm listesi hazırlanamadı: {exc}"))
+            return
+        self.signals.emit_found((rid, prepared))
+
+    def _on_prepared(self, payload: Tuple[int, PreparedEpisodes]) -> None:
+        rid, prepared = payload
+        if rid != self._request_id:
+            return
         self._busy = False
+        self.view.set_skeleton(False)
         source, _slug, title = self._context
-        self._sources = as_sources_data(source, episodes)
-        # Anime adı birleştiriciye veriliyor: kaynaklar başlığa adı da yazıyor
-        # ("86 2nd Season 5. Bölüm") ve addaki rakamlar bölüm/sezon sanılırsa
-        # aynı bölüm kaynak başına ayrı satır olur.
-        self._all = merge_episodes(self._sources, title)
-        self._selected.clear()
-
-        names = active_sources(self._sources)
+        self._all = prepared.episodes
+        self._gecmis = prepared.gecmis
+
+        names = prepared.names
         if len(names) > 1:
             self.lblTitle.setText(f"{title} — {len(names)} kaynak")
             self.lblSources.setText("Kaynaklar: " + ", ".join(names))
@@ -491,103 +959,98 @@ class EpisodePage(QWidget):
         else:
             self.lblSources.setVisible(False)
 
+        self.model.set_prepared(prepared)
+        self.proxy.refresh()
+        self.list_ready.emit()
         if not self._all:
             self.lblStatus.error("Bu kaynakta bölüm bulunamadı.")
-            self._update_selection_label()
             return
-        self._shown = 0
-        self._load_more()
         suffix = f" • {len(names)} kaynak" if len(names) > 1 else ""
         self.lblStatus.ok(f"{len(self._all)} bölüm{suffix}")
-        self._update_selection_label()
 
-    def _on_error(self, message: str) -> None:
+    def _on_error(self, payload: Tuple[int, str]) -> None:
+        rid, message = payload
+        if rid != self._request_id:
+            return
         self._busy = False
+        self.view.set_skeleton(False)
         self.lblStatus.error(message)
 
     # ── Geçmiş ──────────────────────────────────────────────────────────────
-    def _reload_gecmis(self) -> None:
-        """Geçmişi diskten oku (ayar kapalıysa rozet hiç çizilmesin diye None)."""
-        self._gecmis = prefs.Gecmis.yukle() if prefs.oku().izlendi_ikonu else None
-
     def refresh_history(self) -> None:
-        """Oynatma/indirme bitince rozetleri tazele (GUI thread'inden)."""
-        self._reload_gecmis()
-        for row in self._rows:
-            row.apply_history(self._gecmis)
-
-    # ── Liste yönetimi ──────────────────────────────────────────────────────
-    def _clear_rows(self) -> None:
-        while self._list.count():
-            item = self._list.takeAt(0)
-            w = item.widget()
-            if w is not None:
-                w.setParent(None)
-                w.deleteLater()
-        self._rows = []
-        self._shown = 0
-
-    def _load_more(self) -> None:
-        chunk = self._all[self._shown:self._shown + PAGE_SIZE]
-        multi = len(active_sources(self._sources)) > 1
-        for episode in chunk:
-            row = EpisodeRow(episode, multi=multi, gecmis=self._gecmis)
-            row.play_requested.connect(self.play_requested.emit)
-            row.download_requested.connect(self.download_requested.emit)
-            row.toggled.connect(self._on_row_toggled)
-            # Satır sonradan yüklendiyse seçim zaten anahtarda olabilir.
-            if row.key in self._selected:
-                row.set_checked(True)
-            self._list.addWidget(row)
-            self._rows.append(row)
-        self._shown += len(chunk)
-        self.btnMore.setVisible(self._shown < len(self._all))
-        self.btnMore.setText(
-            f"Daha fazla yükle ({len(self._all) - self._shown} kaldı)"
-        )
-        self._apply_filter(self.txtFilter.text())
+        """Oynatma/indirme bitince rozetleri tazele.
+
+        Ayar ve geçmiş dosyası arka planda okunur; rozetler hazır olunca
+        yerleşir (bkz. `history_ready`).
+        """
+        run_bg(self._do_history, self._request_id, list(self._all),
+               signals=self.history_signals, interactive=True)
+
+    def _do_history(self, rid: int, episodes: List[Dict[str, Any]]) -> None:
+        gecmis = load_gecmis()
+        history = ({row: episode_history(e, gecmis) for row, e in enumerate(episodes)}
+                   if gecmis is not None else {})
+        self.history_signals.emit_found((rid, gecmis, history))
+
+    def _on_history(self, payload: Tuple[int, Any, Dict[int, Tuple[bool, bool]]]) -> None:
+        rid, gecmis, history = payload
+        if rid != self._request_id:
+            return
+        self._gecmis = gecmis
+        self.model.set_gecmis(gecmis, history)
+        self.history_ready.emit()
+
+    # ── Filtre ve seçim ─────────────────────────────────────────────────────
+    def _schedule_filter(self, _text: str = "") -> None:
+        """Her tuşta değil, yazma durunca süz (bkz. `FILTER_DEBOUNCE_MS`)."""
+        self._filter_timer.start()
+
+    def _flush_filter(self) -> None:
+        """Bekleyen filtre varsa hemen uygula.
+
+        Seçim ve indirme kullanıcının YAZDIĞI filtreye göre çalışmalı: "3"
+        yazıp gecikme dolmadan "Tümünü Seç"e basan 12 bölüm seçmemeli.
+        """
+        if self._filter_timer.isActive():
+            self._apply_filter(self.txtFilter.text())
 
     def _apply_filter(self, text: str) -> None:
-        self._needle = (text or "").strip().lower()
-        for row in self._rows:
-            row.filtered_out = bool(self._needle) and not row.matches(self._needle)
-            row.setVisible(not row.filtered_out)
+        self._filter_timer.stop()
+        needle = (text or "").strip().lower()
+        if needle != self.proxy.needle():
+            self.proxy.set_needle(needle)
         self._update_selection_label()
 
+    @property
+    def _needle(self) -> str:
+        return self.proxy.needle()
+
     def _toggle_all(self, checked: bool) -> None:
-        """Filtreden geçen TÜM bölümleri seç/bırak (yüklenmemişler dahil)."""
+        """Filtreden geçen TÜM bölümleri seç/bırak."""
         self.btnAll.setText("Seçimi Kaldır" if checked else "Tümünü Seç")
-        for episode in self.filtered_episodes():
-            key = _key_of(episode)
-            if checked:
-                self._selected.add(key)
-            else:
-                self._selected.discard(key)
-        for row in self._rows:
-            if not row.filtered_out:
-                row.set_checked(checked)
-        self._update_selection_label()
+        self._flush_filter()
+        self.model.select([self.model.key(r) for r in self.proxy.accepted_source_rows()],
+                          checked)
 
     def _on_row_toggled(self, key, checked: bool) -> None:
-        if checked:
-            self._selected.add(tuple(key))
-        else:
-            self._selected.discard(tuple(key))
-        self._update_selection_label()
+        self.model.select([tuple(key)], checked)
 
     def _update_selection_label(self) -> None:
         self.lblSelected.setText(f"{len(self.selected_episodes())} seçili")
 
     # ── Sorgular ────────────────────────────────────────────────────────────
-    def visible_rows(self) -> List[EpisodeRow]:
-        """Filtreden geçen satırlar (Qt görünürlüğünden bağımsız)."""
-        return [r for r in self._rows if not r.filtered_out]
+    def visible_rows(self) -> List[Dict[str, Any]]:
+        """Filtreden geçen bölümler, listede göründükleri sırayla."""
+        self._flush_filter()
+        return [self.proxy.index(i, 0).data(EPISODE_ROLE)
+                for i in range(self.proxy.rowCount())]
 
     def filtered_episodes(self) -> List[Dict[str, Any]]:
-        """Filtreden geçen birleşik bölümler — henüz yüklenmemişler dahil."""
+        """Filtreden geçen birleşik bölümler."""
+        self._flush_filter()
         if not self._needle:
             return list(self._all)
-        return [e for e in self._all if episode_matches(e, self._needle)]
+        return [self._all[r] for r in self.proxy.accepted_source_rows()]
 
     def selected_episodes(self) -> List[Dict[str, Any]]:
         """Seçili VE filtreden geçen birleşik bölümler.
@@ -596,7 +1059,10 @@ class EpisodePage(QWidget):
         bölümleri işaretliyor; burada filtreyi yok sayarsak kullanıcı 200 bölümü
         seçip sonra "12" diye filtreleyince yine 200 bölüm indirilir.
         """
-        return [e for e in self.filtered_episodes() if _key_of(e) in self._selected]
+        selected = self.model.selected
+        if not selected:
+            return []
+        return [e for e in self.filtered_episodes() if _key_of(e) in selected]
 
     def selected_entries(self, source: Optional[str] = None) -> List[Dict[str, Any]]:
         """Seçili bölümlerin kaynak kayıtları (istenirse belirli kaynaktan)."""
@@ -666,6 +1132,9 @@ def _key_of(episode: Dict[str, Any]) -> Tuple[int, int, int]:
             int(episode.get("sub") or 0))
 
 
-__all__ = ["EpisodePage", "EpisodeRow", "SourceSelectDialog", "as_sources_data",
-           "active_sources", "episode_matches", "primary_entry", "source_counts",
-           "source_short", "source_color"]
+__all__ = ["EpisodePage", "EpisodeModel", "EpisodeFilterProxy", "EpisodeDelegate",
+           "EpisodeListView", "SourceSelectDialog", "PreparedEpisodes",
+           "prepare_episodes", "merge_cached", "clear_merge_cache", "payload_hash",
+           "episode_history", "as_sources_data",
+           "active_sources", "episode_matches", "filter_key", "key_matches",
+           "primary_entry", "source_counts", "source_short", "source_color"]
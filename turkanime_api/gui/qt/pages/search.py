@@ -3,17 +3,19 @@
 Eski GUI'deki `SearchWorker` + `display_search_results` akışının Qt karşılığı.
 Arama işi `common.adapters.SearchEngine` üzerinden yürür (kaynak listesi orada
 tanımlı; AnimeDepo dahil), bu yüzden kaynak eklemek bu sayfada değişiklik
-gerektirmez.
+gerektirmez. Kartlar her kaynak bittiğinde eklenir; en yavaş kaynağı beklemek
+yalnızca son sayacı geciktirir.
 """
 from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSize, Qt, Signal
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QVBoxLayout, QWidget
 
-from ..widgets import AnimeCard, StatusLabel
-from ..workers import WorkerSignals, run_bg
+from ..images import gorsel_servisi
+from ..widgets import CardItem, StatusLabel
+from ..workers import LANE_PREFETCH, WorkerSignals, current_token, run_bg
 from ._grid import CardGrid
 
 # Kaynak başına gösterilecek azami sonuç
@@ -25,19 +27,27 @@ class SearchPage(QWidget):
 
     # (source_name, slug, title)
     anime_selected = Signal(str, str, str)
-    # (AnimeCard, görsel baytları) — arka plandan UI thread'ine
+    # (CardItem, kart boyutunda QImage) — arka plandan UI thread'ine
     thumb_ready = Signal(object, object)
+    # (arama no, kaynak, kayıtlar) — her kaynak bittiğinde, arka plandan
+    source_ready = Signal(int, str, object)
 
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
         self._busy = False
         self._query = ""
-        self._cards: List[AnimeCard] = []
+        self._cards: List[CardItem] = []
+        # Sürmekte olan aramada yerleştirilmiş kaynaklar → kartları
+        self._source_cards: Dict[str, List[CardItem]] = {}
+        self._search_id = 0
+        # Son aramanın ilk/son sonuç süreleri (`SearchEngine.son_olcum`)
+        self.last_timing = None
 
         self.signals = WorkerSignals()
         self.signals.connect_found(self._on_results)
         self.signals.connect_error(self._on_error)
         self.thumb_ready.connect(self._apply_thumb)
+        self.source_ready.connect(self._on_source_ready)
 
         self._build_ui()
 
@@ -60,6 +70,8 @@ class SearchPage(QWidget):
         # Keşif sayfasıyla aynı ızgara: kartlar üste hizalı, sütunlar eşit
         # genişlikte, artan yer altta.
         self.results = CardGrid()
+        self.results.card_clicked.connect(self._on_card_clicked)
+        self.results.thumbnails_needed.connect(self._request_thumbs)
         layout.addWidget(self.results, 1)
 
         self.lblStatus.info("Aramak için yukarıdaki kutuyu kullanın.")
@@ -77,48 +89,115 @@ class SearchPage(QWidget):
         self._query = query
         self.lblTitle.setText(f"Arama — “{query}”")
         self._cards = []
+        self._source_cards = {}
+        self._search_id += 1
         self.results.clear()
         self.lblStatus.info("Kaynaklarda aranıyor…")
 
-        run_bg(self._do_search, query, signals=self.signals)
+        run_bg(self._do_search, self._search_id, query, signals=self.signals)
 
-    def _do_search(self, query: str) -> None:
+    def _do_search(self, search_id: int, query: str) -> None:
         """Arka plan thread'i: tüm kaynaklarda paralel ara."""
         from ....common.adapters import SearchEngine
 
         engine = SearchEngine()
+
+        def kaynak_bitti(source: str, items: List[Dict[str, Any]]) -> None:
+            self.source_ready.emit(search_id, source, items)
+
         # Zengin sözleşme: kapak görseli sağlayabilen kaynaklar (AniList) görsel
         # URL'si de döndürür; sağlamayanlar image=None ile sarılır.
-        results = engine.search_all_sources_rich(query, limit_per_source=LIMIT_PER_SOURCE)
-        # Sinyal kuyruklu bağlandığı için slot GUI thread'inde çalışır.
+        results = engine.search_all_sources_rich(
+            query, limit_per_source=LIMIT_PER_SOURCE, on_result=kaynak_bitti)
+        self.last_timing = getattr(engine, "son_olcum", None)
+        # Sinyal kuyruklu bağlandığı için slot GUI thread'inde çalışır; aynı
+        # thread'den yayılan `source_ready`'ler bundan önce işlenir.
         self.signals.emit_found(results)
 
-    def cards(self) -> List[AnimeCard]:
+    def cards(self) -> List[CardItem]:
         """Ekrandaki kartlar (test ve köprüleme için) — `DiscoverPage` ile aynı."""
         return list(self._cards)
 
-    def _fetch_thumb(self, card, url: str) -> None:
-        """Arka plan: görseli indir, baytları UI thread'ine taşı.
+    def _request_thumbs(self, cards: List[CardItem]) -> None:
+        """Izgara görünür alana giren kartların kapağını istedi."""
+        for card in cards:
+            if not card.load_cached_thumbnail():
+                # Önden yükleme şeridi: tıklanan işin önüne geçmez, sayfa
+                # gizlenince bekleyenler iptal edilir (bkz. `workers`).
+                run_bg(self._fetch_thumb, card, card.image_url,
+                       card.thumbnail_target(), lane=LANE_PREFETCH, owner=self)
+
+    def _fetch_thumb(self, card, url: str, hedef: QSize) -> None:
+        """Arka plan: görseli indir ve kart boyutunda çöz, `QImage`'ı taşı.
 
-        Widget'a burada DOKUNULMAZ; yalnızca sinyal yayılır (kart bu arada
-        silinmiş olabilir, o yüzden slot tarafında da kontrol var).
+        Karta burada DOKUNULMAZ; yalnızca sinyal yayılır (kart bu arada
+        ızgaradan atılmış olabilir, o yüzden slot tarafında da kontrol var).
         """
         try:
-            import requests
-            data = requests.get(url, timeout=10).content
+            img = gorsel_servisi().kucuk_resim(url, hedef)
         except Exception:
             return
-        if data:
-            self.thumb_ready.emit(card, data)
+        # İndirme sürerken sayfa gizlendiyse çözülen görsel kimseye gitmesin.
+        current_token().raise_if_cancelled()
+        if img is not None:
+            self.thumb_ready.emit(card, img)
 
-    def _apply_thumb(self, card, data: bytes) -> None:
-        """GUI thread'i: görseli karta yerleştir (kart hâlâ yaşıyorsa)."""
-        try:
-            card.set_thumbnail(data)
-        except RuntimeError:
-            pass          # kart bu arada silinmiş (yeni arama)
+    def _apply_thumb(self, card, img) -> None:
+        """GUI thread'i: görseli karta yerleştir.
+
+        Kart bu arada atıldıysa (yeni arama) ızgaraya bağı kopmuştur;
+        kapak yalnızca artık gösterilmeyen nesneye yazılır.
+        """
+        card.set_thumbnail(img)
 
     # ── Sonuç işleme (GUI thread'i) ─────────────────────────────────────────
+    def _build_cards(self, source: str, items) -> List[CardItem]:
+        """Bir kaynağın kayıtlarını karta çevir; bozuk/slug'sız kayıtlar atlanır."""
+        cards: List[CardItem] = []
+        for item in items or []:
+            # Tek bozuk kayıt (eski demet biçimi, None…) tüm sonuç ekranını
+            # götürmemeli: slot içindeki istisna Qt sinyal yolunda yutulur,
+            # geriye yalnızca "aranıyor…"da donmuş bir sayfa kalırdı.
+            if not isinstance(item, dict):
+                continue
+            slug = item.get("slug") or ""
+            # Slug'sız kayıt tıklanabilir ama işe yaramaz: bölüm sayfası boş
+            # slug'la sorgulanır ve kullanıcı sessiz bir hiçlikle karşılaşır.
+            # Kaydı hiç göstermemek, ölü kart göstermekten dürüst.
+            if not slug:
+                continue
+            title = item.get("title") or slug
+            image = item.get("image")
+            card = CardItem(title, source, payload=(source, slug, title),
+                            image_url=image)
+            cards.append(card)
+        return cards
+
+    def _place_source(self, source: str, items) -> None:
+        """Kaynağın kartlarını alfabetik kaynak sırasındaki yerine ekle.
+
+        Önceden yerleşmiş kartlara dokunulmaz (`set_items` onları silerdi);
+        görseller ızgara kartları görünür alana aldıkça, arka planda indirilir
+        (`CardGrid.thumbnails_needed`).
+        """
+        cards = self._build_cards(source, items)
+        self._source_cards[source] = cards
+        if not cards:
+            return
+        index = sum(len(c) for s, c in self._source_cards.items() if s < source)
+        self._cards[index:index] = cards
+        self.results.insert_items(index, cards)
+
+    def _on_source_ready(self, search_id: int, source: str, items) -> None:
+        """Bir kaynak bitti: kartlarını hemen göster (eski aramanınkiler atılır)."""
+        if search_id != self._search_id or not self._busy:
+            return
+        if source in self._source_cards or not isinstance(items, list):
+            return
+        self._place_source(source, items)
+        if self._cards:
+            self.lblStatus.info(f"{len(self._cards)} sonuç — aranıyor…")
+
     def _on_results(self, results: Dict[str, List[Dict[str, Any]]]) -> None:
         """Kaynak → kayıt listesi eşlemesini karta çevir.
 
@@ -127,60 +206,38 @@ class SearchPage(QWidget):
         süre eski `search_all_sources` sözleşmesini (`Tuple[str, str]`) iddia
         ediyordu; gövde en baştan sözlük okuduğu için çalışıyordu ama okuyan
         kişiyi gövdeyi "düzeltmeye" davet ediyordu.
+
+        Akışla zaten yerleşmiş kaynaklar yeniden kurulmaz; yalnızca eksik
+        kalanlar eklenir ve son sayaç yazılır.
         """
         self._busy = False
         if not isinstance(results, dict):
+            self._source_cards = {}
             self.lblStatus.error("Beklenmeyen arama sonucu.")
             return
 
-        cards: List[AnimeCard] = []
-        per_source: List[str] = []
-        pending_thumbs = []
+        if not self._source_cards:
+            # Akış yoksa (ya da hiçbir kaynak henüz gelmediyse) baştan kur.
+            self._cards = []
+            self.results.clear()
         for source, items in sorted(results.items()):
-            if not items:
-                continue
-            eklenen = 0
-            for item in items:
-                # Tek bozuk kayıt (eski demet biçimi, None…) tüm sonuç ekranını
-                # götürmemeli: slot içindeki istisna Qt sinyal yolunda yutulur,
-                # geriye yalnızca "aranıyor…"da donmuş bir sayfa kalırdı.
-                if not isinstance(item, dict):
-                    continue
-                slug = item.get("slug") or ""
-                # Slug'sız kayıt tıklanabilir ama işe yaramaz: bölüm sayfası boş
-                # slug'la sorgulanır ve kullanıcı sessiz bir hiçlikle karşılaşır.
-                # Kaydı hiç göstermemek, ölü kart göstermekten dürüst.
-                if not slug:
-                    continue
-                title = item.get("title") or slug
-                image = item.get("image")
-                card = AnimeCard(title, source, payload=(source, slug, title),
-                                 image_url=image)
-                card.clicked.connect(self._on_card_clicked)
-                cards.append(card)
-                eklenen += 1
-                if image:
-                    pending_thumbs.append((card, image))
-            # Sayaç atılan kayıtları değil GÖSTERİLENLERİ saymalı; aksi hâlde
-            # kaynak dökümünün toplamı üstteki toplamı tutmuyordu.
-            if eklenen:
-                per_source.append(f"{source}: {eklenen}")
+            if source not in self._source_cards:
+                self._place_source(source, items)
 
-        if not cards:
+        # Sayaç atılan kayıtları değil GÖSTERİLENLERİ saymalı; aksi hâlde
+        # kaynak dökümünün toplamı üstteki toplamı tutmuyordu.
+        per_source = [f"{source}: {len(cards)}"
+                      for source, cards in sorted(self._source_cards.items()) if cards]
+        self._source_cards = {}
+
+        if not self._cards:
             # Önceki aramanın kartları ekranda kalmamalı: "sonuç bulunamadı"
             # yazarken altta eski sonuçları göstermek doğrudan yalan olurdu.
-            self._cards = []
             self.results.clear()
             self.lblStatus.error(f"“{self._query}” için sonuç bulunamadı.")
             return
 
-        self._cards = cards
-        self.results.set_items(list(cards))
-        self.lblStatus.ok(f"{len(cards)} sonuç — " + ", ".join(per_source))
-
-        # Görseller kartlar yerleştikten SONRA, arka planda indirilir.
-        for card, url in pending_thumbs:
-            run_bg(self._fetch_thumb, card, url)
+        self.lblStatus.ok(f"{len(self._cards)} sonuç — " + ", ".join(per_source))
 
     def _on_error(self, message: str) -> None:
         self._busy = False
@@ -2,7 +2,7 @@
 
 Eski GUI'deki `show_watchlist` + `load_watchlist` + `create_watchlist_card`
 üçlüsünün karşılığı. Kart ızgarası keşif sayfasıyla aynı bileşenleri kullanır
-(`AnimeCard`, `CardGrid`); tek fark kartın altına eklenen ilerleme
+(`CardItem`, `CardGrid`); tek fark kartın altına eklenen ilerleme
 çubuğu, kullanıcı skoru ve durum rozetidir.
 
 Eski sürümde giriş yapılmamış kullanıcı yalnızca kırmızı bir durum satırı
@@ -13,73 +13,89 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
 from PySide6.QtWidgets import (
-    QComboBox, QFrame, QHBoxLayout, QLabel, QProgressBar, QPushButton,
-    QVBoxLayout, QWidget,
+    QComboBox, QFrame, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget,
 )
 
 from ..anilist import (
     DURUM_ETIKETI, DURUM_RENGI, DURUMLAR, AniListService,
 )
-from ..theme import ACCENT, TEXT_MUTED
-from ..widgets import AnimeCard, StatusLabel
+from ..images import gorsel_servisi
+from ..theme import ACCENT, BG_ELEV_2, TEXT_MUTED
+from ..widgets import CardItem, StatusLabel, small_font
 from ._grid import CardGrid
-from ..workers import run_bg
+from ..workers import LANE_PREFETCH, current_token, run_bg
 from .discover import anime_title, cover_url
 
 # Keşif kartından yüksek: ilerleme çubuğu + skor satırı ekleniyor.
 KART_YUKSEKLIGI = 172
+# Ek satırlar arası boşluk ve ilerleme çubuğu kalınlığı
+_ARALIK = 4
+_CUBUK = 6
 
 
-class WatchlistCard(AnimeCard):
-    """Kapak + başlık + durum rozeti + "İzlenen: x/y" + kullanıcı skoru."""
+class WatchlistCard(CardItem):
+    """Kapak + başlık + durum rozeti + "İzlenen: x/y" + kullanıcı skoru.
 
-    def __init__(self, media: Dict[str, Any], parent: Optional[QWidget] = None):
+    Izgaradaki diğer kartlar gibi widget değil veridir; ek satırlar
+    `paint_extra` ile başlığın altına boyanır.
+    """
+
+    #: Kapaksız kart: keşif kartından yüksek (ilerleme + skor satırı)
+    compact_height = KART_YUKSEKLIGI
+
+    def __init__(self, media: Dict[str, Any]):
         durum = str(media.get("user_status") or "")
-        super().__init__(anime_title(media),
-                         DURUM_ETIKETI.get(durum, durum or "—"),
-                         payload=media, image_url=cover_url(media),
-                         parent=parent)
-        self.setFixedHeight(KART_YUKSEKLIGI)
+        etiket = DURUM_ETIKETI.get(durum, durum or "—")
         self.durum = durum
-        self.lblSource.setStyleSheet(
-            f"color: {DURUM_RENGI.get(durum, TEXT_MUTED)};"
-            " font-size: 11px; font-weight: 600;")
-
         self.izlenen = _sayi(media.get("user_progress"))
         self.toplam = _sayi(media.get("episodes"))
         self.skor = _sayi(media.get("user_score"))
-
-        self.lblProgress = QLabel(
-            f"İzlenen: {self.izlenen}/{self.toplam or '?'}")
-        self.lblProgress.setStyleSheet(f"color: {ACCENT}; font-size: 11px;")
-        self.col.addWidget(self.lblProgress)
-
-        self.barProgress = QProgressBar()
-        self.barProgress.setTextVisible(False)
-        self.barProgress.setFixedHeight(6)
-        if self.toplam > 0:
-            self.barProgress.setRange(0, self.toplam)
-            # Bölüm sayısı AniList'te yayın sürerken artabiliyor; izlenen sayı
-            # toplamı geçerse çubuk taşar.
-            self.barProgress.setValue(min(self.izlenen, self.toplam))
-        else:
-            # Toplam bilinmiyor (devam eden yayın): dolu çubuk yanıltıcı olur.
-            self.barProgress.setRange(0, 1)
-            self.barProgress.setValue(0)
-        self.col.addWidget(self.barProgress)
-
-        self.lblScore = QLabel(f"★ {self.skor:g}" if self.skor else "Puansız")
-        self.lblScore.setStyleSheet(
-            f"color: {'#ffd93d' if self.skor else TEXT_MUTED}; font-size: 11px;")
-        self.col.addWidget(self.lblScore)
-
-        self.setToolTip("\n".join([
-            self.lblTitle.text(),
-            self.lblProgress.text(),
-            f"Durum: {self.lblSource.text()}",
-        ]))
+        self.progress_text = f"İzlenen: {self.izlenen}/{self.toplam or '?'}"
+        self.score_text = f"★ {self.skor:g}" if self.skor else "Puansız"
+        title = anime_title(media)
+        super().__init__(title, etiket, payload=media, image_url=cover_url(media),
+                         tooltip="\n".join([title, self.progress_text,
+                                            f"Durum: {etiket}"]),
+                         badge_color=DURUM_RENGI.get(durum, TEXT_MUTED))
+
+    def progress_ratio(self) -> float:
+        """Çubuğun doluluk oranı.
+
+        Bölüm sayısı AniList'te yayın sürerken artabiliyor; izlenen sayı
+        toplamı geçerse çubuk taşmasın. Toplam bilinmiyorsa (devam eden yayın)
+        dolu çubuk yanıltıcı olur, boş kalır.
+        """
+        if self.toplam <= 0:
+            return 0.0
+        return min(self.izlenen, self.toplam) / self.toplam
+
+    def extra_height(self, font: QFont) -> int:
+        satir = QFontMetrics(small_font(font)).lineSpacing()
+        return _ARALIK + satir + _ARALIK + _CUBUK + _ARALIK + satir
+
+    def paint_extra(self, painter: QPainter, rect: QRect, font: QFont) -> None:
+        kucuk = small_font(font)
+        fm = QFontMetrics(kucuk)
+        painter.setFont(kucuk)
+        y = rect.y() + _ARALIK
+        painter.setPen(QColor(ACCENT))
+        painter.drawText(rect.x(), y + fm.ascent(), self.progress_text)
+        y += fm.lineSpacing() + _ARALIK
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(BG_ELEV_2))
+        painter.drawRoundedRect(QRectF(rect.x(), y, rect.width(), _CUBUK), 3, 3)
+        dolu = int(rect.width() * self.progress_ratio())
+        if dolu > 0:
+            painter.setBrush(QColor(ACCENT))
+            painter.drawRoundedRect(QRectF(rect.x(), y, dolu, _CUBUK), 3, 3)
+        y += _CUBUK + _ARALIK
+
+        painter.setPen(QColor("#ffd93d" if self.skor else TEXT_MUTED))
+        painter.drawText(rect.x(), y + fm.ascent(), self.score_text)
 
 
 def _sayi(deger: Any) -> int:
@@ -181,6 +197,8 @@ class WatchlistPage(QWidget):
         layout.addWidget(self.pnlLogin)
 
         self.results = CardGrid()
+        self.results.card_clicked.connect(self._on_card_clicked)
+        self.results.thumbnails_needed.connect(self._request_thumbs)
         layout.addWidget(self.results, 1)
 
     # ── Durum ───────────────────────────────────────────────────────────────
@@ -252,14 +270,8 @@ class WatchlistPage(QWidget):
         self.results.set_items(list(cards))
         self.lblStatus.ok(f"{len(cards)} anime")
 
-        for card in cards:
-            if card.image_url:
-                run_bg(self._fetch_thumb, card, card.image_url)
-
     def _make_card(self, media: Dict[str, Any]) -> WatchlistCard:
-        card = WatchlistCard(media)
-        card.clicked.connect(self._on_card_clicked)
-        return card
+        return WatchlistCard(media)
 
     def _on_failed(self, message: str) -> None:
         self._busy = False
@@ -304,21 +316,27 @@ class WatchlistPage(QWidget):
             self.anime_selected.emit(payload)
 
     # ── Kapak görselleri ────────────────────────────────────────────────────
-    def _fetch_thumb(self, card: WatchlistCard, url: str) -> None:
-        """Arka plan: görseli indir, baytları sinyalle taşı (widget'a dokunma)."""
+    def _request_thumbs(self, cards: List[WatchlistCard]) -> None:
+        """Izgara görünür alana giren kartların kapağını istedi."""
+        for card in cards:
+            if not card.load_cached_thumbnail():
+                run_bg(self._fetch_thumb, card, card.image_url,
+                       card.thumbnail_target(), lane=LANE_PREFETCH, owner=self)
+
+    def _fetch_thumb(self, card: WatchlistCard, url: str,
+                     hedef: QSize) -> None:
+        """Arka plan: indir, kart boyutunda çöz, sinyalle taşı (karta dokunma)."""
         try:
-            import requests
-            data = requests.get(url, timeout=10).content
+            img = gorsel_servisi().kucuk_resim(url, hedef)
         except Exception:
             return
-        if data:
-            self.thumb_ready.emit(card, data)
+        current_token().raise_if_cancelled()
+        if img is not None:
+            self.thumb_ready.emit(card, img)
 
-    def _apply_thumb(self, card: Any, data: bytes) -> None:
-        try:
-            card.set_thumbnail(data)
-        except RuntimeError:
-            pass                    # kart bu arada silinmiş (yenileme)
+    def _apply_thumb(self, card: Any, img) -> None:
+        # Yenilemede atılan kartın ızgarayla bağı kopuk; yazmak zararsız.
+        card.set_thumbnail(img)
 
 
 __all__ = ["WatchlistPage", "WatchlistCard", "KART_YUKSEKLIGI"]
@@ -21,8 +21,17 @@ from PySide6.QtWidgets import (
 )
 
 from . import prefs
-from .workers import run_bg
-from ...common import requirements as core
+from .workers import LANE_BACKGROUND, LANE_INTERACTIVE, run_bg
+
+
+def _core():
+    """`common.requirements` (requests'i çeker); yalnızca iş anında yüklenir.
+
+    Servis açılışta kuruluyor ama denetim ilk kareden sonra başlıyor; modülü
+    baştan içe aktarmak pencerenin görünmesini boşuna geciktiriyordu.
+    """
+    from ...common import requirements as core
+    return core
 
 
 class RequirementsService(QObject):
@@ -49,11 +58,12 @@ class RequirementsService(QObject):
             return False
         # subprocess çağrıları (araç başına `--version`) saniyeler sürebiliyor;
         # açılışta arayüzü bekletmemek için arka planda.
-        run_bg(self._denetle)
+        run_bg(self._denetle,
+               lane=LANE_INTERACTIVE if kullanici_istegi else LANE_BACKGROUND)
         return True
 
     def _denetle(self) -> None:
-        eksikler = core.eksik_araclar()
+        eksikler = _core().eksik_araclar()
         if eksikler:
             self.missing_found.emit(eksikler)
         else:
@@ -71,6 +81,7 @@ class RequirementsService(QObject):
     def _kur(self, eksikler: List[str]) -> None:
         sonuclar: List[Tuple[str, bool, str]] = []
         try:
+            core = _core()
             try:
                 liste = core.gereksinim_listesi_getir()
             except Exception as exc:
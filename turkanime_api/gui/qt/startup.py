@@ -0,0 +1,153 @@
+"""Açılış zaman çizelgesi ve ilk çizimden sonraki arka plan ısınması.
+
+Soğuk açılış yavaşladığında nerede yavaşladığı görünmüyordu: `app.py` bütün
+sayfaları, servisleri ve onların çektiği ağır modülleri (yt-dlp, requests,
+kaynak adapter'ları) pencere gösterilmeden önce kuruyordu. Artık sayfalar ilk
+ziyarette kuruluyor, ağır modüller ilk kareden sonra arka planda ısınıyor ve
+her aşamanın süresi `Timeline`'a yazılıyor:
+
+- `~/.turkanime/acilis.log` her açılışta son raporla değiştirilir,
+- `TURKANIME_ACILIS_RAPORU=1` ortam değişkeni raporu stderr'e de basar,
+- ana pencerede Ctrl+Shift+T raporu bir diyalogda gösterir.
+
+Modül Qt'siz; CLI de aynı çizelgeyi kullanabilir.
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+LOG_PATH = Path.home() / ".turkanime" / "acilis.log"
+RAPOR_ORTAM_ANAHTARI = "TURKANIME_ACILIS_RAPORU"
+
+# İlk kareden sonra arka planda yüklenen modüller. Sıra önemli: önce ilk
+# aramanın ihtiyacı olanlar, en son oynatma/indirme zinciri. Kaynaklar tek tek
+# yazılı: `turkanime_api.sources` tembel paket (PEP 562), onu yüklemek hiçbir
+# kaynak modülünü yüklemez.
+WARMUP_MODULES = (
+    "requests",
+    "rapidfuzz",
+    "turkanime_api.common.adapters",
+    "turkanime_api.sources.animecix",
+    "turkanime_api.sources.anizle",
+    "turkanime_api.sources.tranime",
+    "turkanime_api.sources.animedepo",
+    "turkanime_api.sources.openani",
+    "turkanime_api.sources.tranimaci",
+    "turkanime_api.sources.adapter",
+    "yt_dlp",
+    "turkanime_api.objects",
+)
+
+
+class Timeline:
+    """Açılış aşamaları ve süreleri (ms).
+
+    `mark` ardışık aşamalar içindir: süre bir önceki işaretten bu yana
+    ölçülür. `measure` ise bağımsız bir işin (bir sayfanın kurulumu, arka
+    plandaki bir import) kendi süresini kaydeder; ana akışın işaretini
+    kaydırmaz.
+    """
+
+    def __init__(self, saat: Callable[[], float] = time.perf_counter):
+        self._saat = saat
+        self._baslangic = self._son = saat()
+        self._asamalar: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    def mark(self, ad: str) -> float:
+        simdi = self._saat()
+        with self._lock:
+            sure = (simdi - self._son) * 1000
+            self._son = simdi
+            self._asamalar.append((ad, sure))
+        return sure
+
+    def record(self, ad: str, ms: float) -> None:
+        with self._lock:
+            self._asamalar.append((ad, ms))
+
+    @contextmanager
+    def measure(self, ad: str) -> Iterator[None]:
+        t0 = self._saat()
+        try:
+            yield
+        finally:
+            self.record(ad, (self._saat() - t0) * 1000)
+
+    def phases(self) -> List[Tuple[str, float]]:
+        with self._lock:
+            return list(self._asamalar)
+
+    def phase(self, ad: str) -> Optional[float]:
+        """``ad`` aşamasının süresi (birden çok kez kaydedildiyse sonuncusu)."""
+        for isim, ms in reversed(self.phases()):
+            if isim == ad:
+                return ms
+        return None
+
+    def elapsed(self) -> float:
+        """Çizelge başından bu yana geçen süre (ms)."""
+        return (self._saat() - self._baslangic) * 1000
+
+    def report(self) -> str:
+        satirlar = [f"{ms:9.1f} ms  {ad}" for ad, ms in self.phases()]
+        satirlar.append(f"{self.elapsed():9.1f} ms  toplam (çizelge başından)")
+        return "\n".join(satirlar)
+
+    def write(self, path: Optional[Path] = None) -> bool:
+        """Raporu diske yaz (atomik); yazılamazsa açılış etkilenmez."""
+        hedef = Path(path or LOG_PATH)
+        try:
+            hedef.parent.mkdir(parents=True, exist_ok=True)
+            gecici = hedef.with_suffix(hedef.suffix + ".tmp")
+            gecici.write_text(self.report() + "\n", encoding="utf-8")
+            os.replace(gecici, hedef)
+        except OSError:
+            return False
+        return True
+
+
+# Çizelge bu modül içe aktarıldığında başlar; `app.py` onu ilk iş yükler.
+_timeline = Timeline()
+
+
+def timeline() -> Timeline:
+    """Süreç genelindeki açılış çizelgesi."""
+    return _timeline
+
+
+def warm_up(tl: Optional[Timeline] = None,
+            modules: Tuple[str, ...] = WARMUP_MODULES) -> List[str]:
+    """Ağır modülleri yükle (arka plan thread'inde çağrılır).
+
+    Opsiyonel bir paket (ör. rapidfuzz) kurulu değilse atlanır. Dönüş:
+    yüklenemeyen modüller.
+    """
+    tl = tl or _timeline
+    eksik: List[str] = []
+    for ad in modules:
+        with tl.measure(f"ısınma: {ad}"):
+            try:
+                importlib.import_module(ad)
+            except Exception:
+                eksik.append(ad)
+    return eksik
+
+
+def finish(tl: Optional[Timeline] = None) -> None:
+    """Açılış bitti: raporu yaz, istenirse stderr'e bas."""
+    tl = tl or _timeline
+    tl.write()
+    if os.environ.get(RAPOR_ORTAM_ANAHTARI):
+        print("[açılış]\n" + tl.report(), file=sys.stderr)
+
+
+__all__ = ["Timeline", "timeline", "warm_up", "finish", "LOG_PATH",
+           "WARMUP_MODULES", "RAPOR_ORTAM_ANAHTARI"]
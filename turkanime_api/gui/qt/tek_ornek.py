@@ -0,0 +1,242 @@
+"""Tek örnek koruması: ikinci açılış argümanlarını çalışan pencereye devreder.
+
+Eskiden her `turkanime-gui` çağrısı yeni bir pencere, yeni bir indirme
+kuyruğu ve yeni bir arka plan havuzu açıyordu; iki pencere aynı geçmiş ve
+ayar dosyalarına yazıp birbirinin kaydını eziyordu. Artık ilk açılış bir
+`QLocalServer` dinler; sonraki açılış `QLocalSocket` ile bağlanır, isteğini
+(arama, anime, indirme) tek satır JSON olarak gönderir, onayı alınca çıkar.
+
+Devir yolu `app` modülünü (ve PySide6 widget'larını) **yüklemez**: yalnızca
+QtNetwork. İkinci açılış böylece milisaniyeler içinde biter.
+
+Komut satırı::
+
+    turkanime-gui --ara "frieren"
+    turkanime-gui --anime AnimeciX:12345 --baslik "Frieren"
+    turkanime-gui --anime AnimeciX:12345 --indir 1,3-5
+
+Çöken bir örneğin bıraktığı soket dosyası (Unix) yeni örneğin dinlemesini
+engellemez: adres doluysa ve kimse cevap vermiyorsa dosya silinip yeniden
+dinlenir (bkz. `TekOrnekSunucu.dinle`).
+"""
+from __future__ import annotations
+
+import argparse
+import getpass
+import json
+import os
+import re
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+# Testler ve taşınabilir kurulumlar sunucu adını ortamdan değiştirebilir.
+AD_ORTAM_ANAHTARI = "TURKANIME_TEK_ORNEK"
+
+# Çalışan örneğin onayı için beklenen süre (ms). Olay döngüsü meşgulse
+# (ör. bir sayfa kuruluyor) onay birkaç yüz ms gecikebilir.
+ILETIM_ZAMAN_ASIMI = 1500
+# Bağlantı denemesi (ms): soket yoksa ya da ölü ise anında döner.
+BAGLANTI_ZAMAN_ASIMI = 200
+
+ONAY = b"ok\n"
+# Bir istek bundan büyükse bozuk/yabancı bağlantı sayılır.
+AZAMI_ISTEK = 64 * 1024
+
+
+def sunucu_adi() -> str:
+    """Kullanıcıya özel sunucu adı: başka kullanıcının örneğine bağlanılmaz."""
+    ad = os.environ.get(AD_ORTAM_ANAHTARI)
+    if ad:
+        return ad
+    try:
+        kullanici = getpass.getuser()
+    except Exception:
+        kullanici = "kullanici"
+    return "turkanime-gui-" + (re.sub(r"[^A-Za-z0-9_.-]", "_", kullanici) or "kullanici")
+
+
+# ── Argümanlar ─────────────────────────────────────────────────────────────
+def _bolumler(deger: str) -> List[int]:
+    """``"1,3-5"`` → ``[1, 3, 4, 5]`` (1'den başlayan sıra numaraları)."""
+    sonuc: List[int] = []
+    for parca in deger.split(","):
+        parca = parca.strip()
+        if not parca:
+            continue
+        bas, _, son = parca.partition("-")
+        try:
+            ilk, sonuncu = int(bas), int(son or bas)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"geçersiz bölüm aralığı: {parca!r}") from None
+        if ilk < 1 or sonuncu < ilk:
+            raise argparse.ArgumentTypeError(f"geçersiz bölüm aralığı: {parca!r}")
+        sonuc.extend(n for n in range(ilk, sonuncu + 1) if n not in sonuc)
+    if not sonuc:
+        raise argparse.ArgumentTypeError("en az bir bölüm verilmeli")
+    return sonuc
+
+
+def _ayristirici() -> argparse.ArgumentParser:
+    ayr = argparse.ArgumentParser(
+        prog="turkanime-gui",
+        description="TürkAnime GUI. Uygulama açıksa istek açık pencereye iletilir.")
+    ayr.add_argument("--ara", metavar="SORGU", help="kaynaklarda ara")
+    ayr.add_argument("--anime", metavar="KAYNAK:SLUG",
+                     help="animenin detay sayfasını aç (ör. AnimeciX:12345)")
+    ayr.add_argument("--baslik", metavar="BASLIK", help="--anime için görünen ad")
+    ayr.add_argument("--indir", metavar="BOLUMLER", type=_bolumler,
+                     help="--anime'nin bu bölümlerini indirme kuyruğuna al (ör. 1,3-5)")
+    return ayr
+
+
+def istegi_coz(argv: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Komut satırını devredilebilir bir isteğe çevir.
+
+    Tanınmayan argümanlar (Qt'nin kendi ``-platform`` vb. seçenekleri)
+    yok sayılır; hatalı kullanımda argparse mesajı basıp çıkar.
+    """
+    ayr = _ayristirici()
+    args, _ = ayr.parse_known_args(sys.argv[1:] if argv is None else list(argv))
+    istek: Dict[str, Any] = {}
+    if args.ara and args.ara.strip():
+        istek["ara"] = args.ara.strip()
+    if args.anime:
+        kaynak, ayrac, slug = args.anime.partition(":")
+        if not (ayrac and kaynak.strip() and slug.strip()):
+            ayr.error(f"--anime KAYNAK:SLUG biçiminde olmalı: {args.anime!r}")
+        istek["anime"] = {"kaynak": kaynak.strip(), "slug": slug.strip(),
+                          "baslik": (args.baslik or "").strip() or slug.strip()}
+    if args.indir:
+        if "anime" not in istek:
+            ayr.error("--indir için --anime gerekli")
+        istek["indir"] = args.indir
+    return istek
+
+
+# ── İstemci ────────────────────────────────────────────────────────────────
+def ilet(istek: Dict[str, Any], ad: Optional[str] = None,
+         zaman_asimi_ms: int = ILETIM_ZAMAN_ASIMI) -> bool:
+    """İsteği çalışan örneğe gönder; onay geldiyse True.
+
+    Olay döngüsü gerekmez (engelleyen `waitFor*` çağrıları): `QApplication`
+    kurulmadan, pencere modülleri yüklenmeden çalışır.
+    """
+    soket = QLocalSocket()
+    soket.connectToServer(ad or sunucu_adi())
+    if not soket.waitForConnected(min(BAGLANTI_ZAMAN_ASIMI, zaman_asimi_ms)):
+        return False
+    try:
+        soket.write(json.dumps(istek, ensure_ascii=False).encode("utf-8") + b"\n")
+        if not soket.waitForBytesWritten(zaman_asimi_ms):
+            return False
+        cevap = b""
+        while not cevap.endswith(b"\n"):
+            if not soket.waitForReadyRead(zaman_asimi_ms):
+                return False
+            cevap += bytes(soket.readAll().data())
+        return cevap == ONAY
+    finally:
+        soket.abort()
+
+
+def devret(argv: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+    """Çalışan örnek varsa isteği ona ilet ve None döndür; yoksa isteği döndür.
+
+    Giriş noktaları bunu `app`'i yüklemeden önce çağırır: None gelirse
+    süreç hemen çıkar.
+    """
+    istek = istegi_coz(argv)
+    return None if ilet(istek) else istek
+
+
+# ── Sunucu ─────────────────────────────────────────────────────────────────
+class TekOrnekSunucu(QObject):
+    """Çalışan örneğin ucu: gelen her istek `istek_geldi` ile yayılır.
+
+    Onay, istek yayılmadan önce yazılır: isteği işlemek (sayfa kurmak,
+    arama başlatmak) ikinci açılışı bekletmemeli.
+    """
+
+    istek_geldi = Signal(dict)
+
+    def __init__(self, ad: Optional[str] = None, parent: QObject | None = None):
+        super().__init__(parent)
+        self.ad = ad or sunucu_adi()
+        self._sunucu = QLocalServer(self)
+        # Unix'te soket dosyası yalnızca bu kullanıcıya açık olsun.
+        self._sunucu.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self._sunucu.newConnection.connect(self._baglanti_geldi)
+        self._tamponlar: Dict[QLocalSocket, bytes] = {}
+
+    def dinle(self) -> bool:
+        """Dinlemeye başla; ad canlı bir örnekteyse False.
+
+        Canlılık `listen`'dan önce sorulur: `UserAccessOption` ile Qt soketi
+        geçici bir dizinde kurup hedefin üstüne taşır, yani canlı bir örneğin
+        adını da sessizce devralırdı. Adres doluysa ama bağlanan olmuyorsa
+        soket dosyası çökmüş bir örnekten kalmıştır: silinir ve yeniden denenir.
+        """
+        if _canli_mi(self.ad):
+            return False
+        if self._sunucu.listen(self.ad):
+            return True
+        if self._sunucu.serverError() != QAbstractSocket.SocketError.AddressInUseError:
+            return False
+        QLocalServer.removeServer(self.ad)
+        return self._sunucu.listen(self.ad)
+
+    def kapat(self) -> None:
+        self._sunucu.close()
+
+    def dinliyor_mu(self) -> bool:
+        return self._sunucu.isListening()
+
+    def _baglanti_geldi(self) -> None:
+        while self._sunucu.hasPendingConnections():
+            soket = self._sunucu.nextPendingConnection()
+            self._tamponlar[soket] = b""
+            soket.readyRead.connect(lambda s=soket: self._oku(s))
+            soket.disconnected.connect(lambda s=soket: self._birak(s))
+
+    def _oku(self, soket: QLocalSocket) -> None:
+        tampon = self._tamponlar.get(soket, b"") + bytes(soket.readAll().data())
+        if b"\n" not in tampon:
+            if len(tampon) > AZAMI_ISTEK:
+                soket.abort()
+            else:
+                self._tamponlar[soket] = tampon
+            return
+        satir = tampon.split(b"\n", 1)[0]
+        self._tamponlar[soket] = b""
+        try:
+            istek = json.loads(satir.decode("utf-8"))
+        except ValueError:
+            soket.abort()
+            return
+        if not isinstance(istek, dict):
+            soket.abort()
+            return
+        soket.write(ONAY)
+        soket.flush()
+        soket.disconnectFromServer()
+        self.istek_geldi.emit(istek)
+
+    def _birak(self, soket: QLocalSocket) -> None:
+        self._tamponlar.pop(soket, None)
+        soket.deleteLater()
+
+
+def _canli_mi(ad: str) -> bool:
+    soket = QLocalSocket()
+    soket.connectToServer(ad)
+    try:
+        return soket.waitForConnected(BAGLANTI_ZAMAN_ASIMI)
+    finally:
+        soket.abort()
+
+
+__all__ = ["TekOrnekSunucu", "devret", "ilet", "istegi_coz", "sunucu_adi",
+           "AD_ORTAM_ANAHTARI"]
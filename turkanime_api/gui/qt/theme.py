@@ -62,6 +62,13 @@ QFrame#CardBadgeFlat, QFrame#CardBadgeFlat QLabel {{
     border: none;
 }}
 
+/* Sanal kart ızgarası ve bölüm listesi: satırları delegate boyar,
+   görünümün kendi zemini ve çerçevesi olmamalı. */
+QListView#CardGrid, QListView#EpisodeList {{
+    background: transparent;
+    border: none;
+}}
+
 QFrame#Header {{
     background-color: {BG_ELEV};
     border: none;
@@ -16,7 +16,7 @@ from PySide6.QtWidgets import (
 )
 
 from . import prefs
-from .workers import run_bg
+from .workers import LANE_BACKGROUND, LANE_INTERACTIVE, run_bg
 from ...common import updater
 
 
@@ -47,7 +47,9 @@ class UpdateService(QObject):
         `sessiz=True` (açılış denetimi) hata yaymaz: kullanıcı uygulamayı anime
         izlemek için açtı, GitHub'a erişilemedi diye uyarı görmesinin anlamı yok.
         """
-        run_bg(self._kontrol, bool(sessiz))
+        # Açılış denetimi arka plan şeridinde; elle istenen denetim beklenir.
+        run_bg(self._kontrol, bool(sessiz),
+               lane=LANE_BACKGROUND if sessiz else LANE_INTERACTIVE)
 
     def _kontrol(self, sessiz: bool) -> None:
         try:
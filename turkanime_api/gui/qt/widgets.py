@@ -1,16 +1,22 @@
 """Yeniden kullanılabilir Qt widget'ları (eski CTk kart/ızgara mantığının karşılığı)."""
 from __future__ import annotations
 
-from typing import Any, List, Optional
+import math
+from typing import Any, Callable, List, Optional
 
-from PySide6.QtCore import QSize, Qt, Signal
-from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtCore import QRect, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import (
+    QColor, QFont, QFontMetrics, QImage, QPainter, QPen, QPixmap,
+)
 from PySide6.QtWidgets import (
     QFrame, QHBoxLayout, QLabel, QSizePolicy,
     QStyle, QStyleOption, QVBoxLayout, QWidget,
 )
 
-from .theme import ACCENT, BG_ELEV_2, TEXT_MUTED
+from .images import gorsel_servisi, kucult
+from .theme import (
+    ACCENT, BG_ELEV, BG_ELEV_2, BORDER, RADIUS, TEXT, TEXT_MUTED,
+)
 
 CARD_MIN_WIDTH = 210
 CARD_HEIGHT = 116          # yalnızca kapaksız (kompakt) kartlar için
@@ -21,6 +27,48 @@ POSTER_RATIO = 3 / 2       # yükseklik / genişlik
 CARD_PAD = 6               # kart kenar boşluğu (poster bu kadar içeride kalır)
 BADGE_INSET = 6            # rozetin poster köşesine uzaklığı
 TITLE_LINES = 2            # başlık en çok kaç satır
+# Kapak bu adımlarla yukarı yuvarlanmış boyutta çözülür: yakın genişlikteki
+# kartlar önbellekte aynı küçültülmüş pixmap'i paylaşır.
+THUMB_STEP = 64
+
+
+def elide_lines(text: str, fm: QFontMetrics, avail: int,
+                max_lines: int = TITLE_LINES) -> List[str]:
+    """Metni ``avail`` genişliğinde en çok ``max_lines`` satıra sar ve kırp.
+
+    `ElidedLabel` ile ızgara delegesi aynı kuralı kullanır; kart widget'ı da
+    boyanan kart da başlığı aynı yerden böler.
+    """
+    text = " ".join((text or "").split())
+    if not text:
+        return []
+    if avail <= 0:
+        # Henüz yerleşmemiş widget: genişlik bilinmeden kırpmak, metni
+        # sebepsiz "…"e indirirdi.
+        return [text]
+
+    lines: List[str] = []
+    current = ""
+    for word in text.split(" "):
+        trial = f"{current} {word}" if current else word
+        if not current or fm.horizontalAdvance(trial) <= avail:
+            current = trial
+        else:
+            lines.append(current)
+            current = word
+    if current:
+        lines.append(current)
+
+    if len(lines) > max_lines:
+        kalan = " ".join(lines[max_lines - 1:])
+        lines = lines[:max_lines - 1] + [kalan]
+
+    # Tek kelime satırdan uzun olabilir (uzun Japonca isim); o da kırpılır.
+    return [
+        line if fm.horizontalAdvance(line) <= avail
+        else fm.elidedText(line, Qt.TextElideMode.ElideRight, avail)
+        for line in lines
+    ]
 
 
 class ElidedLabel(QLabel):
@@ -57,38 +105,8 @@ class ElidedLabel(QLabel):
     # ── Sarma / kırpma ──────────────────────────────────────────────────────
     def visible_lines(self, width: Optional[int] = None) -> List[str]:
         """Gerçekten çizilen satırlar (kırpılmış hâlleriyle)."""
-        text = " ".join((self.text() or "").split())
-        if not text:
-            return []
         avail = self.width() if width is None else int(width)
-        if avail <= 0:
-            # Henüz yerleşmemiş widget: genişlik bilinmeden kırpmak, metni
-            # sebepsiz "…"e indirirdi.
-            return [text]
-
-        fm = self.fontMetrics()
-        lines: List[str] = []
-        current = ""
-        for word in text.split(" "):
-            trial = f"{current} {word}" if current else word
-            if not current or fm.horizontalAdvance(trial) <= avail:
-                current = trial
-            else:
-                lines.append(current)
-                current = word
-        if current:
-            lines.append(current)
-
-        if len(lines) > self._max_lines:
-            kalan = " ".join(lines[self._max_lines - 1:])
-            lines = lines[:self._max_lines - 1] + [kalan]
-
-        # Tek kelime satırdan uzun olabilir (uzun Japonca isim); o da kırpılır.
-        return [
-            line if fm.horizontalAdvance(line) <= avail
-            else fm.elidedText(line, Qt.TextElideMode.ElideRight, avail)
-            for line in lines
-        ]
+        return elide_lines(self.text(), self.fontMetrics(), avail, self._max_lines)
 
     def is_elided(self) -> bool:
         """Başlık sığmadığı için kısaltıldı mı?"""
@@ -114,6 +132,23 @@ class ElidedLabel(QLabel):
             y += fm.lineSpacing()
 
 
+def _thumbnail_pixmap(image_url: Optional[str], data,
+                      hedef: QSize) -> Optional[QPixmap]:
+    """Kapak verisini (QPixmap / QImage / bayt) ``hedef`` boyutlu pixmap'e çevir.
+
+    Olağan yol worker'da zaten küçültülmüş bir `QImage`'dır; ham bayt (eski
+    çağıranlar) burada yine küçültülerek çözülür. Çözülemezse ``None``.
+    """
+    if isinstance(data, QPixmap):
+        return data if not data.isNull() else None
+    if data is None or (not isinstance(data, QImage) and not data):
+        return None
+    if image_url:
+        return gorsel_servisi().pixmap(image_url, data, hedef)
+    img = data if isinstance(data, QImage) else kucult(data, hedef)
+    return QPixmap.fromImage(img) if img is not None and not img.isNull() else None
+
+
 class AnimeCard(QFrame):
     """Tek bir anime sonucunu temsil eden tıklanabilir poster kartı.
 
@@ -134,7 +169,9 @@ class AnimeCard(QFrame):
         self.image_url = image_url
         self._poster_mode = bool(image_url)
         self._poster_size = (0, 0)
-        self._src_pixmap: Optional[QPixmap] = None   # ham kapak (yeniden ölçek için)
+        # Poster kutusu boyutunda çözülmüş kapak (yeniden ölçek için); tam
+        # çözünürlüklü görüntü kartta tutulmaz.
+        self._src_pixmap: Optional[QPixmap] = None
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setMinimumWidth(CARD_MIN_WIDTH)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
@@ -276,18 +313,47 @@ class AnimeCard(QFrame):
         self._apply_geometry()
 
     # ── Genel API ───────────────────────────────────────────────────────────
-    def set_thumbnail(self, data: bytes) -> None:
-        """İndirilen görsel baytlarını karta yerleştir (GUI thread'inden çağrılmalı)."""
-        if not data:
-            return
-        pix = QPixmap()
-        if not pix.loadFromData(data):
+    def thumbnail_target(self) -> QSize:
+        """Kapağın çözüleceği boyut: poster kutusu, fiziksel piksel, yuvarlı.
+
+        GUI thread'inde okunup worker'a verilir (`GorselServisi.kucuk_resim`).
+        """
+        # Kapaksız açılmış kartta poster gizli, genişliği anlamsız: kart
+        # poster kipine geçince alacağı genişlik kullanılır.
+        pw = self._poster_width() if self._poster_mode \
+            else max(self.width(), CARD_MIN_WIDTH) - 2 * CARD_PAD
+        dpr = max(1.0, self.devicePixelRatioF())
+        w = math.ceil(pw * dpr / THUMB_STEP) * THUMB_STEP
+        return QSize(w, int(round(w * POSTER_RATIO)))
+
+    def set_thumbnail(self, data) -> None:
+        """Kapağı karta yerleştir (GUI thread'inden çağrılmalı).
+
+        Olağan yol worker'da `thumbnail_target()` boyutunda çözülmüş bir
+        `QImage`'dır; burada yalnızca pixmap'e çevrilir. Hazır `QPixmap` olduğu
+        gibi, ham bayt ise (eski çağıranlar) yine küçültülerek çözülür.
+        """
+        pix = _thumbnail_pixmap(self.image_url, data, self.thumbnail_target())
+        if pix is None:
             return
         self._src_pixmap = pix
         self._enable_poster()
         self._poster_size = (0, 0)        # ölçeklemeyi zorla
         self._apply_geometry()
 
+    def load_cached_thumbnail(self) -> bool:
+        """Kapak bellekte çözülmüş duruyorsa hemen uygula.
+
+        ``False`` dönerse indirme arka plana kuyruklanmalıdır.
+        """
+        if not self.image_url:
+            return False
+        pix = gorsel_servisi().pixmap(self.image_url, hedef=self.thumbnail_target())
+        if pix is None:
+            return False
+        self.set_thumbnail(pix)
+        return True
+
     def resizeEvent(self, event):  # noqa: N802 (Qt imzası)
         super().resizeEvent(event)
         self._apply_geometry()
@@ -302,6 +368,203 @@ class AnimeCard(QFrame):
         super().mousePressEvent(event)
 
 
+# ── Boyanan kart (sanal ızgara) ─────────────────────────────────────────────
+# Izgara (`pages/_grid.CardGrid`) kart başına widget kurmaz: kartlar
+# `CardItem` verisi olarak tutulur ve yalnızca görünen satırlar aşağıdaki
+# `paint_card` ile boyanır. Ölçüler `AnimeCard` ile birebir aynıdır (kenarlık
+# + `CARD_PAD` + 2:3 poster + iki satırlık başlık); görünüm tek yerden
+# değişsin diye renkler de tema sabitlerinden gelir.
+CARD_BORDER = 1
+BADGE_FONT_PX = 11
+
+
+def small_font(base: QFont, bold: bool = False) -> QFont:
+    """Rozet / ilerleme satırlarının 11px yazısı."""
+    font = QFont(base)
+    font.setPixelSize(BADGE_FONT_PX)
+    if bold:
+        font.setWeight(QFont.Weight.DemiBold)
+    return font
+
+
+class CardItem:
+    """Izgaradaki tek kartın verisi (widget değil).
+
+    `AnimeCard`'ın kapak API'si korunur (`thumbnail_target`,
+    `set_thumbnail`, `load_cached_thumbnail`); sayfalar kapak indirme yolunu
+    değiştirmeden kullanır. Kapak gelince ızgara `_on_changed` ile haberdar
+    edilir ve yalnızca o satır yeniden boyanır.
+    """
+
+    #: Kapaksız (kompakt) kartın sabit yüksekliği
+    compact_height = CARD_HEIGHT
+
+    def __init__(self, title: str, source: str, payload: Any = None,
+                 image_url: Optional[str] = None, tooltip: Optional[str] = None,
+                 badge_color: str = ACCENT):
+        self.title = title
+        self.source = source
+        self.payload = payload
+        self.image_url = image_url
+        self.tooltip = tooltip if tooltip is not None else f"{title}\nKaynak: {source}"
+        self.badge_color = badge_color
+        # Poster kutusu boyutunda çözülmüş kapak; tam boy görüntü tutulmaz.
+        self.pixmap: Optional[QPixmap] = None
+        # Izgara yerleşince güncellenir (bkz. `CardGrid._relayout`).
+        self.poster_width = CARD_MIN_WIDTH - 2 * (CARD_PAD + CARD_BORDER)
+        self.device_pixel_ratio = 1.0
+        self.thumb_requested = False
+        self._scaled: Optional[QPixmap] = None
+        self._on_changed: Optional[Callable[["CardItem"], None]] = None
+
+    @property
+    def poster_mode(self) -> bool:
+        """Kapaklı kart mı? Kapaksız açılıp sonradan görsel alan da sayılır."""
+        return bool(self.image_url) or self.pixmap is not None
+
+    def thumbnail_target(self) -> QSize:
+        """Kapağın çözüleceği boyut (bkz. `AnimeCard.thumbnail_target`)."""
+        dpr = max(1.0, self.device_pixel_ratio)
+        w = math.ceil(self.poster_width * dpr / THUMB_STEP) * THUMB_STEP
+        return QSize(w, int(round(w * POSTER_RATIO)))
+
+    def set_thumbnail(self, data) -> None:
+        """Kapağı yerleştir ve ızgaraya yalnızca bu kartı yeniden boyat."""
+        pix = _thumbnail_pixmap(self.image_url, data, self.thumbnail_target())
+        if pix is None:
+            return
+        self.pixmap = pix
+        self._scaled = None
+        if self._on_changed is not None:
+            self._on_changed(self)
+
+    def load_cached_thumbnail(self) -> bool:
+        """Kapak bellekte çözülmüş duruyorsa hemen uygula."""
+        if not self.image_url:
+            return False
+        pix = gorsel_servisi().pixmap(self.image_url, hedef=self.thumbnail_target())
+        if pix is None:
+            return False
+        self.set_thumbnail(pix)
+        return True
+
+    def scaled_poster(self, pw: int, ph: int) -> Optional[QPixmap]:
+        """Kapağı poster kutusunu dolduracak şekilde ölçekle, ortadan kırp.
+
+        Sonuç boyutuyla birlikte saklanır: kaydırırken her boyamada yeniden
+        ölçeklenmez, yalnızca sütun genişliği değişince.
+        """
+        if self.pixmap is None or pw <= 0 or ph <= 0:
+            return None
+        if self._scaled is not None and (self._scaled.width(),
+                                         self._scaled.height()) == (pw, ph):
+            return self._scaled
+        scaled = self.pixmap.scaled(
+            pw, ph,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation,
+        )
+        x = max(0, (scaled.width() - pw) // 2)
+        y = max(0, (scaled.height() - ph) // 2)
+        self._scaled = scaled.copy(x, y, min(pw, scaled.width()),
+                                   min(ph, scaled.height()))
+        return self._scaled
+
+    # ── Alt sınıf kancaları (ör. izleme listesi kartı) ──────────────────────
+    def extra_height(self, font: QFont) -> int:
+        """Başlığın altına eklenen satırların yüksekliği."""
+        return 0
+
+    def paint_extra(self, painter: QPainter, rect: QRect, font: QFont) -> None:
+        """Başlığın altındaki ek satırları ``rect`` içine boya."""
+
+
+def card_height(card: CardItem, width: int, font: QFont) -> int:
+    """``width`` genişliğindeki kartın yüksekliği (`AnimeCard._apply_geometry`)."""
+    if not card.poster_mode:
+        return card.compact_height
+    pw = width - 2 * (CARD_PAD + CARD_BORDER)
+    ph = int(round(pw * POSTER_RATIO))
+    baslik = QFontMetrics(font).lineSpacing() * TITLE_LINES
+    return (2 * CARD_BORDER + 2 * CARD_PAD + ph + CARD_PAD + baslik
+            + card.extra_height(font))
+
+
+def paint_card(painter: QPainter, rect: QRect, card: CardItem, font: QFont,
+               hovered: bool = False) -> None:
+    """Kartı ``rect`` içine boya; görünüm `AnimeCard` + tema QSS'iyle aynı."""
+    painter.save()
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+    painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
+
+    # Yüzey: `QFrame#Card` (hover'da vurgulu kenarlık).
+    painter.setPen(QPen(QColor(ACCENT if hovered else BORDER), CARD_BORDER))
+    painter.setBrush(QColor(BG_ELEV))
+    painter.drawRoundedRect(QRectF(rect).adjusted(0.5, 0.5, -0.5, -0.5),
+                            RADIUS, RADIUS)
+
+    icerik = rect.adjusted(CARD_BORDER + CARD_PAD, CARD_BORDER + CARD_PAD,
+                           -(CARD_BORDER + CARD_PAD), -(CARD_BORDER + CARD_PAD))
+    fm = QFontMetrics(font)
+    rozet_font = small_font(font, bold=True)
+    rfm = QFontMetrics(rozet_font)
+    metin_x = icerik.x() + 2
+    metin_w = icerik.width() - 4
+
+    if card.poster_mode:
+        pw = icerik.width()
+        ph = int(round(pw * POSTER_RATIO))
+        poster = QRect(icerik.x(), icerik.y(), pw, ph)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(BG_ELEV_2))
+        painter.drawRoundedRect(QRectF(poster), 6, 6)
+        pix = card.scaled_poster(pw, ph)
+        if pix is not None:
+            painter.drawPixmap(poster.topLeft(), pix)
+        else:
+            # Kapak inene kadar boş dikdörtgen yerine adın kendisi durur.
+            painter.setFont(small_font(font))
+            painter.setPen(QColor(TEXT_MUTED))
+            painter.drawText(poster.adjusted(4, 4, -4, -4),
+                             int(Qt.AlignmentFlag.AlignCenter
+                                 | Qt.TextFlag.TextWordWrap), card.title)
+        # Köşe rozeti: `QFrame#CardBadge` hapı.
+        rw = rfm.horizontalAdvance(card.source) + 12
+        rh = rfm.height() + 4
+        rozet = QRect(poster.right() + 1 - BADGE_INSET - rw,
+                      poster.bottom() + 1 - BADGE_INSET - rh, rw, rh)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(8, 8, 8, 200))
+        painter.drawRoundedRect(QRectF(rozet), 5, 5)
+        painter.setFont(rozet_font)
+        painter.setPen(QColor(card.badge_color))
+        painter.drawText(rozet, int(Qt.AlignmentFlag.AlignCenter), card.source)
+        y = poster.bottom() + 1 + CARD_PAD
+    else:
+        y = icerik.y()
+
+    painter.setFont(font)
+    painter.setPen(QColor(TEXT))
+    satir_y = y
+    for line in elide_lines(card.title, fm, metin_w):
+        painter.drawText(metin_x, satir_y + fm.ascent(), line)
+        satir_y += fm.lineSpacing()
+    y += fm.lineSpacing() * TITLE_LINES
+
+    if not card.poster_mode:
+        # Poster yoksa rozet sarkacak yer bulamaz; başlığın altına iner.
+        y += 4
+        painter.setFont(rozet_font)
+        painter.setPen(QColor(card.badge_color))
+        painter.drawText(metin_x + 6, y + 2 + rfm.ascent(), card.source)
+        y += rfm.height() + 4
+
+    ek = card.extra_height(font)
+    if ek:
+        card.paint_extra(painter, QRect(metin_x, y, metin_w, ek), font)
+    painter.restore()
+
+
 # NOT: ResponsiveGrid ve ScrollableGrid buradan KALDIRILDI.
 # Sutun sayisini kendi genisliginden hesapliyorlardi; QScrollArea
 # icerigi kendi asgarisinin altina sikistirmadigi icin olcu, olctugu
@@ -333,5 +596,6 @@ class StatusLabel(QLabel):
         self.setText(text)
 
 
-__all__ = ["AnimeCard", "ElidedLabel",
-           "StatusLabel", "CARD_MIN_WIDTH", "CARD_PAD", "POSTER_RATIO"]
+__all__ = ["AnimeCard", "CardItem", "ElidedLabel", "StatusLabel",
+           "card_height", "elide_lines", "paint_card", "small_font",
+           "CARD_MIN_WIDTH", "CARD_PAD", "POSTER_RATIO"]
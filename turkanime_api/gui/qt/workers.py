@@ -10,16 +10,33 @@ karşılığı:
 - `run_bg(fn)`     : `threading.Thread(...).start()` yerine QThreadPool.
 - `UiBridge`       : elden geçirilmemiş `self.after(0, cb)` çağrıları için köprü.
 
+Öncelik şeritleri ve iptal
+--------------------------
+Eskiden her iş havuza öncelik ve iptal olmadan gidiyordu: kullanıcının terk
+ettiği sayfanın kapak indirmeleri, az önce tıkladığı bölüm listesinin önünde
+sırada bekliyordu. Artık `run_bg` bir `TaskHandle` döndürür ve her iş bir
+şeritte koşar — `LANE_INTERACTIVE` > `LANE_PREFETCH` > `LANE_BACKGROUND`;
+şerit, havuz kuyruğundaki önceliği belirler. İptal işbirlikçidir: başlamamış
+iş hiç koşmaz, koşan iş `current_token()`'a bakarak erken çıkabilir.
+`owner=` verilen işler sahibi gizlendiğinde (sayfa değişimi) kendiliğinden
+iptal edilir; şerit başına kuyruk derinliği ve bekleme süresi
+`lane_metrics()`'ten okunur.
+
 Eski `connect_*` / `emit_*` metod isimleri korunur ki mevcut worker sınıfları
 (DownloadWorker, VideoFindWorker, SearchWorker, EpisodesWorker) minimum
 değişiklikle taşınabilsin.
 """
 from __future__ import annotations
 
+import threading
+import time
 import traceback
-from typing import Any, Callable
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+
+from PySide6.QtCore import QEvent, QObject, QRunnable, QThreadPool, Signal, Slot
 
-from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from ...common import iptal
+from ...common.iptal import IptalBaglami, IptalEdildi
 
 
 class WorkerSignals(QObject):
@@ -77,24 +94,276 @@ class WorkerSignals(QObject):
         self.found.emit(item)
 
 
+# ── Şeritler ────────────────────────────────────────────────────────────────
+# Kullanıcının az önce istediği iş (arama, bölüm listesi, detay).
+LANE_INTERACTIVE = "interactive"
+# Görünür alanın önden yüklemesi (kapaklar): ekran onsuz da kullanılabilir.
+LANE_PREFETCH = "prefetch"
+# Sessiz denetimler ve senkron (güncelleme, gereksinim, AniList ilerlemesi).
+LANE_BACKGROUND = "background"
+
+# Şerit → `QThreadPool.start` önceliği (büyük olan kuyrukta öne geçer).
+LANE_PRIORITY: Dict[str, int] = {
+    LANE_INTERACTIVE: 2,
+    LANE_PREFETCH: 1,
+    LANE_BACKGROUND: 0,
+}
+
+# Sahibi gizlenince iptal edilen şeritler. Etkileşimli iş hariç: kullanıcı
+# onu açıkça istedi, sayfalar da bayat sonucu istek kimliğiyle zaten atıyor;
+# iptal edilseydi dönüldüğünde sayfa "aranıyor…" durumunda takılı kalırdı.
+GIZLENINCE_IPTAL = (LANE_PREFETCH, LANE_BACKGROUND)
+
+
+class TaskCancelled(IptalEdildi):
+    """İş, iptal belirteci tetiklendiği için yarıda bırakıldı."""
+
+
+class CancelToken(IptalBaglami):
+    """İşbirlikçi iptal belirteci (thread güvenli).
+
+    Birden çok işe paylaştırılabilir; `cancel()` hepsini birden iptal eder.
+    `common.iptal` bağlamıdır: iş koşarken etkin olduğundan kaynakların ağ
+    çağrıları (`CFSession`, `bypass.fetch`) da iptali görür ve süren
+    bağlantılarını keser.
+    """
+
+    def cancel(self) -> None:
+        self.iptal()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.iptal_edildi
+
+    def raise_if_cancelled(self) -> None:
+        if self.iptal_edildi:
+            raise TaskCancelled()
+
+
+_BOS_BELIRTEC = CancelToken()     # hiç iptal edilmeyen (iş dışı çağrılar için)
+
+
+def current_token() -> CancelToken:
+    """Bu thread'de koşan işin iptal belirteci (iş dışında: hiç iptal edilmeyen)."""
+    belirtec = iptal.gecerli()
+    return belirtec if isinstance(belirtec, CancelToken) else _BOS_BELIRTEC
+
+
+class _LaneStats:
+    """Şerit başına sayaçlar; `lane_metrics()` anlık görüntüsünü verir."""
+
+    def __init__(self):
+        self.submitted = 0
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.started = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "queued": self.queued,
+            "running": self.running,
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+            "wait_ms_avg": (self.wait_total / self.started * 1000) if self.started else 0.0,
+            "wait_ms_max": self.wait_max * 1000,
+        }
+
+
+_metrik_kilidi = threading.Lock()
+_metrikler: Dict[str, _LaneStats] = {lane: _LaneStats() for lane in LANE_PRIORITY}
+# Henüz başlamamış işlerin tutamaçları (kapanışta iptal için; bkz. `shutdown_pools`)
+_kuyrukta: Dict[str, Set["TaskHandle"]] = {lane: set() for lane in LANE_PRIORITY}
+
+
+def lane_metrics() -> Dict[str, Dict[str, Any]]:
+    """Şerit başına kuyruk derinliği, koşan iş sayısı ve bekleme süreleri (ms)."""
+    with _metrik_kilidi:
+        return {lane: st.snapshot() for lane, st in _metrikler.items()}
+
+
+def reset_lane_metrics() -> None:
+    """Sayaçları sıfırla (kuyrukta/koşmakta olan işler sayılmaya devam eder)."""
+    with _metrik_kilidi:
+        for lane, st in _metrikler.items():
+            yeni = _LaneStats()
+            yeni.queued, yeni.running = st.queued, st.running
+            _metrikler[lane] = yeni
+
+
+class TaskHandle:
+    """`run_bg`'nin döndürdüğü tutamaç: durum, iptal ve şerit bilgisi.
+
+    Durum geçişleri tek kilit altında: ``queued`` → ``running`` → ``done``
+    ya da ``queued`` → ``cancelled``. Başlamadan iptal edilen iş havuzdan
+    sırası gelince hiç koşmadan düşer.
+    """
+
+    def __init__(self, lane: str, token: CancelToken):
+        self.lane = lane
+        self.token = token
+        self._durum = "queued"
+        self._kilit = threading.Lock()
+        self._kuyruga_girdi = time.perf_counter()
+        self._bitti = threading.Event()
+
+    @property
+    def state(self) -> str:
+        return self._durum
+
+    def cancelled(self) -> bool:
+        return self.token.cancelled
+
+    def done(self) -> bool:
+        return self._bitti.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """İş bitene (ya da düşene) kadar bekle; testler ve kapanış için."""
+        return self._bitti.wait(timeout)
+
+    def cancel(self) -> bool:
+        """İptal et. Dönüş: iş henüz başlamamıştı ve hiç koşmayacak."""
+        self.token.cancel()
+        with self._kilit:
+            if self._durum != "queued":
+                return False
+            self._durum = "cancelled"
+        with _metrik_kilidi:
+            _kuyrukta[self.lane].discard(self)
+            st = _metrikler[self.lane]
+            st.queued -= 1
+            st.cancelled += 1
+        self._bitti.set()
+        return True
+
+    # ── Havuz tarafı ────────────────────────────────────────────────────────
+    def _baslat(self) -> bool:
+        with self._kilit:
+            if self._durum != "queued":
+                return False
+            if self.token.cancelled:        # paylaşılan belirteç başka yerden
+                self._durum = "cancelled"
+                sonuc = "iptal"
+            else:
+                self._durum = "running"
+                sonuc = "kos"
+        bekleme = time.perf_counter() - self._kuyruga_girdi
+        with _metrik_kilidi:
+            _kuyrukta[self.lane].discard(self)
+            st = _metrikler[self.lane]
+            st.queued -= 1
+            if sonuc == "iptal":
+                st.cancelled += 1
+            else:
+                st.running += 1
+                st.started += 1
+                st.wait_total += bekleme
+                st.wait_max = max(st.wait_max, bekleme)
+        if sonuc == "iptal":
+            self._bitti.set()
+            return False
+        return True
+
+    def _bitir(self, sonuc: str) -> None:
+        with self._kilit:
+            self._durum = "cancelled" if sonuc == "cancelled" else "done"
+        with _metrik_kilidi:
+            st = _metrikler[self.lane]
+            st.running -= 1
+            if sonuc == "cancelled":
+                st.cancelled += 1
+            elif sonuc == "failed":
+                st.failed += 1
+            else:
+                st.completed += 1
+        self._bitti.set()
+
+
+class TaskGroup(QObject):
+    """Bir sahibin (sayfanın) işleri; sahip gizlenince bekleyenleri iptal eder.
+
+    `run_bg(..., owner=widget)` grubu ilk kullanımda kurar ve sahibe olay
+    süzgeci olarak takar; sayfaların ayrıca bir şey yapması gerekmez.
+    """
+
+    def __init__(self, owner: QObject):
+        super().__init__(owner)
+        self._isler: Set[TaskHandle] = set()
+        self._kilit = threading.Lock()
+        owner.installEventFilter(self)
+
+    def add(self, handle: TaskHandle) -> None:
+        with self._kilit:
+            self._isler = {h for h in self._isler if not h.done()}
+            self._isler.add(handle)
+
+    def pending(self) -> list:
+        with self._kilit:
+            return [h for h in self._isler if not h.done()]
+
+    def cancel(self, lanes: Iterable[str] = GIZLENINCE_IPTAL) -> int:
+        """``lanes``'teki bitmemiş işleri iptal et; dönüş: iptal edilen sayısı."""
+        lanes = tuple(lanes)
+        sayi = 0
+        for handle in self.pending():
+            if handle.lane in lanes:
+                handle.cancel()
+                sayi += 1
+        return sayi
+
+    def eventFilter(self, obj, event) -> bool:  # noqa: N802 (Qt imzası)
+        if event.type() == QEvent.Type.Hide:
+            self.cancel()
+        return False
+
+
+def task_group(owner: QObject) -> TaskGroup:
+    """``owner``'ın iş grubu (yoksa kurulur)."""
+    grup = getattr(owner, "_task_group", None)
+    if grup is None:
+        grup = TaskGroup(owner)
+        owner._task_group = grup
+    return grup
+
+
 class _Task(QRunnable):
     """Bir callable'ı thread havuzunda çalıştıran QRunnable sarmalayıcı."""
 
     def __init__(self, fn: Callable[..., Any], args: tuple, kwargs: dict,
-                 signals: WorkerSignals | None):
+                 signals: WorkerSignals | None, handle: TaskHandle | None = None):
         super().__init__()
         self._fn = fn
         self._args = args
         self._kwargs = kwargs
         self._signals = signals
+        self._handle = handle
 
     @Slot()
     def run(self) -> None:  # pragma: no cover - thread gövdesi
+        handle = self._handle
+        if handle is not None and not handle._baslat():
+            self._yay_bitti()            # başlamadan iptal: gövde hiç koşmaz
+            return
+        sonuc = "completed"
         try:
-            self._fn(*self._args, **self._kwargs)
+            with iptal.etkin(handle.token if handle is not None else None):
+                self._fn(*self._args, **self._kwargs)
+        except IptalEdildi:
+            sonuc = "cancelled"
         except Exception as exc:  # arka plan hatası UI'yı düşürmemeli
+            sonuc = "failed"
             self._yay_hata(exc)
         finally:
+            if handle is not None:
+                if sonuc == "completed" and handle.token.cancelled:
+                    sonuc = "cancelled"
+                handle._bitir(sonuc)
             self._yay_bitti()
 
     # ── Sinyal yayma (alıcı silinmiş olabilir) ──────────────────────────────
@@ -140,6 +409,12 @@ _long_pool: QThreadPool | None = None
 # — yani indirme kuyruğu bitene kadar oynatma tamamen ölür.
 _play_pool: QThreadPool | None = None
 
+# Ekranın beklediği kısa CPU işleri (bölüm listesini birleştirme/hazırlama)
+# için de ayrı havuz: global havuz ağ isteklerini taşıyor ve tek çekirdekli
+# makinede tek thread'i var; hazırlık, zaman aşımına kadar süren bir keşif
+# isteğinin arkasında beklerse liste saniyelerce iskelette kalır.
+_ui_pool: QThreadPool | None = None
+
 # Yalnızca YEDEK değer: gerçek sınır "paralel indirme sayisi" ayarından gelir
 # (bkz. `set_long_task_limit`). Sabit tutulduğu sürece kullanıcının ayarı
 # hiçbir işe yaramıyordu.
@@ -149,6 +424,10 @@ VARSAYILAN_UZUN_IS = 3
 # biten mpv'nin thread'i havuza dönerken yeni isteğin beklememesi için.
 ES_ZAMANLI_OYNATMA = 2
 
+# Arayüz işleri kısa; iki slot, biri sürerken yeni sayfanın hazırlığı
+# beklemesin diye.
+ES_ZAMANLI_ARAYUZ = 2
+
 
 def long_task_pool() -> QThreadPool:
     """İndirme gibi uzun işler için ayrılmış havuz."""
@@ -168,6 +447,15 @@ def playback_pool() -> QThreadPool:
     return _play_pool
 
 
+def ui_task_pool() -> QThreadPool:
+    """Ekranın beklediği kısa hazırlık işleri için ayrılmış havuz."""
+    global _ui_pool
+    if _ui_pool is None:
+        _ui_pool = QThreadPool()
+        _ui_pool.setMaxThreadCount(ES_ZAMANLI_ARAYUZ)
+    return _ui_pool
+
+
 def set_long_task_limit(sayi: int | None) -> int:
     """Uzun iş havuzunun eşzamanlılığını çalışma anında ayarla.
 
@@ -187,22 +475,46 @@ def set_long_task_limit(sayi: int | None) -> int:
 
 
 def run_bg(fn: Callable[..., Any], *args, signals: WorkerSignals | None = None,
-           long_running: bool = False, playback: bool = False, **kwargs) -> None:
+           long_running: bool = False, playback: bool = False,
+           interactive: bool = False, lane: str = LANE_INTERACTIVE,
+           owner: QObject | None = None, cancel_token: CancelToken | None = None,
+           **kwargs) -> TaskHandle:
     """`fn`'i arka planda çalıştır (eski `threading.Thread(daemon=True)` yerine).
 
     `long_running=True` verilirse iş, kısa UI görevlerini aç bırakmamak için
     indirme havuzuna gönderilir. `playback=True` ise oynatmaya ayrılmış havuza:
     mpv, kullanıcının indirme kuyruğu yüzünden beklemek zorunda kalmamalı.
+    `interactive=True` ağa çıkmayan, ekranın beklediği kısa işler içindir
+    (bkz. `ui_task_pool`).
+
+    `lane` kuyruk önceliğidir (bkz. `LANE_PRIORITY`); `owner` verilirse iş
+    o nesne gizlendiğinde iptal edilir (`GIZLENINCE_IPTAL` şeritleri).
+    `cancel_token` birden çok işe tek belirteç paylaştırmak içindir.
 
     Hata olursa `signals.error` yayılır; sinyal verilmemişse traceback basılır.
+    İş `TaskCancelled` (ya da kaynaklardan gelen `IptalEdildi`) ile çıkarsa
+    hata sayılmaz.
     """
+    if lane not in LANE_PRIORITY:
+        raise ValueError(f"bilinmeyen şerit: {lane!r}")
+    handle = TaskHandle(lane, cancel_token or CancelToken())
+    with _metrik_kilidi:
+        st = _metrikler[lane]
+        st.submitted += 1
+        st.queued += 1
+        _kuyrukta[lane].add(handle)
+    if owner is not None:
+        task_group(owner).add(handle)
     if playback:
         pool = playback_pool()
+    elif interactive:
+        pool = ui_task_pool()
     elif long_running:
         pool = long_task_pool()
     else:
         pool = QThreadPool.globalInstance()
-    pool.start(_Task(fn, args, kwargs, signals))
+    pool.start(_Task(fn, args, kwargs, signals, handle), LANE_PRIORITY[lane])
+    return handle
 
 
 def shutdown_pools(msecs: int = 3000) -> bool:
@@ -212,9 +524,17 @@ def shutdown_pools(msecs: int = 3000) -> bool:
     `~QThreadPool` yıkıcısı zaman aşımsız `waitForDone()` çağırdığı için,
     burada `False` dönüldüğünde süreç normal yoldan çıkmaya çalışırsa iş
     (ör. yarım kalmış bir indirme) bitene kadar askıda kalır.
+
+    Başlamamış işler `pool.clear()`'dan önce tutamaçları üzerinden iptal
+    edilir: yalnızca atılsalar ``queued`` kalırlar, zaman aşımsız `wait()`
+    askıda kalır ve `lane_metrics()` onları kuyrukta saymaya devam ederdi.
     """
+    with _metrik_kilidi:
+        bekleyenler = [h for tutamaclar in _kuyrukta.values() for h in tutamaclar]
+    for handle in bekleyenler:
+        handle.cancel()
     tamam = True
-    for pool in (QThreadPool.globalInstance(), _long_pool, _play_pool):
+    for pool in (QThreadPool.globalInstance(), _long_pool, _play_pool, _ui_pool):
         if pool is None:
             continue
         pool.clear()                      # henüz başlamamışları at
@@ -250,5 +570,9 @@ class UiBridge(QObject):
 
 
 __all__ = ["WorkerSignals", "run_bg", "UiBridge", "long_task_pool",
-           "playback_pool", "set_long_task_limit", "shutdown_pools",
-           "VARSAYILAN_UZUN_IS", "ES_ZAMANLI_OYNATMA"]
+           "playback_pool", "ui_task_pool", "set_long_task_limit", "shutdown_pools",
+           "VARSAYILAN_UZUN_IS", "ES_ZAMANLI_OYNATMA", "ES_ZAMANLI_ARAYUZ",
+           "LANE_INTERACTIVE", "LANE_PREFETCH", "LANE_BACKGROUND", "LANE_PRIORITY",
+           "GIZLENINCE_IPTAL", "CancelToken", "TaskCancelled", "TaskHandle",
+           "TaskGroup", "task_group", "current_token", "lane_metrics",
+           "reset_lane_metrics"]
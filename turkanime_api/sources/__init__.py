@@ -5,74 +5,145 @@ Ek sağlayıcılar bu modülden dışa aktarılır ve `register_provider`
 yardımıyla sisteme kaydedilebilir.
 """
 
-from .animecix import CixAnime, search_animecix  # noqa: F401
-from .anizle import AnizleAnime, search_anizle  # noqa: F401
-from .tranime import (  # noqa: F401
-    TRAnimeAnime, TRAnimeEpisode, TRAnimeVideo,
-    search_tranime, get_anime_by_slug as get_tranime_anime,
-    get_anime_episodes as get_tranime_episodes,
-    get_episode_details as get_tranime_episode_details,
-    set_session_cookie as set_tranime_cookie
-)
-from .openani import ( # noqa: F401
-    OpenAniAdapter, OpenAniAnime, search_openani,
-    get_anime_episodes as get_openani_episodes,
-    get_episode_streams as get_openani_streams
-)
-from .tranimaci import (  # noqa: F401
-    search_tranimaci,
-    get_anime_episodes as get_tranimaci_episodes,
-    get_episode_streams as get_tranimaci_streams,
-)
-from .animedepo import (  # noqa: F401
-    search_animedepo,
-    get_anime_episodes as get_animedepo_episodes,
-    get_episode_streams as get_animedepo_streams,
-)
-
-# Mevcut sağlayıcılar
-PROVIDERS = {
-    "animecix": {
-        "name": "AnimeciX",
-        "adapter": None,  # Eski sistem kullanılıyor
-        "enabled": True,
-        "priority": 1
-    },
-    "anizle": {
-        "name": "Anizle",
-        "adapter": None,
-        "enabled": True,
-        "priority": 2
-    },
-    "tranime": {
-        "name": "TRAnimeİzle",
-        "adapter": None,
-        "enabled": True,
-        "priority": 3
-    },
-    "openani": {
-        "name": "OpenAnime",
-        "adapter": OpenAniAdapter,
-        "enabled": True,
-        "priority": 4
-    },
-    "tranimaci": {
-        "name": "Tranimaci",
-        "adapter": None,
-        "enabled": True,
-        "priority": 5
-    },
-    "animedepo": {
-        "name": "AnimeDepo",
-        "adapter": None,  # Fonksiyon-stili (GitLab statik arşiv)
-        "enabled": True,
-        "priority": 6
-    }
+from typing import TYPE_CHECKING
+
+# Dışa aktarılan adlar **tembel** açılıyor (PEP 562; bkz. `turkanime_api/__init__`).
+# Eskiden bu dosya altı kaynağı da import ediyordu: `sources.animecix` gibi tek
+# bir alt modüle erişmek bile hepsini (curl_cffi, cloudscraper, Playwright
+# köprüsü…) yüklüyordu.
+if TYPE_CHECKING:
+    from .animecix import CixAnime, search_animecix, search_animecix_async  # noqa: F401
+    from .anizle import AnizleAnime, search_anizle  # noqa: F401
+    from .tranime import (  # noqa: F401
+        TRAnimeAnime, TRAnimeEpisode, TRAnimeVideo,
+        search_tranime, get_anime_by_slug as get_tranime_anime,
+        get_anime_episodes as get_tranime_episodes,
+        get_episode_details as get_tranime_episode_details,
+        set_session_cookie as set_tranime_cookie
+    )
+    from .openani import ( # noqa: F401
+        OpenAniAdapter, OpenAniAnime, search_openani,
+        get_anime_episodes as get_openani_episodes,
+        get_episode_streams as get_openani_streams
+    )
+    from .tranimaci import (  # noqa: F401
+        search_tranimaci,
+        get_anime_episodes as get_tranimaci_episodes,
+        get_episode_streams as get_tranimaci_streams,
+    )
+    from .animedepo import (  # noqa: F401
+        search_animedepo,
+        get_anime_episodes as get_animedepo_episodes,
+        get_episode_streams as get_animedepo_streams,
+    )
+
+_TEMBEL = {
+    "CixAnime": ("animecix", "CixAnime"),
+    "search_animecix": ("animecix", "search_animecix"),
+    "search_animecix_async": ("animecix", "search_animecix_async"),
+    "AnizleAnime": ("anizle", "AnizleAnime"),
+    "search_anizle": ("anizle", "search_anizle"),
+    "TRAnimeAnime": ("tranime", "TRAnimeAnime"),
+    "TRAnimeEpisode": ("tranime", "TRAnimeEpisode"),
+    "TRAnimeVideo": ("tranime", "TRAnimeVideo"),
+    "search_tranime": ("tranime", "search_tranime"),
+    "get_tranime_anime": ("tranime", "get_anime_by_slug"),
+    "get_tranime_episodes": ("tranime", "get_anime_episodes"),
+    "get_tranime_episode_details": ("tranime", "get_episode_details"),
+    "set_tranime_cookie": ("tranime", "set_session_cookie"),
+    "OpenAniAdapter": ("openani", "OpenAniAdapter"),
+    "OpenAniAnime": ("openani", "OpenAniAnime"),
+    "search_openani": ("openani", "search_openani"),
+    "get_openani_episodes": ("openani", "get_anime_episodes"),
+    "get_openani_streams": ("openani", "get_episode_streams"),
+    "search_tranimaci": ("tranimaci", "search_tranimaci"),
+    "get_tranimaci_episodes": ("tranimaci", "get_anime_episodes"),
+    "get_tranimaci_streams": ("tranimaci", "get_episode_streams"),
+    "search_animedepo": ("animedepo", "search_animedepo"),
+    "get_animedepo_episodes": ("animedepo", "get_anime_episodes"),
+    "get_animedepo_streams": ("animedepo", "get_episode_streams"),
 }
 
+
+def __getattr__(ad):
+    """İlk erişimde ilgili kaynak modülünü yükle (PEP 562).
+
+    Bilinmeyen adda `AttributeError` şart: `from turkanime_api.sources import
+    anizle` alt modülü ancak bu hatayı görünce içe aktarır.
+    """
+    if ad == "PROVIDERS":
+        return _saglayicilar()
+    try:
+        modul_adi, nesne_adi = _TEMBEL[ad]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {ad!r}") from None
+    from importlib import import_module
+    nesne = getattr(import_module(f".{modul_adi}", __name__), nesne_adi)
+    globals()[ad] = nesne          # ikinci erişim __getattr__'a hiç uğramasın
+    return nesne
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_TEMBEL) | {"PROVIDERS"})
+
+
+def _saglayicilar():
+    """Mevcut sağlayıcılar; tablo ilk erişimde kurulur.
+
+    OpenAnime girdisi adapter sınıfını taşıdığı için tablo da tembel:
+    modül düzeyinde kurulsaydı `openani` yine import anında yüklenirdi.
+    """
+    tablo = globals().get("PROVIDERS")
+    if tablo is None:
+        tablo = globals()["PROVIDERS"] = _varsayilan_saglayicilar()
+    return tablo
+
+
+def _varsayilan_saglayicilar():
+    from .openani import OpenAniAdapter
+    return {
+        "animecix": {
+            "name": "AnimeciX",
+            "adapter": None,  # Eski sistem kullanılıyor
+            "enabled": True,
+            "priority": 1
+        },
+        "anizle": {
+            "name": "Anizle",
+            "adapter": None,
+            "enabled": True,
+            "priority": 2
+        },
+        "tranime": {
+            "name": "TRAnimeİzle",
+            "adapter": None,
+            "enabled": True,
+            "priority": 3
+        },
+        "openani": {
+            "name": "OpenAnime",
+            "adapter": OpenAniAdapter,
+            "enabled": True,
+            "priority": 4
+        },
+        "tranimaci": {
+            "name": "Tranimaci",
+            "adapter": None,
+            "enabled": True,
+            "priority": 5
+        },
+        "animedepo": {
+            "name": "AnimeDepo",
+            "adapter": None,  # Fonksiyon-stili (GitLab statik arşiv)
+            "enabled": True,
+            "priority": 6
+        }
+    }
+
+
 def register_provider(name: str, adapter_class, enabled: bool = True, priority: int = 5):
     """Yeni bir anime sağlayıcısı kaydet."""
-    PROVIDERS[name] = {
+    _saglayicilar()[name] = {
         "name": name,
         "adapter": adapter_class,
         "enabled": enabled,
@@ -81,7 +152,7 @@ def register_provider(name: str, adapter_class, enabled: bool = True, priority:
 
 def get_enabled_providers():
     """Etkin sağlayıcıları döndür."""
-    return {name: data for name, data in PROVIDERS.items() if data["enabled"]}
+    return {name: data for name, data in _saglayicilar().items() if data["enabled"]}
 
 def get_provider_by_priority():
     """Öncelik sırasına göre sağlayıcıları döndür."""
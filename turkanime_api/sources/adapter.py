@@ -10,13 +10,30 @@ import subprocess as sp
 import re
 import unicodedata
 
-from yt_dlp import YoutubeDL
-
 from .animecix import _video_streams
 from ..common.dosya_adi import guvenli_alt_yol
 from ..common.utils import get_ydl_opts, get_video_resolution_mpv, extract_video_info
 
 
+def __getattr__(ad):
+    """`YoutubeDL` ilk erişimde yüklenir (PEP 562).
+
+    yt-dlp ~0.2 sn import ediyor; CLI menüsü ve arama bu modülü yalnızca
+    `AdapterAnime`/`AdapterBolum` sınıfları için yüklüyor. Testler
+    `adapter.YoutubeDL`'i sahteleyebilsin diye ad modülde kalıyor.
+    """
+    if ad == "YoutubeDL":
+        from yt_dlp import YoutubeDL
+        globals()[ad] = YoutubeDL
+        return YoutubeDL
+    raise AttributeError(f"module {__name__!r} has no attribute {ad!r}")
+
+
+def _youtube_dl():
+    """Modül içinden `YoutubeDL` — düz ad araması `__getattr__`'a uğramıyor."""
+    return globals().get("YoutubeDL") or __getattr__("YoutubeDL")
+
+
 def _slugify(text: str) -> str:
     """Basit ve güvenli bir slug üretici: ASCII'ye indirger,
     boşlukları '-' yapar, gereksizleri temizler."""
@@ -138,7 +155,7 @@ class AdapterVideo:
         with NamedTemporaryFile("w", delete=False, suffix=".info.json") as tmp:
             json.dump(self.info, tmp)
         try:
-            with YoutubeDL(opts) as ydl:  # type: ignore
+            with _youtube_dl()(opts) as ydl:  # type: ignore
                 ydl.download_with_info_file(tmp.name)
         finally:
             try:
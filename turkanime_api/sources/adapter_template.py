@@ -21,6 +21,7 @@ from bs4.element import Tag
 import re
 import time
 
+from ..common import oturum_havuzu
 from ..objects import Anime, Bolum
 
 
@@ -40,8 +41,9 @@ class TemplateAnimeAdapter(ABC):
     }
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Bağlantılar süreç geneli havuzdan (bkz. `common.oturum_havuzu`);
+        # kendi `requests.Session`'ını kurmak her adapter'a ayrı TLS el sıkışması demek.
+        self.session = oturum_havuzu.oturum(headers={
             'User-Agent': self.PROVIDER_CONFIG['user_agent']
         })
         self.last_request = 0
@@ -241,8 +243,9 @@ class ExampleAnimeAdapter:
     }
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Bağlantılar süreç geneli havuzdan (bkz. `common.oturum_havuzu`);
+        # kendi `requests.Session`'ını kurmak her adapter'a ayrı TLS el sıkışması demek.
+        self.session = oturum_havuzu.oturum(headers={
             'User-Agent': self.PROVIDER_CONFIG['user_agent']
         })
         self.last_request = 0
@@ -5,16 +5,24 @@ Mevcut `objects.Anime/Bolum/Video` yapısına dokunmamak için, yalnızca
 harici arama/episode/watch listesi sağlar; indirme/oynatma yine yt-dlp/mpv ile.
 
 Cloudflare koruması için cf_bypass modülü entegre edilmiştir.
+
+Arama, bölüm ve izleme uçlarının `*_async` eşleri de var (bkz.
+`common.asenkron`): doğrudan curl_cffi `AsyncSession` ile gider, başarısız
+olursa eşzamanlı yolu (CF bypass + urllib) bir havuz thread'inde dener.
+Sezon listeleri asenkron yolda sırayla değil aynı anda çekilir.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import List, Dict, Any, Optional, Tuple
+import asyncio
 import json
 from urllib.parse import urlparse, parse_qs, quote, urlsplit, urlunsplit
 
 import urllib.request
 
+from ..common import asenkron
+
 # Cloudflare bypass entegrasyonu
 try:
     from ..common.cf_bypass import CFSession, CFBypassError
@@ -26,6 +34,7 @@ except ImportError:
 BASE_URL = "https://animecix.tv/"
 ALT_URL = "https://mangacix.net/"
 HEADERS = {"Accept": "application/json", "User-Agent": "Mozilla/5.0"}
+CURL_PROFILI = "chrome110"
 VIDEO_PLAYERS = ["tau-video.xyz", "sibnet"]
 
 # Global CF session (lazy-load)
@@ -36,17 +45,21 @@ def _get_cf_session() -> Optional[CFSession]:
     """CF session'ı lazy-load et."""
     global _cf_session
     if _cf_session is None and HAS_CF_BYPASS:
-        _cf_session = CFSession(impersonate="chrome110", timeout=15, max_retries=3)
+        _cf_session = CFSession(impersonate=CURL_PROFILI, timeout=15, max_retries=3)
     return _cf_session
 
 
-def _http_get(url: str, timeout: int = 10) -> bytes:
-    """HTTP GET isteği - önce CF bypass, sonra fallback urllib."""
-    # Non-ASCII pathleri ASCII'ye uygun hale getirmek için yüzde-encode et
+def _guvenli_url(url: str) -> str:
+    """Non-ASCII path'i ASCII'ye uygun hale getirmek için yüzde-encode et."""
     sp = urlsplit(url)
     safe_path = quote(sp.path, safe="/:%@")
-    safe_url = urlunsplit((sp.scheme, sp.netloc, safe_path, sp.query, sp.fragment))
-    
+    return urlunsplit((sp.scheme, sp.netloc, safe_path, sp.query, sp.fragment))
+
+
+def _http_get(url: str, timeout: int = 10) -> bytes:
+    """HTTP GET isteği - önce CF bypass, sonra fallback urllib."""
+    safe_url = _guvenli_url(url)
+
     # Önce CF bypass ile dene
     cf_session = _get_cf_session()
     if cf_session is not None:
@@ -63,6 +76,24 @@ def _http_get(url: str, timeout: int = 10) -> bytes:
         return resp.read()
 
 
+async def _http_get_async(url: str, timeout: int = 10) -> bytes:
+    """`_http_get`'in asenkron eşi: önce doğrudan `AsyncSession`.
+
+    Cloudflare engeli ya da ağ hatasında eşzamanlı yol (CF bypass + urllib)
+    havuz thread'inde denenir; iptal her iki yolda da geçerli.
+    """
+    try:
+        resp = await asenkron.getir(_guvenli_url(url), profil=CURL_PROFILI,
+                                    headers=HEADERS, timeout=timeout)
+        if resp.status_code == 200:
+            return resp.content
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        print(f"[AnimeCix] Asenkron istek başarısız, eşzamanlı yola düşülüyor: {e}")
+    return await asenkron.thread_ile(_http_get, url, timeout)
+
+
 def _sayisal_kimlik(deger: Any) -> Optional[int]:
     """AnimeciX başlık kimliğini int'e çevir; olmuyorsa ``None``.
 
@@ -83,12 +114,23 @@ def _sayisal_kimlik(deger: Any) -> Optional[int]:
         return None
 
 
-def search_animecix(query: str, timeout: int = 8) -> List[Tuple[str, str]]:
+def _arama_url(query: str) -> str:
     # Boşluk -> '-' ve non-ASCII karakterleri encode et
     q = (query or "").strip().replace(" ", "-")
     q_enc = quote(q, safe="-")
-    url = f"{BASE_URL}secure/search/{q_enc}?type=&limit=20"
-    data = json.loads(_http_get(url, timeout=timeout))
+    return f"{BASE_URL}secure/search/{q_enc}?type=&limit=20"
+
+
+def search_animecix(query: str, timeout: int = 8) -> List[Tuple[str, str]]:
+    return _arama_sonuclari(json.loads(_http_get(_arama_url(query), timeout=timeout)))
+
+
+async def search_animecix_async(query: str, timeout: int = 8) -> List[Tuple[str, str]]:
+    data = json.loads(await _http_get_async(_arama_url(query), timeout=timeout))
+    return _arama_sonuclari(data)
+
+
+def _arama_sonuclari(data: Dict[str, Any]) -> List[Tuple[str, str]]:
     results = []
     res = data.get("results") or []
     for item in res:
@@ -165,23 +207,82 @@ def _episodes_for_title(title_id: int) -> List[Dict[str, Any]]:
     episodes: List[Dict[str, Any]] = []
     seen = set()
     for sidx in _seasons_for_title(safe_id):
-        url = (
-            f"{ALT_URL}secure/related-videos?"
-            f"episode=1&season={sidx+1}&titleId={safe_id}&videoId={video_id}"
-        )
+        url = _sezon_url(safe_id, sidx, video_id)
         try:
             data = json.loads(_http_get(url))
-            for v in data.get("videos", []):
-                name = v.get("name")
-                ep_url = v.get("url")
-                if not name or not ep_url:
-                    continue
-                if name in seen:
-                    continue
-                episodes.append({"name": name, "url": ep_url, "season_num": v.get("season_num")})
-                seen.add(name)
         except Exception:
             continue
+        _sezonu_ekle(data, episodes, seen)
+    return episodes
+
+
+def _sezon_url(title_id: int, sidx: int, video_id: str) -> str:
+    return (f"{ALT_URL}secure/related-videos?"
+            f"episode=1&season={sidx+1}&titleId={title_id}&videoId={video_id}")
+
+
+def _sezonu_ekle(data: Dict[str, Any], episodes: List[Dict[str, Any]], seen: set) -> None:
+    for v in data.get("videos", []):
+        name = v.get("name")
+        ep_url = v.get("url")
+        if not name or not ep_url:
+            continue
+        if name in seen:
+            continue
+        episodes.append({"name": name, "url": ep_url, "season_num": v.get("season_num")})
+        seen.add(name)
+
+
+async def _episodes_for_title_async(title_id: int) -> List[Dict[str, Any]]:
+    """`_episodes_for_title`'ın asenkron eşi.
+
+    Eşzamanlı yol başlık sayfasını iki kez çekiyor (bir kez video kimliği,
+    bir kez sezon sayısı için) ve sezonları sırayla istiyordu. Burada başlık
+    bir kez çekilir, sezonlar aynı anda istenir; sonuç sezon sırasıyla
+    birleştirilir, yani çıktı eşzamanlı yolla aynıdır.
+    """
+    safe_id = _sayisal_kimlik(title_id)
+    if safe_id is None:
+        return []
+
+    video_id = ""
+    sezon_sayisi = 0
+    try:
+        title_data = json.loads(await _http_get_async(f"{BASE_URL}secure/titles/{safe_id}"))
+        title_obj = title_data.get("title", title_data)
+        videos = title_obj.get("videos", [])
+        if videos:
+            video_id = str(videos[0].get("id", ""))
+        sezon_sayisi = len(title_obj.get("seasons", []))
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        pass
+    if not video_id:
+        video_id = "637113"  # Eski hardcoded fallback
+    if not sezon_sayisi:
+        try:
+            data = json.loads(await _http_get_async(_sezon_url(safe_id, 0, video_id)))
+            title = ((data.get("videos") or [{}])[0] or {}).get("title") or {}
+            sezon_sayisi = len(title.get("seasons") or [])
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return []
+
+    sezonlar = await asyncio.gather(
+        *(_http_get_async(_sezon_url(safe_id, sidx, video_id))
+          for sidx in range(sezon_sayisi)),
+        return_exceptions=True)
+    episodes: List[Dict[str, Any]] = []
+    seen: set = set()
+    for ham in sezonlar:
+        if isinstance(ham, BaseException):
+            continue
+        try:
+            _sezonu_ekle(json.loads(ham), episodes, seen)
+        except ValueError:
+            continue
     return episodes
 
 
@@ -198,17 +299,38 @@ def _video_streams(embed_path: str, timeout: int = 10) -> List[Dict[str, str]]:
     istek = urllib.request.Request(full, headers=HEADERS)
     with urllib.request.urlopen(istek, timeout=timeout) as resp:
         final_url = resp.geturl()
+    api = _izleme_api_url(final_url)
+    if not api:
+        return []
+    return _akis_listesi(json.loads(_http_get(api, timeout=timeout)))
+
+
+async def _video_streams_async(embed_path: str, timeout: int = 10) -> List[Dict[str, str]]:
+    """`_video_streams`'in asenkron eşi: yönlendirmeyi `AsyncSession` izler."""
+    full = f"{BASE_URL}{quote(embed_path, safe='/:?=&')}"
+    resp = await asenkron.getir(full, profil=CURL_PROFILI, headers=HEADERS,
+                                timeout=timeout, allow_redirects=True)
+    api = _izleme_api_url(str(resp.url))
+    if not api:
+        return []
+    return _akis_listesi(json.loads(await _http_get_async(api, timeout=timeout)))
+
+
+def _izleme_api_url(final_url: str) -> Optional[str]:
+    """Yönlendirilmiş embed URL'inden oynatıcı API adresini kur."""
     p = urlparse(final_url)
     parts = p.path.strip("/").split("/")
     if len(parts) < 2:
-        return []
+        return None
     embed_id = parts[1] if parts[0] == "embed" else parts[0]
     qs = parse_qs(p.query)
     vid = (qs.get("vid") or [None])[0]
     if not embed_id or not vid:
-        return []
-    api = f"https://{VIDEO_PLAYERS[0]}/api/video/{embed_id}?vid={vid}"
-    data = json.loads(_http_get(api, timeout=timeout))
+        return None
+    return f"https://{VIDEO_PLAYERS[0]}/api/video/{embed_id}?vid={vid}"
+
+
+def _akis_listesi(data: Dict[str, Any]) -> List[Dict[str, str]]:
     out: List[Dict[str, str]] = []
     for u in data.get("urls", []):
         label = u.get("label")
@@ -249,3 +371,13 @@ class CixAnime:
         for i, e in enumerate(eps):
             out.append(CixEpisode(title=e.get("name") or f"Bölüm {i+1}", url=e.get("url") or ""))
         return out
+
+
+async def get_episodes_async(title_id: Any) -> List[CixEpisode]:
+    """`CixAnime(title_id, ...).episodes`'un asenkron eşi."""
+    safe_id = _sayisal_kimlik(title_id)
+    if safe_id is None:
+        return []
+    eps = await _episodes_for_title_async(safe_id)
+    return [CixEpisode(title=e.get("name") or f"Bölüm {i+1}", url=e.get("url") or "")
+            for i, e in enumerate(eps)]
@@ -25,17 +25,21 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
+import time
 from difflib import SequenceMatcher
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+# Arama indeksinde bulanık katmanın ön elemesi için (bkz. `DizinIndeksi`).
 try:
-    from curl_cffi import requests as _requests  # type: ignore
-    _HAS_CURL = True
-except ImportError:  # pragma: no cover - kütüphane yoksa düz requests'e düş
-    import requests as _requests  # type: ignore[no-redef]
-    _HAS_CURL = False
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process  # type: ignore
+    _HAS_RF = True
+except ImportError:
+    _HAS_RF = False
+
+from ..common import oturum_havuzu
 
 
 BASE_URL = "https://gitlab.com/AnimeDepo/animedepo/-/raw/master"
@@ -50,6 +54,21 @@ _dizin_cache: Optional[Dict[str, Any]] = None
 _etag_defteri: Dict[str, str] = {}
 _taban_cache: Optional[str] = None
 
+# dizin.json'ın diskteki kopyası (ETag'iyle). Yalnızca bellekte tutulduğunda
+# her süreç açılışı megabaytlık dizini koşulsuz indiriyordu; kopya varsa ilk
+# istek `If-None-Match` ile atılır ve arşiv değişmediyse 304 ile biter.
+CACHE_DIR = Path.home() / ".turkanime" / "animedepo_cache"
+DIZIN_DOSYASI = "dizin.json"
+
+_arama_indeksi: Optional["DizinIndeksi"] = None
+
+# Ağ yokken kullanılan kopya (taze SAYILMAZ; bkz. `dizin`) ve arşive yeniden
+# sorulmadan önce beklenecek süre (sn). Kopya bellekte durmazsa her arama
+# megabaytlık dosyayı diskten yeniden okuyup indeksi baştan kuruyordu.
+YENIDEN_DENEME_ARALIGI = 30.0
+_dizin_yedegi: Optional[Dict[str, Any]] = None
+_yeniden_deneme = 0.0
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Arşiv adresi
@@ -87,21 +106,20 @@ def taban_url() -> str:
 
 def taban_url_sifirla() -> None:
     """Çözülmüş adresi ve ona bağlı cache'leri unut (ayar değişince)."""
-    global _taban_cache, _dizin_cache
+    global _taban_cache, _dizin_cache, _arama_indeksi, _dizin_yedegi, _yeniden_deneme
     with _dizin_lock:
         _taban_cache = None
         _dizin_cache = None
+        _arama_indeksi = None
+        _dizin_yedegi = None
+        _yeniden_deneme = 0.0
         _etag_defteri.clear()
 
 
 def _session():
-    if _HAS_CURL:
-        return _requests.Session(impersonate="chrome131")
-    sess = _requests.Session()
-    sess.headers.update({
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/131.0"
-    })
-    return sess
+    # Paylaşılan havuz: gitlab.com bağlantısı istekler arasında açık kalır
+    # (eskiden her `fetch_json` yeni oturum ve yeni TLS el sıkışmasıydı).
+    return oturum_havuzu.oturum("chrome131")
 
 
 def fetch_json(path: str) -> Any:
@@ -135,38 +153,97 @@ def _kosullu_getir(path: str) -> Tuple[Any, bool]:
     return r.json(), False
 
 
+def _dizin_kopyasi_oku() -> Optional[Dict[str, Any]]:
+    """Diskteki dizin kopyasını yükle ve ETag'ini deftere işle.
+
+    Kopya başka bir arşiv adresine aitse (ayar değişmiş) yok sayılır.
+    """
+    try:
+        kayit = json.loads((CACHE_DIR / DIZIN_DOSYASI).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(kayit, dict) or kayit.get("taban") != taban_url():
+        return None
+    data = kayit.get("data")
+    if not isinstance(data, dict) or not data:
+        return None
+    if kayit.get("etag"):
+        _etag_defteri["dizin.json"] = kayit["etag"]
+    return data
+
+
+def _dizin_kopyasi_yaz(data: Dict[str, Any]) -> None:
+    """Dizini ETag'iyle atomik yaz; yazılamazsa sessizce geç (yalnızca önbellek)."""
+    yol = CACHE_DIR / DIZIN_DOSYASI
+    gecici = yol.with_name(f".{yol.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        yol.parent.mkdir(parents=True, exist_ok=True)
+        gecici.write_text(json.dumps({
+            "taban": taban_url(),
+            "etag": _etag_defteri.get("dizin.json"),
+            "ts": time.time(),
+            "data": data,
+        }, ensure_ascii=False), encoding="utf-8")
+        os.replace(gecici, yol)
+    except OSError:
+        try:
+            gecici.unlink()
+        except OSError:
+            pass
+
+
 def dizin(tazele: bool = False) -> Dict[str, Any]:
     """AnimeDepo dizin.json dosyasını cache'li döndür.
 
     ``tazele=True`` cache'i koşullu istekle doğrular: sunucu 304 döndürürse
     (arşiv commit'i değişmemişse) megabaytlık dizin yeniden indirilmez.
+    Süreçteki ilk çağrı diskteki kopyayı (`CACHE_DIR`) aynı yolla doğrular;
+    ağ yoksa kopya olduğu gibi kullanılır.
 
     NOT: Başarısızlık cache'lenmez. Aksi hâlde tek bir geçici ağ hatası
     AnimeDepo'yu süreç boyunca sessizce devre dışı bırakır (her arama 0 sonuç,
     hiçbir hata görünmez) ve tek çare uygulamayı yeniden başlatmak olur.
+    Ağ yokken kullanılan kopya yalnızca bellekte tutulur (`_dizin_yedegi`);
+    arşive en geç `YENIDEN_DENEME_ARALIGI` sonra yeniden sorulur.
     """
-    global _dizin_cache
+    global _dizin_cache, _dizin_yedegi, _yeniden_deneme
     with _dizin_lock:
         if _dizin_cache and not tazele:
             return _dizin_cache
+        eldeki = _dizin_cache or _dizin_yedegi or _dizin_kopyasi_oku()
+        if eldeki and not tazele and time.monotonic() < _yeniden_deneme:
+            return eldeki
         try:
-            if _dizin_cache and tazele:
+            if eldeki:
                 data, degismedi = _kosullu_getir("dizin.json")
                 if degismedi:
+                    _dizin_cache, _dizin_yedegi, _yeniden_deneme = eldeki, None, 0.0
                     return _dizin_cache
             else:
                 data = fetch_json("dizin.json")
         except Exception:
-            return _dizin_cache or {}    # cache'leme: sonraki çağrı tekrar dener
+            # cache'leme: sonraki çağrı tekrar dener — ama diskteki kopya
+            # çevrimdışıyken de arama yapılabilsin diye döndürülür (aynı
+            # nesne: arama indeksi yeniden kurulmaz).
+            if eldeki:
+                if _dizin_cache is None:
+                    _dizin_yedegi = eldeki
+                _yeniden_deneme = time.monotonic() + YENIDEN_DENEME_ARALIGI
+            return eldeki or {}
         if data:
-            _dizin_cache = data
+            _dizin_cache, _dizin_yedegi, _yeniden_deneme = data, None, 0.0
+            _dizin_kopyasi_yaz(data)
         return data or {}
 
 
 def get_anime_listesi() -> List[Tuple[str, str]]:
     """AnimeDepo anime listesini [(slug, title), ...] biçiminde döndür."""
+    return _anime_listesi(dizin())
+
+
+def _anime_listesi(veri: Dict[str, Any]) -> List[Tuple[str, str]]:
     liste: List[Tuple[str, str]] = []
-    for grup in dizin().get("index", {}).values():
+    for grup in (veri or {}).get("index", {}).values():
         if not isinstance(grup, dict):
             continue
         for slug, anime in grup.items():
@@ -178,6 +255,146 @@ def get_anime_listesi() -> List[Tuple[str, str]]:
 # ─────────────────────────────────────────────────────────────────────────────
 # Arama (yerel fuzzy — AnimeDepo'da gerçek arama endpoint'i yok)
 # ─────────────────────────────────────────────────────────────────────────────
+ONEK_UZUNLUGU = 4
+BULANIK_ESIK = 0.55
+# rapidfuzz kesimi tam sınırdaki adayı düşürebiliyor; kesin oran zaten
+# SequenceMatcher ile ayrıca hesaplandığı için pay yalnızca eler.
+_KESIM_PAYI = 0.01
+
+
+class DizinIndeksi:
+    """Dizin sürümü başına bir kez kurulan arama yapısı.
+
+    `search_animedepo` eskiden her sorguda `get_anime_listesi()`'ni baştan
+    kurup her başlığı SequenceMatcher ile puanlıyordu. Burada başlık ve slug
+    bir kez küçük harfe çevrilir; sorgu yalnızca aday kayıtlara dokunur:
+
+    - tam eşleşme   → başlık/slug sözlüğü,
+    - başlangıç     → ilk ``ONEK_UZUNLUGU`` karakterlik önek haritası,
+    - alt-dize      → sorgunun TÜM trigramlarını içeren kayıtlar (kesişim),
+    - bulanık       → en az bir trigram paylaşan kayıtlar; rapidfuzz oranı
+                      SequenceMatcher'ın üst sınırı olduğu için eşiğin altında
+                      kalanlara SequenceMatcher hiç çalıştırılmaz.
+
+    Sorgu 3 karakterden kısaysa trigram yok; o zaman tüm kayıtlar adaydır.
+    Trigram paylaşmayan başlık da bulanık eşiği geçebilir ("narto" → "No").
+    Onlara yalnızca eşleşme katmanlarından ``limit``'i dolduracak kadar sonuç
+    çıkmadığında bakılır (bulanık skor hep 1'in altında, katmanlar hep
+    üstünde); o zaman da yalnızca uzunluğu yetebilecek başlıklar rapidfuzz'ın
+    C döngüsüyle elenir. Sonuç sırası eski doğrusal taramayla birebir aynıdır.
+    """
+
+    def __init__(self, veri: Dict[str, Any]):
+        self.kaynak = veri
+        self.kayitlar = _anime_listesi(veri)
+        self.basliklar = [(title or "").lower() for _, title in self.kayitlar]
+        self.sluglar = [slug.lower() for slug, _ in self.kayitlar]
+        self.tam: Dict[str, List[int]] = {}
+        self.onekler: Dict[str, List[int]] = {}
+        self.trigramlar: Dict[str, Set[int]] = {}
+        # başlık uzunluğu -> (kayıt sıraları, başlıklar)
+        self.uzunluklar: Dict[int, Tuple[List[int], List[str]]] = {}
+        for sira, (baslik, slug) in enumerate(zip(self.basliklar, self.sluglar)):
+            siralar, basliklar = self.uzunluklar.setdefault(len(baslik), ([], []))
+            siralar.append(sira)
+            basliklar.append(baslik)
+            for metin in {baslik, slug}:
+                if not metin:
+                    continue
+                self.tam.setdefault(metin, []).append(sira)
+                for n in range(1, min(len(metin), ONEK_UZUNLUGU) + 1):
+                    self.onekler.setdefault(metin[:n], []).append(sira)
+                for i in range(len(metin) - 2):
+                    self.trigramlar.setdefault(metin[i:i + 3], set()).add(sira)
+
+    def __len__(self) -> int:
+        return len(self.kayitlar)
+
+    def _adaylar(self, q: str) -> Set[int]:
+        if len(q) < 3:
+            return set(range(len(self.kayitlar)))
+        adaylar: Set[int] = set(self.tam.get(q, ()))
+        adaylar.update(self.onekler.get(q[:ONEK_UZUNLUGU], ()))
+        for i in range(len(q) - 2):
+            adaylar.update(self.trigramlar.get(q[i:i + 3], ()))
+        return adaylar
+
+    def ara(self, query: str, limit: int = 20) -> List[Tuple[str, str]]:
+        q = query.strip().lower()
+        if not q:
+            return []
+        adaylar = self._adaylar(q)
+        scored: List[Tuple[float, int]] = []
+        eslesen = 0
+        for sira in adaylar:
+            hay, slug = self.basliklar[sira], self.sluglar[sira]
+            if hay == q or slug == q:
+                katman = 3.0            # tam eşleşme en üstte
+            elif hay.startswith(q) or slug.startswith(q):
+                katman = 2.0            # başlangıç eşleşmesi
+            elif q in hay or q in slug:
+                katman = 1.0            # alt-dize eşleşmesi (kısa başlık öne)
+            else:
+                ratio = self._bulanik(q, hay)
+                if ratio >= BULANIK_ESIK:
+                    scored.append((ratio, sira))    # yalnızca fuzzy
+                continue
+            eslesen += 1
+            scored.append((katman + SequenceMatcher(None, q, hay).ratio(), sira))
+
+        if eslesen < limit and len(q) >= 3:
+            scored.extend(self._trigramsiz(q, adaylar))
+        # Eşit skorda dizin sırası — eski taramanın kararlı sıralamasıyla aynı.
+        scored.sort(key=lambda x: (-x[0], x[1]))
+        return [self.kayitlar[sira] for _, sira in scored[:limit]]
+
+
+    @staticmethod
+    def _bulanik(q: str, hay: str) -> float:
+        """SequenceMatcher oranı; rapidfuzz sınırı eşiğin altındaysa 0."""
+        if _HAS_RF and _rf_fuzz.ratio(q, hay) < BULANIK_ESIK * 100.0 - _KESIM_PAYI:
+            return 0.0
+        return SequenceMatcher(None, q, hay).ratio()
+
+    def _trigramsiz(self, q: str, adaylar: Set[int]) -> List[Tuple[float, int]]:
+        """Aday olmayan başlıklardan bulanık eşiği geçenler.
+
+        2·min(a, b) / (a + b) SequenceMatcher oranının da üst sınırı; bu
+        pencerenin dışındaki uzunluklar hiç açılmaz.
+        """
+        n = len(q)
+        en_kisa = int(n * BULANIK_ESIK / (2.0 - BULANIK_ESIK))
+        en_uzun = int(n * (2.0 - BULANIK_ESIK) / BULANIK_ESIK) + 1
+        bulunan: List[Tuple[float, int]] = []
+        for uzunluk in range(max(en_kisa, 1), en_uzun + 1):
+            kova = self.uzunluklar.get(uzunluk)
+            if not kova:
+                continue
+            siralar, basliklar = kova
+            if _HAS_RF:
+                isabetler = [(siralar[j], basliklar[j]) for _, _, j in _rf_process.extract(
+                    q, basliklar, scorer=_rf_fuzz.ratio, limit=None,
+                    score_cutoff=BULANIK_ESIK * 100.0 - _KESIM_PAYI)]
+            else:
+                isabetler = list(zip(siralar, basliklar))
+            for sira, hay in isabetler:
+                if sira in adaylar:
+                    continue
+                ratio = SequenceMatcher(None, q, hay).ratio()
+                if ratio >= BULANIK_ESIK:
+                    bulunan.append((ratio, sira))
+        return bulunan
+
+
+def _indeks(veri: Dict[str, Any]) -> DizinIndeksi:
+    """Dizin sürümüne ait indeks; dizin değiştiyse (yeni nesne) yeniden kur."""
+    global _arama_indeksi
+    indeks = _arama_indeksi
+    if indeks is None or indeks.kaynak is not veri:
+        indeks = _arama_indeksi = DizinIndeksi(veri)
+    return indeks
+
+
 def search_animedepo(query: str, limit: int = 20) -> List[Tuple[str, str]]:
     """AnimeDepo dizininde yerel fuzzy arama yap.
 
@@ -185,24 +402,7 @@ def search_animedepo(query: str, limit: int = 20) -> List[Tuple[str, str]]:
     """
     if not query or not query.strip():
         return []
-    q = query.strip().lower()
-    scored: List[Tuple[float, Tuple[str, str]]] = []
-    for slug, title in get_anime_listesi():
-        hay = (title or "").lower()
-        ratio = SequenceMatcher(None, q, hay).ratio()
-        if hay == q or slug.lower() == q:
-            score = 3.0 + ratio            # tam eşleşme en üstte
-        elif hay.startswith(q) or slug.lower().startswith(q):
-            score = 2.0 + ratio            # başlangıç eşleşmesi
-        elif q in hay or q in slug.lower():
-            score = 1.0 + ratio            # alt-dize eşleşmesi (kısa başlık öne)
-        elif ratio >= 0.55:
-            score = ratio                  # yalnızca fuzzy
-        else:
-            continue
-        scored.append((score, (slug, title)))
-    scored.sort(key=lambda x: -x[0])
-    return [item for _, item in scored[:limit]]
+    return _indeks(dizin()).ara(query, limit)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -313,6 +513,7 @@ __all__ = [
     "get_episode_streams",
     "get_anime_listesi",
     "dizin",
+    "DizinIndeksi",
     "taban_url",
     "taban_url_sifirla",
     "BASE_URL",
@@ -14,14 +14,27 @@ API Akışı (Stream'ler için):
 """
 from __future__ import annotations
 
+import heapq
+import os
 import re
 import json
+import threading
+import time
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
 from difflib import SequenceMatcher
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
 from urllib.parse import urlparse
 
+# rapidfuzz yalnızca aday eleme için (SequenceMatcher'ın üst sınırı); yoksa
+# eleme atlanır, sonuç yine aynıdır.
+try:
+    from rapidfuzz import fuzz as _rf_fuzz, process as _rf_process  # type: ignore
+    _HAS_RF = True
+except ImportError:
+    _HAS_RF = False
+
 # CF Bypass modülünü içe aktar
 try:
     from turkanime_api.common.cf_bypass import (
@@ -36,6 +49,9 @@ except ImportError:
 
 import requests
 
+from ..common import iptal, oturum_havuzu
+from ..common.iptal import IptalEdildi
+
 # ============================================================================
 # Konfigürasyon
 # ============================================================================
@@ -53,11 +69,31 @@ USE_REMOTE_SERVER = False  # True yapılırsa eski sunucu kullanılır
 # Hız ayarları
 HTTP_TIMEOUT = 10  # Varsayılan timeout (saniye)
 MAX_WORKERS = 8  # Paralel işlem sayısı
+CURL_PROFILI = "chrome110"  # curl_cffi TLS parmak izi (havuz anahtarının parçası)
 
 # Global anime veritabanı (cache)
 _anime_database: List[Dict[str, Any]] = []
 _database_loaded: bool = False
 
+# Katalog anlık görüntüsü: `getAnimeListForSearch` megabaytlarca JSON ve her
+# süreç açılışında yeniden indiriliyordu; oturumun ilk araması bunu bekliyordu.
+# Diskteki kopya açılışta anında yüklenir, tazeliği arka planda ETag /
+# Last-Modified ile doğrulanır.
+CACHE_DIR = Path.home() / ".turkanime" / "anizle_cache"
+KATALOG_DOSYASI = "katalog.json"
+# Anlık görüntü bu kadar saniyeden gençse ağa HİÇ çıkılmaz (None = her açılışta
+# arka planda doğrula). CLI ve sunucu tarayıcısı kendi değerini atar; ortam
+# değişkeni ikisini de ezer.
+AZAMI_YAS_ANAHTARI = "TURKANIME_ANIZLE_AZAMI_YAS"
+KATALOG_AZAMI_YAS: Optional[float] = None
+
+_katalog_lock = threading.Lock()
+_katalog_etag: Optional[str] = None
+_katalog_last_modified: Optional[str] = None
+_katalog_ts: float = 0.0
+_tazeleme_thread: Optional[threading.Thread] = None
+_katalog_indeksi: Optional["KatalogIndeksi"] = None
+
 # Global CF session
 _cf_session: Optional[Any] = None
 
@@ -114,14 +150,16 @@ def _http_get(url: str, timeout: int = 60, headers: Optional[Dict[str, str]] = N
     # istek ağ hatasıyla düşse de 403 challenge dönse de aşağıdaki iki kademe
     # ÖLÜ KODDU. Anizle CF arkasındaki kaynak olduğu için pratikte "kaynak
     # çalışmıyor" demekti. Artık her kademe gerçekten sırasını alıyor.
+    #
+    # Oturum paylaşılan havuzdan: anizm.pro bağlantısı istekler arasında açık
+    # kalır (eskiden her çağrı yeni oturum, yeni TLS el sıkışmasıydı).
     try:
-        from curl_cffi import requests as curl_requests
-        session = curl_requests.Session(impersonate="chrome110")
-        yanit = session.get(url, headers=default_headers, timeout=timeout)
+        yanit = oturum_havuzu.oturum(CURL_PROFILI).get(
+            url, headers=default_headers, timeout=timeout)
         if not _engellenmis(yanit):
             return yanit
-    except ImportError:
-        pass
+    except IptalEdildi:
+        raise                 # iş terk edildi; sıradaki kademeler de boşuna
     except Exception:
         pass  # ağ/TLS hatası — sıradaki kademeye düş
 
@@ -132,10 +170,13 @@ def _http_get(url: str, timeout: int = 60, headers: Optional[Dict[str, str]] = N
             yanit = session.get(url, headers=default_headers)
             if not _engellenmis(yanit):
                 return yanit
+        except IptalEdildi:
+            raise
         except Exception:
             pass
 
     # 3) Son çare: düz requests
+    iptal.kontrol()
     try:
         return requests.get(url, headers=default_headers, timeout=timeout)
     except Exception:
@@ -156,13 +197,12 @@ def _http_post(url: str, timeout: int = 60, headers: Optional[Dict[str, str]] =
     
     # Kademeler `_http_get` ile aynı; gerekçesi için oradaki nota bak.
     try:
-        from curl_cffi import requests as curl_requests
-        session = curl_requests.Session(impersonate="chrome110")
-        yanit = session.post(url, headers=default_headers, timeout=timeout, data=data)
+        yanit = oturum_havuzu.oturum(CURL_PROFILI).post(
+            url, headers=default_headers, timeout=timeout, data=data)
         if not _engellenmis(yanit):
             return yanit
-    except ImportError:
-        pass
+    except IptalEdildi:
+        raise
     except Exception:
         pass
 
@@ -172,9 +212,12 @@ def _http_post(url: str, timeout: int = 60, headers: Optional[Dict[str, str]] =
             yanit = session.post(url, headers=default_headers, data=data)
             if not _engellenmis(yanit):
                 return yanit
+        except IptalEdildi:
+            raise
         except Exception:
             pass
 
+    iptal.kontrol()
     try:
         return requests.post(url, headers=default_headers, timeout=timeout, data=data)
     except Exception as e:
@@ -186,7 +229,128 @@ def _http_post(url: str, timeout: int = 60, headers: Optional[Dict[str, str]] =
 # Anime Veritabanı Yönetimi
 # ============================================================================
 
-def load_anime_database(force_reload: bool = False) -> List[Dict[str, Any]]:
+def _katalog_yolu() -> Path:
+    return CACHE_DIR / KATALOG_DOSYASI
+
+
+def _azami_yas(azami_yas: Optional[float]) -> Optional[float]:
+    """Geçerli azami yaş: ortam değişkeni > parametre > modül varsayılanı."""
+    ortam = (os.environ.get(AZAMI_YAS_ANAHTARI) or "").strip()
+    if ortam:
+        try:
+            return float(ortam)
+        except ValueError:
+            pass        # bozuk değer varsayılanı bozmasın
+    return azami_yas if azami_yas is not None else KATALOG_AZAMI_YAS
+
+
+def _katalogu_kur(data: List[Dict[str, Any]]) -> None:
+    """Bellekteki katalog referansını değiştir.
+
+    Liste yerinde değiştirilmez, referans değişir: arka plan tazelemesi bir
+    arama sürerken biterse o arama eski listeyi sonuna kadar tutarlı görür.
+    """
+    global _anime_database, _database_loaded, _katalog_indeksi
+    _katalog_indeksi = KatalogIndeksi(data)
+    _anime_database = data
+    _database_loaded = True
+
+
+def _anlik_goruntu_oku() -> bool:
+    """Diskteki katalog kopyasını yükle; yoksa/bozuksa ``False``."""
+    global _katalog_etag, _katalog_last_modified, _katalog_ts
+    try:
+        kayit = json.loads(_katalog_yolu().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    if not isinstance(kayit, dict) or not isinstance(kayit.get("data"), list) \
+            or not kayit["data"]:
+        return False
+    _katalog_etag = kayit.get("etag") or None
+    _katalog_last_modified = kayit.get("last_modified") or None
+    _katalog_ts = float(kayit.get("ts") or 0.0)
+    _katalogu_kur(kayit["data"])
+    return True
+
+
+def _anlik_goruntu_yaz(data: List[Dict[str, Any]]) -> None:
+    """Katalogu meta verisiyle birlikte atomik yaz (geçici dosya + `os.replace`).
+
+    Yazım hatası sessiz geçer: diskin dolu olması aramayı bozmamalı, yalnızca
+    bir sonraki açılışı yavaşlatır.
+    """
+    yol = _katalog_yolu()
+    gecici = yol.with_name(f".{yol.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        yol.parent.mkdir(parents=True, exist_ok=True)
+        gecici.write_text(json.dumps({
+            "ts": _katalog_ts,
+            "etag": _katalog_etag,
+            "last_modified": _katalog_last_modified,
+            "data": data,
+        }, ensure_ascii=False), encoding="utf-8")
+        os.replace(gecici, yol)
+    except OSError:
+        try:
+            gecici.unlink()
+        except OSError:
+            pass
+
+
+def _katalogu_getir(kosullu: bool) -> Optional[List[Dict[str, Any]]]:
+    """Katalogu ağdan çek; değişmemişse (HTTP 304) mevcut listeyi döndür.
+
+    ``kosullu=True`` ve bilinen bir ETag/Last-Modified varsa istek koşullu
+    atılır. Başarısızlıkta ``None`` — çağıran eldeki kopyayla devam eder.
+    """
+    global _katalog_etag, _katalog_last_modified, _katalog_ts
+    basliklar: Dict[str, str] = {}
+    if kosullu and _anime_database:
+        if _katalog_etag:
+            basliklar["If-None-Match"] = _katalog_etag
+        if _katalog_last_modified:
+            basliklar["If-Modified-Since"] = _katalog_last_modified
+    try:
+        response = _http_get(ANIME_LIST_URL, timeout=120, headers=basliklar or None)
+        if response is None:
+            return None
+        if response.status_code == 304 and basliklar:
+            _katalog_ts = time.time()
+            _anlik_goruntu_yaz(_anime_database)
+            return _anime_database
+        if response.status_code != 200:
+            return None
+        data = response.json()
+    except Exception:
+        return None
+    if not isinstance(data, list) or not data:
+        return None
+    etiketler = getattr(response, "headers", None) or {}
+    _katalog_etag = etiketler.get("ETag") or None
+    _katalog_last_modified = etiketler.get("Last-Modified") or None
+    _katalog_ts = time.time()
+    _katalogu_kur(data)
+    _anlik_goruntu_yaz(data)
+    return data
+
+
+def _arka_planda_tazele() -> None:
+    """Katalogu arka planda koşullu istekle doğrula (aynı anda tek thread)."""
+    global _tazeleme_thread
+
+    def _calis():
+        with _katalog_lock:
+            _katalogu_getir(kosullu=True)
+
+    if _tazeleme_thread is not None and _tazeleme_thread.is_alive():
+        return
+    _tazeleme_thread = threading.Thread(
+        target=_calis, name="anizle-katalog-tazele", daemon=True)
+    _tazeleme_thread.start()
+
+
+def load_anime_database(force_reload: bool = False,
+                        azami_yas: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     Anizm.pro'dan anime veritabanını yükle.
     
@@ -205,34 +369,29 @@ def load_anime_database(force_reload: bool = False) -> List[Dict[str, Any]]:
     - info_malpoint: float
     - lastEpisode: list (son bölümler)
     - categories: list (kategoriler)
+
+    Önce diskteki anlık görüntü (`CACHE_DIR/katalog.json`) yüklenir ve hemen
+    döndürülür; ``azami_yas`` saniyeden eskiyse tazeliği arka planda koşullu
+    istekle doğrulanır. Anlık görüntü yoksa indirme eskisi gibi senkrondur.
+    ``force_reload=True`` her zaman senkron (ama koşullu) istek atar.
     """
-    global _anime_database, _database_loaded
-    
     if _database_loaded and not force_reload:
         return _anime_database
-    
-    try:
-        response = _http_get(ANIME_LIST_URL, timeout=120)
-        
-        if response is None:
-            return []
-        
-        if response.status_code != 200:
-            return []
-        
-        data = response.json()
-        
-        if isinstance(data, list):
-            _anime_database = data
-            _database_loaded = True
+
+    with _katalog_lock:
+        if force_reload:
+            _katalogu_getir(kosullu=True)
             return _anime_database
-        else:
-            return []
-            
-    except json.JSONDecodeError:
-        return []
-    except Exception:
-        return []
+        if _database_loaded:
+            return _anime_database
+        if not _anlik_goruntu_oku():
+            return _katalogu_getir(kosullu=False) or []
+
+    yas = time.time() - _katalog_ts
+    esik = _azami_yas(azami_yas)
+    if esik is None or yas > esik:
+        _arka_planda_tazele()
+    return _anime_database
 
 
 def _similarity_score(query: str, text: str) -> float:
@@ -254,6 +413,218 @@ def _similarity_score(query: str, text: str) -> float:
     return SequenceMatcher(None, query_lower, text_lower).ratio()
 
 
+# ============================================================================
+# Yerel Arama İndeksi
+# ============================================================================
+
+ARAMA_ALANLARI = ("info_title", "info_titleoriginal", "info_titleenglish",
+                  "info_othernames", "info_japanese")
+ARAMA_ESIGI = 0.3  # Minimum eşik (bu skorun ÜSTÜ sonuca girer)
+# rapidfuzz ile SequenceMatcher aynı kesri farklı yuvarlayabiliyor; eşit
+# skorlu adayın sınırda elenmemesi için üst sınıra küçük pay.
+_SINIR_PAYI = 1e-9
+# `process.extract` kesimi içeride tamsayı mesafeye çeviriyor ve tam sınırdaki
+# adayı düşürebiliyor (ölçüldü: 51.85 skorlu aday 51.8518 kesiminde yok).
+# Kesin skor zaten SequenceMatcher ile ayrıca hesaplanıyor; pay yalnızca eler.
+_KESIM_PAYI = 0.01
+
+
+def _dogrusal_ara(database: List[Dict[str, Any]], query: str,
+                  limit: int) -> List[Tuple[str, str]]:
+    """Eski doğrusal tarama — indeksin karşılaştırıldığı referans.
+
+    Her kayıt için beş alanı da `_similarity_score` ile puanlar; binlerce
+    kayıtta sorgu başına on binlerce SequenceMatcher çağrısı demek.
+    """
+    results: List[Tuple[float, str, str]] = []
+    for anime in database:
+        max_score = max(_similarity_score(query, anime.get(alan, ""))
+                        for alan in ARAMA_ALANLARI)
+        if max_score > ARAMA_ESIGI:
+            slug = anime.get("info_slug", "")
+            title = anime.get("info_title", "")
+            if slug and title:
+                results.append((max_score, slug, title))
+    results.sort(key=lambda x: x[0], reverse=True)
+    return [(slug, title) for _, slug, title in results[:limit]]
+
+
+def _alan(anime: Dict[str, Any], ad: str) -> str:
+    deger = anime.get(ad)
+    return deger.lower() if isinstance(deger, str) else ""
+
+
+class KatalogIndeksi:
+    """Katalog yüklenirken bir kez kurulan arama indeksi.
+
+    Sonuç sırası `_dogrusal_ara` ile BİREBİR aynıdır; hız yalnızca kesin
+    skoru hesaplanacak kayıt sayısını azaltmaktan gelir:
+
+    1. **Aday üretimi:** sorgunun karakter trigramlarından en az birini
+       paylaşan kayıtlar (tersine indeks). Alt-dize ve tam eşleşmeler her
+       trigramı paylaştığı için hiçbiri kaçmaz.
+    2. **Üst sınır:** `rapidfuzz` oranı LCS'ye dayanır, SequenceMatcher'ın
+       eşleşen blokları ise bir ortak alt-dizidir; yani rapidfuzz skoru
+       SequenceMatcher'ınkinden asla küçük değildir. Adaylar bu sınıra göre
+       sıralanır ve ilk ``limit`` kesin skorun altına düşen sınırda durulur.
+    3. **Aday olmayanlar:** trigram paylaşmayan bir başlık yine de bulanık
+       eşleşebilir. Yalnızca uzunluğu eldeki en düşük skora ulaşmaya izin
+       veren kovalar rapidfuzz ile (C tarafında) taranır.
+    """
+
+    def __init__(self, database: List[Dict[str, Any]]):
+        self.kaynak = database
+        self.kayitlar: List[Tuple[str, str]] = []
+        self.alanlar: List[Tuple[str, ...]] = []
+        self.trigramlar: Dict[str, List[int]] = {}
+        # uzunluk -> (kayıt sırası, alan metni) listeleri; rapidfuzz'a toplu
+        # verilebilsin diye iki paralel liste.
+        self.uzunluklar: Dict[int, Tuple[List[int], List[str]]] = {}
+
+        for anime in database:
+            if not isinstance(anime, dict):
+                continue
+            slug = anime.get("info_slug", "")
+            title = anime.get("info_title", "")
+            if not (slug and title):
+                continue            # doğrusal tarama da bunları döndürmüyor
+            sira = len(self.kayitlar)
+            alanlar = tuple(_alan(anime, ad) for ad in ARAMA_ALANLARI)
+            self.kayitlar.append((slug, title))
+            self.alanlar.append(alanlar)
+            gorulen = set()
+            for metin in alanlar:
+                if not metin or metin in gorulen:
+                    continue
+                gorulen.add(metin)
+                sira_ler, metinler = self.uzunluklar.setdefault(len(metin), ([], []))
+                sira_ler.append(sira)
+                metinler.append(metin)
+                for i in range(len(metin) - 2):
+                    self.trigramlar.setdefault(metin[i:i + 3], []).append(sira)
+        for sira_listesi in self.trigramlar.values():
+            # Aynı kaydın farklı alanları aynı trigramı iki kez yazmış olabilir.
+            sira_listesi[:] = sorted(set(sira_listesi))
+
+    def __len__(self) -> int:
+        return len(self.kayitlar)
+
+    @staticmethod
+    def _sinir(sorgu: str, metin: str) -> float:
+        """`_similarity_score`'un ucuz üst sınırı."""
+        if metin == sorgu:
+            return 1.0
+        if sorgu in metin:
+            return 0.9
+        if not _HAS_RF:
+            return 1.0
+        return _rf_fuzz.ratio(sorgu, metin) / 100.0 + _SINIR_PAYI
+
+    @staticmethod
+    def _skor(sorgu: str, alanlar: Tuple[str, ...], alt: float = 0.0) -> float:
+        """Kaydın kesin skoru; üst sınırı ``alt``'ı geçemeyen alan atlanır."""
+        en_iyi = 0.0
+        for metin in alanlar:
+            if not metin:
+                continue
+            if metin == sorgu:
+                return 1.0
+            if sorgu in metin:
+                en_iyi = max(en_iyi, 0.9)
+                continue
+            if _HAS_RF and _rf_fuzz.ratio(sorgu, metin) / 100.0 + _SINIR_PAYI \
+                    <= max(en_iyi, alt):
+                continue
+            en_iyi = max(en_iyi, SequenceMatcher(None, sorgu, metin).ratio())
+        return en_iyi
+
+    def ara(self, query: str, limit: int = 20) -> List[Tuple[str, str]]:
+        """``[(slug, başlık), ...]`` — `_dogrusal_ara` ile aynı sonuç ve sıra."""
+        sorgu = query.lower()
+        if limit <= 0:
+            return []
+        if not sorgu:
+            # Boş dize her başlığın "içinde" geçer: doğrusal taramada herkes
+            # 0.9 alıyor ve katalog sırası kalıyordu.
+            return self.kayitlar[:limit]
+
+        if len(sorgu) >= 3:
+            adaylar = set()
+            for i in range(len(sorgu) - 2):
+                adaylar.update(self.trigramlar.get(sorgu[i:i + 3], ()))
+        else:
+            adaylar = set(range(len(self.kayitlar)))
+
+        # 1) Adaylar: üst sınıra göre sırala, kesin skoru tembel hesapla.
+        sinirlar = []
+        for sira in adaylar:
+            ust = max((self._sinir(sorgu, m) for m in self.alanlar[sira] if m),
+                      default=0.0)
+            if ust > ARAMA_ESIGI:
+                sinirlar.append((-ust, sira))
+        sinirlar.sort()
+
+        skorlar: Dict[int, float] = {}
+        enler: List[float] = []          # en iyi `limit` skorun min-yığını
+        for eksi_ust, sira in sinirlar:
+            if len(enler) >= limit and -eksi_ust < enler[0]:
+                break
+            skor = self._skor(sorgu, self.alanlar[sira], ARAMA_ESIGI)
+            if skor > ARAMA_ESIGI:
+                skorlar[sira] = skor
+                if len(enler) < limit:
+                    heapq.heappush(enler, skor)
+                elif skor > enler[0]:
+                    heapq.heapreplace(enler, skor)
+
+        # 2) Aday olmayanlar: yalnızca uzunluğu yetebilecek kovalar.
+        if len(sorgu) >= 3:
+            alt = enler[0] if len(enler) >= limit else ARAMA_ESIGI
+            for sira, skor in self._trigramsiz(sorgu, adaylar, alt):
+                if skor > ARAMA_ESIGI and skor > skorlar.get(sira, 0.0):
+                    skorlar[sira] = skor
+
+        # Eşit skorda katalog sırası — doğrusal taramadaki kararlı sıralama.
+        sirali = sorted(skorlar.items(), key=lambda x: (-x[1], x[0]))
+        return [self.kayitlar[sira] for sira, _ in sirali[:limit]]
+
+    def _trigramsiz(self, sorgu: str, adaylar: set, alt: float):
+        """Trigram paylaşmayan alanlardan ``alt`` skoruna ulaşabilenler.
+
+        2·min(a, b) / (a + b) oranı SequenceMatcher'ın da üst sınırı; bu
+        yüzden uzunluğu penceresi dışındaki kovalar hiç açılmaz.
+        """
+        n = len(sorgu)
+        en_kisa = int(n * alt / (2.0 - alt))
+        en_uzun = int(n * (2.0 - alt) / alt) + 1
+        for uzunluk in range(max(en_kisa, 1), en_uzun + 1):
+            kova = self.uzunluklar.get(uzunluk)
+            if not kova:
+                continue
+            sira_ler, metinler = kova
+            if _HAS_RF:
+                isabetler = ((sira_ler[j], metinler[j]) for _, _, j in _rf_process.extract(
+                    sorgu, metinler, scorer=_rf_fuzz.ratio, limit=None,
+                    score_cutoff=max(alt * 100.0 - _KESIM_PAYI, 0.0)))
+            else:
+                isabetler = zip(sira_ler, metinler)
+            for sira, metin in isabetler:
+                if sira in adaylar:
+                    continue
+                skor = SequenceMatcher(None, sorgu, metin).ratio()
+                if skor >= alt:
+                    yield sira, skor
+
+
+def _indeks(database: List[Dict[str, Any]]) -> KatalogIndeksi:
+    """``database`` için kurulmuş indeks; katalog dışarıdan değiştiyse yeniden kur."""
+    global _katalog_indeksi
+    indeks = _katalog_indeksi
+    if indeks is None or indeks.kaynak is not database:
+        indeks = _katalog_indeksi = KatalogIndeksi(database)
+    return indeks
+
+
 def search_anizle(query: str, limit: int = 20, timeout: int = 60) -> List[Tuple[str, str]]:
     """
     Anizle/Anizm üzerinde anime ara.
@@ -276,29 +647,43 @@ def search_anizle(query: str, limit: int = 20, timeout: int = 60) -> List[Tuple[
         print("[Anizle] Veritabanı boş, uzak sunucu deneniyor...")
         return _search_remote(query, limit, timeout)
     
-    # Arama yap
-    results: List[Tuple[float, str, str]] = []
-    
-    for anime in database:
-        # Tüm başlıklardan en yüksek skoru al
-        scores = [
-            _similarity_score(query, anime.get("info_title", "")),
-            _similarity_score(query, anime.get("info_titleoriginal", "")),
-            _similarity_score(query, anime.get("info_titleenglish", "")),
-            _similarity_score(query, anime.get("info_othernames", "")),
-            _similarity_score(query, anime.get("info_japanese", "")),
-        ]
-        max_score = max(scores)
-        
-        if max_score > 0.3:  # Minimum eşik
-            slug = anime.get("info_slug", "")
-            title = anime.get("info_title", "")
-            if slug and title:
-                results.append((max_score, slug, title))
-    
-    # Skora göre sırala ve limitle
-    results.sort(key=lambda x: x[0], reverse=True)
-    return [(slug, title) for _, slug, title in results[:limit]]
+    # Arama yap (katalogla birlikte kurulan indeks üzerinden)
+    return _indeks(database).ara(query, limit)
+
+
+def kiyasla(sorgular: Optional[List[str]] = None, tekrar: int = 3,
+            database: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """İndeksli aramayı eski doğrusal taramayla kıyasla (sorgu başına ms).
+
+    ``database`` verilmezse yüklü katalog kullanılır. Dönen sözlükte iki
+    yolun ortalama gecikmesi, indeks kurulum süresi ve sonuçların birebir
+    aynı olup olmadığı bulunur.
+    """
+    database = database if database is not None else load_anime_database()
+    sorgular = sorgular or ["one piece", "naruto", "shingeki no kyojin",
+                            "frieren", "kimetsu", "bleach", "ao", "spy famly"]
+    t0 = time.perf_counter()
+    indeks = KatalogIndeksi(database)
+    kurulum = time.perf_counter() - t0
+
+    def _olc(fn) -> float:
+        t0 = time.perf_counter()
+        for _ in range(tekrar):
+            for sorgu in sorgular:
+                fn(sorgu)
+        return (time.perf_counter() - t0) * 1000.0 / (tekrar * len(sorgular))
+
+    dogrusal = _olc(lambda q: _dogrusal_ara(database, q, 20))
+    indeksli = _olc(lambda q: indeks.ara(q, 20))
+    return {
+        "kayit": len(database),
+        "kurulum_ms": kurulum * 1000.0,
+        "dogrusal_ms": dogrusal,
+        "indeks_ms": indeksli,
+        "hizlanma": dogrusal / indeksli if indeksli else float("inf"),
+        "ayni": all(_dogrusal_ara(database, q, 20) == indeks.ara(q, 20)
+                    for q in sorgular),
+    }
 
 
 def _search_remote(query: str, limit: int = 20, timeout: int = 60) -> List[Tuple[str, str]]:
@@ -1043,7 +1428,18 @@ __all__ = [
     "get_anime_details",
     "get_anime_episodes",
     "get_episode_streams",
+    "KatalogIndeksi",
+    "kiyasla",
     "load_anime_database",
     "search_anizle",
     "USE_REMOTE_SERVER",
 ]
+
+
+if __name__ == "__main__":
+    # Gecikme ölçümü: python -m turkanime_api.sources.anizle
+    olcum = kiyasla()
+    print(f"{olcum['kayit']} kayıt, indeks kurulumu {olcum['kurulum_ms']:.0f} ms")
+    print(f"doğrusal tarama : {olcum['dogrusal_ms']:8.2f} ms/sorgu")
+    print(f"indeks          : {olcum['indeks_ms']:8.2f} ms/sorgu "
+          f"({olcum['hizlanma']:.0f}x, sonuçlar {'aynı' if olcum['ayni'] else 'FARKLI'})")
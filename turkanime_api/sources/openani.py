@@ -20,6 +20,8 @@ from bs4 import BeautifulSoup
 # hem uyarıyı hem kırılganlığı bitiriyor (requests zaten zorunlu bağımlılık).
 import requests
 
+from ..common import iptal, oturum_havuzu
+
 # `..objects` yt_dlp'yi (71 modül, ~0.5 sn) ve `..bypass` üzerinden Crypto'yu
 # çeker. `Anime`/`Bolum` bu modülde yalnızca `OpenAniAdapter`'ın iki fabrika
 # metodunda kullanılıyor; arama/bölüm/stream uçlarını çağıran sunucu tarayıcısı
@@ -182,15 +184,19 @@ class OpenAniAdapter:
         ama mevcut CFSession her isteği selenium/flaresolverr ile çözmeye
         çalışıyor — bu hem yavaş hem ortama bağımlı. Burada plain curl_cffi
         kullanarak hızlı doğrudan istek atıyoruz.
+
+        Bağlantı süreç geneli havuzdan (bkz. `oturum_havuzu`): adapter'ın
+        paralel aramaları eskiden tek bir curl oturumunu thread'ler arasında
+        paylaşıyordu.
         """
         try:
-            from curl_cffi import requests as _curl
             sess = getattr(self, "_light_session", None)
             if sess is None:
-                sess = _curl.Session(impersonate="chrome110")
-                self._light_session = sess
+                sess = self._light_session = oturum_havuzu.oturum("chrome110")
             return sess.get(url, headers=headers, timeout=self.timeout,
                             allow_redirects=False)
+        except iptal.IptalEdildi:
+            raise
         except Exception:
             # Yedek yolda da süre veriyoruz: `requests.Session` varsayılanı
             # SONSUZ bekler (CFSession kendi varsayılanını koyar ama düz
@@ -19,12 +19,7 @@ import threading
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
-try:
-    from curl_cffi import requests as _curl_requests
-    _HAS_CURL = True
-except ImportError:
-    import requests as _curl_requests  # type: ignore[no-redef]
-    _HAS_CURL = False
+from ..common import oturum_havuzu
 
 
 BASE_URL = "https://tranimaci.com"
@@ -40,11 +35,9 @@ _SESSION_TTL = 30 * 60  # 30 dakika
 
 
 def _new_session():
-    if _HAS_CURL:
-        return _curl_requests.Session(impersonate="chrome131")
-    sess = _curl_requests.Session()
-    sess.headers.update({"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/131.0"})
-    return sess
+    # Bağlantılar süreç geneli havuzdan; WAF çerezi bu nesnenin kavanozunda.
+    # TTL dolunca yeni nesne = temiz kavanoz, ama TLS bağlantısı korunur.
+    return oturum_havuzu.oturum("chrome131")
 
 
 def _extract_challenge(html: str) -> Optional[Dict[str, Any]]:
@@ -19,13 +19,7 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any, Tuple
 from urllib.parse import unquote
 
-try:
-    from curl_cffi import requests as curl_requests
-    HAS_CURL = True
-except ImportError:
-    HAS_CURL = False
-
-import requests as std_requests
+from ..common import oturum_havuzu
 
 # ─────────────────────────────────────────────────────────────────────────────
 # YAPILANDIRMA
@@ -99,15 +93,12 @@ def set_session_cookie(cookie_value: str):
 
 
 def _get_session():
-    """HTTP session oluştur."""
-    if HAS_CURL:
-        session = curl_requests.Session(impersonate="chrome110")
-    else:
-        session = std_requests.Session()
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36'
-        })
-    return session
+    """HTTP oturumu: bağlantılar süreç geneli havuzdan (iptal bağlamına bağlı).
+
+    Her çağrı kendi çerez kavanozunu alır; kullanıcı çerezleri isteklere
+    `_get_cookies()` ile ayrıca eklendiği için paylaşılacak durum yok.
+    """
+    return oturum_havuzu.oturum("chrome110")
 
 
 def _get_cookies() -> dict:
@@ -77,9 +77,10 @@ def _safe_import():
     registry: Dict[str, Dict[str, Any]] = {}
 
     try:
-        from turkanime_api.sources.animecix import search_animecix
+        from turkanime_api.sources.animecix import search_animecix, search_animecix_async
         registry["animecix"] = {
             "search": search_animecix,
+            "search_async": search_animecix_async,
             "episodes": None,   # CixAnime ile yapılıyor — özel akış
             "streams": None,
         }
@@ -155,7 +156,10 @@ SOURCES = _safe_import()
 # Title matching utilities
 # ─────────────────────────────────────────────────────────────────────────────
 try:
-    from turkanime_api.common.title_match import multilang_search, SearchResponse
+    from turkanime_api.common.title_match import (
+        get_title_aliases, SearchResponse,
+    )
+    from turkanime_api.common.adapters import AsyncSearchEngine
     _HAS_MATCH = True
 except Exception as e:
     log.warning("title_match yüklenemedi: %s", e)
@@ -331,32 +335,58 @@ def universal_search():
     threshold = float(request.args.get("threshold", "0.95"))
 
     targets = [only] if only and only in SOURCES else list(SOURCES.keys())
+    targets = [src for src in targets if SOURCES[src].get("search")]
     by_source: Dict[str, Any] = {}
 
-    for src in targets:
-        searcher = SOURCES[src].get("search")
-        if not searcher:
-            continue
-        if _HAS_MATCH:
-            resp: SearchResponse = multilang_search(
-                lambda x, _s=searcher: _norm_to_tuples(_s(x)),
-                q, threshold=threshold,
-            )
+    if _HAS_MATCH:
+        # Kaynaklar eskiden SIRAYLA aranıyordu: toplam süre kaynak sürelerinin
+        # toplamıydı. Artık hepsi (ve alias'ları) tek olay döngüsünde, kaynak
+        # başına süre sınırıyla; alias'lar istek başına bir kez çözülür.
+        aliases = get_title_aliases(q)
+        motor = AsyncSearchEngine({src: _KayitAdapteri(SOURCES[src]) for src in targets})
+        yanitlar = motor.multilang_search_all(q, aliases=aliases, threshold=threshold)
+        for src in targets:
+            resp: SearchResponse = yanitlar[src]
             by_source[src] = {
                 "exact": [_mr_to_dict(r) for r in resp.exact],
                 "possible": [_mr_to_dict(r) for r in resp.possible] if fuzzy else [],
                 "aliases": resp.aliases,
             }
-        else:
-            try:
-                rows = _norm_results(searcher(q))
-            except Exception as e:
-                rows = []
-                log.warning("%s search hatası: %s", src, e)
-            by_source[src] = {"exact": rows, "possible": [], "aliases": [q]}
+        return jsonify({"query": q, "results": by_source})
+
+    for src in targets:
+        try:
+            rows = _norm_results(SOURCES[src]["search"](q))
+        except Exception as e:
+            rows = []
+            log.warning("%s search hatası: %s", src, e)
+        by_source[src] = {"exact": rows, "possible": [], "aliases": [q]}
     return jsonify({"query": q, "results": by_source})
 
 
+class _KayitAdapteri:
+    """`SOURCES` kaydını `AsyncSearchEngine` adapter'ı olarak sun.
+
+    Kayıtta ``search_async`` varsa istek doğrudan olay döngüsünde yapılır;
+    yoksa eşzamanlı ``search`` motorun havuz thread'inde koşar.
+    """
+
+    def __init__(self, kayit: Dict[str, Any]):
+        self._ara = kayit["search"]
+        ara_async = kayit.get("search_async")
+        if ara_async is not None:
+            async def search_anime_async(query: str, limit: int = 10):
+                return _norm_to_tuples(await ara_async(query))
+            self.search_anime_async = search_anime_async
+
+    def search_anime(self, query: str, limit: int = 10):
+        try:
+            return _norm_to_tuples(self._ara(query))
+        except Exception as e:
+            log.warning("search hatası: %s", e)
+            return []
+
+
 def _norm_to_tuples(rows):
     out = []
     for r in rows or []:
@@ -11,15 +11,20 @@ tarayıcının "yalnızca hedef kaynaklara istek" garantisini bozardı.
 
 Bölüm kimlikleri `common.episode_parser` ile normalize edilir; böylece
 "Bölüm 5", "5. Bölüm" ve "S01E05" arşivde aynı dosyaya düşer.
+
+Küme arama bloklama indeksiyle yapılır: yeni başlık yalnızca `fuzzy_score`
+eşiğini *geçebilecek* kümelere karşı skorlanır (bkz. `KumeDefteri._adaylar`).
 """
 from __future__ import annotations
 
+import math
 import re
 import unicodedata
-from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from turkanime_api.common.episode_parser import extract_episode_info, parse_episode
-from turkanime_api.common.title_match import fuzzy_score
+from turkanime_api.common.title_match import _normalize, fuzzy_score
 
 from .durum import DurumDeposu
 
@@ -60,6 +65,47 @@ def bolum_slugu(baslik: str) -> str:
     return slugla(baslik, "bolum")
 
 
+_KAYAN_PAY = 1e-9
+
+
+def _esit_kes(kelime: str, adet: int) -> List[str]:
+    boy, artan = divmod(len(kelime), adet)
+    parcalar, i = [], 0
+    for j in range(adet):
+        son = i + boy + (1 if j < artan else 0)
+        parcalar.append(kelime[i:son])
+        i = son
+    return parcalar
+
+
+def _parcala(kelimeler: List[str], adet: int,
+             maliyet: Callable[[str], int]) -> Optional[List[str]]:
+    """Kelimelerden ``adet`` tane ayrık, kelime içi parça seç.
+
+    Hangi parçaların seçildiği doğruluğu değil, yalnızca aday sayısını
+    etkiler: açgözlü olarak en ucuz (en az kümede geçen) parçalar alınır;
+    yaygın kelimeler ("no", "season") mümkünse hiç kullanılmaz.
+    Harf sayısı yetmiyorsa ``None``.
+    """
+    if adet <= 0 or sum(map(len, kelimeler)) < adet:
+        return None
+    bolum = {k: 0 for k in kelimeler}
+    bedel = {k: 0 for k in kelimeler}
+    for _ in range(adet):
+        secim = None
+        for k in kelimeler:
+            if bolum[k] >= len(k):
+                continue
+            yeni = sum(maliyet(p) for p in _esit_kes(k, bolum[k] + 1))
+            artis = (yeni - bedel[k], k)
+            if secim is None or artis < secim[0]:
+                secim = (artis, k, yeni)
+        _, k, yeni = secim
+        bolum[k] += 1
+        bedel[k] = yeni
+    return [p for k, n in bolum.items() if n for p in _esit_kes(k, n)]
+
+
 class KumeDefteri:
     """Kaynak kayıtlarını küme (arşiv slug'ı) altında toplar.
 
@@ -67,16 +113,143 @@ class KumeDefteri:
     eşik üstündeki en iyi kümeye bağlanır, yoksa yeni küme açılır. Küme
     başlıkları `DurumDeposu`dan yüklenir; süreç yeniden başlasa da aynı anime
     aynı slug'a düşer (slug arşiv yolunun parçası, kayması kırık link demek).
+
+    Her başlığı her kümeye skorlamak tarama boyunca O(N²) idi. `_basliklar`ın
+    yanında bir bloklama indeksi tutulur (kelime parçası postaları + uzunluk
+    ölçüleri); `fuzzy_score` yalnızca eşiği geçebilecek adaylara uygulanır.
+    Eleme kesin bir gerekli koşula dayanır, atamalar değişmez.
     """
 
     def __init__(self, depo: DurumDeposu, esik: float = 0.90):
         self.depo = depo
         self.esik = esik
-        self._basliklar: Dict[str, str] = dict(depo.kumeler())
+        self._basliklar: Dict[str, str] = {}
+        self._sira: Dict[str, int] = {}
+        # Bloklama indeksi (bkz. `_adaylar`)
+        self._gramlar: Dict[str, Set[str]] = {}       # kelime içi 1-3 harflik dizgi
+        self._parcalar: Dict[str, Set[str]] = {}      # kümenin kendi parçaları
+        self._parca_boylari: Counter = Counter()
+        self._uzunluklar: Dict[str, Tuple[int, int]] = {}
+        self._zayiflar: Set[str] = set()
+        kumeler = depo.kumeler()
+        # Parça seçimi gram sıklıklarına bakıyor: önce tüm gramlar, sonra parçalar.
+        for slug, baslik in kumeler:
+            self._kume_ekle(slug, baslik, parcalar=False)
+        if self._indeks_kullanilir():
+            for slug, baslik in kumeler:
+                self._parcalari_ekle(slug, _normalize(baslik))
         self._bulgu_kume: Dict[Tuple[str, str], str] = {
             (b["kaynak"], b["kaynak_id"]): b["kume"] for b in depo.bulgular()
         }
 
+    # ── Bloklama indeksi ────────────────────────────────────────────────────
+    def _indeks_kullanilir(self) -> bool:
+        return 0.0 < self.esik <= 1.0
+
+    @staticmethod
+    def _olcu(normal: str) -> Tuple[int, int]:
+        """(tam uzunluk, sıralı tekil kelimelerin uzunluğu)."""
+        return len(normal), len(" ".join(sorted(set(normal.split()))))
+
+    def _maliyet(self, parca: str) -> int:
+        if len(parca) <= 3:
+            return len(self._gramlar.get(parca, ()))
+        return min(len(self._gramlar.get(parca[i:i + 3], ()))
+                   for i in range(len(parca) - 2))
+
+    def _parcalari(self, normal: str) -> Optional[List[str]]:
+        """Eşiği geçen her hizalamada en az biri bozulmadan kalan parçalar.
+
+        `fuzzy_score` = max(ratio, partial_ratio, token_set_ratio). Üçü de
+        kısa taraf ile öbür tarafın (bir parçasının / kelime sırası değişmiş
+        hâlinin) Indel oranına indirgenir; oran ≥ t ise düzenleme sayısı
+        k ≤ 2(1-t)/t · kısa_uzunluk. Her düzenleme en fazla bir parçaya
+        dokunduğu için k+1 ayrık parçadan biri öbür başlıkta aynen geçer.
+        Kelime içi parçalar kelime sırası değişse de bozulmaz.
+        """
+        c = 2.0 * (1.0 - self.esik) / self.esik
+        kelimeler = sorted(set(normal.split()))
+        return _parcala(kelimeler, math.floor(c * len(normal) + _KAYAN_PAY) + 1,
+                        self._maliyet)
+
+    def _kume_ekle(self, slug: str, baslik: str, parcalar: bool = True) -> None:
+        self._basliklar[slug] = baslik
+        self._sira[slug] = len(self._sira)
+        if not self._indeks_kullanilir():
+            return
+        normal = _normalize(baslik)
+        self._uzunluklar[slug] = self._olcu(normal)
+        for kelime in set(normal.split()):
+            for q in (1, 2, 3):
+                for i in range(len(kelime) - q + 1):
+                    self._gramlar.setdefault(kelime[i:i + q], set()).add(slug)
+        if parcalar:
+            self._parcalari_ekle(slug, normal)
+
+    def _parcalari_ekle(self, slug: str, normal: str) -> None:
+        parcalar = self._parcalari(normal)
+        if parcalar is None:
+            self._zayiflar.add(slug)
+            return
+        for parca in parcalar:
+            self._parcalar.setdefault(parca, set()).add(slug)
+            self._parca_boylari[len(parca)] += 1
+
+    def _gecenler(self, parca: str) -> Set[str]:
+        """Kelimelerinde ``parca`` geçebilecek kümeler (üçlü postaların kesişimi)."""
+        if len(parca) <= 3:
+            return self._gramlar.get(parca, set())
+        postalar = sorted((self._gramlar.get(parca[i:i + 3], set())
+                           for i in range(len(parca) - 2)), key=len)
+        return postalar[0].intersection(*postalar[1:])
+
+    def _adaylar(self, baslik: str) -> List[str]:
+        """`fuzzy_score(baslik, küme) >= esik` olabilecek kümeler, ekleme sırasıyla.
+
+        Kısa taraf sorguysa sorgunun parçalarından biri kümede, kümeyse
+        kümenin (eklenirken seçilmiş) parçalarından biri sorguda aynen geçer;
+        iki yön de aranır ve her yön yalnızca uzunluğu uyan kümelerle sınırlanır:
+
+            sorgu yönü  (|a| ≤ |b| ya da  |b'| ≥ |a'|·t/(2-t))
+            küme yönü   (|b| ≤ |a| ya da  |b'| ≤ |a'|·(2-t)/t)
+
+        (a' / b' = sıralı tekil kelimeler; token_set_ratio'nun kıyasladığı metin.)
+        Parçalanamayacak kadar kısa başlıklar ("zayıf") her zaman adaydır;
+        sorgu zayıfsa bütün kümeler.
+        """
+        if not self._indeks_kullanilir():
+            return list(self._basliklar)
+        normal = _normalize(baslik)
+        if not normal:
+            return []
+        parcalar = self._parcalari(normal)
+        if parcalar is None:
+            return list(self._basliklar)
+        t = self.esik
+        uz, tekil_uz = self._olcu(normal)
+        alt = tekil_uz * t / (2.0 - t) - _KAYAN_PAY
+        ust = tekil_uz * (2.0 - t) / t + _KAYAN_PAY
+
+        sorgu_yonu: Set[str] = set()
+        for parca in parcalar:
+            sorgu_yonu |= self._gecenler(parca)
+        kume_yonu: Set[str] = set()
+        for kelime in set(normal.split()):
+            for boy in self._parca_boylari:
+                for i in range(len(kelime) - boy + 1):
+                    kume_yonu |= self._parcalar.get(kelime[i:i + boy], set())
+
+        adaylar = set(self._zayiflar)
+        for slug in sorgu_yonu:
+            b_uz, b_tekil = self._uzunluklar[slug]
+            if uz <= b_uz or b_tekil >= alt:
+                adaylar.add(slug)
+        for slug in kume_yonu:
+            b_uz, b_tekil = self._uzunluklar[slug]
+            if b_uz <= uz or b_tekil <= ust:
+                adaylar.add(slug)
+        return sorted(adaylar, key=self._sira.__getitem__)
+
     # ── Sorgu ───────────────────────────────────────────────────────────────
     def kume_bul(self, baslik: str) -> Optional[str]:
         """Başlığa uyan mevcut kümeyi döndür (yoksa ``None``)."""
@@ -87,8 +260,10 @@ class KumeDefteri:
             return aday
         en_iyi: Optional[str] = None
         en_iyi_skor = 0.0
-        for slug, mevcut in self._basliklar.items():
-            skor = fuzzy_score(baslik, mevcut)
+        # Adaylar ekleme sırasıyla geliyor: eşit skorda ilk küme kazanır,
+        # tam taramadaki gibi.
+        for slug in self._adaylar(baslik):
+            skor = fuzzy_score(baslik, self._basliklar[slug])
             if skor > en_iyi_skor:
                 en_iyi_skor, en_iyi = skor, slug
         return en_iyi if en_iyi_skor >= self.esik else None
@@ -117,7 +292,7 @@ class KumeDefteri:
         slug = self.kume_bul(baslik)
         if slug is None:
             slug = self._bos_slug(baslik)
-            self._basliklar[slug] = baslik
+            self._kume_ekle(slug, baslik)
             self.depo.kume_yaz(slug, baslik)
         self._bulgu_kume[anahtar] = slug
         self.depo.bulgu_yaz(kaynak, str(kaynak_id), baslik, slug)
@@ -63,10 +63,19 @@ class KosulluSonuc:
 
 
 # ── Yükleyiciler ────────────────────────────────────────────────────────────
+# Tarayıcı cron ile 30 dakikada bir yeni süreçte başlıyor; Anizle katalogu
+# her seferinde indirilirse günde 48 kez megabaytlık liste çekilir. Bu yaştan
+# genç anlık görüntü varsa ağa hiç çıkılmaz (kayıt tazeliğiyle aynı taban).
+ANIZLE_KATALOG_AZAMI_YAS = 6 * 3600.0
+
+
 def _anizle() -> KaynakUclari:
+    from turkanime_api.sources import anizle
     from turkanime_api.sources.anizle import (
         search_anizle, get_anime_episodes, get_episode_streams,
     )
+    if anizle.KATALOG_AZAMI_YAS is None:
+        anizle.KATALOG_AZAMI_YAS = ANIZLE_KATALOG_AZAMI_YAS
     return KaynakUclari(search_anizle, get_anime_episodes, get_episode_streams)
 
 